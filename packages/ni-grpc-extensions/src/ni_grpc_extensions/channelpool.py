@@ -1,18 +1,24 @@
 """gRPC channel pool."""
 
+# The gRPC multi-callable base classes are generic only in the type stubs, so suppress mypy
+# errors about their missing type parameters.
+# mypy: allow-any-generics
+
 from __future__ import annotations
 
 import ipaddress
 import re
 import sys
+from collections.abc import Callable, Iterator
 from threading import Lock
 from types import TracebackType
-from typing import TYPE_CHECKING, Literal
+from typing import TYPE_CHECKING, Generic, Literal, TypeVar
 from urllib.parse import urlparse
 
 import grpc
+import grpc.aio
 
-from ni_grpc_extensions.loggers import ClientLogger
+from ni_grpc_extensions.loggers import AsyncClientLogger, ClientLogger
 
 if TYPE_CHECKING:
     if sys.version_info >= (3, 11):
@@ -20,6 +26,13 @@ if TYPE_CHECKING:
     else:
         from typing_extensions import Self
 
+LoadBalancing = Literal["round_robin", "least_outstanding_calls"]
+"""How a channel with multiple subchannels chooses the subchannel for each call."""
+
+_T = TypeVar("_T")
+_TRequest = TypeVar("_TRequest")
+_TResponse = TypeVar("_TResponse")
+
 
 class GrpcChannelPool:
     """Class that manages :any:`grpc.Channel` lifetimes."""
@@ -28,6 +41,7 @@ class GrpcChannelPool:
         """Initialize the :class:`GrpcChannelPool` object."""
         self._lock: Lock = Lock()
         self._channel_cache: dict[str, grpc.Channel] = {}
+        self._target_config: dict[str, tuple[int, LoadBalancing]] = {}
 
     def __enter__(self: Self) -> Self:
         """Enter the runtime context of the GrpcChannelPool."""
@@ -67,6 +81,41 @@ class GrpcChannelPool:
 
         return channel
 
+    def configure_target(
+        self,
+        target: str,
+        *,
+        subchannel_count: int = 1,
+        load_balancing: LoadBalancing = "round_robin",
+    ) -> None:
+        """Configure the channel that get_channel() returns for a target.
+
+        If subchannel_count is greater than 1, the channel spreads its calls across that many
+        subchannels, each with its own connection, so large messages and many concurrent calls
+        do not queue behind each other on a single connection.
+
+        Args:
+            target (str): The server address
+            subchannel_count (int): The number of subchannels to use for the target
+            load_balancing (str): How to choose the subchannel for each call: "round_robin"
+                or "least_outstanding_calls"
+
+        """
+        if subchannel_count < 1:
+            raise ValueError("The subchannel count must be a positive integer.")
+        if load_balancing not in ("round_robin", "least_outstanding_calls"):
+            raise ValueError(
+                "The load balancing policy must be 'round_robin' or 'least_outstanding_calls'."
+                f"\n\nLoad balancing policy: {load_balancing}"
+            )
+        with self._lock:
+            if target in self._channel_cache:
+                raise ValueError(
+                    "The target must be configured before get_channel() is called for it."
+                    f"\n\nTarget: {target}"
+                )
+            self._target_config[target] = (subchannel_count, load_balancing)
+
     def close(self) -> None:
         """Close channels opened by get_channel()."""
         with self._lock:
@@ -75,42 +124,464 @@ class GrpcChannelPool:
             self._channel_cache.clear()
 
     def _create_channel(self, target: str) -> grpc.Channel:
-        options = [
-            ("grpc.max_receive_message_length", -1),
-            ("grpc.max_send_message_length", -1),
+        subchannel_count, load_balancing = self._target_config.get(target, (1, "round_robin"))
+        if subchannel_count == 1:
+            return self._create_subchannel(target, _get_channel_options(target))
+        # Channels with different options do not share a connection, so give each subchannel a
+        # distinct index and its own subchannel pool.
+        subchannels = [
+            self._create_subchannel(
+                target,
+                [
+                    *_get_channel_options(target),
+                    ("grpc.use_local_subchannel_pool", 1),
+                    ("ni.grpc_extensions.subchannel_index", index),
+                ],
+            )
+            for index in range(subchannel_count)
         ]
-        if self._is_local(target):
-            options.append(("grpc.enable_http_proxy", 0))
+        return _StripedChannel(subchannels, load_balancing)
+
+    def _create_subchannel(self, target: str, options: list[tuple[str, int]]) -> grpc.Channel:
         channel = grpc.insecure_channel(target, options)
         if ClientLogger.is_enabled():
             channel = grpc.intercept_channel(channel, ClientLogger())
         return channel
 
     def _is_local(self, target: str) -> bool:
-        hostname = ""
-        # First, check if the target string is in URL format
-        parse_result = urlparse(target)
-        if parse_result.scheme and parse_result.hostname and parse_result.port:
-            hostname = parse_result.hostname
-        else:
-            # Next, check for target string in <host_name>:<port> format
-            match = re.match(r"^(.*):(\d+)$", target)
-            if match:
-                hostname = match.group(1)
-
-        if not hostname:
-            return False
-        if hostname == "localhost" or hostname == "LOCALHOST":
-            return True
-
-        # IPv6 addresses don't support parsing with leading/trailing brackets
-        # so we need to remove them.
-        match = re.match(r"^\[(.*)\]$", hostname)
+        return _is_local(target)
+
+
+class AsyncGrpcChannelPool:
+    """Class that manages :any:`grpc.aio.Channel` lifetimes.
+
+    A :any:`grpc.aio.Channel` is bound to the event loop that it was created on, so use each
+    AsyncGrpcChannelPool with a single event loop.
+    """
+
+    def __init__(self) -> None:
+        """Initialize the :class:`AsyncGrpcChannelPool` object."""
+        self._channel_cache: dict[str, grpc.aio.Channel] = {}
+
+    async def __aenter__(self: Self) -> Self:
+        """Enter the runtime context of the AsyncGrpcChannelPool."""
+        return self
+
+    async def __aexit__(
+        self,
+        exc_type: type[BaseException] | None,
+        exc_val: BaseException | None,
+        traceback: TracebackType | None,
+    ) -> Literal[False]:
+        """Exit the runtime context of the AsyncGrpcChannelPool."""
+        await self.close()
+        return False
+
+    def get_channel(self, target: str) -> grpc.aio.Channel:
+        """Return a gRPC asyncio channel.
+
+        Args:
+            target (str): The server address
+
+        """
+        # Creating a channel does not await, so no other task can add a channel for the same
+        # target in the meantime.
+        channel = self._channel_cache.get(target)
+        if channel is None:
+            channel = self._channel_cache[target] = self._create_channel(target)
+        return channel
+
+    async def close(self) -> None:
+        """Close channels opened by get_channel()."""
+        channels = list(self._channel_cache.values())
+        self._channel_cache.clear()
+        for channel in channels:
+            await channel.close()
+
+    def _create_channel(self, target: str) -> grpc.aio.Channel:
+        interceptors = [AsyncClientLogger()] if AsyncClientLogger.is_enabled() else None
+        return grpc.aio.insecure_channel(
+            target, _get_channel_options(target), interceptors=interceptors
+        )
+
+
+class _StripedChannel(grpc.Channel):
+    """A channel that spreads its calls across multiple subchannels."""
+
+    def __init__(self, subchannels: list[grpc.Channel], load_balancing: LoadBalancing) -> None:
+        self._subchannels = subchannels
+        self._least_outstanding_calls = load_balancing == "least_outstanding_calls"
+        self._lock = Lock()
+        self._outstanding_calls = [0] * len(subchannels)
+        self._next_index = 0
+
+    def subscribe(
+        self, callback: Callable[[grpc.ChannelConnectivity], None], try_to_connect: bool = False
+    ) -> None:
+        # Report the connectivity of the first subchannel. The other subchannels connect when
+        # they are first used.
+        self._subchannels[0].subscribe(callback, try_to_connect)
+
+    def unsubscribe(self, callback: Callable[[grpc.ChannelConnectivity], None]) -> None:
+        self._subchannels[0].unsubscribe(callback)
+
+    def unary_unary(
+        self,
+        method: str,
+        request_serializer: Callable[[_TRequest], bytes] | None = None,
+        response_deserializer: Callable[[bytes], _TResponse] | None = None,
+        _registered_method: bool | None = False,
+    ) -> grpc.UnaryUnaryMultiCallable[_TRequest, _TResponse]:
+        return _StripedUnaryUnaryMultiCallable(
+            self,
+            [
+                subchannel.unary_unary(  # type: ignore[call-arg]
+                    method,
+                    request_serializer,
+                    response_deserializer,
+                    _registered_method=_registered_method,
+                )
+                for subchannel in self._subchannels
+            ],
+        )
+
+    def unary_stream(
+        self,
+        method: str,
+        request_serializer: Callable[[_TRequest], bytes] | None = None,
+        response_deserializer: Callable[[bytes], _TResponse] | None = None,
+        _registered_method: bool | None = False,
+    ) -> grpc.UnaryStreamMultiCallable[_TRequest, _TResponse]:
+        return _StripedUnaryStreamMultiCallable(
+            self,
+            [
+                subchannel.unary_stream(  # type: ignore[call-arg]
+                    method,
+                    request_serializer,
+                    response_deserializer,
+                    _registered_method=_registered_method,
+                )
+                for subchannel in self._subchannels
+            ],
+        )
+
+    def stream_unary(
+        self,
+        method: str,
+        request_serializer: Callable[[_TRequest], bytes] | None = None,
+        response_deserializer: Callable[[bytes], _TResponse] | None = None,
+        _registered_method: bool | None = False,
+    ) -> grpc.StreamUnaryMultiCallable[_TRequest, _TResponse]:
+        return _StripedStreamUnaryMultiCallable(
+            self,
+            [
+                subchannel.stream_unary(  # type: ignore[call-arg]
+                    method,
+                    request_serializer,
+                    response_deserializer,
+                    _registered_method=_registered_method,
+                )
+                for subchannel in self._subchannels
+            ],
+        )
+
+    def stream_stream(
+        self,
+        method: str,
+        request_serializer: Callable[[_TRequest], bytes] | None = None,
+        response_deserializer: Callable[[bytes], _TResponse] | None = None,
+        _registered_method: bool | None = False,
+    ) -> grpc.StreamStreamMultiCallable[_TRequest, _TResponse]:
+        return _StripedStreamStreamMultiCallable(
+            self,
+            [
+                subchannel.stream_stream(  # type: ignore[call-arg]
+                    method,
+                    request_serializer,
+                    response_deserializer,
+                    _registered_method=_registered_method,
+                )
+                for subchannel in self._subchannels
+            ],
+        )
+
+    def close(self) -> None:
+        for subchannel in self._subchannels:
+            subchannel.close()
+
+    def __enter__(self: Self) -> Self:
+        return self
+
+    def __exit__(
+        self,
+        exc_type: type[BaseException] | None,
+        exc_val: BaseException | None,
+        traceback: TracebackType | None,
+    ) -> Literal[False]:
+        self.close()
+        return False
+
+    def _start_call(self) -> int:
+        with self._lock:
+            index = self._next_index
+            if self._least_outstanding_calls:
+                # Start searching at the next index, so idle subchannels are used in turn.
+                count = len(self._subchannels)
+                index = min(
+                    ((index + offset) % count for offset in range(count)),
+                    key=self._outstanding_calls.__getitem__,
+                )
+            self._next_index = (index + 1) % len(self._subchannels)
+            self._outstanding_calls[index] += 1
+            return index
+
+    def _end_call(self, index: int) -> None:
+        with self._lock:
+            self._outstanding_calls[index] -= 1
+
+    def _invoke_blocking(self, invoke: Callable[[int], _T]) -> _T:
+        index = self._start_call()
+        try:
+            return invoke(index)
+        finally:
+            self._end_call(index)
+
+    def _invoke_future(
+        self, invoke: Callable[[int], grpc._CallFuture[_TResponse]]
+    ) -> grpc._CallFuture[_TResponse]:
+        index = self._start_call()
+        try:
+            future = invoke(index)
+        except BaseException:
+            self._end_call(index)
+            raise
+        future.add_done_callback(lambda _: self._end_call(index))
+        return future
+
+    def _invoke_streaming(
+        self, invoke: Callable[[int], grpc._CallIterator[_TResponse]]
+    ) -> grpc._CallIterator[_TResponse]:
+        index = self._start_call()
+        try:
+            call_iterator = invoke(index)
+        except BaseException:
+            self._end_call(index)
+            raise
+        # add_callback() returns False if the call has already terminated.
+        if not call_iterator.add_callback(lambda: self._end_call(index)):
+            self._end_call(index)
+        return call_iterator
+
+
+class _StripedUnaryUnaryMultiCallable(grpc.UnaryUnaryMultiCallable, Generic[_TRequest, _TResponse]):
+    __slots__ = ["_channel", "_multicallables"]
+
+    def __init__(
+        self,
+        channel: _StripedChannel,
+        multicallables: list[grpc.UnaryUnaryMultiCallable[_TRequest, _TResponse]],
+    ) -> None:
+        self._channel = channel
+        self._multicallables = multicallables
+
+    def __call__(
+        self,
+        request: _TRequest,
+        timeout: float | None = None,
+        metadata: grpc._Metadata | None = None,
+        credentials: grpc.CallCredentials | None = None,
+        wait_for_ready: bool | None = None,
+        compression: grpc.Compression | None = None,
+    ) -> _TResponse:
+        return self._channel._invoke_blocking(
+            lambda index: self._multicallables[index](
+                request, timeout, metadata, credentials, wait_for_ready, compression
+            )
+        )
+
+    def with_call(
+        self,
+        request: _TRequest,
+        timeout: float | None = None,
+        metadata: grpc._Metadata | None = None,
+        credentials: grpc.CallCredentials | None = None,
+        wait_for_ready: bool | None = None,
+        compression: grpc.Compression | None = None,
+    ) -> tuple[_TResponse, grpc.Call]:
+        return self._channel._invoke_blocking(
+            lambda index: self._multicallables[index].with_call(
+                request, timeout, metadata, credentials, wait_for_ready, compression
+            )
+        )
+
+    def future(
+        self,
+        request: _TRequest,
+        timeout: float | None = None,
+        metadata: grpc._Metadata | None = None,
+        credentials: grpc.CallCredentials | None = None,
+        wait_for_ready: bool | None = None,
+        compression: grpc.Compression | None = None,
+    ) -> grpc._CallFuture[_TResponse]:
+        return self._channel._invoke_future(
+            lambda index: self._multicallables[index].future(
+                request, timeout, metadata, credentials, wait_for_ready, compression
+            )
+        )
+
+
+class _StripedUnaryStreamMultiCallable(
+    grpc.UnaryStreamMultiCallable, Generic[_TRequest, _TResponse]
+):
+    __slots__ = ["_channel", "_multicallables"]
+
+    def __init__(
+        self,
+        channel: _StripedChannel,
+        multicallables: list[grpc.UnaryStreamMultiCallable[_TRequest, _TResponse]],
+    ) -> None:
+        self._channel = channel
+        self._multicallables = multicallables
+
+    def __call__(
+        self,
+        request: _TRequest,
+        timeout: float | None = None,
+        metadata: grpc._Metadata | None = None,
+        credentials: grpc.CallCredentials | None = None,
+        wait_for_ready: bool | None = None,
+        compression: grpc.Compression | None = None,
+    ) -> grpc._CallIterator[_TResponse]:
+        return self._channel._invoke_streaming(
+            lambda index: self._multicallables[index](
+                request, timeout, metadata, credentials, wait_for_ready, compression
+            )
+        )
+
+
+class _StripedStreamUnaryMultiCallable(
+    grpc.StreamUnaryMultiCallable, Generic[_TRequest, _TResponse]
+):
+    __slots__ = ["_channel", "_multicallables"]
+
+    def __init__(
+        self,
+        channel: _StripedChannel,
+        multicallables: list[grpc.StreamUnaryMultiCallable[_TRequest, _TResponse]],
+    ) -> None:
+        self._channel = channel
+        self._multicallables = multicallables
+
+    def __call__(
+        self,
+        request_iterator: Iterator[_TRequest],
+        timeout: float | None = None,
+        metadata: grpc._Metadata | None = None,
+        credentials: grpc.CallCredentials | None = None,
+        wait_for_ready: bool | None = None,
+        compression: grpc.Compression | None = None,
+    ) -> _TResponse:
+        return self._channel._invoke_blocking(
+            lambda index: self._multicallables[index](
+                request_iterator, timeout, metadata, credentials, wait_for_ready, compression
+            )
+        )
+
+    def with_call(
+        self,
+        request_iterator: Iterator[_TRequest],
+        timeout: float | None = None,
+        metadata: grpc._Metadata | None = None,
+        credentials: grpc.CallCredentials | None = None,
+        wait_for_ready: bool | None = None,
+        compression: grpc.Compression | None = None,
+    ) -> tuple[_TResponse, grpc.Call]:
+        return self._channel._invoke_blocking(
+            lambda index: self._multicallables[index].with_call(
+                request_iterator, timeout, metadata, credentials, wait_for_ready, compression
+            )
+        )
+
+    def future(
+        self,
+        request_iterator: Iterator[_TRequest],
+        timeout: float | None = None,
+        metadata: grpc._Metadata | None = None,
+        credentials: grpc.CallCredentials | None = None,
+        wait_for_ready: bool | None = None,
+        compression: grpc.Compression | None = None,
+    ) -> grpc._CallFuture[_TResponse]:
+        return self._channel._invoke_future(
+            lambda index: self._multicallables[index].future(
+                request_iterator, timeout, metadata, credentials, wait_for_ready, compression
+            )
+        )
+
+
+class _StripedStreamStreamMultiCallable(
+    grpc.StreamStreamMultiCallable, Generic[_TRequest, _TResponse]
+):
+    __slots__ = ["_channel", "_multicallables"]
+
+    def __init__(
+        self,
+        channel: _StripedChannel,
+        multicallables: list[grpc.StreamStreamMultiCallable[_TRequest, _TResponse]],
+    ) -> None:
+        self._channel = channel
+        self._multicallables = multicallables
+
+    def __call__(
+        self,
+        request_iterator: Iterator[_TRequest],
+        timeout: float | None = None,
+        metadata: grpc._Metadata | None = None,
+        credentials: grpc.CallCredentials | None = None,
+        wait_for_ready: bool | None = None,
+        compression: grpc.Compression | None = None,
+    ) -> grpc._CallIterator[_TResponse]:
+        return self._channel._invoke_streaming(
+            lambda index: self._multicallables[index](
+                request_iterator, timeout, metadata, credentials, wait_for_ready, compression
+            )
+        )
+
+
+def _get_channel_options(target: str) -> list[tuple[str, int]]:
+    options = [
+        ("grpc.max_receive_message_length", -1),
+        ("grpc.max_send_message_length", -1),
+    ]
+    if _is_local(target):
+        options.append(("grpc.enable_http_proxy", 0))
+    return options
+
+
+def _is_local(target: str) -> bool:
+    hostname = ""
+    # First, check if the target string is in URL format
+    parse_result = urlparse(target)
+    if parse_result.scheme and parse_result.hostname and parse_result.port:
+        hostname = parse_result.hostname
+    else:
+        # Next, check for target string in <host_name>:<port> format
+        match = re.match(r"^(.*):(\d+)$", target)
         if match:
             hostname = match.group(1)
 
-        try:
-            address = ipaddress.ip_address(hostname)
-            return address.is_loopback
-        except ValueError:
-            return False
+    if not hostname:
+        return False
+    if hostname == "localhost" or hostname == "LOCALHOST":
+        return True
+
+    # IPv6 addresses don't support parsing with leading/trailing brackets
+    # so we need to remove them.
+    match = re.match(r"^\[(.*)\]$", hostname)
+    if match:
+        hostname = match.group(1)
+
+    try:
+        address = ipaddress.ip_address(hostname)
+        return address.is_loopback
+    except ValueError:
+        return False
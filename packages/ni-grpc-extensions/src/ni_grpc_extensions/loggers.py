@@ -13,11 +13,12 @@ import logging
 import sys
 import threading
 import time
-from collections.abc import Iterator
+from collections.abc import AsyncIterable, AsyncIterator, Awaitable, Iterable, Iterator
 from types import TracebackType
 from typing import TYPE_CHECKING, Any, Callable, Generic, TypeVar
 
 import grpc
+import grpc.aio
 
 from ni_grpc_extensions import _tracelogging
 
@@ -128,6 +129,148 @@ class ClientLogger(
             return continuation(client_call_details, request_iterator)
 
 
+class AsyncClientLogger(
+    grpc.aio.UnaryUnaryClientInterceptor,
+    grpc.aio.UnaryStreamClientInterceptor,
+    grpc.aio.StreamUnaryClientInterceptor,
+    grpc.aio.StreamStreamClientInterceptor,
+):
+    """Intercepts :any:`grpc.aio` client calls and logs them for debugging.
+
+    The call is logged when it starts and when it is done. Streaming requests are logged when
+    they are read from a request iterator. Streaming responses are not logged, so that the
+    returned call still supports ``read()`` and ``write()``.
+    """
+
+    @classmethod
+    def is_enabled(cls) -> bool:
+        """Indicates whether gRPC client call logging is enabled for the current log level."""
+        return _ClientCallLogger.is_enabled()
+
+    async def intercept_unary_unary(
+        self,
+        continuation: Callable[
+            [grpc.aio.ClientCallDetails, Any], Awaitable[grpc.aio.UnaryUnaryCall]
+        ],
+        client_call_details: grpc.aio.ClientCallDetails,
+        request: Any,
+    ) -> grpc.aio.UnaryUnaryCall:
+        """Intercept and log a unary call."""
+        if _ClientCallLogger.is_enabled():
+            call_logger = _ClientCallLogger(_get_method_name(client_call_details))
+            return _close_when_done(
+                call_logger,
+                await _continue(call_logger, continuation, client_call_details, request),
+            )
+        else:
+            return await continuation(client_call_details, request)
+
+    async def intercept_unary_stream(
+        self,
+        continuation: Callable[
+            [grpc.aio.ClientCallDetails, Any], Awaitable[grpc.aio.UnaryStreamCall]
+        ],
+        client_call_details: grpc.aio.ClientCallDetails,
+        request: Any,
+    ) -> grpc.aio.UnaryStreamCall:
+        """Intercept and log a server-streaming call."""
+        if _ClientCallLogger.is_enabled():
+            call_logger = _ClientCallLogger(_get_method_name(client_call_details))
+            return _close_when_done(
+                call_logger,
+                await _continue(call_logger, continuation, client_call_details, request),
+            )
+        else:
+            return await continuation(client_call_details, request)
+
+    async def intercept_stream_unary(
+        self,
+        continuation: Callable[
+            [grpc.aio.ClientCallDetails, Any], Awaitable[grpc.aio.StreamUnaryCall]
+        ],
+        client_call_details: grpc.aio.ClientCallDetails,
+        request_iterator: Iterable[Any] | AsyncIterable[Any] | None,
+    ) -> grpc.aio.StreamUnaryCall:
+        """Intercept and log a client-streaming call."""
+        if _ClientCallLogger.is_enabled():
+            call_logger = _ClientCallLogger(_get_method_name(client_call_details))
+            return _close_when_done(
+                call_logger,
+                await _continue(
+                    call_logger,
+                    continuation,
+                    client_call_details,
+                    _log_request_iterable(call_logger, request_iterator),
+                ),
+            )
+        else:
+            return await continuation(client_call_details, request_iterator)
+
+    async def intercept_stream_stream(
+        self,
+        continuation: Callable[
+            [grpc.aio.ClientCallDetails, Any], Awaitable[grpc.aio.StreamStreamCall]
+        ],
+        client_call_details: grpc.aio.ClientCallDetails,
+        request_iterator: Iterable[Any] | AsyncIterable[Any] | None,
+    ) -> grpc.aio.StreamStreamCall:
+        """Intercept and log a bidirectional streaming call."""
+        if _ClientCallLogger.is_enabled():
+            call_logger = _ClientCallLogger(_get_method_name(client_call_details))
+            return _close_when_done(
+                call_logger,
+                await _continue(
+                    call_logger,
+                    continuation,
+                    client_call_details,
+                    _log_request_iterable(call_logger, request_iterator),
+                ),
+            )
+        else:
+            return await continuation(client_call_details, request_iterator)
+
+
+_TCall = TypeVar("_TCall", bound=grpc.aio.Call)
+
+
+async def _continue(
+    call_logger: _CallLogger,
+    continuation: Callable[[grpc.aio.ClientCallDetails, Any], Awaitable[_TCall]],
+    client_call_details: grpc.aio.ClientCallDetails,
+    request: Any,
+) -> _TCall:
+    try:
+        return await continuation(client_call_details, request)
+    except BaseException as e:
+        call_logger.close(e)
+        raise
+
+
+def _close_when_done(call_logger: _CallLogger, call: _TCall) -> _TCall:
+    # For grpc.aio calls, the call is complete when it is done, whether the caller awaits the
+    # response, reads the response stream, or cancels the call.
+    call.add_done_callback(lambda _: call_logger.close())
+    return call
+
+
+def _get_method_name(client_call_details: grpc.aio.ClientCallDetails) -> str:
+    # grpc.aio passes the method name as bytes.
+    method = client_call_details.method
+    return method.decode() if isinstance(method, bytes) else method
+
+
+def _log_request_iterable(
+    call_logger: _CallLogger, request_iterator: Iterable[Any] | AsyncIterable[Any] | None
+) -> Iterable[Any] | AsyncIterable[Any] | None:
+    # If the request iterator is None, the caller writes the requests with call.write().
+    if request_iterator is None:
+        return None
+    elif isinstance(request_iterator, AsyncIterable):
+        return _LoggingAsyncRequestIterator(call_logger, request_iterator.__aiter__())
+    else:
+        return _LoggingRequestIterator(call_logger, iter(request_iterator))
+
+
 class ServerLogger(grpc.ServerInterceptor):
     """Intercepts gRPC server calls and logs them for debugging."""
 
@@ -371,6 +514,22 @@ class _LoggingRequestIterator(Generic[_T]):
         return request
 
 
+class _LoggingAsyncRequestIterator(Generic[_T]):
+    __slots__ = ["_call_logger", "_inner_iterator"]
+
+    def __init__(self, call_logger: _CallLogger, inner_iterator: AsyncIterator[_T]) -> None:
+        self._call_logger = call_logger
+        self._inner_iterator = inner_iterator
+
+    def __aiter__(self) -> AsyncIterator[_T]:
+        return self
+
+    async def __anext__(self) -> _T:
+        request = await self._inner_iterator.__anext__()
+        self._call_logger.log_streaming_request()
+        return request
+
+
 class _LoggingResponseIterator(Generic[_T]):
     __slots__ = ["_call_logger", "_inner_iterator"]
 
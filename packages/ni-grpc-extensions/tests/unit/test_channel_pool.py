@@ -1,6 +1,15 @@
+from __future__ import annotations
+
+import asyncio
+import threading
+from collections.abc import Generator, Iterator
+from concurrent import futures
+
+import grpc
+import grpc.aio
 import pytest
 
-from ni_grpc_extensions.channelpool import GrpcChannelPool
+from ni_grpc_extensions.channelpool import AsyncGrpcChannelPool, GrpcChannelPool
 
 
 @pytest.mark.parametrize(
@@ -30,3 +39,160 @@ def test___channel_pool___is_local___returns_expected_result(
     result = channel_pool._is_local(target)
 
     assert result == expected_result
+
+
+def test___async_channel_pool___get_channel_twice___returns_same_channel() -> None:
+    async def get_channels() -> tuple[grpc.aio.Channel, grpc.aio.Channel, grpc.aio.Channel]:
+        async with AsyncGrpcChannelPool() as channel_pool:
+            return (
+                channel_pool.get_channel("localhost:100"),
+                channel_pool.get_channel("localhost:100"),
+                channel_pool.get_channel("localhost:200"),
+            )
+
+    first_channel, second_channel, other_channel = asyncio.run(get_channels())
+
+    assert first_channel is second_channel
+    assert first_channel is not other_channel
+
+
+def test___async_channel_pool___close___closes_channels() -> None:
+    async def call_closed_channel() -> None:
+        async with AsyncGrpcChannelPool() as channel_pool:
+            channel = channel_pool.get_channel("localhost:100")
+        method: grpc.aio.UnaryUnaryMultiCallable[bytes, bytes] = channel.unary_unary(
+            "/test.Service/Method"
+        )
+        await method(b"")
+
+    with pytest.raises(grpc.aio.UsageError, match="Channel is closed"):
+        asyncio.run(call_closed_channel())
+
+
+# ========================================================
+# Subchannels
+# ========================================================
+# Handler for a test service whose methods return the address of the calling client.
+class _PeerService(grpc.GenericRpcHandler):
+    def __init__(self) -> None:
+        self.release_calls = threading.Event()
+
+    def service(
+        self, handler_call_details: grpc.HandlerCallDetails
+    ) -> grpc.RpcMethodHandler[bytes, bytes] | None:
+        if handler_call_details.method == "/test.PeerService/GetPeer":
+            return grpc.unary_unary_rpc_method_handler(self._get_peer)
+        elif handler_call_details.method == "/test.PeerService/WaitForRelease":
+            return grpc.unary_unary_rpc_method_handler(self._wait_for_release)
+        elif handler_call_details.method == "/test.PeerService/StreamPeer":
+            return grpc.unary_stream_rpc_method_handler(self._stream_peer)
+        return None
+
+    def _get_peer(self, request: bytes, context: grpc.ServicerContext) -> bytes:
+        return context.peer().encode()
+
+    def _wait_for_release(self, request: bytes, context: grpc.ServicerContext) -> bytes:
+        self.release_calls.wait(timeout=10.0)
+        return context.peer().encode()
+
+    def _stream_peer(self, request: bytes, context: grpc.ServicerContext) -> Iterator[bytes]:
+        yield context.peer().encode()
+
+
+@pytest.fixture
+def peer_service() -> Generator[tuple[_PeerService, str]]:
+    service = _PeerService()
+    server = grpc.server(futures.ThreadPoolExecutor(max_workers=8))
+    server.add_generic_rpc_handlers([service])
+    port = server.add_insecure_port("localhost:0")
+    server.start()
+    yield service, f"localhost:{port}"
+    service.release_calls.set()
+    server.stop(None)
+
+
+def test___subchannel_count___round_robin_calls___calls_use_separate_connections(
+    peer_service: tuple[_PeerService, str],
+) -> None:
+    _, target = peer_service
+    with GrpcChannelPool() as channel_pool:
+        channel_pool.configure_target(target, subchannel_count=3)
+        channel = channel_pool.get_channel(target)
+        get_peer: grpc.UnaryUnaryMultiCallable[bytes, bytes] = channel.unary_unary(
+            "/test.PeerService/GetPeer"
+        )
+
+        peers = [get_peer(b"") for _ in range(6)]
+
+    assert len(set(peers)) == 3
+    assert peers[:3] == peers[3:]
+
+
+def test___subchannel_count___streaming_calls___calls_use_separate_connections(
+    peer_service: tuple[_PeerService, str],
+) -> None:
+    _, target = peer_service
+    with GrpcChannelPool() as channel_pool:
+        channel_pool.configure_target(target, subchannel_count=2)
+        stream_peer: grpc.UnaryStreamMultiCallable[bytes, bytes] = channel_pool.get_channel(
+            target
+        ).unary_stream("/test.PeerService/StreamPeer")
+
+        peers = [response for _ in range(2) for response in stream_peer(b"")]
+
+    assert len(set(peers)) == 2
+
+
+def test___least_outstanding_calls___call_outstanding___other_subchannel_used(
+    peer_service: tuple[_PeerService, str],
+) -> None:
+    service, target = peer_service
+    with GrpcChannelPool() as channel_pool:
+        channel_pool.configure_target(
+            target, subchannel_count=2, load_balancing="least_outstanding_calls"
+        )
+        channel = channel_pool.get_channel(target)
+        get_peer: grpc.UnaryUnaryMultiCallable[bytes, bytes] = channel.unary_unary(
+            "/test.PeerService/GetPeer"
+        )
+        wait_for_release: grpc.UnaryUnaryMultiCallable[bytes, bytes] = channel.unary_unary(
+            "/test.PeerService/WaitForRelease"
+        )
+
+        outstanding_call = wait_for_release.future(b"")
+        peers = [get_peer(b"") for _ in range(3)]
+        service.release_calls.set()
+        outstanding_peer = outstanding_call.result()
+        peers_after_release = {get_peer(b"") for _ in range(4)}
+
+    assert outstanding_peer not in peers
+    assert len(set(peers)) == 1
+    assert peers_after_release == {outstanding_peer, peers[0]}
+
+
+def test___subchannel_count___with_channel___subchannels_closed() -> None:
+    channel_pool = GrpcChannelPool()
+    channel_pool.configure_target("localhost:100", subchannel_count=2)
+
+    with channel_pool.get_channel("localhost:100") as channel:
+        method: grpc.UnaryUnaryMultiCallable[bytes, bytes] = channel.unary_unary(
+            "/test.Service/Method"
+        )
+
+    with pytest.raises(ValueError, match="closed channel"):
+        method(b"")
+
+
+def test___channel_created___configure_target___raises_value_error() -> None:
+    with GrpcChannelPool() as channel_pool:
+        channel_pool.get_channel("localhost:100")
+
+        with pytest.raises(ValueError, match="must be configured before get_channel"):
+            channel_pool.configure_target("localhost:100", subchannel_count=2)
+
+
+def test___invalid_subchannel_count___configure_target___raises_value_error() -> None:
+    channel_pool = GrpcChannelPool()
+
+    with pytest.raises(ValueError, match="must be a positive integer"):
+        channel_pool.configure_target("localhost:100", subchannel_count=0)
@@ -1,12 +1,20 @@
+import asyncio
 import logging
+from typing import TYPE_CHECKING, cast
 
 import grpc
+import grpc.aio
 import pytest
 from ni.measurementlink.discovery.v1.discovery_service_pb2 import ResolveServiceRequest
 from ni.measurementlink.discovery.v1.discovery_service_pb2_grpc import DiscoveryServiceStub
 from pytest import LogCaptureFixture
 
-from ni_grpc_extensions.loggers import ClientLogger
+from ni_grpc_extensions.loggers import AsyncClientLogger, ClientLogger
+
+if TYPE_CHECKING:
+    from ni.measurementlink.discovery.v1.discovery_service_pb2_grpc import (
+        DiscoveryServiceAsyncStub,
+    )
 
 
 def test___client_logger___logs_grpc_call(caplog: LogCaptureFixture) -> None:
@@ -23,3 +31,21 @@ def test___client_logger___logs_grpc_call(caplog: LogCaptureFixture) -> None:
     method_name = "/ni.measurementlink.discovery.v1.DiscoveryService/ResolveService"
     debug_messages = [r.message for r in caplog.records if r.levelno == logging.DEBUG]
     assert any(method_name in msg for msg in debug_messages)
+
+
+def test___async_client_logger___logs_grpc_call(caplog: LogCaptureFixture) -> None:
+    async def resolve_service() -> None:
+        async with grpc.aio.insecure_channel(
+            "localhost:12345", interceptors=[AsyncClientLogger()]
+        ) as channel:
+            stub = cast("DiscoveryServiceAsyncStub", DiscoveryServiceStub(channel))
+            await stub.ResolveService(ResolveServiceRequest())
+
+    with caplog.at_level(logging.DEBUG):
+        with pytest.raises(grpc.aio.AioRpcError):
+            asyncio.run(resolve_service())
+
+    method_name = "/ni.measurementlink.discovery.v1.DiscoveryService/ResolveService"
+    debug_messages = [r.message for r in caplog.records if r.levelno == logging.DEBUG]
+    assert any(method_name in msg and "call starting" in msg for msg in debug_messages)
+    assert any(method_name in msg and "call complete" in msg for msg in debug_messages)
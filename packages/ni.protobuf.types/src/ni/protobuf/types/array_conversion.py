@@ -0,0 +1,108 @@
+"""Methods to convert to and from 2D array protobuf messages."""
+
+from __future__ import annotations
+
+from typing import Any, cast
+
+import numpy as np
+import numpy.typing as npt
+from typing_extensions import Buffer
+
+from ni.protobuf.types._wire_format import (
+    encode_packed_fixed,
+    frombuffer_le,
+    split_repeated_field,
+)
+from ni.protobuf.types.array_pb2 import Double2DArray, String2DArray
+
+# Upper bound on the number of bytes encoded per block, so that strided inputs are converted
+# without a full-size temporary array.
+_BLOCK_SIZE = 1 << 20
+
+
+def double_2d_array_to_protobuf(value: npt.NDArray[Any], /) -> Double2DArray:
+    """Convert a two-dimensional NumPy array to a protobuf Double2DArray.
+
+    The data is written in row-major order, a block of rows at a time, so non-contiguous,
+    Fortran-ordered, and non-float64 arrays are converted without a full-size temporary array.
+    """
+    rows, columns = _check_2d_shape(value)
+    message = Double2DArray(rows=rows, columns=columns)
+    rows_per_block = max(1, _BLOCK_SIZE // max(1, columns * np.dtype(np.float64).itemsize))
+    for start in range(0, rows, rows_per_block):
+        block = value[start : start + rows_per_block].astype(np.float64, order="C", copy=False)
+        # Packed repeated fields can be split across records, and merging them concatenates the
+        # values.
+        message.MergeFromString(
+            b"".join(encode_packed_fixed(Double2DArray.DATA_FIELD_NUMBER, block.reshape(-1)))
+        )
+    return message
+
+
+def double_2d_array_from_protobuf(message: Double2DArray, /) -> npt.NDArray[np.float64]:
+    """Convert the protobuf Double2DArray to a C-contiguous two-dimensional NumPy array."""
+    _check_data_length(message.rows, message.columns, len(message.data))
+    data = np.array(message.data, np.float64)
+    return data.reshape(message.rows, message.columns)
+
+
+def double_2d_array_from_protobuf_bytes(data: Buffer, /) -> npt.NDArray[np.float64]:
+    """Convert a serialized protobuf Double2DArray to a two-dimensional NumPy array.
+
+    The data is not copied. The returned array is a read-only, C-contiguous view of ``data``,
+    created with ``np.frombuffer``, and keeps a reference to ``data``. Do not modify ``data``
+    while the array is in use. The data is copied only if it is split across multiple records.
+    """
+    header, payloads = split_repeated_field(data, Double2DArray.DATA_FIELD_NUMBER)
+    message = Double2DArray()
+    message.ParseFromString(header)
+    array = cast(npt.NDArray[np.float64], frombuffer_le(payloads, np.float64))
+    _check_data_length(message.rows, message.columns, len(array))
+    return array.reshape(message.rows, message.columns)
+
+
+def string_2d_array_to_protobuf(value: npt.NDArray[Any], /) -> String2DArray:
+    """Convert a two-dimensional NumPy array of str to a protobuf String2DArray.
+
+    The array may have a str or object dtype. Its data is written in row-major order.
+    """
+    rows, columns = _check_2d_shape(value)
+    message = String2DArray(rows=rows, columns=columns)
+    for row in value:
+        message.data.extend(row.tolist())
+    return message
+
+
+def string_2d_array_from_protobuf(message: String2DArray, /) -> npt.NDArray[np.object_]:
+    """Convert the protobuf String2DArray to a two-dimensional NumPy array of objects."""
+    _check_data_length(message.rows, message.columns, len(message.data))
+    array = np.empty((message.rows, message.columns), np.object_)
+    for row in range(message.rows):
+        array[row] = message.data[row * message.columns : (row + 1) * message.columns]
+    return array
+
+
+def _check_2d_shape(value: npt.NDArray[Any]) -> tuple[int, int]:
+    if value.ndim != 2:
+        raise ValueError(
+            f"The array must be two-dimensional.\n\nNumber of dimensions: {value.ndim}"
+        )
+    rows, columns = value.shape
+    info = np.iinfo(np.int32)
+    if rows > info.max or columns > info.max:
+        raise ValueError(
+            "The number of rows and columns must be within the range of an Int32.\n\n"
+            f"Shape: {value.shape}"
+        )
+    return rows, columns
+
+
+def _check_data_length(rows: int, columns: int, length: int) -> None:
+    if rows < 0 or columns < 0:
+        raise ValueError(
+            f"The rows and columns must be non-negative.\n\nShape: ({rows}, {columns})"
+        )
+    if rows * columns != length:
+        raise ValueError(
+            f"The data length ({length}) does not match the shape ({rows}, {columns})."
+        )
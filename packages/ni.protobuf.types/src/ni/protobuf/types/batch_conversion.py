@@ -0,0 +1,89 @@
+"""Methods to convert batches of values to and from protobuf messages in parallel."""
+
+from __future__ import annotations
+
+import contextvars
+import os
+from collections import deque
+from collections.abc import Callable, Iterable, Iterator
+from concurrent.futures import Executor, Future, ThreadPoolExecutor
+from typing import TypeVar
+
+_TInput = TypeVar("_TInput")
+_TOutput = TypeVar("_TOutput")
+
+
+def convert_many(
+    converter: Callable[[_TInput], _TOutput],
+    values: Iterable[_TInput],
+    /,
+    *,
+    executor: Executor | None = None,
+    max_workers: int | None = None,
+    max_pending: int | None = None,
+) -> Iterator[_TOutput]:
+    """Convert each value with the converter on a pool of workers, yielding the results in order.
+
+    The converter may be any conversion function in this package, such as
+    ``float64_analog_waveform_to_protobuf_bytes`` or ``float64_spectrum_from_protobuf``. By
+    default, the values are converted on a thread pool with ``max_workers`` threads, which
+    defaults to the number of CPUs. The bytes conversion functions spend most of their time in
+    NumPy and ``bytes.join``, which release the GIL for large arrays, so they scale best.
+
+    To use another executor, such as a ``ProcessPoolExecutor`` for GIL-bound conversions, pass it
+    as ``executor``. The converter, values, and results must then be picklable, so each value and
+    result is copied between processes. This function does not shut down an executor that it
+    did not create.
+
+    On a ``ThreadPoolExecutor``, each conversion runs in a copy of the caller's context, so
+    settings such as :func:`ni.protobuf.types.conversion_context.trusted_input` apply to it.
+
+    The values are read lazily, and at most ``max_pending`` conversions are submitted but not yet
+    yielded, which bounds the memory used by the results. ``max_pending`` defaults to twice the
+    number of workers. If a conversion raises an exception, it is raised when its result would
+    be yielded, and the remaining conversions are cancelled.
+    """
+    if executor is not None and max_workers is not None:
+        raise ValueError("The max_workers argument cannot be used with the executor argument.")
+    if max_workers is None:
+        max_workers = os.cpu_count() or 1
+    elif max_workers < 1:
+        raise ValueError("The max workers must be a positive integer.")
+    if max_pending is None:
+        max_pending = 2 * max_workers
+    elif max_pending < 1:
+        raise ValueError("The max pending must be a positive integer.")
+
+    return _convert_many(converter, values, executor, max_workers, max_pending)
+
+
+def _convert_many(
+    converter: Callable[[_TInput], _TOutput],
+    values: Iterable[_TInput],
+    executor: Executor | None,
+    max_workers: int,
+    max_pending: int,
+) -> Iterator[_TOutput]:
+    owned_executor = None
+    if executor is None:
+        executor = owned_executor = ThreadPoolExecutor(max_workers)
+    # A context cannot be pickled or entered by two threads at once, so copy it for each value,
+    # and only when the conversions run on threads.
+    copy_context = isinstance(executor, ThreadPoolExecutor)
+    pending: deque[Future[_TOutput]] = deque()
+    try:
+        for value in values:
+            if len(pending) >= max_pending:
+                yield pending.popleft().result()
+            if copy_context:
+                future = executor.submit(contextvars.copy_context().run, converter, value)
+            else:
+                future = executor.submit(converter, value)
+            pending.append(future)
+        while pending:
+            yield pending.popleft().result()
+    finally:
+        for future in pending:
+            future.cancel()
+        if owned_executor is not None:
+            owned_executor.shutdown(wait=True)
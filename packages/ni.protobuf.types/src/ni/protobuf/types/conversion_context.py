@@ -0,0 +1,48 @@
+"""Options that control how the ni.protobuf.types conversion functions validate their inputs."""
+
+from __future__ import annotations
+
+import contextlib
+import sys
+from collections.abc import Iterator
+from contextvars import ContextVar
+
+_trusted_input: ContextVar[bool] = ContextVar("_trusted_input", default=False)
+
+# Python Development Mode (-X dev) and debug builds of Python always validate the inputs.
+_ALWAYS_VALIDATE = sys.flags.dev_mode or hasattr(sys, "gettotalrefcount")
+
+
+@contextlib.contextmanager
+def trusted_input(enabled: bool = True) -> Iterator[None]:
+    """Skip the validation of conversion inputs that are known to be valid.
+
+    Within this context, the conversion functions skip checks that only detect invalid inputs,
+    such as the Int32 range checks of scalars and vectors, the value type checks of decoded
+    scalars and vectors, and the consistency checks of decoded waveform timing fields. Use it
+    when the inputs were produced by a trusted source, such as values that were just validated
+    or messages that were just encoded by the same application. Invalid inputs may then raise
+    a different error, or be converted without an error.
+
+    The setting applies to the current thread or asyncio task, and to the conversions that
+    :func:`ni.protobuf.types.batch_conversion.convert_many` runs on a thread pool. It can be
+    used as a decorator to apply it to every call of a function. Pass ``enabled=False`` to
+    restore validation within a trusted context.
+
+    The inputs are always validated in Python Development Mode (``python -X dev``) and in debug
+    builds of Python.
+    """
+    token = _trusted_input.set(enabled)
+    try:
+        yield
+    finally:
+        _trusted_input.reset(token)
+
+
+def is_trusted_input() -> bool:
+    """Get whether the conversion functions skip the validation of their inputs."""
+    return _trusted_input.get() and not _ALWAYS_VALIDATE
+
+
+def _validate_input() -> bool:
+    return _ALWAYS_VALIDATE or not _trusted_input.get()
@@ -0,0 +1,428 @@
+"""Type-keyed registry of protobuf converters with google.protobuf.Any support."""
+
+from __future__ import annotations
+
+from collections.abc import Callable
+from typing import Any, NamedTuple
+
+import hightime as ht
+import nitypes.bintime as bt
+import numpy as np
+from google.protobuf import any_pb2
+from google.protobuf.message import Message
+from nitypes.complex import ComplexInt32DType
+from nitypes.scalar import Scalar
+from nitypes.vector import Vector
+from nitypes.waveform import AnalogWaveform, ComplexWaveform, DigitalWaveform, Spectrum
+from nitypes.xy_data import XYData
+from typing_extensions import Buffer
+
+import ni.protobuf.types.precision_duration_conversion as pdc
+import ni.protobuf.types.precision_timestamp_conversion as ptc
+import ni.protobuf.types.waveform_conversion as wfc
+import ni.protobuf.types.waveform_wrappers_conversion as wwc
+from ni.protobuf.types import (
+    array_conversion,
+    array_pb2,
+    precision_duration_pb2,
+    precision_timestamp_pb2,
+    scalar_pb2,
+    vector_pb2,
+    waveform_pb2,
+    waveform_wrappers_pb2,
+    xydata_pb2,
+)
+from ni.protobuf.types.scalar_conversion import scalar_from_protobuf, scalar_to_protobuf
+from ni.protobuf.types.vector_conversion import vector_from_protobuf, vector_to_protobuf
+from ni.protobuf.types.xydata_conversion import (
+    float64_xydata_from_protobuf,
+    float64_xydata_to_protobuf,
+)
+
+_TYPE_URL_PREFIX = "type.googleapis.com/"
+
+
+class Converter(NamedTuple):
+    """Functions that convert between a Python type and a protobuf message type."""
+
+    message_type: type[Message]
+    """The protobuf message type."""
+
+    from_protobuf: Callable[[Any], Any]
+    """Converts a protobuf message to a Python object."""
+
+    python_type: type | None = None
+    """The Python type to convert from, or None if the converter only converts from protobuf."""
+
+    dtype_type: type[np.generic] | None = None
+    """The scalar type of the Python object's dtype, for Python types that are generic over a
+    NumPy dtype, such as AnalogWaveform. If None, the converter accepts any dtype."""
+
+    to_protobuf: Callable[[Any], Message] | None = None
+    """Converts a Python object to a protobuf message."""
+
+    to_protobuf_bytes: Callable[[Any], bytes] | None = None
+    """Converts a Python object directly to a serialized protobuf message, if supported."""
+
+    from_protobuf_bytes: Callable[[Buffer], Any] | None = None
+    """Converts a serialized protobuf message directly to a Python object, if supported."""
+
+
+class _Registration(NamedTuple):
+    converter: Converter
+    type_url: str
+
+
+class ConverterRegistry:
+    """Maps Python types and protobuf message types to converters.
+
+    Converters are found with dictionary lookups instead of isinstance checks, and the
+    converters for ``google.protobuf.Any`` type URLs are cached, so the cost of dispatching a
+    value does not depend on the number of registered converters.
+    """
+
+    __slots__ = (
+        "_by_python_type",
+        "_by_python_dtype",
+        "_by_derived_type",
+        "_by_message_type",
+        "_by_type_url",
+    )
+
+    def __init__(self) -> None:
+        """Initialize an empty ConverterRegistry."""
+        self._by_python_type: dict[type, _Registration] = {}
+        self._by_python_dtype: dict[type, dict[type[np.generic], _Registration]] = {}
+        self._by_derived_type: dict[type, _Registration] = {}
+        self._by_message_type: dict[type[Message], _Registration] = {}
+        self._by_type_url: dict[str, _Registration] = {}
+
+    def register(self, converter: Converter, /) -> None:
+        """Register a converter.
+
+        The converter replaces any converter previously registered for the same Python type
+        and dtype, and for the same protobuf message type.
+        """
+        if converter.python_type is not None and converter.to_protobuf is None:
+            raise ValueError("A converter with a Python type must have a to_protobuf function.")
+
+        registration = _Registration(
+            converter, _TYPE_URL_PREFIX + converter.message_type.DESCRIPTOR.full_name
+        )
+        if converter.python_type is None:
+            pass
+        elif converter.dtype_type is None:
+            self._by_python_type[converter.python_type] = registration
+        else:
+            self._by_python_dtype.setdefault(converter.python_type, {})[
+                converter.dtype_type
+            ] = registration
+        self._by_message_type[converter.message_type] = registration
+        # The new converter may apply to a derived class that was resolved to a base class.
+        self._by_derived_type.clear()
+        # Replacing a converter invalidates the cached type URLs that refer to its message type.
+        self._by_type_url = {
+            type_url: cached
+            for type_url, cached in self._by_type_url.items()
+            if cached.converter.message_type is not converter.message_type
+        }
+        self._by_type_url[registration.type_url] = registration
+
+    def get_converter(self, value: object, /) -> Converter:
+        """Get the converter for a Python object."""
+        return self._get_python_registration(value).converter
+
+    def get_message_converter(self, message_type: type[Message] | str, /) -> Converter:
+        """Get the converter for a protobuf message type or ``google.protobuf.Any`` type URL."""
+        if isinstance(message_type, str):
+            return self._get_type_url_registration(message_type).converter
+        registration = self._by_message_type.get(message_type)
+        if registration is None:
+            raise TypeError(f"No converter is registered for message type: {message_type}")
+        return registration.converter
+
+    def to_protobuf(self, value: object, /) -> Message:
+        """Convert a Python object to a protobuf message."""
+        converter = self._get_python_registration(value).converter
+        assert converter.to_protobuf is not None
+        return converter.to_protobuf(value)
+
+    def from_protobuf(self, message: Message, /) -> Any:
+        """Convert a protobuf message to a Python object."""
+        registration = self._by_message_type.get(type(message))
+        if registration is None:
+            raise TypeError(f"No converter is registered for message type: {type(message)}")
+        return registration.converter.from_protobuf(message)
+
+    def to_any(self, value: object, /) -> any_pb2.Any:
+        """Convert a Python object to a ``google.protobuf.Any``.
+
+        If the converter can serialize the object directly, the protobuf message is not
+        created.
+        """
+        converter, type_url = self._get_python_registration(value)
+        if converter.to_protobuf_bytes is not None:
+            data = converter.to_protobuf_bytes(value)
+        else:
+            assert converter.to_protobuf is not None
+            data = converter.to_protobuf(value).SerializeToString()
+        return any_pb2.Any(type_url=type_url, value=data)
+
+    def from_any(self, message: any_pb2.Any, /) -> Any:
+        """Convert a ``google.protobuf.Any`` to a Python object.
+
+        If the converter can deserialize the object directly, the protobuf message is not
+        created, and the object's data may be a read-only view of ``message.value``.
+        """
+        converter = self._get_type_url_registration(message.type_url).converter
+        if converter.from_protobuf_bytes is not None:
+            return converter.from_protobuf_bytes(message.value)
+        return converter.from_protobuf(converter.message_type.FromString(message.value))
+
+    def _get_python_registration(self, value: object) -> _Registration:
+        value_type = type(value)
+        registration = self._by_python_type.get(value_type)
+        if registration is not None:
+            return registration
+
+        by_dtype = self._by_python_dtype.get(value_type)
+        if by_dtype is not None:
+            dtype_type = getattr(value, "dtype").type
+            registration = by_dtype.get(dtype_type)
+            if registration is None:
+                raise TypeError(
+                    f"No converter is registered for type: {value_type} with dtype: "
+                    f"{getattr(value, 'dtype')}"
+                )
+            return registration
+
+        registration = self._by_derived_type.get(value_type)
+        if registration is not None:
+            return registration
+
+        # Fall back to the base classes, and cache the result for the derived class.
+        for base_type in value_type.__mro__[1:]:
+            registration = self._by_python_type.get(base_type)
+            if registration is not None:
+                self._by_derived_type[value_type] = registration
+                return registration
+        raise TypeError(f"No converter is registered for type: {value_type}")
+
+    def _get_type_url_registration(self, type_url: str) -> _Registration:
+        registration = self._by_type_url.get(type_url)
+        if registration is not None:
+            return registration
+
+        # Like Any.Is(), ignore the type URL's prefix and compare the message's full name.
+        full_name = type_url.rpartition("/")[2]
+        for registration in self._by_message_type.values():
+            if registration.converter.message_type.DESCRIPTOR.full_name == full_name:
+                self._by_type_url[type_url] = registration
+                return registration
+        raise TypeError(f"No converter is registered for type URL: {type_url}")
+
+
+def _create_default_registry() -> ConverterRegistry:
+    registry = ConverterRegistry()
+    for converter in [
+        Converter(scalar_pb2.Scalar, scalar_from_protobuf, Scalar, to_protobuf=scalar_to_protobuf),
+        Converter(vector_pb2.Vector, vector_from_protobuf, Vector, to_protobuf=vector_to_protobuf),
+        Converter(
+            xydata_pb2.DoubleXYData,
+            float64_xydata_from_protobuf,
+            XYData,
+            to_protobuf=float64_xydata_to_protobuf,
+        ),
+        # hightime is registered first so that bintime is used when converting from protobuf.
+        Converter(
+            precision_timestamp_pb2.PrecisionTimestamp,
+            ptc.hightime_datetime_from_protobuf,
+            ht.datetime,
+            to_protobuf=ptc.hightime_datetime_to_protobuf,
+        ),
+        Converter(
+            precision_timestamp_pb2.PrecisionTimestamp,
+            ptc.bintime_datetime_from_protobuf,
+            bt.DateTime,
+            to_protobuf=ptc.bintime_datetime_to_protobuf,
+        ),
+        Converter(
+            precision_duration_pb2.PrecisionDuration,
+            pdc.hightime_timedelta_from_protobuf,
+            ht.timedelta,
+            to_protobuf=pdc.hightime_timedelta_to_protobuf,
+        ),
+        Converter(
+            precision_duration_pb2.PrecisionDuration,
+            pdc.bintime_timedelta_from_protobuf,
+            bt.TimeDelta,
+            to_protobuf=pdc.bintime_timedelta_to_protobuf,
+        ),
+        Converter(
+            array_pb2.Double2DArray,
+            array_conversion.double_2d_array_from_protobuf,
+            np.ndarray,
+            np.float64,
+            to_protobuf=array_conversion.double_2d_array_to_protobuf,
+            from_protobuf_bytes=array_conversion.double_2d_array_from_protobuf_bytes,
+        ),
+        Converter(
+            array_pb2.String2DArray,
+            array_conversion.string_2d_array_from_protobuf,
+            np.ndarray,
+            np.str_,
+            to_protobuf=array_conversion.string_2d_array_to_protobuf,
+        ),
+        Converter(
+            array_pb2.String2DArray,
+            array_conversion.string_2d_array_from_protobuf,
+            np.ndarray,
+            np.object_,
+            to_protobuf=array_conversion.string_2d_array_to_protobuf,
+        ),
+        Converter(
+            waveform_pb2.DoubleAnalogWaveform,
+            wfc.float64_analog_waveform_from_protobuf,
+            AnalogWaveform,
+            np.float64,
+            to_protobuf=wfc.float64_analog_waveform_to_protobuf,
+            to_protobuf_bytes=wfc.float64_analog_waveform_to_protobuf_bytes,
+            from_protobuf_bytes=wfc.float64_analog_waveform_from_protobuf_bytes,
+        ),
+        Converter(
+            waveform_pb2.FloatAnalogWaveform,
+            wfc.float32_analog_waveform_from_protobuf,
+            AnalogWaveform,
+            np.float32,
+            to_protobuf=wfc.float32_analog_waveform_to_protobuf,
+            to_protobuf_bytes=wfc.float32_analog_waveform_to_protobuf_bytes,
+            from_protobuf_bytes=wfc.float32_analog_waveform_from_protobuf_bytes,
+        ),
+        Converter(
+            waveform_pb2.I16AnalogWaveform,
+            wfc.int16_analog_waveform_from_protobuf,
+            AnalogWaveform,
+            np.int16,
+            to_protobuf=wfc.int16_analog_waveform_to_protobuf,
+            to_protobuf_bytes=wfc.int16_analog_waveform_to_protobuf_bytes,
+            from_protobuf_bytes=wfc.int16_analog_waveform_from_protobuf_bytes,
+        ),
+        Converter(
+            waveform_pb2.DoubleComplexWaveform,
+            wfc.float64_complex_waveform_from_protobuf,
+            ComplexWaveform,
+            np.complex128,
+            to_protobuf=wfc.float64_complex_waveform_to_protobuf,
+            to_protobuf_bytes=wfc.float64_complex_waveform_to_protobuf_bytes,
+            from_protobuf_bytes=wfc.float64_complex_waveform_from_protobuf_bytes,
+        ),
+        Converter(
+            waveform_pb2.FloatComplexWaveform,
+            wfc.float32_complex_waveform_from_protobuf,
+            ComplexWaveform,
+            np.complex64,
+            to_protobuf=wfc.float32_complex_waveform_to_protobuf,
+            to_protobuf_bytes=wfc.float32_complex_waveform_to_protobuf_bytes,
+            from_protobuf_bytes=wfc.float32_complex_waveform_from_protobuf_bytes,
+        ),
+        Converter(
+            waveform_pb2.I16ComplexWaveform,
+            wfc.int16_complex_waveform_from_protobuf,
+            ComplexWaveform,
+            ComplexInt32DType.type,
+            to_protobuf=wfc.int16_complex_waveform_to_protobuf,
+            to_protobuf_bytes=wfc.int16_complex_waveform_to_protobuf_bytes,
+            from_protobuf_bytes=wfc.int16_complex_waveform_from_protobuf_bytes,
+        ),
+        Converter(
+            waveform_pb2.DoubleSpectrum,
+            wfc.float64_spectrum_from_protobuf,
+            Spectrum,
+            np.float64,
+            to_protobuf=wfc.float64_spectrum_to_protobuf,
+        ),
+        Converter(
+            waveform_pb2.FloatSpectrum,
+            wfc.float32_spectrum_from_protobuf,
+            Spectrum,
+            np.float32,
+            to_protobuf=wfc.float32_spectrum_to_protobuf,
+        ),
+        Converter(
+            waveform_pb2.DigitalWaveform,
+            wfc.digital_waveform_from_protobuf,
+            DigitalWaveform,
+            to_protobuf=wfc.digital_waveform_to_protobuf,
+            to_protobuf_bytes=wfc.digital_waveform_to_protobuf_bytes,
+            from_protobuf_bytes=wfc.digital_waveform_from_protobuf_bytes,
+        ),
+        # A batch of waveforms is a Python sequence, so batches are only converted from protobuf.
+        Converter(
+            waveform_wrappers_pb2.DoubleAnalogWaveformArrayValue,
+            wwc.float64_analog_waveforms_from_protobuf,
+        ),
+        Converter(
+            waveform_wrappers_pb2.FloatAnalogWaveformArrayValue,
+            wwc.float32_analog_waveforms_from_protobuf,
+        ),
+        Converter(
+            waveform_wrappers_pb2.I16AnalogWaveformArrayValue,
+            wwc.int16_analog_waveforms_from_protobuf,
+        ),
+        Converter(
+            waveform_wrappers_pb2.DoubleComplexWaveformArrayValue,
+            wwc.float64_complex_waveforms_from_protobuf,
+        ),
+        Converter(
+            waveform_wrappers_pb2.FloatComplexWaveformArrayValue,
+            wwc.float32_complex_waveforms_from_protobuf,
+        ),
+        Converter(
+            waveform_wrappers_pb2.I16ComplexWaveformArrayValue,
+            wwc.int16_complex_waveforms_from_protobuf,
+        ),
+        Converter(
+            waveform_wrappers_pb2.DoubleSpectrumArrayValue,
+            wwc.float64_spectra_from_protobuf,
+        ),
+        Converter(
+            waveform_wrappers_pb2.FloatSpectrumArrayValue,
+            wwc.float32_spectra_from_protobuf,
+        ),
+        Converter(
+            waveform_wrappers_pb2.DigitalWaveformArrayValue,
+            wwc.digital_waveforms_from_protobuf,
+        ),
+    ]:
+        registry.register(converter)
+    return registry
+
+
+default_registry = _create_default_registry()
+"""The registry used by :func:`to_protobuf`, :func:`from_protobuf`, :func:`to_any`, and
+:func:`from_any`. It has converters for the types supported by the ``*_conversion`` modules."""
+
+
+def register_converter(converter: Converter, /) -> None:
+    """Register a converter with the default registry."""
+    default_registry.register(converter)
+
+
+def to_protobuf(value: object, /) -> Message:
+    """Convert a Python object to a protobuf message using the default registry."""
+    return default_registry.to_protobuf(value)
+
+
+def from_protobuf(message: Message, /) -> Any:
+    """Convert a protobuf message to a Python object using the default registry."""
+    return default_registry.from_protobuf(message)
+
+
+def to_any(value: object, /) -> any_pb2.Any:
+    """Convert a Python object to a ``google.protobuf.Any`` using the default registry."""
+    return default_registry.to_any(value)
+
+
+def from_any(message: any_pb2.Any, /) -> Any:
+    """Convert a ``google.protobuf.Any`` to a Python object using the default registry."""
+    return default_registry.from_any(message)
@@ -2,18 +2,36 @@
 
 from __future__ import annotations
 
-from collections.abc import Mapping
+import struct
+import threading
+from collections import OrderedDict
+from collections.abc import Hashable, Mapping
+from typing import Generic, NamedTuple, TypeVar
 
+from google.protobuf.message import Message
 from nitypes.waveform import ExtendedPropertyDictionary
 from nitypes.waveform.typing import ExtendedPropertyValue
 
 from ni.protobuf.types.attribute_value_pb2 import AttributeValue
 
+DEFAULT_ATTRIBUTE_CACHE_SIZE = 256
+"""The default maximum number of entries in each attribute cache."""
+
+_DOUBLE = struct.Struct("<d")
+
+_TKey = TypeVar("_TKey", bound=Hashable)
+_TValue = TypeVar("_TValue")
+_TMessage = TypeVar("_TMessage", bound=Message)
+
 
 def extended_properties_to_protobuf(
     extended_properties: ExtendedPropertyDictionary,
 ) -> dict[str, AttributeValue]:
-    """Convert an ExtendedPropertyDictionary to an AttributeValue map."""
+    """Convert an ExtendedPropertyDictionary to an AttributeValue map.
+
+    This function does not use the attribute cache, because the AttributeValue messages are
+    created directly.
+    """
     return {key: _value_to_attribute(value) for key, value in extended_properties.items()}
 
 
@@ -37,9 +55,206 @@ def extended_properties_from_protobuf(
     attributes: Mapping[str, AttributeValue],
     extended_properties: ExtendedPropertyDictionary,
 ) -> None:
-    """Convert an AttributeValue map and insert values into an ExtendedPropertyDictionary."""
+    """Convert an AttributeValue map and insert values into an ExtendedPropertyDictionary.
+
+    This function does not use the attribute cache, because it is keyed on serialized
+    attributes, and serializing the map costs more than converting it.
+    """
     for key, value in attributes.items():
         attr_type = value.WhichOneof("attribute")
         if attr_type is None:
             raise ValueError("Could not determine the data type of 'attribute'.")
         extended_properties[key] = getattr(value, attr_type)
+
+
+class CacheInfo(NamedTuple):
+    """Statistics for an attribute cache."""
+
+    hits: int
+    misses: int
+    maxsize: int
+    currsize: int
+
+
+class AttributeCacheInfo(NamedTuple):
+    """Statistics for the attribute caches used by the conversion functions."""
+
+    to_protobuf: CacheInfo
+    """The cache of serialized attributes, keyed on message type and extended properties.
+
+    It is used by the functions that convert Python objects to protobuf messages or serialized
+    messages.
+    """
+
+    from_protobuf: CacheInfo
+    """The cache of extended properties, keyed on serialized attributes.
+
+    It is used by the functions that convert serialized messages, such as the
+    ``*_from_protobuf_bytes`` functions and views of serialized waveforms. The functions that
+    convert protobuf messages read the attributes directly, because serializing them to look up
+    the cache costs more than converting them.
+    """
+
+
+def get_attribute_cache_info() -> AttributeCacheInfo:
+    """Get the hit and miss counters of the attribute caches."""
+    return AttributeCacheInfo(_to_protobuf_cache.info(), _from_protobuf_cache.info())
+
+
+def clear_attribute_cache() -> None:
+    """Clear the attribute caches and reset their counters."""
+    _to_protobuf_cache.clear()
+    _from_protobuf_cache.clear()
+
+
+def set_attribute_cache_size(maxsize: int) -> None:
+    """Set the maximum number of entries in each attribute cache.
+
+    A size of zero disables caching.
+    """
+    if maxsize < 0:
+        raise ValueError(f"The cache size must be a non-negative integer.\n\nSize: {maxsize}")
+    _to_protobuf_cache.resize(maxsize)
+    _from_protobuf_cache.resize(maxsize)
+
+
+class _LruCache(Generic[_TKey, _TValue]):
+    """A thread-safe, bounded, least recently used cache with hit and miss counters."""
+
+    __slots__ = ("_entries", "_lock", "_maxsize", "_hits", "_misses")
+
+    def __init__(self, maxsize: int) -> None:
+        self._entries: OrderedDict[_TKey, _TValue] = OrderedDict()
+        self._lock = threading.Lock()
+        self._maxsize = maxsize
+        self._hits = 0
+        self._misses = 0
+
+    def get(self, key: _TKey) -> _TValue | None:
+        with self._lock:
+            value = self._entries.get(key)
+            if value is not None:
+                self._hits += 1
+                self._entries.move_to_end(key)
+            return value
+
+    def put(self, key: _TKey, value: _TValue) -> None:
+        with self._lock:
+            self._misses += 1
+            if self._maxsize > 0:
+                self._entries[key] = value
+                if len(self._entries) > self._maxsize:
+                    self._entries.popitem(last=False)
+
+    def info(self) -> CacheInfo:
+        with self._lock:
+            return CacheInfo(self._hits, self._misses, self._maxsize, len(self._entries))
+
+    def clear(self) -> None:
+        with self._lock:
+            self._entries.clear()
+            self._hits = self._misses = 0
+
+    def resize(self, maxsize: int) -> None:
+        with self._lock:
+            self._maxsize = maxsize
+            while len(self._entries) > maxsize:
+                self._entries.popitem(last=False)
+
+
+_to_protobuf_cache: _LruCache[Hashable, tuple[bytes, bytes]] = _LruCache(
+    DEFAULT_ATTRIBUTE_CACHE_SIZE
+)
+_from_protobuf_cache: _LruCache[bytes, dict[str, ExtendedPropertyValue]] = _LruCache(
+    DEFAULT_ATTRIBUTE_CACHE_SIZE
+)
+
+
+def _extended_properties_key(extended_properties: Mapping[str, ExtendedPropertyValue]) -> Hashable:
+    # Include the value types so that True, 1, and 1.0 have different keys. Floats are compared
+    # by their bit pattern, so 0.0 and -0.0 have different keys and NaN matches itself.
+    return tuple(
+        (name, type(value), _DOUBLE.pack(value) if isinstance(value, float) else value)
+        for name, value in extended_properties.items()
+    )
+
+
+def _merge_attributes(
+    message: _TMessage, extended_properties: Mapping[str, ExtendedPropertyValue]
+) -> _TMessage:
+    """Merge an ExtendedPropertyDictionary into the attributes field of a protobuf message.
+
+    The message type must have an ``attributes`` map field whose values are AttributeValue or
+    WaveformAttributeValue messages. The serialized attributes are cached, so converting
+    messages with the same extended properties only converts the properties once.
+    """
+    message.MergeFromString(_get_cached_attributes(type(message), extended_properties)[0])
+    return message
+
+
+def _get_serialized_attributes(
+    message_type: type[Message], extended_properties: Mapping[str, ExtendedPropertyValue]
+) -> bytes:
+    """Get the serialized attributes field of a message type for the extended properties.
+
+    The result matches how a message created by _merge_attributes serializes the field.
+    """
+    return _get_cached_attributes(message_type, extended_properties)[1]
+
+
+def _get_cached_attributes(
+    message_type: type[Message], extended_properties: Mapping[str, ExtendedPropertyValue]
+) -> tuple[bytes, bytes]:
+    key: Hashable = (message_type, _extended_properties_key(extended_properties))
+    try:
+        cached_attributes = _to_protobuf_cache.get(key)
+    except TypeError:
+        # An unhashable value is not a valid extended property value, so let the conversion
+        # below report it.
+        key = cached_attributes = None
+    if cached_attributes is None:
+        # AttributeValue and WaveformAttributeValue have the same fields, so the attribute
+        # values are specified as dictionaries that either message type accepts.
+        attributes = {
+            name: _value_to_attribute_fields(value) for name, value in extended_properties.items()
+        }
+        merged_attributes = message_type(attributes=attributes).SerializeToString()
+        # Map entries are serialized in hash table order, which depends on the order they were
+        # inserted in. Serialize the map the way a message that merged it does.
+        serialized_attributes = message_type.FromString(merged_attributes).SerializeToString()
+        cached_attributes = (merged_attributes, serialized_attributes)
+        if key is not None:
+            _to_protobuf_cache.put(key, cached_attributes)
+    return cached_attributes
+
+
+def _value_to_attribute_fields(value: ExtendedPropertyValue) -> dict[str, ExtendedPropertyValue]:
+    if isinstance(value, bool):
+        return {"bool_value": value}
+    elif isinstance(value, int):
+        return {"integer_value": value}
+    elif isinstance(value, float):
+        return {"double_value": value}
+    elif isinstance(value, str):
+        return {"string_value": value}
+    else:
+        raise TypeError(f"Unexpected type for extended property value {type(value)}")
+
+
+def _get_extended_properties(
+    message_type: type[Message], serialized_attributes: bytes
+) -> dict[str, ExtendedPropertyValue]:
+    """Get a new dictionary of the extended properties in a serialized attributes field."""
+    if not serialized_attributes:
+        return {}
+    extended_properties = _from_protobuf_cache.get(serialized_attributes)
+    if extended_properties is None:
+        extended_properties = {}
+        attributes = message_type.FromString(serialized_attributes).attributes  # type: ignore[attr-defined]
+        for key, value in attributes.items():
+            attr_type = value.WhichOneof("attribute")
+            if attr_type is None:
+                raise ValueError("Could not determine the data type of 'attribute'.")
+            extended_properties[key] = getattr(value, attr_type)
+        _from_protobuf_cache.put(serialized_attributes, extended_properties)
+    return dict(extended_properties)
@@ -2,13 +2,19 @@
 
 from __future__ import annotations
 
+from collections.abc import Collection
+
 import hightime as ht
 import nitypes.bintime as bt
+import numpy as np
+import numpy.typing as npt
 from nitypes.time import convert_datetime
 
+from ni.protobuf.types._wire_format import encode_precision_timestamps
 from ni.protobuf.types.precision_timestamp_pb2 import (
     PrecisionTimestamp,
 )
+from ni.protobuf.types.waveform_pb2 import DoubleAnalogWaveform
 
 
 def bintime_datetime_to_protobuf(value: bt.DateTime, /) -> PrecisionTimestamp:
@@ -34,3 +40,61 @@ def hightime_datetime_from_protobuf(message: PrecisionTimestamp, /) -> ht.dateti
     bt_datetime = bintime_datetime_from_protobuf(message)
     ht_datetime = convert_datetime(ht.datetime, bt_datetime)
     return ht_datetime
+
+
+def precision_timestamps_to_arrays(
+    messages: Collection[PrecisionTimestamp], /
+) -> tuple[npt.NDArray[np.int64], npt.NDArray[np.uint64]]:
+    """Convert protobuf PrecisionTimestamps to arrays of whole and fractional seconds.
+
+    This is a bulk alternative to converting each PrecisionTimestamp separately. It reads the
+    fields of each message, but it does not create a NI-BTF DateTime or hightime.datetime per
+    timestamp.
+    """
+    count = len(messages)
+    seconds = np.fromiter((message.seconds for message in messages), np.int64, count)
+    fractional_seconds = np.fromiter(
+        (message.fractional_seconds for message in messages), np.uint64, count
+    )
+    return seconds, fractional_seconds
+
+
+def precision_timestamps_from_arrays(
+    seconds: npt.ArrayLike, fractional_seconds: npt.ArrayLike, /
+) -> list[PrecisionTimestamp]:
+    """Convert arrays of whole and fractional seconds to a list of protobuf PrecisionTimestamps.
+
+    The timestamps are encoded with vectorized NumPy operations and parsed by the protobuf
+    runtime in one pass. Use the result to initialize or extend a repeated PrecisionTimestamp
+    field, such as the ``timestamps`` field of a waveform message.
+    """
+    seconds_array, fractional_seconds_array = _validate_timestamp_arrays(
+        seconds, fractional_seconds
+    )
+    holder = DoubleAnalogWaveform()
+    holder.MergeFromString(
+        encode_precision_timestamps(
+            DoubleAnalogWaveform.TIMESTAMPS_FIELD_NUMBER, seconds_array, fractional_seconds_array
+        )
+    )
+    return list(holder.timestamps)
+
+
+def _validate_timestamp_arrays(
+    seconds: npt.ArrayLike, fractional_seconds: npt.ArrayLike
+) -> tuple[npt.NDArray[np.int64], npt.NDArray[np.uint64]]:
+    seconds_array = np.asarray(seconds)
+    fractional_seconds_array = np.asarray(fractional_seconds)
+    if seconds_array.ndim != 1 or fractional_seconds_array.ndim != 1:
+        raise ValueError("The seconds and fractional_seconds arrays must be one-dimensional.")
+    if len(seconds_array) != len(fractional_seconds_array):
+        raise ValueError(
+            f"The seconds array length ({len(seconds_array)}) does not match the "
+            f"fractional_seconds array length ({len(fractional_seconds_array)})."
+        )
+    if fractional_seconds_array.dtype.kind == "i" and (fractional_seconds_array < 0).any():
+        raise ValueError("The fractional_seconds array must not contain negative values.")
+    return (
+        seconds_array.astype(np.int64, copy=False),
+        fractional_seconds_array.astype(np.uint64, copy=False),
+    )
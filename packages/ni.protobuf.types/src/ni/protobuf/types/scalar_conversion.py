@@ -2,16 +2,22 @@
 
 from __future__ import annotations
 
-from typing import Union
+from collections.abc import Iterator, Mapping, Sequence
+from typing import Any, Union
 
+import numpy as np
+import numpy.typing as npt
 from nitypes.scalar import Scalar
+from nitypes.waveform.typing import ExtendedPropertyValue
 from typing_extensions import TypeAlias
 
 from ni.protobuf.types import scalar_pb2
+from ni.protobuf.types.conversion_context import _validate_input
 from ni.protobuf.types.extended_property_conversion import (
+    _merge_attributes,
     extended_properties_from_protobuf,
-    extended_properties_to_protobuf,
 )
+from ni.protobuf.types.vector_conversion import _properties_with_units
 
 AnyScalarType: TypeAlias = Union[bool, int, float, str]
 _SCALAR_TYPE_TO_PB_ATTR_MAP = {
@@ -24,11 +30,11 @@ _SCALAR_TYPE_TO_PB_ATTR_MAP = {
 
 def scalar_to_protobuf(value: Scalar[AnyScalarType], /) -> scalar_pb2.Scalar:
     """Convert a Scalar python object to a protobuf scalar_pb2.Scalar."""
-    attributes = extended_properties_to_protobuf(value.extended_properties)
-    message = scalar_pb2.Scalar(attributes=attributes)
+    message = _merge_attributes(scalar_pb2.Scalar(), value.extended_properties)
 
     # Convert the scalar value
-    _check_scalar_value(value.value)
+    if _validate_input():
+        _check_scalar_value(value.value)
     value_attr = _SCALAR_TYPE_TO_PB_ATTR_MAP.get(type(value.value), None)
     if not value_attr:
         raise TypeError(f"Unexpected type for value.value: {type(value.value)}")
@@ -45,7 +51,7 @@ def scalar_from_protobuf(message: scalar_pb2.Scalar, /) -> Scalar[AnyScalarType]
     if pb_type is None:
         raise ValueError("Could not determine the data type of 'value'.")
 
-    if pb_type not in _SCALAR_TYPE_TO_PB_ATTR_MAP.values():
+    if _validate_input() and pb_type not in _SCALAR_TYPE_TO_PB_ATTR_MAP.values():
         raise ValueError(f"Unexpected value for protobuf_value.WhichOneOf: {pb_type}")
     value = getattr(message, pb_type)
 
@@ -59,6 +65,114 @@ def scalar_from_protobuf(message: scalar_pb2.Scalar, /) -> Scalar[AnyScalarType]
     return scalar
 
 
+def array_to_scalar_protobufs(
+    values: npt.NDArray[Any] | Sequence[AnyScalarType],
+    /,
+    *,
+    units: str = "",
+    extended_properties: Mapping[str, ExtendedPropertyValue] | None = None,
+) -> list[scalar_pb2.Scalar]:
+    """Convert a one-dimensional array or list of values to protobuf scalar_pb2.Scalar messages.
+
+    Every message has the same units and extended properties. The attributes are converted
+    once and copied to each message, and integer values are range checked with a single
+    vectorized min/max check.
+
+    To publish the values as one packed vector, use
+    :func:`ni.protobuf.types.vector_conversion.array_to_vector_protobuf` instead.
+    """
+    array = np.asarray(values)
+    if array.ndim != 1:
+        raise ValueError(
+            f"The array must be one-dimensional.\n\nNumber of dimensions: {array.ndim}"
+        )
+    template = _merge_attributes(
+        scalar_pb2.Scalar(), _properties_with_units(units, extended_properties)
+    )
+    if not len(array):
+        return []
+
+    if array.dtype == np.bool_:
+        value_attr = "bool_value"
+    elif np.issubdtype(array.dtype, np.integer):
+        if _validate_input() and (array.min() <= -0x80000000 or array.max() >= 0x7FFFFFFF):
+            raise ValueError("The integer value in a scalar must be within the range of an Int32.")
+        value_attr = "sint32_value"
+    elif np.issubdtype(array.dtype, np.floating):
+        value_attr = "double_value"
+    elif array.dtype.kind in "OU":
+        value_attr = "string_value"
+    else:
+        raise TypeError(f"Invalid array value type: {array.dtype}")
+
+    # tolist() converts the values to Python objects in one step.
+    python_values = array.tolist()
+    if (
+        value_attr == "string_value"
+        and _validate_input()
+        and not all(isinstance(value, str) for value in python_values)
+    ):
+        raise TypeError("Object arrays must contain only str values.")
+
+    messages = []
+    for python_value in python_values:
+        message = scalar_pb2.Scalar()
+        message.CopyFrom(template)
+        setattr(message, value_attr, python_value)
+        messages.append(message)
+    return messages
+
+
+def array_from_scalar_protobufs(
+    messages: Sequence[scalar_pb2.Scalar], /, *, dtype: npt.DTypeLike | None = None
+) -> npt.NDArray[Any]:
+    """Convert a sequence of protobuf scalar_pb2.Scalar messages to a NumPy array.
+
+    The messages must all have the same value type. By default, the array's dtype is bool,
+    int32, float64, or object (for strings), depending on the value type, and an empty sequence
+    produces an empty float64 array. If ``dtype`` is specified, the array is converted to it.
+    The attributes are not converted; use :func:`scalar_from_protobuf` to convert the
+    attributes of a message.
+    """
+    if not len(messages):
+        return np.empty(0, np.float64 if dtype is None else dtype)
+    pb_type = messages[0].WhichOneof("value")
+    if pb_type is None:
+        raise ValueError("Could not determine the data type of 'value'.")
+
+    value_dtype: npt.DTypeLike
+    if pb_type == "bool_value":
+        value_dtype = np.bool_
+    elif pb_type == "sint32_value":
+        value_dtype = np.int32
+    elif pb_type == "double_value":
+        value_dtype = np.float64
+    elif pb_type == "string_value":
+        # np.fromiter() does not support object arrays in NumPy < 1.23.
+        value_dtype = object
+    else:
+        raise ValueError(f"Unexpected value for protobuf_value.WhichOneOf: {pb_type}")
+
+    values: npt.NDArray[Any]
+    if value_dtype is object:
+        values = np.empty(len(messages), object)
+        values[:] = list(_iter_scalar_values(messages, pb_type))
+    else:
+        values = np.fromiter(
+            _iter_scalar_values(messages, pb_type), value_dtype, count=len(messages)
+        )
+    return values if dtype is None else values.astype(dtype, copy=False)
+
+
+def _iter_scalar_values(
+    messages: Sequence[scalar_pb2.Scalar], pb_type: str
+) -> Iterator[AnyScalarType]:
+    for message in messages:
+        if message.WhichOneof("value") != pb_type:
+            raise ValueError("The scalars must all have the same value type.")
+        yield getattr(message, pb_type)
+
+
 def _check_scalar_value(value: AnyScalarType) -> None:
     """Perform value checking on a scalar value."""
     if isinstance(value, int):
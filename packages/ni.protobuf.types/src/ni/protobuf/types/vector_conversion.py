@@ -2,21 +2,33 @@
 
 from __future__ import annotations
 
+from collections.abc import Mapping
 from typing import TYPE_CHECKING, Any, cast
 
+import numpy as np
+import numpy.typing as npt
 from nitypes.vector import Vector
+from nitypes.waveform import ExtendedPropertyDictionary
+from nitypes.waveform.typing import ExtendedPropertyValue
 
 from ni.protobuf.types import array_pb2
 from ni.protobuf.types import vector_pb2
-from ni.protobuf.types.attribute_value_pb2 import AttributeValue
+from ni.protobuf.types._wire_format import (
+    encode_length_delimited,
+    encode_packed_fixed,
+    encode_packed_sint32,
+)
+from ni.protobuf.types.conversion_context import _validate_input
 from ni.protobuf.types.extended_property_conversion import (
+    _merge_attributes,
     extended_properties_from_protobuf,
-    extended_properties_to_protobuf,
 )
 
 if TYPE_CHECKING:
     from ni.protobuf.types.scalar_conversion import AnyScalarType
 
+_UNIT_DESCRIPTION = "NI_UnitDescription"
+
 _VECTOR_TYPE_TO_PB_ATTR_MAP = {
     bool: "bool_array",
     int: "sint32_array",
@@ -30,9 +42,12 @@ def vector_to_protobuf(value: Vector[Any], /) -> vector_pb2.Vector:
     if not len(value):
         raise ValueError("Cannot convert an empty vector.")
 
-    _check_vector_values(value)
-    attributes = extended_properties_to_protobuf(value.extended_properties)
-    return _create_vector_message(value, attributes)
+    # Slicing copies the backing list in one step, which is much faster than iterating the
+    # Vector one element at a time.
+    values = cast(list[Any], value[:])
+    if _validate_input():
+        _check_vector_values(values)
+    return _merge_attributes(_create_vector_message(values), value.extended_properties)
 
 
 def vector_from_protobuf(message: vector_pb2.Vector, /) -> Vector[AnyScalarType]:
@@ -41,7 +56,7 @@ def vector_from_protobuf(message: vector_pb2.Vector, /) -> Vector[AnyScalarType]
     if pb_type is None:
         raise ValueError("Could not determine the data type of 'value'.")
 
-    if pb_type not in _VECTOR_TYPE_TO_PB_ATTR_MAP.values():
+    if _validate_input() and pb_type not in _VECTOR_TYPE_TO_PB_ATTR_MAP.values():
         raise ValueError(f"Unexpected value for protobuf_value.WhichOneOf: {pb_type}")
 
     value: (
@@ -59,32 +74,131 @@ def vector_from_protobuf(message: vector_pb2.Vector, /) -> Vector[AnyScalarType]
     return vector
 
 
+def array_to_vector_protobuf(
+    values: npt.NDArray[Any],
+    /,
+    *,
+    units: str = "",
+    extended_properties: Mapping[str, ExtendedPropertyValue] | None = None,
+) -> vector_pb2.Vector:
+    """Convert a one-dimensional NumPy array to a protobuf vector_pb2.Vector.
+
+    Boolean, integer, and floating-point arrays are written directly from the array's buffer,
+    and integer arrays are range checked with a single vectorized min/max check. Arrays of
+    str or object are converted element by element.
+    """
+    if values.ndim != 1:
+        raise ValueError(
+            f"The array must be one-dimensional.\n\nNumber of dimensions: {values.ndim}"
+        )
+    if not len(values):
+        raise ValueError("Cannot convert an empty vector.")
+
+    message = _merge_attributes(
+        vector_pb2.Vector(), _properties_with_units(units, extended_properties)
+    )
+
+    if values.dtype == np.bool_:
+        bool_values = np.ascontiguousarray(values).view(np.uint8)
+        message.bool_array.MergeFromString(
+            b"".join(
+                encode_length_delimited(array_pb2.BoolArray.VALUES_FIELD_NUMBER, bool_values.data)
+            )
+        )
+    elif np.issubdtype(values.dtype, np.integer):
+        if _validate_input() and (values.min() <= -0x80000000 or values.max() >= 0x7FFFFFFF):
+            raise ValueError("Integer values in a vector must be within the range of an Int32.")
+        message.sint32_array.MergeFromString(
+            b"".join(encode_packed_sint32(array_pb2.SInt32Array.VALUES_FIELD_NUMBER, values))
+        )
+    elif np.issubdtype(values.dtype, np.floating):
+        message.double_array.MergeFromString(
+            b"".join(
+                encode_packed_fixed(
+                    array_pb2.DoubleArray.VALUES_FIELD_NUMBER, values.astype(np.float64, copy=False)
+                )
+            )
+        )
+    elif values.dtype.kind in "OU":
+        string_values = values.tolist()
+        if _validate_input() and not all(isinstance(value, str) for value in string_values):
+            raise TypeError("Object arrays must contain only str values.")
+        message.string_array.values.extend(string_values)
+    else:
+        raise TypeError(f"Invalid array value type: {values.dtype}")
+    return message
+
+
+def array_from_vector_protobuf(
+    message: vector_pb2.Vector, /
+) -> tuple[npt.NDArray[Any], ExtendedPropertyDictionary]:
+    """Convert the protobuf vector_pb2.Vector to a NumPy array and its extended properties.
+
+    The array's dtype is bool, int32, float64, or object (for strings), depending on the
+    message's value type. Numeric values are copied from the repeated field in one step.
+    """
+    pb_type = message.WhichOneof("value")
+    if pb_type is None:
+        raise ValueError("Could not determine the data type of 'value'.")
+
+    values: npt.NDArray[Any]
+    if pb_type == "bool_array":
+        values = np.array(message.bool_array.values, np.bool_)
+    elif pb_type == "sint32_array":
+        values = np.array(message.sint32_array.values, np.int32)
+    elif pb_type == "double_array":
+        values = np.array(message.double_array.values, np.float64)
+    elif pb_type == "string_array":
+        values = np.empty(len(message.string_array.values), object)
+        values[:] = message.string_array.values
+    else:
+        raise ValueError(f"Unexpected value for protobuf_value.WhichOneOf: {pb_type}")
+
+    extended_properties = ExtendedPropertyDictionary()
+    extended_properties_from_protobuf(message.attributes, extended_properties)
+    return values, extended_properties
+
+
+def _properties_with_units(
+    units: str, extended_properties: Mapping[str, ExtendedPropertyValue] | None
+) -> ExtendedPropertyDictionary:
+    properties = ExtendedPropertyDictionary(extended_properties)
+    if _UNIT_DESCRIPTION not in properties:
+        properties[_UNIT_DESCRIPTION] = units
+    elif units and units != properties[_UNIT_DESCRIPTION]:
+        raise ValueError(
+            "The specified units input does not match the units specified in "
+            "extended_properties."
+        )
+    return properties
+
+
 def _create_vector_message(
-    vector_obj: Vector[Any],
-    attributes: dict[str, AttributeValue],
+    vector_obj: list[Any],
 ) -> vector_pb2.Vector:
     if isinstance(vector_obj[0], bool):
-        bool_vector = cast(Vector[bool], vector_obj)
+        bool_vector = cast(list[bool], vector_obj)
         bool_array = array_pb2.BoolArray(values=bool_vector)
-        return vector_pb2.Vector(attributes=attributes, bool_array=bool_array)
+        return vector_pb2.Vector(bool_array=bool_array)
     elif isinstance(vector_obj[0], int):
-        int_vector = cast(Vector[int], vector_obj)
+        int_vector = cast(list[int], vector_obj)
         int_array = array_pb2.SInt32Array(values=int_vector)
-        return vector_pb2.Vector(attributes=attributes, sint32_array=int_array)
+        return vector_pb2.Vector(sint32_array=int_array)
     elif isinstance(vector_obj[0], float):
-        double_vector = cast(Vector[float], vector_obj)
+        double_vector = cast(list[float], vector_obj)
         double_array = array_pb2.DoubleArray(values=double_vector)
-        return vector_pb2.Vector(attributes=attributes, double_array=double_array)
+        return vector_pb2.Vector(double_array=double_array)
     elif isinstance(vector_obj[0], str):
-        string_vector = cast(Vector[str], vector_obj)
+        string_vector = cast(list[str], vector_obj)
         string_array = array_pb2.StringArray(values=string_vector)
-        return vector_pb2.Vector(attributes=attributes, string_array=string_array)
+        return vector_pb2.Vector(string_array=string_array)
     else:
         raise TypeError(f"Invalid array value type: {type(vector_obj[0])}")
 
 
-def _check_vector_values(vector: Vector[AnyScalarType]) -> None:
-    for value in vector:
-        if isinstance(value, int):
-            if value <= -0x80000000 or value >= 0x7FFFFFFF:
-                raise ValueError("Integer values in a vector must be within the range of an Int32.")
+def _check_vector_values(values: list[AnyScalarType]) -> None:
+    # A Vector's values all have the same type, so the range can be checked with min() and max().
+    if isinstance(values[0], int) and not isinstance(values[0], bool):
+        int_values = cast(list[int], values)
+        if min(int_values) <= -0x80000000 or max(int_values) >= 0x7FFFFFFF:
+            raise ValueError("Integer values in a vector must be within the range of an Int32.")
@@ -0,0 +1,147 @@
+"""Incremental builders for waveform protobuf messages."""
+
+from __future__ import annotations
+
+from collections.abc import Mapping
+
+import numpy as np
+import numpy.typing as npt
+from nitypes.time.typing import AnyDateTime, AnyTimeDelta
+from nitypes.waveform import AnalogWaveform, SampleIntervalMode, Timing
+from nitypes.waveform.typing import ExtendedPropertyValue
+
+from ni.protobuf.types.waveform_chunking import _slice_timing
+from ni.protobuf.types.waveform_conversion import float64_analog_waveform_to_protobuf_bytes
+from ni.protobuf.types.waveform_pb2 import DoubleAnalogWaveform
+
+_MIN_CAPACITY = 1024
+
+
+class Float64AnalogWaveformBuilder:
+    """Builds a protobuf DoubleAnalogWaveform from blocks of samples.
+
+    The samples are appended to a buffer that grows geometrically, so appending a block takes
+    amortized time proportional to the block size. A snapshot of the samples appended so far
+    can be converted to a protobuf message at any time, without reconverting the timing and
+    extended properties of a Python AnalogWaveform.
+
+    If ``max_sample_count`` is specified, the builder keeps only the most recent
+    ``max_sample_count`` samples, like a ring buffer, and the start time of the snapshot
+    advances as samples are discarded. The samples are kept contiguous, so a snapshot is
+    written with a single copy.
+    """
+
+    def __init__(
+        self,
+        *,
+        timing: Timing[AnyDateTime, AnyTimeDelta, AnyTimeDelta] | None = None,
+        extended_properties: Mapping[str, ExtendedPropertyValue] | None = None,
+        max_sample_count: int | None = None,
+    ) -> None:
+        """Initialize a new Float64AnalogWaveformBuilder.
+
+        Args:
+            timing: The timing of the first sample. Irregular timing is not supported.
+            extended_properties: The extended properties of the waveform.
+            max_sample_count: The maximum number of samples to keep, or None to keep all of
+                the samples.
+        """
+        if timing is None:
+            timing = Timing.empty
+        if timing.sample_interval_mode == SampleIntervalMode.IRREGULAR:
+            raise ValueError("Irregular timing is not supported by waveform builders.")
+        if max_sample_count is not None and max_sample_count < 1:
+            raise ValueError("The max sample count must be a positive integer.")
+        self._timing = timing
+        self._extended_properties = dict(extended_properties or {})
+        self._max_sample_count = max_sample_count
+        self._buffer: npt.NDArray[np.float64] = np.empty(0, np.float64)
+        self._start = 0
+        self._stop = 0
+        self._start_index = 0
+
+    @property
+    def sample_count(self) -> int:
+        """The number of samples in the builder."""
+        return self._stop - self._start
+
+    @property
+    def start_index(self) -> int:
+        """The index of the first sample in the builder, counting the discarded samples."""
+        return self._start_index
+
+    @property
+    def max_sample_count(self) -> int | None:
+        """The maximum number of samples to keep, or None to keep all of the samples."""
+        return self._max_sample_count
+
+    def append(self, data: npt.ArrayLike, /) -> None:
+        """Append a one-dimensional block of samples."""
+        block = np.asarray(data, np.float64)
+        if block.ndim != 1:
+            raise ValueError(
+                f"The data must be a one-dimensional array.\n\nNumber of dimensions: {block.ndim}"
+            )
+        if self._max_sample_count is not None:
+            discard_count = self.sample_count + len(block) - self._max_sample_count
+            if discard_count > self.sample_count:
+                # The block replaces all of the samples, and its leading samples are discarded.
+                self._start_index += discard_count
+                block = block[discard_count - self.sample_count :]
+                self._start = self._stop = 0
+            elif discard_count > 0:
+                self._start_index += discard_count
+                self._start += discard_count
+        self._reserve(len(block))
+        self._buffer[self._stop : self._stop + len(block)] = block
+        self._stop += len(block)
+
+    def clear(self) -> None:
+        """Discard all of the samples, keeping the timing of the next sample."""
+        self._start_index += self.sample_count
+        self._start = self._stop = 0
+
+    def to_waveform(self) -> AnalogWaveform[np.float64]:
+        """Copy the samples to a Python AnalogWaveform."""
+        return AnalogWaveform.from_array_1d(
+            self._buffer[self._start : self._stop],
+            dtype=np.float64,
+            copy=True,
+            extended_properties=self._extended_properties,
+            timing=self._get_timing(),
+        )
+
+    def to_protobuf(self) -> DoubleAnalogWaveform:
+        """Convert the samples to a protobuf DoubleAnalogWaveform."""
+        return DoubleAnalogWaveform.FromString(self.to_protobuf_bytes())
+
+    def to_protobuf_bytes(self) -> bytes:
+        """Convert the samples to a serialized protobuf DoubleAnalogWaveform."""
+        snapshot = AnalogWaveform.from_array_1d(
+            self._buffer[self._start : self._stop],
+            dtype=np.float64,
+            copy=False,
+            extended_properties=self._extended_properties,
+            timing=self._get_timing(),
+        )
+        return float64_analog_waveform_to_protobuf_bytes(snapshot)
+
+    def _get_timing(self) -> Timing[AnyDateTime, AnyTimeDelta, AnyTimeDelta]:
+        return _slice_timing(self._timing, self._start_index, self.sample_count)
+
+    def _reserve(self, count: int) -> None:
+        if self._stop + count <= len(self._buffer):
+            return
+        sample_count = self.sample_count
+        if sample_count + count <= len(self._buffer) // 2:
+            # Move the samples to the front of the buffer. At least half of the buffer was
+            # appended since the last move, so moving is amortized over the appended samples.
+            self._buffer[:sample_count] = self._buffer[self._start : self._stop]
+        else:
+            capacity = max(sample_count + count, 2 * len(self._buffer), _MIN_CAPACITY)
+            if self._max_sample_count is not None:
+                capacity = min(capacity, 2 * self._max_sample_count)
+            buffer = np.empty(capacity, np.float64)
+            buffer[:sample_count] = self._buffer[self._start : self._stop]
+            self._buffer = buffer
+        self._start, self._stop = 0, sample_count
@@ -0,0 +1,352 @@
+"""Methods to split waveforms into chunked protobuf messages and reassemble them."""
+
+from __future__ import annotations
+
+from collections.abc import Callable, Iterable, Iterator
+from typing import Any, TypeVar
+
+import numpy as np
+import numpy.typing as npt
+from nitypes.complex import ComplexInt32Base
+from nitypes.time.typing import AnyDateTime, AnyTimeDelta
+from nitypes.waveform import (
+    AnalogWaveform,
+    ComplexWaveform,
+    DigitalWaveform,
+    SampleIntervalMode,
+    Timing,
+)
+
+from ni.protobuf.types.waveform_conversion import (
+    AnyNiWaveform,
+    AnyWaveformProto,
+    digital_waveform_from_protobuf,
+    digital_waveform_to_protobuf,
+    float32_analog_waveform_from_protobuf,
+    float32_analog_waveform_to_protobuf,
+    float32_complex_waveform_from_protobuf,
+    float32_complex_waveform_to_protobuf,
+    float64_analog_waveform_from_protobuf,
+    float64_analog_waveform_to_protobuf,
+    float64_complex_waveform_from_protobuf,
+    float64_complex_waveform_to_protobuf,
+    int16_analog_waveform_from_protobuf,
+    int16_analog_waveform_to_protobuf,
+    int16_complex_waveform_from_protobuf,
+    int16_complex_waveform_to_protobuf,
+)
+from ni.protobuf.types.waveform_pb2 import (
+    DigitalWaveform as DigitalWaveformProto,
+    DoubleAnalogWaveform,
+    DoubleComplexWaveform,
+    FloatAnalogWaveform,
+    FloatComplexWaveform,
+    I16AnalogWaveform,
+    I16ComplexWaveform,
+)
+
+DEFAULT_MAX_MESSAGE_SIZE = 4 * 1024 * 1024
+"""The default maximum size of a chunk message, which matches gRPC's default receive limit."""
+
+# The y_data tag and length prefix.
+_Y_DATA_OVERHEAD = 1 + 5
+# A serialized PrecisionTimestamp in the timestamps field, including its tag and length.
+_MAX_TIMESTAMP_SIZE = 2 + 1 + 10 + 1 + 10
+
+_AnyTiming = Timing[AnyDateTime, AnyTimeDelta, AnyTimeDelta]
+
+_TWaveform = TypeVar("_TWaveform", bound=AnyNiWaveform)
+_TWaveformProto = TypeVar("_TWaveformProto", bound=AnyWaveformProto)
+
+
+def float64_analog_waveform_to_protobuf_chunks(
+    value: AnalogWaveform[np.float64], /, *, max_message_size: int = DEFAULT_MAX_MESSAGE_SIZE
+) -> Iterator[DoubleAnalogWaveform]:
+    """Split the Python AnalogWaveform into protobuf DoubleAnalogWaveform chunks.
+
+    Each chunk has the waveform's extended properties and timing, with t0 advanced to the
+    chunk's first sample, and is at most max_message_size bytes when serialized. A waveform
+    with no samples produces one chunk.
+    """
+    return _waveform_to_chunks(value, float64_analog_waveform_to_protobuf, 8, max_message_size)
+
+
+def float64_analog_waveform_from_protobuf_chunks(
+    chunks: Iterable[DoubleAnalogWaveform], /, *, sample_count: int | None = None
+) -> AnalogWaveform[np.float64]:
+    """Reassemble protobuf DoubleAnalogWaveform chunks into a Python AnalogWaveform.
+
+    If sample_count is specified, the samples are copied into a preallocated array as each chunk
+    is received. Otherwise, the chunks' samples are concatenated after the last chunk.
+    """
+    return _waveform_from_chunks(chunks, float64_analog_waveform_from_protobuf, sample_count)
+
+
+def float32_analog_waveform_to_protobuf_chunks(
+    value: AnalogWaveform[np.float32], /, *, max_message_size: int = DEFAULT_MAX_MESSAGE_SIZE
+) -> Iterator[FloatAnalogWaveform]:
+    """Split the Python AnalogWaveform into protobuf FloatAnalogWaveform chunks."""
+    return _waveform_to_chunks(value, float32_analog_waveform_to_protobuf, 4, max_message_size)
+
+
+def float32_analog_waveform_from_protobuf_chunks(
+    chunks: Iterable[FloatAnalogWaveform], /, *, sample_count: int | None = None
+) -> AnalogWaveform[np.float32]:
+    """Reassemble protobuf FloatAnalogWaveform chunks into a Python AnalogWaveform."""
+    return _waveform_from_chunks(chunks, float32_analog_waveform_from_protobuf, sample_count)
+
+
+def int16_analog_waveform_to_protobuf_chunks(
+    value: AnalogWaveform[np.int16], /, *, max_message_size: int = DEFAULT_MAX_MESSAGE_SIZE
+) -> Iterator[I16AnalogWaveform]:
+    """Split the Python AnalogWaveform into protobuf I16AnalogWaveform chunks."""
+    # A zigzag-encoded int16 is at most 3 bytes.
+    return _waveform_to_chunks(value, int16_analog_waveform_to_protobuf, 3, max_message_size)
+
+
+def int16_analog_waveform_from_protobuf_chunks(
+    chunks: Iterable[I16AnalogWaveform], /, *, sample_count: int | None = None
+) -> AnalogWaveform[np.int16]:
+    """Reassemble protobuf I16AnalogWaveform chunks into a Python AnalogWaveform."""
+    return _waveform_from_chunks(chunks, int16_analog_waveform_from_protobuf, sample_count)
+
+
+def float64_complex_waveform_to_protobuf_chunks(
+    value: ComplexWaveform[np.complex128], /, *, max_message_size: int = DEFAULT_MAX_MESSAGE_SIZE
+) -> Iterator[DoubleComplexWaveform]:
+    """Split the Python ComplexWaveform into protobuf DoubleComplexWaveform chunks."""
+    return _waveform_to_chunks(value, float64_complex_waveform_to_protobuf, 16, max_message_size)
+
+
+def float64_complex_waveform_from_protobuf_chunks(
+    chunks: Iterable[DoubleComplexWaveform], /, *, sample_count: int | None = None
+) -> ComplexWaveform[np.complex128]:
+    """Reassemble protobuf DoubleComplexWaveform chunks into a Python ComplexWaveform."""
+    return _waveform_from_chunks(chunks, float64_complex_waveform_from_protobuf, sample_count)
+
+
+def float32_complex_waveform_to_protobuf_chunks(
+    value: ComplexWaveform[np.complex64], /, *, max_message_size: int = DEFAULT_MAX_MESSAGE_SIZE
+) -> Iterator[FloatComplexWaveform]:
+    """Split the Python ComplexWaveform into protobuf FloatComplexWaveform chunks."""
+    return _waveform_to_chunks(value, float32_complex_waveform_to_protobuf, 8, max_message_size)
+
+
+def float32_complex_waveform_from_protobuf_chunks(
+    chunks: Iterable[FloatComplexWaveform], /, *, sample_count: int | None = None
+) -> ComplexWaveform[np.complex64]:
+    """Reassemble protobuf FloatComplexWaveform chunks into a Python ComplexWaveform."""
+    return _waveform_from_chunks(chunks, float32_complex_waveform_from_protobuf, sample_count)
+
+
+def int16_complex_waveform_to_protobuf_chunks(
+    value: ComplexWaveform[ComplexInt32Base],
+    /,
+    *,
+    max_message_size: int = DEFAULT_MAX_MESSAGE_SIZE,
+) -> Iterator[I16ComplexWaveform]:
+    """Split the Python ComplexWaveform into protobuf I16ComplexWaveform chunks."""
+    return _waveform_to_chunks(value, int16_complex_waveform_to_protobuf, 6, max_message_size)
+
+
+def int16_complex_waveform_from_protobuf_chunks(
+    chunks: Iterable[I16ComplexWaveform], /, *, sample_count: int | None = None
+) -> ComplexWaveform[ComplexInt32Base]:
+    """Reassemble protobuf I16ComplexWaveform chunks into a Python ComplexWaveform."""
+    return _waveform_from_chunks(chunks, int16_complex_waveform_from_protobuf, sample_count)
+
+
+def digital_waveform_to_protobuf_chunks(
+    value: DigitalWaveform[Any], /, *, max_message_size: int = DEFAULT_MAX_MESSAGE_SIZE
+) -> Iterator[DigitalWaveformProto]:
+    """Split the Python DigitalWaveform into protobuf DigitalWaveform chunks."""
+    return _waveform_to_chunks(
+        value, digital_waveform_to_protobuf, value.signal_count, max_message_size
+    )
+
+
+def digital_waveform_from_protobuf_chunks(
+    chunks: Iterable[DigitalWaveformProto], /, *, sample_count: int | None = None
+) -> DigitalWaveform[np.uint8]:
+    """Reassemble protobuf DigitalWaveform chunks into a Python DigitalWaveform."""
+    return _waveform_from_chunks(chunks, digital_waveform_from_protobuf, sample_count)
+
+
+def _waveform_to_chunks(
+    value: _TWaveform,
+    to_protobuf: Callable[[_TWaveform], _TWaveformProto],
+    bytes_per_sample: int,
+    max_message_size: int,
+) -> Iterator[_TWaveformProto]:
+    if max_message_size <= 0:
+        raise ValueError("The maximum message size must be a positive integer.")
+    if value.timing.sample_interval_mode == SampleIntervalMode.IRREGULAR:
+        bytes_per_sample += _MAX_TIMESTAMP_SIZE
+    # Advancing the timestamp of a later chunk can make t0 and timestamp larger, so reserve room
+    # for both at their maximum size.
+    header_size = (
+        to_protobuf(_slice_waveform(value, 0, 0)).ByteSize()
+        + _Y_DATA_OVERHEAD
+        + 2 * _MAX_TIMESTAMP_SIZE
+    )
+    samples_per_chunk = (max_message_size - header_size) // bytes_per_sample
+    if samples_per_chunk <= 0:
+        raise ValueError(
+            "The maximum message size is too small for the waveform's timing and extended "
+            f"properties.\n\nMaximum message size: {max_message_size}\n"
+            f"Header size: {header_size}"
+        )
+    return _generate_chunks(value, to_protobuf, samples_per_chunk)
+
+
+def _generate_chunks(
+    value: _TWaveform,
+    to_protobuf: Callable[[_TWaveform], _TWaveformProto],
+    samples_per_chunk: int,
+) -> Iterator[_TWaveformProto]:
+    for start_index in range(0, max(value.sample_count, 1), samples_per_chunk):
+        sample_count = min(samples_per_chunk, value.sample_count - start_index)
+        yield to_protobuf(_slice_waveform(value, start_index, sample_count))
+
+
+def _slice_waveform(value: _TWaveform, start_index: int, sample_count: int) -> _TWaveform:
+    timing = _slice_timing(value.timing, start_index, sample_count)
+    waveform: AnyNiWaveform
+    if isinstance(value, DigitalWaveform):
+        waveform = DigitalWaveform.from_lines(
+            value.data[start_index : start_index + sample_count],
+            value.dtype,
+            copy=False,
+            signal_count=value.signal_count,
+            extended_properties=value.extended_properties,
+            timing=timing,
+        )
+    else:
+        waveform = type(value).from_array_1d(
+            value.raw_data[start_index : start_index + sample_count],
+            value.dtype,
+            copy=False,
+            extended_properties=value.extended_properties,
+            timing=timing,
+            scale_mode=value.scale_mode,
+        )
+    return waveform  # type: ignore[return-value]
+
+
+def _slice_timing(timing: _AnyTiming, start_index: int, sample_count: int) -> _AnyTiming:
+    if timing.sample_interval_mode == SampleIntervalMode.IRREGULAR:
+        return Timing.create_with_irregular_interval(
+            list(timing.get_timestamps(start_index, sample_count))
+        )
+    elif (
+        timing.sample_interval_mode == SampleIntervalMode.REGULAR
+        and timing.has_timestamp
+        and start_index
+    ):
+        # Advance the timestamp in NI-BTF, which is the precision of PrecisionTimestamp.
+        bin_timing = timing.to_bintime()
+        return Timing.create_with_regular_interval(
+            bin_timing.sample_interval,
+            bin_timing.timestamp + bin_timing.sample_interval * start_index,
+            bin_timing.time_offset if bin_timing.has_time_offset else None,
+        )
+    else:
+        return timing
+
+
+def _waveform_from_chunks(
+    chunks: Iterable[_TWaveformProto],
+    from_protobuf: Callable[[_TWaveformProto], _TWaveform],
+    sample_count: int | None,
+) -> _TWaveform:
+    iterator = iter(chunks)
+    first_chunk = next(iterator, None)
+    if first_chunk is None:
+        raise ValueError("At least one waveform chunk is required.")
+    first = from_protobuf(first_chunk)
+    first_data = _waveform_data(first)
+
+    data: npt.NDArray[Any]
+    arrays: list[npt.NDArray[Any]] = []
+    if sample_count is not None:
+        data = np.empty((sample_count, *first_data.shape[1:]), first_data.dtype)
+    timestamps: list[AnyDateTime] = []
+    position = 0
+    chunk = first
+    while True:
+        _check_chunk_matches(first, chunk)
+        chunk_data = _waveform_data(chunk)
+        if sample_count is not None:
+            if position + len(chunk_data) > sample_count:
+                raise ValueError(
+                    "The waveform chunks contain more samples than the specified sample count.\n\n"
+                    f"Sample count: {sample_count}"
+                )
+            data[position : position + len(chunk_data)] = chunk_data
+        else:
+            arrays.append(chunk_data)
+        if chunk.timing.sample_interval_mode == SampleIntervalMode.IRREGULAR:
+            timestamps.extend(chunk.timing.get_timestamps(0, chunk.sample_count))
+        position += len(chunk_data)
+
+        next_chunk = next(iterator, None)
+        if next_chunk is None:
+            break
+        chunk = from_protobuf(next_chunk)
+
+    if sample_count is None:
+        data = np.concatenate(arrays) if len(arrays) > 1 else first_data
+    elif position != sample_count:
+        raise ValueError(
+            "The waveform chunks contain fewer samples than the specified sample count.\n\n"
+            f"Sample count: {sample_count}\nSamples received: {position}"
+        )
+
+    timing = first.timing
+    if timing.sample_interval_mode == SampleIntervalMode.IRREGULAR:
+        timing = Timing.create_with_irregular_interval(timestamps)
+
+    waveform: AnyNiWaveform
+    if isinstance(first, DigitalWaveform):
+        waveform = DigitalWaveform.from_lines(
+            data,
+            first.dtype,
+            copy=False,
+            signal_count=first.signal_count,
+            extended_properties=first.extended_properties,
+            timing=timing,
+        )
+    else:
+        waveform = type(first).from_array_1d(
+            data,
+            first.dtype,
+            copy=False,
+            extended_properties=first.extended_properties,
+            timing=timing,
+            scale_mode=first.scale_mode,
+        )
+    return waveform  # type: ignore[return-value]
+
+
+def _waveform_data(waveform: AnyNiWaveform) -> npt.NDArray[Any]:
+    if isinstance(waveform, DigitalWaveform):
+        return waveform.data
+    return waveform.raw_data
+
+
+def _check_chunk_matches(first: AnyNiWaveform, chunk: AnyNiWaveform) -> None:
+    if chunk.extended_properties != first.extended_properties:
+        raise ValueError("The waveform chunks have different extended properties.")
+    if chunk.timing.sample_interval_mode != first.timing.sample_interval_mode or (
+        chunk.timing.has_sample_interval
+        and chunk.timing.sample_interval != first.timing.sample_interval
+    ):
+        raise ValueError("The waveform chunks have different sample intervals.")
+    if isinstance(first, DigitalWaveform):
+        assert isinstance(chunk, DigitalWaveform)
+        if chunk.signal_count != first.signal_count:
+            raise ValueError("The waveform chunks have different signal counts.")
+    else:
+        assert not isinstance(chunk, DigitalWaveform)
+        if chunk.scale_mode != first.scale_mode:
+            raise ValueError("The waveform chunks have different scale modes.")
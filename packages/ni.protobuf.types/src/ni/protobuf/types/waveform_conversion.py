@@ -2,12 +2,14 @@
 
 from __future__ import annotations
 
-from collections.abc import Iterable, Mapping
-from typing import Any, TypeAlias
+import math
+from collections.abc import Mapping, Sequence
+from typing import Any, NamedTuple, TypeAlias, TypeVar
 
 import hightime as ht
 import nitypes.bintime as bt
 import numpy as np
+import numpy.typing as npt
 from nitypes.complex import ComplexInt32Base, ComplexInt32DType
 from nitypes.time import convert_datetime
 from nitypes.time.typing import AnyDateTime, AnyTimeDelta
@@ -15,16 +17,37 @@ from nitypes.waveform import (
     AnalogWaveform,
     ComplexWaveform,
     DigitalWaveform,
-    ExtendedPropertyDictionary,
     LinearScaleMode,
     NoneScaleMode,
     SampleIntervalMode,
+    ScaleMode,
     Spectrum,
     Timing,
 )
 from nitypes.waveform.typing import ExtendedPropertyValue
+from typing_extensions import Buffer
 
 import ni.protobuf.types.precision_timestamp_conversion as ptc
+from ni.protobuf.types._wire_format import (
+    decode_packed_sint32,
+    encode_length_delimited,
+    encode_packed_fixed,
+    encode_packed_sint32,
+    encode_precision_timestamps,
+    frombuffer_le,
+    length_delimited_size,
+    packed_sint32_size,
+    parse_fields,
+    precision_timestamps_size,
+)
+from ni.protobuf.types.conversion_context import _validate_input
+from ni.protobuf.types.extended_property_conversion import (
+    CacheInfo,
+    _get_extended_properties,
+    _get_serialized_attributes,
+    _LruCache,
+    _merge_attributes,
+)
 from ni.protobuf.types.precision_timestamp_pb2 import PrecisionTimestamp
 from ni.protobuf.types.waveform_pb2 import (
     DigitalWaveform as DigitalWaveformProto,
@@ -43,6 +66,9 @@ from ni.protobuf.types.waveform_pb2 import (
 
 DEFAULT_PRECISION_TIMESTAMP = PrecisionTimestamp()
 
+DEFAULT_TIMING_CACHE_SIZE = 256
+"""The default maximum number of entries in each timing cache."""
+
 AnyNiWaveform: TypeAlias = AnalogWaveform[Any] | ComplexWaveform[Any] | DigitalWaveform[Any]
 
 AnyWaveformProto: TypeAlias = (
@@ -55,27 +81,68 @@ AnyWaveformProto: TypeAlias = (
     | DigitalWaveformProto
 )
 
+_TIME_VALUE_DTYPE = np.dtype([("seconds", np.int64), ("fractional_seconds", np.uint64)])
+
+_INT16_MIN = -0x8000
+_INT16_MAX = 0x7FFF
+
+# The extended property that contains the digital line names, highest line first.
+_LINE_NAMES = "NI_LineNames"
+
+_TWaveformProto = TypeVar("_TWaveformProto", bound=AnyWaveformProto)
+
+# Timing objects are immutable, so waveforms decoded from messages with the same timing fields
+# share one Timing object. Creating an ht.timedelta from a float is slow, so the sample
+# intervals and time offsets are also cached, for messages that differ only in t0.
+_timing_cache: _LruCache[
+    tuple[float, float, int, int], Timing[AnyDateTime, AnyTimeDelta, AnyTimeDelta]
+] = _LruCache(DEFAULT_TIMING_CACHE_SIZE)
+_time_delta_cache: _LruCache[float, ht.timedelta] = _LruCache(DEFAULT_TIMING_CACHE_SIZE)
+
+
+def get_timing_cache_info() -> CacheInfo:
+    """Get the hit and miss counters of the cache of Timing objects used by the conversions."""
+    return _timing_cache.info()
+
+
+def clear_timing_cache() -> None:
+    """Clear the timing caches and reset their counters."""
+    _timing_cache.clear()
+    _time_delta_cache.clear()
+
+
+def set_timing_cache_size(maxsize: int) -> None:
+    """Set the maximum number of entries in each timing cache.
+
+    A size of zero disables caching.
+    """
+    if maxsize < 0:
+        raise ValueError(f"The cache size must be a non-negative integer.\n\nSize: {maxsize}")
+    _timing_cache.resize(maxsize)
+    _time_delta_cache.resize(maxsize)
+
 
 def float64_analog_waveform_to_protobuf(
     value: AnalogWaveform[np.float64], /
 ) -> DoubleAnalogWaveform:
     """Convert the Python AnalogWaveform to a protobuf DoubleAnalogWaveform."""
-    attributes = _extended_properties_to_attributes(value.extended_properties)
     if value.timing.sample_interval_mode in [SampleIntervalMode.REGULAR, SampleIntervalMode.NONE]:
-        return DoubleAnalogWaveform(
-            t0=_t0_from_waveform(value),
-            dt=_time_interval_from_waveform(value),
-            y_data=value.scaled_data,
-            attributes=attributes,
-            timestamp=_timestamp_from_waveform(value),
-            time_offset=_time_offset_from_waveform(value),
+        return _merge_attributes(
+            DoubleAnalogWaveform(
+                t0=_t0_from_waveform(value),
+                dt=_time_interval_from_waveform(value),
+                y_data=value.scaled_data,
+                timestamp=_timestamp_from_waveform(value),
+                time_offset=_time_offset_from_waveform(value),
+            ),
+            value.extended_properties,
         )
     elif value.timing.sample_interval_mode == SampleIntervalMode.IRREGULAR:
-        return DoubleAnalogWaveform(
+        message = DoubleAnalogWaveform(
             y_data=value.scaled_data,
-            attributes=attributes,
-            timestamps=_timestamps_from_waveform(value),
         )
+        _add_timestamps_from_waveform(message, value)
+        return _merge_attributes(message, value.extended_properties)
     else:
         raise ValueError(f"Invalid sample interval mode: {value.timing.sample_interval_mode}")
 
@@ -100,22 +167,23 @@ def float32_analog_waveform_to_protobuf(
     value: AnalogWaveform[np.float32], /
 ) -> FloatAnalogWaveform:
     """Convert the Python AnalogWaveform to a protobuf FloatAnalogWaveform."""
-    attributes = _extended_properties_to_attributes(value.extended_properties)
     if value.timing.sample_interval_mode in [SampleIntervalMode.REGULAR, SampleIntervalMode.NONE]:
-        return FloatAnalogWaveform(
-            t0=_t0_from_waveform(value),
-            dt=_time_interval_from_waveform(value),
-            y_data=value.get_scaled_data(np.float32),
-            attributes=attributes,
-            timestamp=_timestamp_from_waveform(value),
-            time_offset=_time_offset_from_waveform(value),
+        return _merge_attributes(
+            FloatAnalogWaveform(
+                t0=_t0_from_waveform(value),
+                dt=_time_interval_from_waveform(value),
+                y_data=value.get_scaled_data(np.float32),
+                timestamp=_timestamp_from_waveform(value),
+                time_offset=_time_offset_from_waveform(value),
+            ),
+            value.extended_properties,
         )
     elif value.timing.sample_interval_mode == SampleIntervalMode.IRREGULAR:
-        return FloatAnalogWaveform(
+        message = FloatAnalogWaveform(
             y_data=value.get_scaled_data(np.float32),
-            attributes=attributes,
-            timestamps=_timestamps_from_waveform(value),
         )
+        _add_timestamps_from_waveform(message, value)
+        return _merge_attributes(message, value.extended_properties)
     else:
         raise ValueError(f"Invalid sample interval mode: {value.timing.sample_interval_mode}")
 
@@ -140,23 +208,24 @@ def float64_complex_waveform_to_protobuf(
     value: ComplexWaveform[np.complex128], /
 ) -> DoubleComplexWaveform:
     """Convert the Python ComplexWaveform to a protobuf DoubleComplexWaveform."""
-    attributes = _extended_properties_to_attributes(value.extended_properties)
     interleaved_array = value.scaled_data.view(np.float64)
     if value.timing.sample_interval_mode in [SampleIntervalMode.REGULAR, SampleIntervalMode.NONE]:
-        return DoubleComplexWaveform(
-            t0=_t0_from_waveform(value),
-            dt=_time_interval_from_waveform(value),
-            y_data=interleaved_array,
-            attributes=attributes,
-            timestamp=_timestamp_from_waveform(value),
-            time_offset=_time_offset_from_waveform(value),
+        return _merge_attributes(
+            DoubleComplexWaveform(
+                t0=_t0_from_waveform(value),
+                dt=_time_interval_from_waveform(value),
+                y_data=interleaved_array,
+                timestamp=_timestamp_from_waveform(value),
+                time_offset=_time_offset_from_waveform(value),
+            ),
+            value.extended_properties,
         )
     elif value.timing.sample_interval_mode == SampleIntervalMode.IRREGULAR:
-        return DoubleComplexWaveform(
+        message = DoubleComplexWaveform(
             y_data=interleaved_array,
-            attributes=attributes,
-            timestamps=_timestamps_from_waveform(value),
         )
+        _add_timestamps_from_waveform(message, value)
+        return _merge_attributes(message, value.extended_properties)
     else:
         raise ValueError(f"Invalid sample interval mode: {value.timing.sample_interval_mode}")
 
@@ -184,23 +253,24 @@ def float32_complex_waveform_to_protobuf(
     value: ComplexWaveform[np.complex64], /
 ) -> FloatComplexWaveform:
     """Convert the Python ComplexWaveform to a protobuf FloatComplexWaveform."""
-    attributes = _extended_properties_to_attributes(value.extended_properties)
     interleaved_array = value.get_scaled_data(np.complex64).view(np.float32)
     if value.timing.sample_interval_mode in [SampleIntervalMode.REGULAR, SampleIntervalMode.NONE]:
-        return FloatComplexWaveform(
-            t0=_t0_from_waveform(value),
-            dt=_time_interval_from_waveform(value),
-            y_data=interleaved_array,
-            attributes=attributes,
-            timestamp=_timestamp_from_waveform(value),
-            time_offset=_time_offset_from_waveform(value),
+        return _merge_attributes(
+            FloatComplexWaveform(
+                t0=_t0_from_waveform(value),
+                dt=_time_interval_from_waveform(value),
+                y_data=interleaved_array,
+                timestamp=_timestamp_from_waveform(value),
+                time_offset=_time_offset_from_waveform(value),
+            ),
+            value.extended_properties,
         )
     elif value.timing.sample_interval_mode == SampleIntervalMode.IRREGULAR:
-        return FloatComplexWaveform(
+        message = FloatComplexWaveform(
             y_data=interleaved_array,
-            attributes=attributes,
-            timestamps=_timestamps_from_waveform(value),
         )
+        _add_timestamps_from_waveform(message, value)
+        return _merge_attributes(message, value.extended_properties)
     else:
         raise ValueError(f"Invalid sample interval mode: {value.timing.sample_interval_mode}")
 
@@ -228,26 +298,27 @@ def int16_complex_waveform_to_protobuf(
     value: ComplexWaveform[ComplexInt32Base], /
 ) -> I16ComplexWaveform:
     """Convert the Python ComplexWaveform to a protobuf DoubleComplexWaveform."""
-    attributes = _extended_properties_to_attributes(value.extended_properties)
     scale = _scale_from_waveform(value)
     interleaved_array = value.raw_data.view(np.int16)
     if value.timing.sample_interval_mode in [SampleIntervalMode.REGULAR, SampleIntervalMode.NONE]:
-        return I16ComplexWaveform(
-            t0=_t0_from_waveform(value),
-            dt=_time_interval_from_waveform(value),
-            y_data=interleaved_array,
-            attributes=attributes,
-            scale=scale,
-            timestamp=_timestamp_from_waveform(value),
-            time_offset=_time_offset_from_waveform(value),
+        return _merge_attributes(
+            I16ComplexWaveform(
+                t0=_t0_from_waveform(value),
+                dt=_time_interval_from_waveform(value),
+                y_data=interleaved_array,
+                scale=scale,
+                timestamp=_timestamp_from_waveform(value),
+                time_offset=_time_offset_from_waveform(value),
+            ),
+            value.extended_properties,
         )
     elif value.timing.sample_interval_mode == SampleIntervalMode.IRREGULAR:
-        return I16ComplexWaveform(
+        message = I16ComplexWaveform(
             y_data=interleaved_array,
-            attributes=attributes,
             scale=scale,
-            timestamps=_timestamps_from_waveform(value),
         )
+        _add_timestamps_from_waveform(message, value)
+        return _merge_attributes(message, value.extended_properties)
     else:
         raise ValueError(f"Invalid sample interval mode: {value.timing.sample_interval_mode}")
 
@@ -274,12 +345,13 @@ def int16_complex_waveform_from_protobuf(
 
 def float64_spectrum_to_protobuf(value: Spectrum[np.float64], /) -> DoubleSpectrum:
     """Convert the Python Spectrum to a protobuf DoubleSpectrum."""
-    attributes = _extended_properties_to_attributes(value.extended_properties)
-    return DoubleSpectrum(
-        start_frequency=value.start_frequency,
-        frequency_increment=value.frequency_increment,
-        data=value.data,
-        attributes=attributes,
+    return _merge_attributes(
+        DoubleSpectrum(
+            start_frequency=value.start_frequency,
+            frequency_increment=value.frequency_increment,
+            data=value.data,
+        ),
+        value.extended_properties,
     )
 
 
@@ -297,12 +369,13 @@ def float64_spectrum_from_protobuf(message: DoubleSpectrum, /) -> Spectrum[np.fl
 
 def float32_spectrum_to_protobuf(value: Spectrum[np.float32], /) -> FloatSpectrum:
     """Convert the Python Spectrum to a protobuf FloatSpectrum."""
-    attributes = _extended_properties_to_attributes(value.extended_properties)
-    return FloatSpectrum(
-        start_frequency=value.start_frequency,
-        frequency_increment=value.frequency_increment,
-        data=value.data,
-        attributes=attributes,
+    return _merge_attributes(
+        FloatSpectrum(
+            start_frequency=value.start_frequency,
+            frequency_increment=value.frequency_increment,
+            data=value.data,
+        ),
+        value.extended_properties,
     )
 
 
@@ -321,24 +394,25 @@ def float32_spectrum_from_protobuf(message: FloatSpectrum, /) -> Spectrum[np.flo
 def int16_analog_waveform_to_protobuf(value: AnalogWaveform[np.int16], /) -> I16AnalogWaveform:
     """Convert the Python AnalogWaveform to a protobuf I16AnalogWaveform."""
     scale = _scale_from_waveform(value)
-    attributes = _extended_properties_to_attributes(value.extended_properties)
     if value.timing.sample_interval_mode in [SampleIntervalMode.REGULAR, SampleIntervalMode.NONE]:
-        return I16AnalogWaveform(
-            t0=_t0_from_waveform(value),
-            dt=_time_interval_from_waveform(value),
-            y_data=value.raw_data,
-            attributes=attributes,
-            scale=scale,
-            timestamp=_timestamp_from_waveform(value),
-            time_offset=_time_offset_from_waveform(value),
+        return _merge_attributes(
+            I16AnalogWaveform(
+                t0=_t0_from_waveform(value),
+                dt=_time_interval_from_waveform(value),
+                y_data=value.raw_data,
+                scale=scale,
+                timestamp=_timestamp_from_waveform(value),
+                time_offset=_time_offset_from_waveform(value),
+            ),
+            value.extended_properties,
         )
     elif value.timing.sample_interval_mode == SampleIntervalMode.IRREGULAR:
-        return I16AnalogWaveform(
+        message = I16AnalogWaveform(
             y_data=value.raw_data,
-            attributes=attributes,
             scale=scale,
-            timestamps=_timestamps_from_waveform(value),
         )
+        _add_timestamps_from_waveform(message, value)
+        return _merge_attributes(message, value.extended_properties)
     else:
         raise ValueError(f"Invalid sample interval mode: {value.timing.sample_interval_mode}")
 
@@ -358,26 +432,86 @@ def int16_analog_waveform_from_protobuf(message: I16AnalogWaveform, /) -> Analog
     )
 
 
+class QuantizationError(NamedTuple):
+    """The error introduced by encoding a waveform's samples with less precision."""
+
+    max_error: float
+    """The largest absolute difference between an encoded sample and the original sample."""
+
+    rms_error: float
+    """The root mean square of the differences between the encoded and original samples."""
+
+
+def float64_analog_waveform_to_int16_protobuf(
+    value: AnalogWaveform[np.float64], /
+) -> tuple[I16AnalogWaveform, QuantizationError]:
+    """Quantize the Python AnalogWaveform to a protobuf I16AnalogWaveform.
+
+    The samples are mapped onto the full Int16 range with a LinearScale computed from their
+    minimum and maximum, so the maximum error is at most half of the scale's gain. Returns the
+    message and the quantization error.
+    """
+    raw_data, scale_mode, error = _quantize_int16(value.scaled_data)
+    return _int16_message_from_raw_data(value, raw_data, scale_mode), error
+
+
+def float64_analog_waveform_to_float32_protobuf(
+    value: AnalogWaveform[np.float64], /
+) -> tuple[FloatAnalogWaveform, QuantizationError]:
+    """Round the Python AnalogWaveform's samples to a protobuf FloatAnalogWaveform.
+
+    Raises ValueError if a finite sample is outside the range of a float32. Returns the message
+    and the rounding error.
+    """
+    data, error = _downcast_float32(value.scaled_data)
+    if error is None:
+        raise ValueError("The waveform data is outside the range of a float32.")
+    return _float32_message_from_data(value, data), error
+
+
+def float64_analog_waveform_to_reduced_protobuf(
+    value: AnalogWaveform[np.float64], /, *, max_error: float
+) -> I16AnalogWaveform | FloatAnalogWaveform | DoubleAnalogWaveform:
+    """Convert the Python AnalogWaveform to the smallest message type that preserves its samples.
+
+    The waveform is quantized to an I16AnalogWaveform if the maximum quantization error is at most
+    max_error, otherwise rounded to a FloatAnalogWaveform if the maximum rounding error is at most
+    max_error, otherwise converted to a DoubleAnalogWaveform.
+    """
+    if max_error < 0.0:
+        raise ValueError(f"The maximum error must be non-negative.\n\nMaximum error: {max_error}")
+    data = value.scaled_data
+    if np.isfinite(data).all():
+        raw_data, scale_mode, error = _quantize_int16(data)
+        if error.max_error <= max_error:
+            return _int16_message_from_raw_data(value, raw_data, scale_mode)
+    float32_data, float32_error = _downcast_float32(data)
+    if float32_error is not None and float32_error.max_error <= max_error:
+        return _float32_message_from_data(value, float32_data)
+    return DoubleAnalogWaveform.FromString(float64_analog_waveform_to_protobuf_bytes(value))
+
+
 def digital_waveform_to_protobuf(value: DigitalWaveform[Any], /) -> DigitalWaveformProto:
     """Convert the Python DigitalWaveform to a protobuf DigitalWaveform."""
-    attributes = _extended_properties_to_attributes(value.extended_properties)
     if value.timing.sample_interval_mode in [SampleIntervalMode.REGULAR, SampleIntervalMode.NONE]:
-        return DigitalWaveformProto(
-            t0=_t0_from_waveform(value),
-            dt=_time_interval_from_waveform(value),
-            signal_count=value.signal_count,
-            y_data=value.data.tobytes(),
-            attributes=attributes,
-            timestamp=_timestamp_from_waveform(value),
-            time_offset=_time_offset_from_waveform(value),
+        return _merge_attributes(
+            DigitalWaveformProto(
+                t0=_t0_from_waveform(value),
+                dt=_time_interval_from_waveform(value),
+                signal_count=value.signal_count,
+                y_data=value.data.tobytes(),
+                timestamp=_timestamp_from_waveform(value),
+                time_offset=_time_offset_from_waveform(value),
+            ),
+            value.extended_properties,
         )
     elif value.timing.sample_interval_mode == SampleIntervalMode.IRREGULAR:
-        return DigitalWaveformProto(
+        message = DigitalWaveformProto(
             signal_count=value.signal_count,
             y_data=value.data.tobytes(),
-            attributes=attributes,
-            timestamps=_timestamps_from_waveform(value),
         )
+        _add_timestamps_from_waveform(message, value)
+        return _merge_attributes(message, value.extended_properties)
     else:
         raise AttributeError(f"Invalid sample interval mode{value.timing.sample_interval_mode}")
 
@@ -387,14 +521,7 @@ def digital_waveform_from_protobuf(message: DigitalWaveformProto, /) -> DigitalW
     timing = _timing_from_waveform_message(message)
     extended_properties = _attributes_to_extended_properties(message.attributes)
 
-    if message.signal_count <= 0:
-        raise ValueError("signal_count must be greater than zero.")
-
-    data_array = np.frombuffer(message.y_data, dtype=np.uint8)
-    samples_per_signal = len(data_array) // message.signal_count
-    if len(data_array) != samples_per_signal * message.signal_count:
-        raise ValueError(f"Data array length ({len(data_array)}) does not match expected shape.")
-    reshaped_data = data_array.reshape(samples_per_signal, message.signal_count)
+    reshaped_data = _digital_data_from_buffer(message.y_data, message.signal_count)
 
     return DigitalWaveform.from_lines(
         reshaped_data,
@@ -405,6 +532,554 @@ def digital_waveform_from_protobuf(message: DigitalWaveformProto, /) -> DigitalW
     )
 
 
+def float64_analog_waveform_to_protobuf_bytes(value: AnalogWaveform[np.float64], /) -> bytes:
+    """Convert the Python AnalogWaveform to a serialized protobuf DoubleAnalogWaveform.
+
+    The result is the same as ``float64_analog_waveform_to_protobuf(value).SerializeToString()``,
+    but the samples are written directly from the waveform's data instead of being copied into
+    a protobuf message first.
+    """
+    leading, attributes, trailing = _waveform_header_messages(DoubleAnalogWaveform, value)
+    y_data = encode_packed_fixed(DoubleAnalogWaveform.Y_DATA_FIELD_NUMBER, value.scaled_data)
+    return _join_waveform_fields(leading, y_data, attributes, trailing)
+
+
+def float32_analog_waveform_to_protobuf_bytes(value: AnalogWaveform[np.float32], /) -> bytes:
+    """Convert the Python AnalogWaveform to a serialized protobuf FloatAnalogWaveform.
+
+    See :func:`float64_analog_waveform_to_protobuf_bytes` for details.
+    """
+    leading, attributes, trailing = _waveform_header_messages(FloatAnalogWaveform, value)
+    y_data = encode_packed_fixed(
+        FloatAnalogWaveform.Y_DATA_FIELD_NUMBER, value.get_scaled_data(np.float32)
+    )
+    return _join_waveform_fields(leading, y_data, attributes, trailing)
+
+
+def int16_analog_waveform_to_protobuf_bytes(value: AnalogWaveform[np.int16], /) -> bytes:
+    """Convert the Python AnalogWaveform to a serialized protobuf I16AnalogWaveform.
+
+    The samples are encoded as zigzag varints directly from the waveform's raw data. See
+    :func:`float64_analog_waveform_to_protobuf_bytes` for details.
+    """
+    leading, attributes, trailing = _waveform_header_messages(I16AnalogWaveform, value)
+    scale = _scale_from_waveform(value)
+    if scale is not None:
+        trailing.scale.CopyFrom(scale)
+    y_data = encode_packed_sint32(I16AnalogWaveform.Y_DATA_FIELD_NUMBER, value.raw_data)
+    return _join_waveform_fields(leading, y_data, attributes, trailing)
+
+
+def float64_complex_waveform_to_protobuf_bytes(value: ComplexWaveform[np.complex128], /) -> bytes:
+    """Convert the Python ComplexWaveform to a serialized protobuf DoubleComplexWaveform.
+
+    See :func:`float64_analog_waveform_to_protobuf_bytes` for details.
+    """
+    leading, attributes, trailing = _waveform_header_messages(DoubleComplexWaveform, value)
+    y_data = encode_packed_fixed(
+        DoubleComplexWaveform.Y_DATA_FIELD_NUMBER, value.scaled_data.view(np.float64)
+    )
+    return _join_waveform_fields(leading, y_data, attributes, trailing)
+
+
+def float32_complex_waveform_to_protobuf_bytes(value: ComplexWaveform[np.complex64], /) -> bytes:
+    """Convert the Python ComplexWaveform to a serialized protobuf FloatComplexWaveform.
+
+    See :func:`float64_analog_waveform_to_protobuf_bytes` for details.
+    """
+    leading, attributes, trailing = _waveform_header_messages(FloatComplexWaveform, value)
+    y_data = encode_packed_fixed(
+        FloatComplexWaveform.Y_DATA_FIELD_NUMBER,
+        value.get_scaled_data(np.complex64).view(np.float32),
+    )
+    return _join_waveform_fields(leading, y_data, attributes, trailing)
+
+
+def int16_complex_waveform_to_protobuf_bytes(value: ComplexWaveform[ComplexInt32Base], /) -> bytes:
+    """Convert the Python ComplexWaveform to a serialized protobuf I16ComplexWaveform.
+
+    See :func:`int16_analog_waveform_to_protobuf_bytes` for details.
+    """
+    leading, attributes, trailing = _waveform_header_messages(I16ComplexWaveform, value)
+    scale = _scale_from_waveform(value)
+    if scale is not None:
+        trailing.scale.CopyFrom(scale)
+    y_data = encode_packed_sint32(
+        I16ComplexWaveform.Y_DATA_FIELD_NUMBER, value.raw_data.view(np.int16)
+    )
+    return _join_waveform_fields(leading, y_data, attributes, trailing)
+
+
+def digital_waveform_to_protobuf_bytes(value: DigitalWaveform[Any], /) -> bytes:
+    """Convert the Python DigitalWaveform to a serialized protobuf DigitalWaveform.
+
+    See :func:`float64_analog_waveform_to_protobuf_bytes` for details.
+    """
+    leading, attributes, trailing = _waveform_header_messages(DigitalWaveformProto, value)
+    leading.signal_count = value.signal_count
+    y_data = encode_length_delimited(
+        DigitalWaveformProto.Y_DATA_FIELD_NUMBER, np.ascontiguousarray(value.data).data
+    )
+    return _join_waveform_fields(leading, y_data, attributes, trailing)
+
+
+def float64_analog_waveform_protobuf_size(value: AnalogWaveform[np.float64], /) -> int:
+    """Get the serialized size of the message that float64_analog_waveform_to_protobuf returns.
+
+    The size is computed from the waveform's sample count, timing, and extended properties
+    without converting the samples, so it takes constant time for regular timing. For irregular
+    timing, the size of each timestamp is computed.
+    """
+    return _waveform_header_size(DoubleAnalogWaveform, value) + length_delimited_size(
+        DoubleAnalogWaveform.Y_DATA_FIELD_NUMBER, 8 * value.sample_count
+    )
+
+
+def float32_analog_waveform_protobuf_size(value: AnalogWaveform[np.float32], /) -> int:
+    """Get the serialized size of the message that float32_analog_waveform_to_protobuf returns.
+
+    See :func:`float64_analog_waveform_protobuf_size` for details.
+    """
+    return _waveform_header_size(FloatAnalogWaveform, value) + length_delimited_size(
+        FloatAnalogWaveform.Y_DATA_FIELD_NUMBER, 4 * value.sample_count
+    )
+
+
+def int16_analog_waveform_protobuf_size(value: AnalogWaveform[np.int16], /) -> int:
+    """Get the serialized size of the message that int16_analog_waveform_to_protobuf returns.
+
+    The samples are encoded as varints, so their size is computed from the raw data with
+    vectorized NumPy operations. See :func:`float64_analog_waveform_protobuf_size` for details.
+    """
+    return (
+        _waveform_header_size(I16AnalogWaveform, value)
+        + _scale_size(I16AnalogWaveform, value)
+        + packed_sint32_size(I16AnalogWaveform.Y_DATA_FIELD_NUMBER, value.raw_data)
+    )
+
+
+def float64_complex_waveform_protobuf_size(value: ComplexWaveform[np.complex128], /) -> int:
+    """Get the serialized size of the message that float64_complex_waveform_to_protobuf returns.
+
+    See :func:`float64_analog_waveform_protobuf_size` for details.
+    """
+    return _waveform_header_size(DoubleComplexWaveform, value) + length_delimited_size(
+        DoubleComplexWaveform.Y_DATA_FIELD_NUMBER, 16 * value.sample_count
+    )
+
+
+def float32_complex_waveform_protobuf_size(value: ComplexWaveform[np.complex64], /) -> int:
+    """Get the serialized size of the message that float32_complex_waveform_to_protobuf returns.
+
+    See :func:`float64_analog_waveform_protobuf_size` for details.
+    """
+    return _waveform_header_size(FloatComplexWaveform, value) + length_delimited_size(
+        FloatComplexWaveform.Y_DATA_FIELD_NUMBER, 8 * value.sample_count
+    )
+
+
+def int16_complex_waveform_protobuf_size(value: ComplexWaveform[ComplexInt32Base], /) -> int:
+    """Get the serialized size of the message that int16_complex_waveform_to_protobuf returns.
+
+    See :func:`int16_analog_waveform_protobuf_size` for details.
+    """
+    return (
+        _waveform_header_size(I16ComplexWaveform, value)
+        + _scale_size(I16ComplexWaveform, value)
+        + packed_sint32_size(I16ComplexWaveform.Y_DATA_FIELD_NUMBER, value.raw_data.view(np.int16))
+    )
+
+
+def digital_waveform_protobuf_size(value: DigitalWaveform[Any], /) -> int:
+    """Get the serialized size of the message that digital_waveform_to_protobuf returns.
+
+    See :func:`float64_analog_waveform_protobuf_size` for details.
+    """
+    return (
+        _waveform_header_size(DigitalWaveformProto, value)
+        + DigitalWaveformProto(signal_count=value.signal_count).ByteSize()
+        + length_delimited_size(DigitalWaveformProto.Y_DATA_FIELD_NUMBER, value.data.nbytes)
+    )
+
+
+def float64_spectrum_protobuf_size(value: Spectrum[np.float64], /) -> int:
+    """Get the serialized size of the message that float64_spectrum_to_protobuf returns."""
+    return _spectrum_header_size(DoubleSpectrum, value) + length_delimited_size(
+        DoubleSpectrum.DATA_FIELD_NUMBER, 8 * value.sample_count
+    )
+
+
+def float32_spectrum_protobuf_size(value: Spectrum[np.float32], /) -> int:
+    """Get the serialized size of the message that float32_spectrum_to_protobuf returns."""
+    return _spectrum_header_size(FloatSpectrum, value) + length_delimited_size(
+        FloatSpectrum.DATA_FIELD_NUMBER, 4 * value.sample_count
+    )
+
+
+def float64_analog_waveform_from_protobuf_bytes(data: Buffer, /) -> AnalogWaveform[np.float64]:
+    """Convert a serialized protobuf DoubleAnalogWaveform to a Python AnalogWaveform.
+
+    The sample data is not copied. The returned waveform's raw data is a read-only NumPy view
+    of ``data``, created with ``np.frombuffer``, and keeps a reference to ``data``. Do not
+    modify ``data`` while the waveform is in use, and if ``data`` is a buffer that can be
+    released, such as an ``mmap``, keep it open until the waveform is no longer used. The
+    samples are copied only if ``y_data`` is split across multiple records in ``data``.
+    """
+    message, payloads, extended_properties = _parse_waveform_header(DoubleAnalogWaveform, data)
+    return AnalogWaveform.from_array_1d(
+        frombuffer_le(payloads, np.float64),
+        dtype=np.float64,
+        copy=False,
+        extended_properties=extended_properties,
+        timing=_timing_from_waveform_message(message),
+        scale_mode=NoneScaleMode(),
+    )
+
+
+def float32_analog_waveform_from_protobuf_bytes(data: Buffer, /) -> AnalogWaveform[np.float32]:
+    """Convert a serialized protobuf FloatAnalogWaveform to a Python AnalogWaveform.
+
+    The sample data is not copied. See :func:`float64_analog_waveform_from_protobuf_bytes` for
+    the lifetime rules of the returned waveform's raw data.
+    """
+    message, payloads, extended_properties = _parse_waveform_header(FloatAnalogWaveform, data)
+    return AnalogWaveform.from_array_1d(
+        frombuffer_le(payloads, np.float32),
+        dtype=np.float32,
+        copy=False,
+        extended_properties=extended_properties,
+        timing=_timing_from_waveform_message(message),
+        scale_mode=NoneScaleMode(),
+    )
+
+
+def int16_analog_waveform_from_protobuf_bytes(data: Buffer, /) -> AnalogWaveform[np.int16]:
+    """Convert a serialized protobuf I16AnalogWaveform to a Python AnalogWaveform.
+
+    The I16AnalogWaveform y_data field is encoded as zigzag varints, so it cannot be viewed
+    in place. Instead, the samples are decoded directly into the returned waveform's raw data
+    array without creating an intermediate list or int32 array.
+    """
+    message, payloads, extended_properties = _parse_waveform_header(I16AnalogWaveform, data)
+    return AnalogWaveform.from_array_1d(
+        decode_packed_sint32(payloads, np.int16),
+        dtype=np.int16,
+        copy=False,
+        extended_properties=extended_properties,
+        timing=_timing_from_waveform_message(message),
+        scale_mode=_scale_mode_from_waveform_message(message),
+    )
+
+
+def float64_complex_waveform_from_protobuf_bytes(data: Buffer, /) -> ComplexWaveform[np.complex128]:
+    """Convert a serialized protobuf DoubleComplexWaveform to a Python ComplexWaveform.
+
+    The sample data is not copied. See :func:`float64_analog_waveform_from_protobuf_bytes` for
+    the lifetime rules of the returned waveform's raw data.
+    """
+    message, payloads, extended_properties = _parse_waveform_header(DoubleComplexWaveform, data)
+    return ComplexWaveform.from_array_1d(
+        frombuffer_le(payloads, np.float64).view(np.complex128),
+        copy=False,
+        extended_properties=extended_properties,
+        timing=_timing_from_waveform_message(message),
+        scale_mode=NoneScaleMode(),
+    )
+
+
+def float32_complex_waveform_from_protobuf_bytes(data: Buffer, /) -> ComplexWaveform[np.complex64]:
+    """Convert a serialized protobuf FloatComplexWaveform to a Python ComplexWaveform.
+
+    The sample data is not copied. See :func:`float64_analog_waveform_from_protobuf_bytes` for
+    the lifetime rules of the returned waveform's raw data.
+    """
+    message, payloads, extended_properties = _parse_waveform_header(FloatComplexWaveform, data)
+    return ComplexWaveform.from_array_1d(
+        frombuffer_le(payloads, np.float32).view(np.complex64),
+        copy=False,
+        extended_properties=extended_properties,
+        timing=_timing_from_waveform_message(message),
+        scale_mode=NoneScaleMode(),
+    )
+
+
+def int16_complex_waveform_from_protobuf_bytes(
+    data: Buffer, /
+) -> ComplexWaveform[ComplexInt32Base]:
+    """Convert a serialized protobuf I16ComplexWaveform to a Python ComplexWaveform.
+
+    The samples are decoded directly into the returned waveform's raw data array. See
+    :func:`int16_analog_waveform_from_protobuf_bytes` for details.
+    """
+    message, payloads, extended_properties = _parse_waveform_header(I16ComplexWaveform, data)
+    return ComplexWaveform.from_array_1d(
+        decode_packed_sint32(payloads, np.int16).view(ComplexInt32DType),
+        copy=False,
+        extended_properties=extended_properties,
+        timing=_timing_from_waveform_message(message),
+        scale_mode=_scale_mode_from_waveform_message(message),
+    )
+
+
+def digital_waveform_from_protobuf_bytes(data: Buffer, /) -> DigitalWaveform[np.uint8]:
+    """Convert a serialized protobuf DigitalWaveform to a Python DigitalWaveform.
+
+    The sample data is not copied. The returned waveform's data is always a read-only NumPy
+    view of ``data``. See :func:`float64_analog_waveform_from_protobuf_bytes` for the lifetime
+    rules.
+    """
+    message, payloads, extended_properties = _parse_waveform_header(DigitalWaveformProto, data)
+    return DigitalWaveform.from_lines(
+        _digital_data_from_buffer(_last_payload(payloads), message.signal_count),
+        dtype=np.uint8,
+        copy=False,
+        signal_count=message.signal_count,
+        extended_properties=extended_properties,
+        timing=_timing_from_waveform_message(message),
+    )
+
+
+def digital_waveform_signals_from_protobuf(
+    value: DigitalWaveformProto | Buffer, signal_indices: Sequence[int], /
+) -> DigitalWaveform[np.uint8]:
+    """Convert a subset of the signals in a protobuf DigitalWaveform to a Python DigitalWaveform.
+
+    Args:
+        value: A protobuf DigitalWaveform or its serialized bytes. If ``value`` is a serialized
+            message, only the columns of the requested signals are copied out of it.
+        signal_indices: The signal indices to convert, where signal index 0 is line 0. The
+            returned waveform's signal ``i`` is the message's signal ``signal_indices[i]``.
+
+    Returns:
+        A waveform containing the requested signals. If the message has the ``NI_LineNames``
+        attribute, the returned waveform has the names of the requested signals.
+    """
+    if isinstance(value, DigitalWaveformProto):
+        message = value
+        extended_properties: Mapping[str, ExtendedPropertyValue] = (
+            _attributes_to_extended_properties(message.attributes)
+        )
+        data = _digital_data_from_buffer(message.y_data, message.signal_count)
+    else:
+        message, payloads, extended_properties = _parse_waveform_header(DigitalWaveformProto, value)
+        data = _digital_data_from_buffer(_last_payload(payloads), message.signal_count)
+
+    signal_count = message.signal_count
+    for signal_index in signal_indices:
+        if not 0 <= signal_index < signal_count:
+            raise ValueError(
+                "The signal index must be a non-negative integer less than the number of signals."
+                f"\n\nSignal index: {signal_index}\nNumber of signals: {signal_count}"
+            )
+    # Signal index 0 is the last column, so the requested columns are in reverse order.
+    columns = [signal_count - 1 - signal_index for signal_index in reversed(signal_indices)]
+    line_names = extended_properties.get(_LINE_NAMES)
+    if isinstance(line_names, str):
+        names = [name.strip() for name in line_names.split(",")]
+        names += [""] * (signal_count - len(names))
+        extended_properties = dict(extended_properties)
+        extended_properties[_LINE_NAMES] = ", ".join(names[column] for column in columns)
+
+    return DigitalWaveform.from_lines(
+        data[:, columns],
+        dtype=np.uint8,
+        copy=False,
+        signal_count=len(columns),
+        extended_properties=extended_properties,
+        timing=_timing_from_waveform_message(message),
+    )
+
+
+def _last_payload(payloads: list[memoryview]) -> memoryview:
+    # y_data is a bytes field, so the last record wins.
+    return payloads[-1] if payloads else memoryview(b"")
+
+
+def _digital_data_from_buffer(data: bytes | memoryview, signal_count: int) -> npt.NDArray[np.uint8]:
+    if signal_count <= 0:
+        raise ValueError("signal_count must be greater than zero.")
+    data_array: npt.NDArray[np.uint8] = np.frombuffer(data, dtype=np.uint8)
+    samples_per_signal = len(data_array) // signal_count
+    if len(data_array) != samples_per_signal * signal_count:
+        raise ValueError(f"Data array length ({len(data_array)}) does not match expected shape.")
+    return data_array.reshape(samples_per_signal, signal_count)
+
+
+def _quantize_int16(
+    data: npt.NDArray[np.float64],
+) -> tuple[npt.NDArray[np.int16], LinearScaleMode, QuantizationError]:
+    if not len(data):
+        return np.empty(0, np.int16), LinearScaleMode(1.0, 0.0), QuantizationError(0.0, 0.0)
+    minimum, maximum = float(data.min()), float(data.max())
+    if not (math.isfinite(minimum) and math.isfinite(maximum)):
+        raise ValueError("Waveform data with NaN or infinite values cannot be quantized.")
+    if minimum == maximum:
+        return (
+            np.zeros(len(data), np.int16),
+            LinearScaleMode(1.0, minimum),
+            QuantizationError(0.0, 0.0),
+        )
+    gain = (maximum - minimum) / (_INT16_MAX - _INT16_MIN)
+    if not math.isfinite(gain):
+        raise ValueError("The range of the waveform data is too large to quantize.")
+    # Map the minimum to the smallest Int16 value and the maximum to the largest.
+    offset = minimum - _INT16_MIN * gain
+
+    # Reuse one float64 buffer for the scaled samples and then the errors.
+    buffer = data - offset
+    buffer /= gain
+    np.rint(buffer, out=buffer)
+    np.clip(buffer, _INT16_MIN, _INT16_MAX, out=buffer)
+    raw_data = buffer.astype(np.int16)
+    buffer *= gain
+    buffer += offset
+    buffer -= data
+    return raw_data, LinearScaleMode(gain, offset), _error_from_differences(buffer)
+
+
+def _downcast_float32(
+    data: npt.NDArray[np.float64],
+) -> tuple[npt.NDArray[np.float32], QuantizationError | None]:
+    """Round the data to float32 and return the rounding error, or None if it overflows."""
+    with np.errstate(over="ignore"):
+        float32_data = data.astype(np.float32)
+    differences = float32_data.astype(np.float64)
+    with np.errstate(invalid="ignore"):
+        differences -= data
+    finite = np.isfinite(data)
+    if not finite.all():
+        if np.isinf(float32_data[finite]).any():
+            return float32_data, None
+        differences = differences[finite]
+    elif np.isinf(differences).any():
+        return float32_data, None
+    return float32_data, _error_from_differences(differences)
+
+
+def _error_from_differences(differences: npt.NDArray[np.float64]) -> QuantizationError:
+    if not len(differences):
+        return QuantizationError(0.0, 0.0)
+    max_error = max(float(differences.max()), -float(differences.min()))
+    rms_error = math.sqrt(float(np.dot(differences, differences)) / len(differences))
+    return QuantizationError(max_error, rms_error)
+
+
+def _int16_message_from_raw_data(
+    value: AnalogWaveform[np.float64], raw_data: npt.NDArray[np.int16], scale_mode: ScaleMode
+) -> I16AnalogWaveform:
+    waveform = AnalogWaveform.from_array_1d(
+        raw_data,
+        copy=False,
+        extended_properties=value.extended_properties,
+        timing=value.timing,
+        scale_mode=scale_mode,
+    )
+    return I16AnalogWaveform.FromString(int16_analog_waveform_to_protobuf_bytes(waveform))
+
+
+def _float32_message_from_data(
+    value: AnalogWaveform[np.float64], data: npt.NDArray[np.float32]
+) -> FloatAnalogWaveform:
+    waveform = AnalogWaveform.from_array_1d(
+        data, copy=False, extended_properties=value.extended_properties, timing=value.timing
+    )
+    return FloatAnalogWaveform.FromString(float32_analog_waveform_to_protobuf_bytes(waveform))
+
+
+def _waveform_header_size(message_type: type[AnyWaveformProto], value: AnyNiWaveform) -> int:
+    size = len(_get_serialized_attributes(message_type, value.extended_properties))
+    if value.timing.sample_interval_mode in [SampleIntervalMode.REGULAR, SampleIntervalMode.NONE]:
+        size += message_type(
+            t0=_t0_from_waveform(value),
+            dt=_time_interval_from_waveform(value),
+            timestamp=_timestamp_from_waveform(value),
+            time_offset=_time_offset_from_waveform(value),
+        ).ByteSize()
+    elif value.timing.sample_interval_mode == SampleIntervalMode.IRREGULAR:
+        seconds, fractional_seconds = _timestamp_arrays_from_timing(
+            value.timing, value.sample_count
+        )
+        size += precision_timestamps_size(
+            message_type.TIMESTAMPS_FIELD_NUMBER, seconds, fractional_seconds
+        )
+    else:
+        raise ValueError(f"Invalid sample interval mode: {value.timing.sample_interval_mode}")
+    return size
+
+
+def _scale_size(
+    message_type: type[I16AnalogWaveform] | type[I16ComplexWaveform],
+    value: AnalogWaveform[Any] | ComplexWaveform[Any],
+) -> int:
+    scale = _scale_from_waveform(value)
+    return message_type(scale=scale).ByteSize() if scale is not None else 0
+
+
+def _spectrum_header_size(
+    message_type: type[DoubleSpectrum] | type[FloatSpectrum], value: Spectrum[Any]
+) -> int:
+    return message_type(
+        start_frequency=value.start_frequency,
+        frequency_increment=value.frequency_increment,
+    ).ByteSize() + len(_get_serialized_attributes(message_type, value.extended_properties))
+
+
+def _waveform_header_messages(
+    message_type: type[_TWaveformProto], value: AnyNiWaveform
+) -> tuple[_TWaveformProto, bytes, _TWaveformProto]:
+    # Protobuf serializes fields in field number order, so the fields before y_data and the
+    # fields after it are serialized separately. The attributes field is the first field after
+    # y_data, and its serialized bytes are cached.
+    attributes = _get_serialized_attributes(message_type, value.extended_properties)
+    if value.timing.sample_interval_mode in [SampleIntervalMode.REGULAR, SampleIntervalMode.NONE]:
+        leading = message_type(
+            t0=_t0_from_waveform(value),
+            dt=_time_interval_from_waveform(value),
+        )
+        trailing = message_type(
+            timestamp=_timestamp_from_waveform(value),
+            time_offset=_time_offset_from_waveform(value),
+        )
+    elif value.timing.sample_interval_mode == SampleIntervalMode.IRREGULAR:
+        leading = message_type()
+        trailing = message_type()
+        _add_timestamps_from_waveform(trailing, value)
+    else:
+        raise ValueError(f"Invalid sample interval mode: {value.timing.sample_interval_mode}")
+    return leading, attributes, trailing
+
+
+def _join_waveform_fields(
+    leading: AnyWaveformProto, y_data: list[Buffer], attributes: bytes, trailing: AnyWaveformProto
+) -> bytes:
+    return b"".join(
+        [leading.SerializeToString(), *y_data, attributes, trailing.SerializeToString()]
+    )
+
+
+def _parse_waveform_header(
+    message_type: type[_TWaveformProto], data: Buffer
+) -> tuple[_TWaveformProto, list[memoryview], Mapping[str, ExtendedPropertyValue]]:
+    # The attributes are split out of the header so that they can be looked up in the cache
+    # instead of being parsed.
+    buffer = memoryview(data).cast("B")
+    header: list[memoryview] = []
+    payloads: list[memoryview] = []
+    attributes: list[memoryview] = []
+    for field in parse_fields(buffer):
+        if field.number == message_type.Y_DATA_FIELD_NUMBER:
+            payloads.append(buffer[field.value_start : field.end])
+        elif field.number == message_type.ATTRIBUTES_FIELD_NUMBER:
+            attributes.append(buffer[field.start : field.end])
+        else:
+            header.append(buffer[field.start : field.end])
+    message = message_type()
+    message.ParseFromString(b"".join(header))
+    serialized_attributes = b"".join(attributes)
+    extended_properties = _get_extended_properties(message_type, serialized_attributes)
+    return message, payloads, extended_properties
+
+
 def _attributes_to_extended_properties(
     attributes: Mapping[str, WaveformAttributeValue],
 ) -> Mapping[str, ExtendedPropertyValue]:
@@ -418,64 +1093,81 @@ def _attributes_to_extended_properties(
     return extended_properties
 
 
-def _extended_properties_to_attributes(
-    extended_properties: ExtendedPropertyDictionary,
-) -> Mapping[str, WaveformAttributeValue]:
-    return {key: _value_to_attribute(value) for key, value in extended_properties.items()}
-
-
-def _value_to_attribute(value: ExtendedPropertyValue) -> WaveformAttributeValue:
-    attr_value = WaveformAttributeValue()
-    if isinstance(value, bool):
-        attr_value.bool_value = value
-    elif isinstance(value, int):
-        attr_value.integer_value = value
-    elif isinstance(value, float):
-        attr_value.double_value = value
-    elif isinstance(value, str):
-        attr_value.string_value = value
-    else:
-        raise TypeError(f"Unexpected type for extended property value {type(value)}")
-
-    return attr_value
+def _t0_from_waveform(waveform: AnyNiWaveform) -> PrecisionTimestamp | None:
+    return _t0_from_timing(waveform.timing)
 
 
-def _t0_from_waveform(waveform: AnyNiWaveform) -> PrecisionTimestamp | None:
-    if waveform.timing.has_start_time:
-        bin_datetime = convert_datetime(bt.DateTime, waveform.timing.start_time)
+def _t0_from_timing(
+    timing: Timing[AnyDateTime, AnyTimeDelta, AnyTimeDelta],
+) -> PrecisionTimestamp | None:
+    if timing.has_start_time:
+        bin_datetime = convert_datetime(bt.DateTime, timing.start_time)
         return ptc.bintime_datetime_to_protobuf(bin_datetime)
     else:
         return None
 
 
 def _timestamp_from_waveform(waveform: AnyNiWaveform) -> PrecisionTimestamp | None:
-    if waveform.timing.has_timestamp:
-        bin_datetime = convert_datetime(bt.DateTime, waveform.timing.timestamp)
+    return _timestamp_from_timing(waveform.timing)
+
+
+def _timestamp_from_timing(
+    timing: Timing[AnyDateTime, AnyTimeDelta, AnyTimeDelta],
+) -> PrecisionTimestamp | None:
+    if timing.has_timestamp:
+        bin_datetime = convert_datetime(bt.DateTime, timing.timestamp)
         return ptc.bintime_datetime_to_protobuf(bin_datetime)
     else:
         return None
 
 
 def _time_offset_from_waveform(waveform: AnyNiWaveform) -> float:
-    if waveform.timing.has_time_offset:
-        return waveform.timing.time_offset.total_seconds()
+    return _time_offset_from_timing(waveform.timing)
+
+
+def _time_offset_from_timing(timing: Timing[AnyDateTime, AnyTimeDelta, AnyTimeDelta]) -> float:
+    if timing.has_time_offset:
+        return timing.time_offset.total_seconds()
     else:
         return 0
 
 
-def _timestamps_from_waveform(waveform: AnyNiWaveform) -> Iterable[PrecisionTimestamp] | None:
-    if waveform.timing.sample_interval_mode == SampleIntervalMode.IRREGULAR:
-        timestamps = waveform.timing.get_timestamps(0, waveform.sample_count)
-        return [
-            ptc.bintime_datetime_to_protobuf(convert_datetime(bt.DateTime, ts)) for ts in timestamps
-        ]
-    else:
-        return None
+def _add_timestamps_from_waveform(message: AnyWaveformProto, waveform: AnyNiWaveform) -> None:
+    _add_timestamps_from_timing(message, waveform.timing, waveform.sample_count)
+
+
+def _add_timestamps_from_timing(
+    message: AnyWaveformProto,
+    timing: Timing[AnyDateTime, AnyTimeDelta, AnyTimeDelta],
+    sample_count: int,
+) -> None:
+    seconds, fractional_seconds = _timestamp_arrays_from_timing(timing, sample_count)
+    message.MergeFromString(
+        encode_precision_timestamps(message.TIMESTAMPS_FIELD_NUMBER, seconds, fractional_seconds)
+    )
+
+
+def _timestamp_arrays_from_timing(
+    timing: Timing[AnyDateTime, AnyTimeDelta, AnyTimeDelta], sample_count: int
+) -> tuple[npt.NDArray[np.int64], npt.NDArray[np.uint64]]:
+    timestamps = timing.get_timestamps(0, sample_count)
+    time_values = np.array(
+        [
+            (ts if isinstance(ts, bt.DateTime) else convert_datetime(bt.DateTime, ts)).to_tuple()
+            for ts in timestamps
+        ],
+        dtype=_TIME_VALUE_DTYPE,
+    )
+    return time_values["seconds"], time_values["fractional_seconds"]
 
 
 def _time_interval_from_waveform(waveform: AnyNiWaveform) -> float:
-    if waveform.timing.has_sample_interval:
-        return waveform.timing.sample_interval.total_seconds()
+    return _time_interval_from_timing(waveform.timing)
+
+
+def _time_interval_from_timing(timing: Timing[AnyDateTime, AnyTimeDelta, AnyTimeDelta]) -> float:
+    if timing.has_sample_interval:
+        return timing.sample_interval.total_seconds()
     else:
         return 0
 
@@ -483,83 +1175,103 @@ def _time_interval_from_waveform(waveform: AnyNiWaveform) -> float:
 def _timing_from_waveform_message(
     message: AnyWaveformProto,
 ) -> Timing[AnyDateTime, AnyTimeDelta, AnyTimeDelta]:
-    timing: Timing[AnyDateTime, AnyTimeDelta, AnyTimeDelta]
-    _check_regular_vs_irregular_fields(message)
+    # Each field's presence is computed once, and regular timing is looked up in the cache.
+    has_t0 = _has_t0(message)
+    has_timestamp = _has_timestamp(message)
+    validate = _validate_input()
     if message.timestamps:
-        timestamps_list = [ptc.bintime_datetime_from_protobuf(ts) for ts in message.timestamps]
-        timing = Timing.create_with_irregular_interval(timestamps_list)
-    else:
-        # Timestamp/T0 - Precedence is given to timestamp over t0
-        raw_timestamp = _calculate_raw_timestamp(message)
-        bin_datetime: bt.DateTime | None
-        if raw_timestamp:
-            bin_datetime = ptc.bintime_datetime_from_protobuf(raw_timestamp)
-        else:
-            bin_datetime = None
-
-        # Time Offset - Use hightime to avoid bruising of the float proto value.
-        time_offset = ht.timedelta(seconds=message.time_offset)
-
-        # Sample Interval
-        if not message.dt:
-            timing = Timing.create_with_no_interval(timestamp=bin_datetime, time_offset=time_offset)
-        else:
-            sample_interval = ht.timedelta(seconds=message.dt)
-            timing = Timing.create_with_regular_interval(
-                sample_interval=sample_interval,
-                timestamp=bin_datetime,
-                time_offset=time_offset,
+        if validate and (message.dt or message.time_offset or has_t0 or has_timestamp):
+            raise ValueError(
+                "Waveform message has mutually exclusive timing fields set: "
+                "`timestamps` cannot be used together with `t0`, `timestamp`, "
+                "`time_offset`, or `dt`."
             )
+        seconds, fractional_seconds = ptc.precision_timestamps_to_arrays(message.timestamps)
+        # NI-BTF ticks are 64.64 fixed point, so this is equivalent to DateTime.from_tuple()
+        # without creating a TimeValueTuple per sample.
+        timestamps_list = [
+            bt.DateTime.from_ticks(whole_seconds << 64 | fraction)
+            for whole_seconds, fraction in zip(seconds.tolist(), fractional_seconds.tolist())
+        ]
+        return Timing.create_with_irregular_interval(timestamps_list)
 
-    return timing
+    if validate and not has_timestamp and has_t0 and message.time_offset:
+        raise ValueError("Timestamp must be set when supplying a TimeOffset and T0.")
 
+    # Timestamp/T0 - Precedence is given to timestamp over t0
+    raw_timestamp: PrecisionTimestamp | None = None
+    if has_timestamp:
+        raw_timestamp = message.timestamp
+    elif has_t0:
+        raw_timestamp = message.t0
 
-def _check_regular_vs_irregular_fields(message: AnyWaveformProto) -> None:
-    has_any_regular_timing_fields = (
-        message.dt or message.time_offset or _has_t0(message) or _has_timestamp(message)
+    key = (
+        message.dt,
+        message.time_offset,
+        raw_timestamp.seconds if raw_timestamp is not None else 0,
+        raw_timestamp.fractional_seconds if raw_timestamp is not None else -1,
     )
-    if message.timestamps and has_any_regular_timing_fields:
-        raise ValueError(
-            "Waveform message has mutually exclusive timing fields set: "
-            "`timestamps` cannot be used together with `t0`, `timestamp`, "
-            "`time_offset`, or `dt`."
-        )
-
-
-def _calculate_raw_timestamp(message: AnyWaveformProto) -> PrecisionTimestamp | None:
-    _verify_t0_timestamp_offset_relationship(message)
-    raw_timestamp = None
+    timing = _timing_cache.get(key)
+    if timing is None:
+        timing = _create_regular_timing(message.dt, message.time_offset, raw_timestamp)
+        _timing_cache.put(key, timing)
+    return timing
 
-    # Agreed precedence of timestamp over t0
-    if _has_timestamp(message):
-        raw_timestamp = message.timestamp
-    elif _has_t0(message):
-        raw_timestamp = message.t0
 
-    return raw_timestamp
+def _create_regular_timing(
+    dt: float, time_offset: float, raw_timestamp: PrecisionTimestamp | None
+) -> Timing[AnyDateTime, AnyTimeDelta, AnyTimeDelta]:
+    bin_datetime: bt.DateTime | None = None
+    if raw_timestamp is not None:
+        bin_datetime = ptc.bintime_datetime_from_protobuf(raw_timestamp)
+
+    # Time Offset - Use hightime to avoid bruising of the float proto value.
+    if not dt:
+        return Timing.create_with_no_interval(
+            timestamp=bin_datetime, time_offset=_get_time_delta(time_offset)
+        )
+    return Timing.create_with_regular_interval(
+        sample_interval=_get_time_delta(dt),
+        timestamp=bin_datetime,
+        time_offset=_get_time_delta(time_offset),
+    )
 
 
-def _verify_t0_timestamp_offset_relationship(message: AnyWaveformProto) -> None:
-    if not _has_timestamp(message) and _has_t0(message) and message.time_offset:
-        raise ValueError("Timestamp must be set when supplying a TimeOffset and T0.")
+def _get_time_delta(seconds: float) -> ht.timedelta:
+    time_delta = _time_delta_cache.get(seconds)
+    if time_delta is None:
+        time_delta = ht.timedelta(seconds=seconds)
+        _time_delta_cache.put(seconds, time_delta)
+    return time_delta
 
 
 def _has_timestamp(message: AnyWaveformProto) -> bool:
-    return message.HasField("timestamp") and not message.timestamp == DEFAULT_PRECISION_TIMESTAMP
+    # Comparing the fields is faster than comparing against DEFAULT_PRECISION_TIMESTAMP.
+    if not message.HasField("timestamp"):
+        return False
+    timestamp = message.timestamp
+    return bool(timestamp.seconds or timestamp.fractional_seconds)
 
 
 def _has_t0(message: AnyWaveformProto) -> bool:
-    return message.HasField("t0") and not message.t0 == DEFAULT_PRECISION_TIMESTAMP
+    if not message.HasField("t0"):
+        return False
+    t0 = message.t0
+    return bool(t0.seconds or t0.fractional_seconds)
 
 
 def _scale_from_waveform(waveform: AnalogWaveform[Any] | ComplexWaveform[Any]) -> Scale | None:
-    if isinstance(waveform.scale_mode, LinearScaleMode):
-        linear_scale = LinearScale(gain=waveform.scale_mode.gain, offset=waveform.scale_mode.offset)
+    return _scale_from_scale_mode(waveform.scale_mode)
+
+
+def _scale_from_scale_mode(scale_mode: ScaleMode) -> Scale | None:
+    if isinstance(scale_mode, LinearScaleMode):
+        linear_scale = LinearScale(gain=scale_mode.gain, offset=scale_mode.offset)
         return Scale(linear_scale=linear_scale)
-    elif isinstance(waveform.scale_mode, NoneScaleMode):
+    elif isinstance(scale_mode, NoneScaleMode):
         return None
     else:
-        raise ValueError(f"The waveform scale mode {waveform.scale_mode} is not supported.")
+        raise ValueError(f"The waveform scale mode {scale_mode} is not supported.")
 
 
 def _scale_mode_from_waveform_message(
@@ -0,0 +1,118 @@
+"""Methods to convert waveforms to decimated protobuf messages for display."""
+
+from __future__ import annotations
+
+import math
+
+import numpy as np
+import numpy.typing as npt
+from nitypes.waveform import AnalogWaveform, SampleIntervalMode
+from nitypes.waveform.typing import ExtendedPropertyValue
+
+from ni.protobuf.types._wire_format import encode_precision_timestamps
+from ni.protobuf.types.extended_property_conversion import _merge_attributes
+from ni.protobuf.types.waveform_conversion import (
+    _t0_from_waveform,
+    _time_interval_from_waveform,
+    _time_offset_from_waveform,
+    _timestamp_arrays_from_timing,
+    _timestamp_from_waveform,
+    float64_analog_waveform_to_protobuf,
+)
+from ni.protobuf.types.waveform_pb2 import DoubleAnalogWaveform
+
+DECIMATION_METHOD_PROPERTY = "NI_DecimationMethod"
+"""The extended property that identifies the decimation method of a decimated waveform."""
+
+DECIMATION_BUCKET_SIZE_PROPERTY = "NI_DecimationBucketSize"
+"""The extended property that contains the number of samples in each bucket of a decimated
+waveform."""
+
+MIN_MAX_DECIMATION_METHOD = "MinMax"
+"""The value of the decimation method property for min/max envelope decimation."""
+
+
+def float64_analog_waveform_to_decimated_protobuf(
+    value: AnalogWaveform[np.float64],
+    /,
+    *,
+    point_count: int | None = None,
+    bucket_size: int | None = None,
+) -> DoubleAnalogWaveform:
+    """Convert the Python AnalogWaveform to a min/max envelope protobuf DoubleAnalogWaveform.
+
+    The scaled samples are divided into buckets of ``bucket_size`` consecutive samples, and each
+    bucket is replaced by its minimum and maximum samples, in the order they occur. The envelope
+    preserves the peaks of the waveform when it is displayed with fewer points than samples.
+
+    Specify exactly one of ``point_count`` and ``bucket_size``:
+
+    * ``point_count`` is the maximum number of points in the result, such as the width of a
+      plot in pixels. If the waveform has ``point_count`` or fewer samples, it is converted
+      without decimation.
+    * ``bucket_size`` is the number of samples in each bucket. Decimating each chunk of a
+      continuous acquisition with the same ``bucket_size`` produces the same points as
+      decimating the whole acquisition, as long as each chunk except the last is a multiple of
+      ``bucket_size`` samples.
+
+    For regular timing, the result has the same ``t0`` and ``timestamp`` as the waveform, and
+    ``dt`` is half of the bucket duration. For irregular timing, the result has the timestamps
+    of the selected samples. The result has the :data:`DECIMATION_METHOD_PROPERTY` and
+    :data:`DECIMATION_BUCKET_SIZE_PROPERTY` attributes in addition to the waveform's extended
+    properties.
+    """
+    if (point_count is None) == (bucket_size is None):
+        raise ValueError("Specify exactly one of the point_count and bucket_size arguments.")
+    if point_count is not None:
+        if point_count < 2:
+            raise ValueError("The point count must be at least 2.")
+        if value.sample_count <= point_count:
+            return float64_analog_waveform_to_protobuf(value)
+        bucket_size = math.ceil(value.sample_count / (point_count // 2))
+    assert bucket_size is not None
+    if bucket_size < 1:
+        raise ValueError("The bucket size must be a positive integer.")
+
+    # Publish the scaled data, like float64_analog_waveform_to_protobuf does.
+    data = value.scaled_data
+    indices = _min_max_indices(data, bucket_size)
+    extended_properties: dict[str, ExtendedPropertyValue] = dict(value.extended_properties)
+    extended_properties[DECIMATION_METHOD_PROPERTY] = MIN_MAX_DECIMATION_METHOD
+    extended_properties[DECIMATION_BUCKET_SIZE_PROPERTY] = bucket_size
+
+    if value.timing.sample_interval_mode in [SampleIntervalMode.REGULAR, SampleIntervalMode.NONE]:
+        message = DoubleAnalogWaveform(
+            t0=_t0_from_waveform(value),
+            dt=_time_interval_from_waveform(value) * bucket_size / 2,
+            y_data=data[indices],
+            timestamp=_timestamp_from_waveform(value),
+            time_offset=_time_offset_from_waveform(value),
+        )
+    elif value.timing.sample_interval_mode == SampleIntervalMode.IRREGULAR:
+        message = DoubleAnalogWaveform(y_data=data[indices])
+        seconds, fractional_seconds = _timestamp_arrays_from_timing(
+            value.timing, value.sample_count
+        )
+        message.MergeFromString(
+            encode_precision_timestamps(
+                DoubleAnalogWaveform.TIMESTAMPS_FIELD_NUMBER,
+                seconds[indices],
+                fractional_seconds[indices],
+            )
+        )
+    else:
+        raise ValueError(f"Invalid sample interval mode: {value.timing.sample_interval_mode}")
+    return _merge_attributes(message, extended_properties)
+
+
+def _min_max_indices(data: npt.NDArray[np.float64], bucket_size: int) -> npt.NDArray[np.intp]:
+    # Reduce the full buckets as rows of a 2-D view, then the partial bucket at the end.
+    full_length = len(data) - len(data) % bucket_size
+    rows = data[:full_length].reshape(-1, bucket_size)
+    starts = np.arange(0, full_length, bucket_size)
+    indices = [np.stack([rows.argmin(axis=1), rows.argmax(axis=1)], axis=1) + starts[:, None]]
+    if full_length < len(data):
+        tail = data[full_length:]
+        indices.append(np.array([[tail.argmin(), tail.argmax()]]) + full_length)
+    # Emit each bucket's minimum and maximum in the order they occur.
+    return np.sort(np.concatenate(indices), axis=1).ravel()
@@ -0,0 +1,298 @@
+"""Memory-mapped, indexed files of serialized waveform messages.
+
+A waveform file starts with an 8-byte magic number, followed by the waveform records, the record
+index, and a footer:
+
+* Each record is a serialized ``DoubleAnalogWaveform``, ``I16AnalogWaveform``, or
+  ``DigitalWaveform`` message, preceded by its length as a varint.
+* The index has one 17-byte entry per record: the little-endian ``uint64`` offset and length of
+  the serialized message, followed by a ``uint8`` message type code.
+* The footer is the little-endian ``uint64`` offset of the index and number of records, followed
+  by the magic number again.
+
+:class:`WaveformFileReader` memory-maps the file and decodes a record, or a subset of its
+samples, without reading the other records.
+"""
+
+from __future__ import annotations
+
+import contextlib
+import mmap
+import os
+from collections.abc import Iterator
+from types import TracebackType
+from typing import Any, cast
+
+import numpy as np
+import numpy.typing as npt
+from nitypes.waveform import AnalogWaveform, DigitalWaveform
+
+from ni.protobuf.types._wire_format import encode_varint
+from ni.protobuf.types.waveform_chunking import _slice_timing
+from ni.protobuf.types.waveform_conversion import (
+    digital_waveform_to_protobuf_bytes,
+    float64_analog_waveform_to_protobuf_bytes,
+    int16_analog_waveform_to_protobuf_bytes,
+)
+from ni.protobuf.types.waveform_pb2 import (
+    DigitalWaveform as DigitalWaveformProto,
+    DoubleAnalogWaveform,
+    I16AnalogWaveform,
+)
+from ni.protobuf.types.waveform_view import (
+    DigitalWaveformView,
+    Float64AnalogWaveformView,
+    Int16AnalogWaveformView,
+)
+
+AnyFileWaveform = AnalogWaveform[np.float64] | AnalogWaveform[np.int16] | DigitalWaveform[Any]
+"""A Python waveform that can be written to a waveform file."""
+
+AnyFileWaveformProto = DoubleAnalogWaveform | I16AnalogWaveform | DigitalWaveformProto
+"""A protobuf waveform message that can be stored in a waveform file."""
+
+AnyFileWaveformView = Float64AnalogWaveformView | Int16AnalogWaveformView | DigitalWaveformView
+"""A lazy view of a waveform record in a waveform file."""
+
+_MAGIC = b"NIWFMPB\x01"
+_INDEX_DTYPE = np.dtype([("offset", "<u8"), ("length", "<u8"), ("message_type", "u1")])
+_FOOTER_DTYPE = np.dtype([("index_offset", "<u8"), ("record_count", "<u8")])
+_FOOTER_SIZE = _FOOTER_DTYPE.itemsize + len(_MAGIC)
+
+_MESSAGE_TYPE_CODES: dict[type[AnyFileWaveformProto], int] = {
+    DoubleAnalogWaveform: 1,
+    I16AnalogWaveform: 2,
+    DigitalWaveformProto: 3,
+}
+_MESSAGE_TYPES = {code: message_type for message_type, code in _MESSAGE_TYPE_CODES.items()}
+_VIEW_TYPES: dict[int, type[AnyFileWaveformView]] = {
+    1: Float64AnalogWaveformView,
+    2: Int16AnalogWaveformView,
+    3: DigitalWaveformView,
+}
+
+
+class WaveformFileWriter:
+    """Writes waveforms to a waveform file.
+
+    The index is written when the writer is closed, so a waveform file that was not closed
+    cannot be read.
+    """
+
+    def __init__(self, path: str | os.PathLike[str], /) -> None:
+        """Initialize a new WaveformFileWriter, creating or truncating the file at ``path``."""
+        self._file = open(path, "wb")
+        self._file.write(_MAGIC)
+        self._position = len(_MAGIC)
+        self._index: list[tuple[int, int, int]] = []
+
+    def __enter__(self) -> WaveformFileWriter:
+        """Enter the runtime context of the writer."""
+        return self
+
+    def __exit__(
+        self,
+        exc_type: type[BaseException] | None,
+        exc_val: BaseException | None,
+        traceback: TracebackType | None,
+    ) -> None:
+        """Close the writer."""
+        self.close()
+
+    @property
+    def record_count(self) -> int:
+        """The number of records written so far."""
+        return len(self._index)
+
+    def write(self, value: AnyFileWaveform | AnyFileWaveformProto, /) -> int:
+        """Write a Python waveform or a protobuf waveform message and return its record index.
+
+        A Python AnalogWaveform must have float64 or int16 raw data.
+        """
+        if isinstance(value, DigitalWaveform):
+            return self.write_serialized(
+                DigitalWaveformProto, digital_waveform_to_protobuf_bytes(value)
+            )
+        elif isinstance(value, AnalogWaveform):
+            if value.dtype == np.float64:
+                return self.write_serialized(
+                    DoubleAnalogWaveform,
+                    float64_analog_waveform_to_protobuf_bytes(
+                        cast(AnalogWaveform[np.float64], value)
+                    ),
+                )
+            elif value.dtype == np.int16:
+                return self.write_serialized(
+                    I16AnalogWaveform,
+                    int16_analog_waveform_to_protobuf_bytes(cast(AnalogWaveform[np.int16], value)),
+                )
+            raise TypeError(
+                "The analog waveform data type must be float64 or int16.\n\n"
+                f"Data type: {value.dtype}"
+            )
+        elif isinstance(value, (DoubleAnalogWaveform, I16AnalogWaveform, DigitalWaveformProto)):
+            return self.write_serialized(type(value), value.SerializeToString())
+        raise TypeError(f"Unsupported waveform type: {type(value).__name__}")
+
+    def write_serialized(self, message_type: type[AnyFileWaveformProto], data: bytes, /) -> int:
+        """Write a serialized protobuf waveform message and return its record index.
+
+        The data is written as is, so messages received from a gRPC stream can be spooled without
+        decoding them.
+        """
+        message_type_code = _MESSAGE_TYPE_CODES.get(message_type)
+        if message_type_code is None:
+            raise TypeError(f"Unsupported message type: {message_type.__name__}")
+        prefix = encode_varint(len(data))
+        self._file.write(prefix)
+        self._file.write(data)
+        self._index.append((self._position + len(prefix), len(data), message_type_code))
+        self._position += len(prefix) + len(data)
+        return len(self._index) - 1
+
+    def close(self) -> None:
+        """Write the index and footer and close the file."""
+        if self._file.closed:
+            return
+        try:
+            self._file.write(np.array(self._index, _INDEX_DTYPE).tobytes())
+            self._file.write(np.array((self._position, len(self._index)), _FOOTER_DTYPE).tobytes())
+            self._file.write(_MAGIC)
+        finally:
+            self._file.close()
+
+
+class WaveformFileReader:
+    """Reads waveforms from a memory-mapped waveform file.
+
+    Only the pages of the records that are accessed are read from disk. Views, serialized
+    messages, and arrays returned by the reader may refer to the memory map, which stays mapped
+    until they are released, even if the reader is closed.
+    """
+
+    def __init__(self, path: str | os.PathLike[str], /) -> None:
+        """Initialize a new WaveformFileReader for the waveform file at ``path``."""
+        with open(path, "rb") as file:
+            file_size = os.fstat(file.fileno()).st_size
+            if file_size < len(_MAGIC) + _FOOTER_SIZE:
+                raise ValueError("The file is not a waveform file or was not closed.")
+            self._mmap = mmap.mmap(file.fileno(), 0, access=mmap.ACCESS_READ)
+        self._buffer = memoryview(self._mmap)
+        footer_offset = file_size - _FOOTER_SIZE
+        if (
+            self._buffer[: len(_MAGIC)] != _MAGIC
+            or self._buffer[file_size - len(_MAGIC) :] != _MAGIC
+        ):
+            self.close()
+            raise ValueError("The file is not a waveform file or was not closed.")
+        footer = np.frombuffer(self._buffer, _FOOTER_DTYPE, 1, footer_offset)[0]
+        index_offset, record_count = int(footer["index_offset"]), int(footer["record_count"])
+        if (
+            index_offset < len(_MAGIC)
+            or index_offset + record_count * _INDEX_DTYPE.itemsize != footer_offset
+        ):
+            self.close()
+            raise ValueError("The waveform file index is corrupt.")
+        self._index = np.frombuffer(self._buffer, _INDEX_DTYPE, record_count, index_offset)
+        if not _is_index_valid(self._index, index_offset):
+            self.close()
+            raise ValueError("The waveform file index is corrupt.")
+
+    def __enter__(self) -> WaveformFileReader:
+        """Enter the runtime context of the reader."""
+        return self
+
+    def __exit__(
+        self,
+        exc_type: type[BaseException] | None,
+        exc_val: BaseException | None,
+        traceback: TracebackType | None,
+    ) -> None:
+        """Close the reader."""
+        self.close()
+
+    def __len__(self) -> int:
+        """Return the number of records in the file."""
+        return len(self._index)
+
+    def __iter__(self) -> Iterator[AnyFileWaveformView]:
+        """Iterate over lazy views of the records in the file."""
+        for index in range(len(self)):
+            yield self.get_view(index)
+
+    def get_message_type(self, index: int, /) -> type[AnyFileWaveformProto]:
+        """Get the protobuf message type of a record."""
+        return _MESSAGE_TYPES[int(self._get_entry(index)["message_type"])]
+
+    def get_serialized(self, index: int, /) -> memoryview:
+        """Get the serialized protobuf message of a record, as a view of the memory map."""
+        entry = self._get_entry(index)
+        offset, length = int(entry["offset"]), int(entry["length"])
+        return self._buffer[offset : offset + length]
+
+    def get_view(self, index: int, /) -> AnyFileWaveformView:
+        """Get a lazy view of a record.
+
+        The timing and extended properties are decoded, but the samples are not decoded until
+        they are accessed. The view's float64 and digital sample arrays are views of the memory
+        map.
+        """
+        view_type = _VIEW_TYPES[int(self._get_entry(index)["message_type"])]
+        return view_type(self.get_serialized(index))
+
+    def read(
+        self, index: int, /, start_index: int = 0, sample_count: int | None = None
+    ) -> AnalogWaveform[np.float64] | AnalogWaveform[np.int16] | DigitalWaveform[np.uint8]:
+        """Read a record, or a subset of its samples, as a Python waveform.
+
+        Only the requested samples are decoded, and they are copied out of the memory map. The
+        timing of the returned waveform starts at the first requested sample.
+        """
+        view = self.get_view(index)
+        if isinstance(view, DigitalWaveformView):
+            data = view.get_data(start_index, sample_count).copy()
+            return DigitalWaveform.from_lines(
+                data,
+                dtype=np.uint8,
+                copy=False,
+                signal_count=view.signal_count,
+                extended_properties=view.extended_properties,
+                timing=_slice_timing(view.timing, start_index, len(data)),
+            )
+        raw_data = view.get_raw_data(start_index, sample_count)
+        if isinstance(view, Float64AnalogWaveformView):
+            raw_data = raw_data.copy()
+        return AnalogWaveform.from_array_1d(
+            raw_data,
+            dtype=raw_data.dtype,
+            copy=False,
+            extended_properties=view.extended_properties,
+            timing=_slice_timing(view.timing, start_index, len(raw_data)),
+            scale_mode=view.scale_mode,
+        )
+
+    def close(self) -> None:
+        """Release the reader's references to the memory map.
+
+        The file is unmapped immediately unless views, serialized messages, or arrays that refer
+        to it are still alive, in which case it is unmapped when they are released.
+        """
+        self._index = np.empty(0, _INDEX_DTYPE)
+        with contextlib.suppress(BufferError):
+            self._buffer.release()
+            self._mmap.close()
+
+    def _get_entry(self, index: int) -> Any:
+        return self._index[range(len(self._index))[index]]
+
+
+def _is_index_valid(index: npt.NDArray[Any], index_offset: int) -> bool:
+    # Every record must be between the header and the index, so that get_serialized() does not
+    # return a truncated record.
+    offsets, lengths = index["offset"], index["length"]
+    return bool(
+        np.all(offsets >= len(_MAGIC))
+        and np.all(lengths <= index_offset)
+        and np.all(offsets <= np.uint64(index_offset) - lengths)
+        and np.all(np.isin(index["message_type"], list(_MESSAGE_TYPES)))
+    )
@@ -0,0 +1,327 @@
+"""Lazy views of waveform protobuf messages."""
+
+from __future__ import annotations
+
+import abc
+from collections.abc import Mapping
+from typing import Any, Generic, TypeVar, cast
+
+import numpy as np
+import numpy.typing as npt
+from nitypes.time.typing import AnyDateTime, AnyTimeDelta
+from nitypes.waveform import (
+    AnalogWaveform,
+    DigitalWaveform,
+    LinearScaleMode,
+    NoneScaleMode,
+    Timing,
+)
+from nitypes.waveform.typing import ExtendedPropertyValue
+from typing_extensions import Buffer
+
+from ni.protobuf.types._wire_format import (
+    count_varints,
+    decode_packed_sint32,
+    frombuffer_le,
+    skip_varints,
+)
+from ni.protobuf.types.waveform_conversion import (
+    _attributes_to_extended_properties,
+    _last_payload,
+    _parse_waveform_header,
+    _scale_mode_from_waveform_message,
+    _timing_from_waveform_message,
+)
+from ni.protobuf.types.waveform_pb2 import (
+    DigitalWaveform as DigitalWaveformProto,
+    DoubleAnalogWaveform,
+    I16AnalogWaveform,
+)
+
+_TData = TypeVar("_TData", bound=np.generic)
+_TWaveformProto = TypeVar(
+    "_TWaveformProto", bound=DoubleAnalogWaveform | I16AnalogWaveform | DigitalWaveformProto
+)
+
+
+class _WaveformView(abc.ABC, Generic[_TWaveformProto, _TData]):
+    """Base class for lazy waveform views."""
+
+    def __init__(
+        self, message_type: type[_TWaveformProto], value: _TWaveformProto | Buffer
+    ) -> None:
+        self._message: _TWaveformProto | None = None
+        self._payload: memoryview | None = None
+        if isinstance(value, message_type):
+            header = self._message = value
+            extended_properties = _attributes_to_extended_properties(header.attributes)
+        else:
+            header, payloads, extended_properties = _parse_waveform_header(
+                message_type, cast(Buffer, value)
+            )
+            self._payload = self._select_payload(payloads)
+        self._header = header
+        self._timing = _timing_from_waveform_message(header)
+        self._extended_properties = extended_properties
+        self._sample_count: int | None = None
+        self._data: npt.NDArray[_TData] | None = None
+
+    @property
+    def timing(self) -> Timing[AnyDateTime, AnyTimeDelta, AnyTimeDelta]:
+        """The timing information of the waveform."""
+        return self._timing
+
+    @property
+    def extended_properties(self) -> Mapping[str, ExtendedPropertyValue]:
+        """The extended properties of the waveform."""
+        return self._extended_properties
+
+    @property
+    def sample_count(self) -> int:
+        """The number of samples in the waveform.
+
+        This does not decode the samples.
+        """
+        if self._sample_count is None:
+            self._sample_count = self._count_samples()
+        return self._sample_count
+
+    @property
+    def is_materialized(self) -> bool:
+        """Indicates whether all of the samples have been decoded."""
+        return self._data is not None
+
+    def _get_all_data(self) -> npt.NDArray[_TData]:
+        if self._data is None:
+            self._data = self._decode(0, self.sample_count)
+        return self._data
+
+    def _get_data(self, start_index: int | None, sample_count: int | None) -> npt.NDArray[_TData]:
+        start_index = 0 if start_index is None else start_index
+        if start_index < 0:
+            raise ValueError("The start index must be a non-negative integer.")
+        if start_index > self.sample_count:
+            raise ValueError(
+                "The start index must be less than or equal to the number of samples in the "
+                f"waveform.\n\nStart index: {start_index}\nNumber of samples: {self.sample_count}"
+            )
+        sample_count = self.sample_count - start_index if sample_count is None else sample_count
+        if sample_count < 0:
+            raise ValueError("The sample count must be a non-negative integer.")
+        if start_index + sample_count > self.sample_count:
+            raise ValueError(
+                "The sum of the start index and sample count must be less than or equal to the "
+                f"number of samples in the waveform.\n\nStart index: {start_index}\n"
+                f"Sample count: {sample_count}\nNumber of samples: {self.sample_count}"
+            )
+        if self._data is not None:
+            return self._data[start_index : start_index + sample_count]
+        return self._decode(start_index, start_index + sample_count)
+
+    def _select_payload(self, payloads: list[memoryview]) -> memoryview:
+        if len(payloads) == 1:
+            return payloads[0]
+        return memoryview(b"".join(payloads))
+
+    @abc.abstractmethod
+    def _count_samples(self) -> int:
+        raise NotImplementedError
+
+    @abc.abstractmethod
+    def _decode(self, start: int, stop: int) -> npt.NDArray[_TData]:
+        raise NotImplementedError
+
+
+class Float64AnalogWaveformView(_WaveformView[DoubleAnalogWaveform, np.float64]):
+    """A lazy view of a protobuf DoubleAnalogWaveform.
+
+    The timing and extended properties are converted when the view is created, but the samples
+    are not decoded until they are accessed. This allows routing and filtering code to inspect
+    a waveform without paying for its sample data.
+    """
+
+    def __init__(self, value: DoubleAnalogWaveform | Buffer, /) -> None:
+        """Initialize a new Float64AnalogWaveformView.
+
+        Args:
+            value: A protobuf DoubleAnalogWaveform or its serialized bytes. If ``value`` is a
+                serialized message, the samples are views of ``value`` and the lifetime rules of
+                :func:`float64_analog_waveform_from_protobuf_bytes` apply.
+        """
+        super().__init__(DoubleAnalogWaveform, value)
+
+    @property
+    def scale_mode(self) -> NoneScaleMode:
+        """The scale mode of the waveform."""
+        return NoneScaleMode()
+
+    @property
+    def raw_data(self) -> npt.NDArray[np.float64]:
+        """The raw waveform data, decoded on first access."""
+        return self._get_all_data()
+
+    def get_raw_data(
+        self, start_index: int | None = 0, sample_count: int | None = None
+    ) -> npt.NDArray[np.float64]:
+        """Get a subset of the raw waveform data, decoding only the requested samples."""
+        return self._get_data(start_index, sample_count)
+
+    def to_waveform(self) -> AnalogWaveform[np.float64]:
+        """Convert the view to a Python AnalogWaveform."""
+        return AnalogWaveform.from_array_1d(
+            self.raw_data,
+            dtype=np.float64,
+            copy=False,
+            extended_properties=self._extended_properties,
+            timing=self._timing,
+            scale_mode=NoneScaleMode(),
+        )
+
+    def _count_samples(self) -> int:
+        if self._payload is None:
+            assert self._message is not None
+            return len(self._message.y_data)
+        payload_length = len(self._payload)
+        if payload_length % 8:
+            raise ValueError(
+                "The y_data length must be a multiple of 8 bytes.\n\n" f"Length: {payload_length}"
+            )
+        return payload_length // 8
+
+    def _decode(self, start: int, stop: int) -> npt.NDArray[np.float64]:
+        if self._payload is None:
+            assert self._message is not None
+            return np.array(self._message.y_data[start:stop], np.float64)
+        data = frombuffer_le([self._payload], np.float64).astype(np.float64, copy=False)
+        return data[start:stop]
+
+
+class Int16AnalogWaveformView(_WaveformView[I16AnalogWaveform, np.int16]):
+    """A lazy view of a protobuf I16AnalogWaveform.
+
+    The timing, extended properties, and scale mode are converted when the view is created, but
+    the samples are not decoded until they are accessed.
+    """
+
+    def __init__(self, value: I16AnalogWaveform | Buffer, /) -> None:
+        """Initialize a new Int16AnalogWaveformView.
+
+        Args:
+            value: A protobuf I16AnalogWaveform or its serialized bytes.
+        """
+        super().__init__(I16AnalogWaveform, value)
+        self._scale_mode = _scale_mode_from_waveform_message(self._header)
+
+    @property
+    def scale_mode(self) -> LinearScaleMode | NoneScaleMode:
+        """The scale mode of the waveform."""
+        return self._scale_mode
+
+    @property
+    def raw_data(self) -> npt.NDArray[np.int16]:
+        """The raw waveform data, decoded on first access."""
+        return self._get_all_data()
+
+    def get_raw_data(
+        self, start_index: int | None = 0, sample_count: int | None = None
+    ) -> npt.NDArray[np.int16]:
+        """Get a subset of the raw waveform data, decoding only the requested samples.
+
+        The y_data field is encoded as varints, so finding the first requested sample of a
+        serialized message scans the preceding bytes, but only the requested samples are decoded.
+        """
+        return self._get_data(start_index, sample_count)
+
+    def to_waveform(self) -> AnalogWaveform[np.int16]:
+        """Convert the view to a Python AnalogWaveform."""
+        return AnalogWaveform.from_array_1d(
+            self.raw_data,
+            dtype=np.int16,
+            copy=False,
+            extended_properties=self._extended_properties,
+            timing=self._timing,
+            scale_mode=self._scale_mode,
+        )
+
+    def _count_samples(self) -> int:
+        if self._payload is None:
+            assert self._message is not None
+            return len(self._message.y_data)
+        return count_varints(self._payload)
+
+    def _decode(self, start: int, stop: int) -> npt.NDArray[np.int16]:
+        if self._payload is None:
+            assert self._message is not None
+            return np.array(self._message.y_data[start:stop], np.int16)
+        start_pos = skip_varints(self._payload, start)
+        stop_pos = skip_varints(self._payload, stop - start, start_pos)
+        return decode_packed_sint32([self._payload[start_pos:stop_pos]], np.int16).astype(
+            np.int16, copy=False
+        )
+
+
+class DigitalWaveformView(_WaveformView[DigitalWaveformProto, np.uint8]):
+    """A lazy view of a protobuf DigitalWaveform.
+
+    The timing, extended properties, and signal count are converted when the view is created,
+    but the samples are not copied into an array until they are accessed.
+    """
+
+    def __init__(self, value: DigitalWaveformProto | Buffer, /) -> None:
+        """Initialize a new DigitalWaveformView.
+
+        Args:
+            value: A protobuf DigitalWaveform or its serialized bytes. If ``value`` is a
+                serialized message, the samples are views of ``value``.
+        """
+        super().__init__(DigitalWaveformProto, value)
+        if self._header.signal_count <= 0:
+            raise ValueError("signal_count must be greater than zero.")
+        self._signal_count = self._header.signal_count
+
+    @property
+    def signal_count(self) -> int:
+        """The number of signals in the waveform."""
+        return self._signal_count
+
+    @property
+    def data(self) -> npt.NDArray[np.uint8]:
+        """The waveform data, indexed by sample and signal, decoded on first access."""
+        return self._get_all_data()
+
+    def get_data(
+        self, start_index: int | None = 0, sample_count: int | None = None
+    ) -> npt.NDArray[np.uint8]:
+        """Get a subset of the waveform data, indexed by sample and signal."""
+        return self._get_data(start_index, sample_count)
+
+    def to_waveform(self) -> DigitalWaveform[np.uint8]:
+        """Convert the view to a Python DigitalWaveform."""
+        return DigitalWaveform.from_lines(
+            self.data,
+            dtype=np.uint8,
+            copy=False,
+            signal_count=self._signal_count,
+            extended_properties=self._extended_properties,
+            timing=self._timing,
+        )
+
+    def _select_payload(self, payloads: list[memoryview]) -> memoryview:
+        return _last_payload(payloads)
+
+    def _get_payload(self) -> memoryview:
+        if self._payload is None:
+            assert self._message is not None
+            # Reading a bytes field copies it, so only read it once.
+            self._payload = memoryview(self._message.y_data)
+        return self._payload
+
+    def _count_samples(self) -> int:
+        payload_length = len(self._get_payload())
+        if payload_length % self._signal_count:
+            raise ValueError(f"Data array length ({payload_length}) does not match expected shape.")
+        return payload_length // self._signal_count
+
+    def _decode(self, start: int, stop: int) -> npt.NDArray[np.uint8]:
+        data: npt.NDArray[Any] = np.frombuffer(self._get_payload(), np.uint8)
+        return data.reshape(-1, self._signal_count)[start:stop]
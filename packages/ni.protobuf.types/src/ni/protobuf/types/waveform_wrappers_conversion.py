@@ -0,0 +1,952 @@
+"""Methods to convert to and from waveform array value protobuf messages."""
+
+from __future__ import annotations
+
+from collections.abc import Callable, Hashable, Iterator, Mapping, Sequence
+from typing import Any, TypeVar
+
+import numpy as np
+import numpy.typing as npt
+from google.protobuf.internal.containers import RepeatedCompositeFieldContainer
+from nitypes.complex import ComplexInt32Base, ComplexInt32DType
+from nitypes.time.typing import AnyDateTime, AnyTimeDelta
+from nitypes.waveform import (
+    AnalogWaveform,
+    ComplexWaveform,
+    DigitalWaveform,
+    LinearScaleMode,
+    NoneScaleMode,
+    SampleIntervalMode,
+    ScaleMode,
+    Spectrum,
+    Timing,
+)
+from nitypes.waveform.typing import ExtendedPropertyValue
+from typing_extensions import Buffer
+
+from ni.protobuf.types._wire_format import (
+    encode_length_delimited,
+    encode_packed_fixed,
+    encode_packed_sint32,
+)
+from ni.protobuf.types.extended_property_conversion import (
+    _extended_properties_key,
+    _get_serialized_attributes,
+    _merge_attributes,
+)
+from ni.protobuf.types.waveform_conversion import (
+    AnyNiWaveform,
+    AnyWaveformProto,
+    _add_timestamps_from_timing,
+    _attributes_to_extended_properties,
+    _scale_from_scale_mode,
+    _scale_from_waveform,
+    _scale_mode_from_waveform_message,
+    _t0_from_timing,
+    _t0_from_waveform,
+    _time_interval_from_timing,
+    _time_interval_from_waveform,
+    _time_offset_from_timing,
+    _time_offset_from_waveform,
+    _timestamp_from_timing,
+    _timestamp_from_waveform,
+    _timing_from_waveform_message,
+    digital_waveform_from_protobuf,
+    digital_waveform_to_protobuf,
+    float32_analog_waveform_from_protobuf,
+    float32_analog_waveform_to_protobuf,
+    float32_complex_waveform_from_protobuf,
+    float32_complex_waveform_to_protobuf,
+    float64_analog_waveform_from_protobuf,
+    float64_analog_waveform_to_protobuf,
+    float64_complex_waveform_from_protobuf,
+    float64_complex_waveform_to_protobuf,
+    int16_analog_waveform_from_protobuf,
+    int16_analog_waveform_to_protobuf,
+    int16_complex_waveform_from_protobuf,
+    int16_complex_waveform_to_protobuf,
+)
+from ni.protobuf.types.waveform_pb2 import (
+    DigitalWaveform as DigitalWaveformProto,
+    DoubleAnalogWaveform,
+    DoubleComplexWaveform,
+    DoubleSpectrum,
+    FloatAnalogWaveform,
+    FloatComplexWaveform,
+    FloatSpectrum,
+    I16AnalogWaveform,
+    I16ComplexWaveform,
+)
+from ni.protobuf.types.waveform_wrappers_pb2 import (
+    DigitalWaveformArrayValue,
+    DoubleAnalogWaveformArrayValue,
+    DoubleComplexWaveformArrayValue,
+    DoubleSpectrumArrayValue,
+    FloatAnalogWaveformArrayValue,
+    FloatComplexWaveformArrayValue,
+    FloatSpectrumArrayValue,
+    I16AnalogWaveformArrayValue,
+    I16ComplexWaveformArrayValue,
+)
+
+_AnyTiming = Timing[AnyDateTime, AnyTimeDelta, AnyTimeDelta]
+
+_TWaveform = TypeVar("_TWaveform", bound=AnyNiWaveform)
+_TNumericWaveform = TypeVar("_TNumericWaveform", bound=AnalogWaveform[Any] | ComplexWaveform[Any])
+_TWaveformProto = TypeVar("_TWaveformProto", bound=AnyWaveformProto)
+_TSpectrumProto = TypeVar("_TSpectrumProto", bound=DoubleSpectrum | FloatSpectrum)
+
+_ROW_ENCODERS: dict[type[AnyWaveformProto], Callable[[npt.NDArray[Any]], list[Buffer]]] = {
+    DoubleAnalogWaveform: lambda row: encode_packed_fixed(
+        DoubleAnalogWaveform.Y_DATA_FIELD_NUMBER, row
+    ),
+    FloatAnalogWaveform: lambda row: encode_packed_fixed(
+        FloatAnalogWaveform.Y_DATA_FIELD_NUMBER, row
+    ),
+    I16AnalogWaveform: lambda row: encode_packed_sint32(I16AnalogWaveform.Y_DATA_FIELD_NUMBER, row),
+    DoubleComplexWaveform: lambda row: encode_packed_fixed(
+        DoubleComplexWaveform.Y_DATA_FIELD_NUMBER, row.view(np.float64)
+    ),
+    FloatComplexWaveform: lambda row: encode_packed_fixed(
+        FloatComplexWaveform.Y_DATA_FIELD_NUMBER, row.view(np.float32)
+    ),
+    I16ComplexWaveform: lambda row: encode_packed_sint32(
+        I16ComplexWaveform.Y_DATA_FIELD_NUMBER, row.view(np.int16)
+    ),
+}
+
+
+def float64_analog_waveforms_to_protobuf(
+    values: Sequence[AnalogWaveform[np.float64]] | npt.NDArray[np.float64],
+    /,
+    *,
+    timing: _AnyTiming | None = None,
+    extended_properties: Mapping[str, ExtendedPropertyValue] | None = None,
+    channel_properties: Sequence[Mapping[str, ExtendedPropertyValue]] | None = None,
+) -> DoubleAnalogWaveformArrayValue:
+    """Convert a batch of Python AnalogWaveforms to a protobuf DoubleAnalogWaveformArrayValue.
+
+    The values may be a sequence of waveforms or a 2-D array with one waveform per row. The
+    timing and extended_properties arguments apply to every row of a 2-D array, and
+    channel_properties specifies additional extended properties for each row.
+    """
+    message = DoubleAnalogWaveformArrayValue()
+    if isinstance(values, np.ndarray):
+        _add_rows(
+            message.waveforms,
+            DoubleAnalogWaveform,
+            values,
+            np.float64,
+            timing,
+            extended_properties,
+            channel_properties,
+            None,
+        )
+        return message
+    _check_sequence_arguments(timing, extended_properties, channel_properties, None)
+    _add_waveforms(
+        message.waveforms,
+        values,
+        float64_analog_waveform_to_protobuf,
+        lambda value: _make_header(DoubleAnalogWaveform, value),
+        lambda value: encode_packed_fixed(
+            DoubleAnalogWaveform.Y_DATA_FIELD_NUMBER, value.scaled_data
+        ),
+    )
+    return message
+
+
+def float64_analog_waveforms_from_protobuf(
+    message: DoubleAnalogWaveformArrayValue, /
+) -> list[AnalogWaveform[np.float64]]:
+    """Convert the protobuf DoubleAnalogWaveformArrayValue to a list of Python AnalogWaveforms.
+
+    If the waveforms have the same length, their samples are decoded into one contiguous 2-D
+    array and each waveform's raw data is a row of that array.
+    """
+    data = _stack_repeated_field([waveform.y_data for waveform in message.waveforms], np.float64)
+    if data is None:
+        return [float64_analog_waveform_from_protobuf(waveform) for waveform in message.waveforms]
+    return _numeric_waveforms_from_rows(AnalogWaveform, message.waveforms, data)
+
+
+def float32_analog_waveforms_to_protobuf(
+    values: Sequence[AnalogWaveform[np.float32]] | npt.NDArray[np.float32],
+    /,
+    *,
+    timing: _AnyTiming | None = None,
+    extended_properties: Mapping[str, ExtendedPropertyValue] | None = None,
+    channel_properties: Sequence[Mapping[str, ExtendedPropertyValue]] | None = None,
+) -> FloatAnalogWaveformArrayValue:
+    """Convert a batch of Python AnalogWaveforms to a protobuf FloatAnalogWaveformArrayValue.
+
+    The values may be a sequence of waveforms or a 2-D array with one waveform per row. The
+    timing and extended_properties arguments apply to every row of a 2-D array, and
+    channel_properties specifies additional extended properties for each row.
+    """
+    message = FloatAnalogWaveformArrayValue()
+    if isinstance(values, np.ndarray):
+        _add_rows(
+            message.waveforms,
+            FloatAnalogWaveform,
+            values,
+            np.float32,
+            timing,
+            extended_properties,
+            channel_properties,
+            None,
+        )
+        return message
+    _check_sequence_arguments(timing, extended_properties, channel_properties, None)
+    _add_waveforms(
+        message.waveforms,
+        values,
+        float32_analog_waveform_to_protobuf,
+        lambda value: _make_header(FloatAnalogWaveform, value),
+        lambda value: encode_packed_fixed(
+            FloatAnalogWaveform.Y_DATA_FIELD_NUMBER, value.get_scaled_data(np.float32)
+        ),
+    )
+    return message
+
+
+def float32_analog_waveforms_from_protobuf(
+    message: FloatAnalogWaveformArrayValue, /
+) -> list[AnalogWaveform[np.float32]]:
+    """Convert the protobuf FloatAnalogWaveformArrayValue to a list of Python AnalogWaveforms.
+
+    If the waveforms have the same length, their samples are decoded into one contiguous 2-D
+    array and each waveform's raw data is a row of that array.
+    """
+    data = _stack_repeated_field([waveform.y_data for waveform in message.waveforms], np.float32)
+    if data is None:
+        return [float32_analog_waveform_from_protobuf(waveform) for waveform in message.waveforms]
+    return _numeric_waveforms_from_rows(AnalogWaveform, message.waveforms, data)
+
+
+def int16_analog_waveforms_to_protobuf(
+    values: Sequence[AnalogWaveform[np.int16]] | npt.NDArray[np.int16],
+    /,
+    *,
+    timing: _AnyTiming | None = None,
+    extended_properties: Mapping[str, ExtendedPropertyValue] | None = None,
+    channel_properties: Sequence[Mapping[str, ExtendedPropertyValue]] | None = None,
+    scale_mode: ScaleMode | None = None,
+) -> I16AnalogWaveformArrayValue:
+    """Convert a batch of Python AnalogWaveforms to a protobuf I16AnalogWaveformArrayValue.
+
+    The values may be a sequence of waveforms or a 2-D array with one waveform per row. The
+    timing, extended_properties, and scale_mode arguments apply to every row of a 2-D array, and
+    channel_properties specifies additional extended properties for each row.
+    """
+    message = I16AnalogWaveformArrayValue()
+    if isinstance(values, np.ndarray):
+        _add_rows(
+            message.waveforms,
+            I16AnalogWaveform,
+            values,
+            np.int16,
+            timing,
+            extended_properties,
+            channel_properties,
+            scale_mode,
+        )
+        return message
+    _check_sequence_arguments(timing, extended_properties, channel_properties, scale_mode)
+    _add_waveforms(
+        message.waveforms,
+        values,
+        int16_analog_waveform_to_protobuf,
+        lambda value: _make_scaled_header(I16AnalogWaveform, value),
+        lambda value: encode_packed_sint32(I16AnalogWaveform.Y_DATA_FIELD_NUMBER, value.raw_data),
+    )
+    return message
+
+
+def int16_analog_waveforms_from_protobuf(
+    message: I16AnalogWaveformArrayValue, /
+) -> list[AnalogWaveform[np.int16]]:
+    """Convert the protobuf I16AnalogWaveformArrayValue to a list of Python AnalogWaveforms.
+
+    If the waveforms have the same length, their samples are decoded into one contiguous 2-D
+    array and each waveform's raw data is a row of that array.
+    """
+    data = _stack_repeated_field([waveform.y_data for waveform in message.waveforms], np.int16)
+    if data is None:
+        return [int16_analog_waveform_from_protobuf(waveform) for waveform in message.waveforms]
+    return _numeric_waveforms_from_rows(AnalogWaveform, message.waveforms, data)
+
+
+def float64_complex_waveforms_to_protobuf(
+    values: Sequence[ComplexWaveform[np.complex128]] | npt.NDArray[np.complex128],
+    /,
+    *,
+    timing: _AnyTiming | None = None,
+    extended_properties: Mapping[str, ExtendedPropertyValue] | None = None,
+    channel_properties: Sequence[Mapping[str, ExtendedPropertyValue]] | None = None,
+) -> DoubleComplexWaveformArrayValue:
+    """Convert a batch of Python ComplexWaveforms to a protobuf DoubleComplexWaveformArrayValue.
+
+    The values may be a sequence of waveforms or a 2-D array with one waveform per row. The
+    timing and extended_properties arguments apply to every row of a 2-D array, and
+    channel_properties specifies additional extended properties for each row.
+    """
+    message = DoubleComplexWaveformArrayValue()
+    if isinstance(values, np.ndarray):
+        _add_rows(
+            message.waveforms,
+            DoubleComplexWaveform,
+            values,
+            np.complex128,
+            timing,
+            extended_properties,
+            channel_properties,
+            None,
+        )
+        return message
+    _check_sequence_arguments(timing, extended_properties, channel_properties, None)
+    _add_waveforms(
+        message.waveforms,
+        values,
+        float64_complex_waveform_to_protobuf,
+        lambda value: _make_header(DoubleComplexWaveform, value),
+        lambda value: encode_packed_fixed(
+            DoubleComplexWaveform.Y_DATA_FIELD_NUMBER, value.scaled_data.view(np.float64)
+        ),
+    )
+    return message
+
+
+def float64_complex_waveforms_from_protobuf(
+    message: DoubleComplexWaveformArrayValue, /
+) -> list[ComplexWaveform[np.complex128]]:
+    """Convert the protobuf DoubleComplexWaveformArrayValue to a list of Python ComplexWaveforms.
+
+    If the waveforms have the same length, their samples are decoded into one contiguous 2-D
+    array and each waveform's raw data is a row of that array.
+    """
+    data = _stack_repeated_field([waveform.y_data for waveform in message.waveforms], np.float64)
+    if data is None:
+        return [float64_complex_waveform_from_protobuf(waveform) for waveform in message.waveforms]
+    return _numeric_waveforms_from_rows(
+        ComplexWaveform, message.waveforms, data.view(np.complex128)
+    )
+
+
+def float32_complex_waveforms_to_protobuf(
+    values: Sequence[ComplexWaveform[np.complex64]] | npt.NDArray[np.complex64],
+    /,
+    *,
+    timing: _AnyTiming | None = None,
+    extended_properties: Mapping[str, ExtendedPropertyValue] | None = None,
+    channel_properties: Sequence[Mapping[str, ExtendedPropertyValue]] | None = None,
+) -> FloatComplexWaveformArrayValue:
+    """Convert a batch of Python ComplexWaveforms to a protobuf FloatComplexWaveformArrayValue.
+
+    The values may be a sequence of waveforms or a 2-D array with one waveform per row. The
+    timing and extended_properties arguments apply to every row of a 2-D array, and
+    channel_properties specifies additional extended properties for each row.
+    """
+    message = FloatComplexWaveformArrayValue()
+    if isinstance(values, np.ndarray):
+        _add_rows(
+            message.waveforms,
+            FloatComplexWaveform,
+            values,
+            np.complex64,
+            timing,
+            extended_properties,
+            channel_properties,
+            None,
+        )
+        return message
+    _check_sequence_arguments(timing, extended_properties, channel_properties, None)
+    _add_waveforms(
+        message.waveforms,
+        values,
+        float32_complex_waveform_to_protobuf,
+        lambda value: _make_header(FloatComplexWaveform, value),
+        lambda value: encode_packed_fixed(
+            FloatComplexWaveform.Y_DATA_FIELD_NUMBER,
+            value.get_scaled_data(np.complex64).view(np.float32),
+        ),
+    )
+    return message
+
+
+def float32_complex_waveforms_from_protobuf(
+    message: FloatComplexWaveformArrayValue, /
+) -> list[ComplexWaveform[np.complex64]]:
+    """Convert the protobuf FloatComplexWaveformArrayValue to a list of Python ComplexWaveforms.
+
+    If the waveforms have the same length, their samples are decoded into one contiguous 2-D
+    array and each waveform's raw data is a row of that array.
+    """
+    data = _stack_repeated_field([waveform.y_data for waveform in message.waveforms], np.float32)
+    if data is None:
+        return [float32_complex_waveform_from_protobuf(waveform) for waveform in message.waveforms]
+    return _numeric_waveforms_from_rows(ComplexWaveform, message.waveforms, data.view(np.complex64))
+
+
+def int16_complex_waveforms_to_protobuf(
+    values: Sequence[ComplexWaveform[ComplexInt32Base]] | npt.NDArray[ComplexInt32Base],
+    /,
+    *,
+    timing: _AnyTiming | None = None,
+    extended_properties: Mapping[str, ExtendedPropertyValue] | None = None,
+    channel_properties: Sequence[Mapping[str, ExtendedPropertyValue]] | None = None,
+    scale_mode: ScaleMode | None = None,
+) -> I16ComplexWaveformArrayValue:
+    """Convert a batch of Python ComplexWaveforms to a protobuf I16ComplexWaveformArrayValue.
+
+    The values may be a sequence of waveforms or a 2-D array with one waveform per row. The
+    timing, extended_properties, and scale_mode arguments apply to every row of a 2-D array, and
+    channel_properties specifies additional extended properties for each row.
+    """
+    message = I16ComplexWaveformArrayValue()
+    if isinstance(values, np.ndarray):
+        _add_rows(
+            message.waveforms,
+            I16ComplexWaveform,
+            values,
+            ComplexInt32DType,
+            timing,
+            extended_properties,
+            channel_properties,
+            scale_mode,
+        )
+        return message
+    _check_sequence_arguments(timing, extended_properties, channel_properties, scale_mode)
+    _add_waveforms(
+        message.waveforms,
+        values,
+        int16_complex_waveform_to_protobuf,
+        lambda value: _make_scaled_header(I16ComplexWaveform, value),
+        lambda value: encode_packed_sint32(
+            I16ComplexWaveform.Y_DATA_FIELD_NUMBER, value.raw_data.view(np.int16)
+        ),
+    )
+    return message
+
+
+def int16_complex_waveforms_from_protobuf(
+    message: I16ComplexWaveformArrayValue, /
+) -> list[ComplexWaveform[ComplexInt32Base]]:
+    """Convert the protobuf I16ComplexWaveformArrayValue to a list of Python ComplexWaveforms.
+
+    If the waveforms have the same length, their samples are decoded into one contiguous 2-D
+    array and each waveform's raw data is a row of that array.
+    """
+    data = _stack_repeated_field([waveform.y_data for waveform in message.waveforms], np.int16)
+    if data is None:
+        return [int16_complex_waveform_from_protobuf(waveform) for waveform in message.waveforms]
+    return _numeric_waveforms_from_rows(
+        ComplexWaveform, message.waveforms, data.view(ComplexInt32DType)
+    )
+
+
+def float64_spectra_to_protobuf(
+    values: Sequence[Spectrum[np.float64]] | npt.NDArray[np.float64],
+    /,
+    *,
+    start_frequency: float = 0.0,
+    frequency_increment: float = 0.0,
+    extended_properties: Mapping[str, ExtendedPropertyValue] | None = None,
+) -> DoubleSpectrumArrayValue:
+    """Convert a batch of Python Spectrums to a protobuf DoubleSpectrumArrayValue.
+
+    The values may be a sequence of spectrums or a 2-D array with one spectrum per row. The
+    frequency and extended_properties arguments apply to every row of a 2-D array.
+    """
+    spectra = _spectra_from_array_2d(
+        values, np.float64, start_frequency, frequency_increment, extended_properties
+    )
+    message = DoubleSpectrumArrayValue()
+    _add_spectra(message.waveforms, spectra, DoubleSpectrum)
+    return message
+
+
+def float64_spectra_from_protobuf(
+    message: DoubleSpectrumArrayValue, /
+) -> list[Spectrum[np.float64]]:
+    """Convert the protobuf DoubleSpectrumArrayValue to a list of Python Spectrums.
+
+    If the spectrums have the same length, their data is decoded into one contiguous 2-D
+    array and each spectrum's data is a row of that array.
+    """
+    return _spectra_from_protobuf(message.waveforms, np.float64)
+
+
+def float32_spectra_to_protobuf(
+    values: Sequence[Spectrum[np.float32]] | npt.NDArray[np.float32],
+    /,
+    *,
+    start_frequency: float = 0.0,
+    frequency_increment: float = 0.0,
+    extended_properties: Mapping[str, ExtendedPropertyValue] | None = None,
+) -> FloatSpectrumArrayValue:
+    """Convert a batch of Python Spectrums to a protobuf FloatSpectrumArrayValue.
+
+    The values may be a sequence of spectrums or a 2-D array with one spectrum per row. The
+    frequency and extended_properties arguments apply to every row of a 2-D array.
+    """
+    spectra = _spectra_from_array_2d(
+        values, np.float32, start_frequency, frequency_increment, extended_properties
+    )
+    message = FloatSpectrumArrayValue()
+    _add_spectra(message.waveforms, spectra, FloatSpectrum)
+    return message
+
+
+def float32_spectra_from_protobuf(
+    message: FloatSpectrumArrayValue, /
+) -> list[Spectrum[np.float32]]:
+    """Convert the protobuf FloatSpectrumArrayValue to a list of Python Spectrums.
+
+    If the spectrums have the same length, their data is decoded into one contiguous 2-D
+    array and each spectrum's data is a row of that array.
+    """
+    return _spectra_from_protobuf(message.waveforms, np.float32)
+
+
+def digital_waveforms_to_protobuf(
+    values: Sequence[DigitalWaveform[Any]], /
+) -> DigitalWaveformArrayValue:
+    """Convert a batch of Python DigitalWaveforms to a protobuf DigitalWaveformArrayValue."""
+    message = DigitalWaveformArrayValue()
+    _add_waveforms(
+        message.waveforms,
+        values,
+        digital_waveform_to_protobuf,
+        _make_digital_header,
+        lambda value: encode_length_delimited(
+            DigitalWaveformProto.Y_DATA_FIELD_NUMBER, np.ascontiguousarray(value.data).data
+        ),
+    )
+    return message
+
+
+def digital_waveforms_from_protobuf(
+    message: DigitalWaveformArrayValue, /
+) -> list[DigitalWaveform[np.uint8]]:
+    """Convert the protobuf DigitalWaveformArrayValue to a list of Python DigitalWaveforms."""
+    return [digital_waveform_from_protobuf(waveform) for waveform in message.waveforms]
+
+
+def float64_analog_waveforms_to_protobuf_list(
+    values: npt.NDArray[np.float64],
+    /,
+    *,
+    timing: _AnyTiming | None = None,
+    extended_properties: Mapping[str, ExtendedPropertyValue] | None = None,
+    channel_properties: Sequence[Mapping[str, ExtendedPropertyValue]] | None = None,
+) -> list[DoubleAnalogWaveform]:
+    """Convert the rows of a 2-D array to a list of protobuf DoubleAnalogWaveform messages.
+
+    The timing and extended_properties arguments apply to every row, and
+    channel_properties specifies additional extended properties for each row. The timing
+    fields are converted once, and each row is encoded from a view of the array.
+    """
+    return [
+        DoubleAnalogWaveform.FromString(data)
+        for data in _serialize_rows(
+            DoubleAnalogWaveform,
+            values,
+            np.float64,
+            timing,
+            extended_properties,
+            channel_properties,
+            None,
+        )
+    ]
+
+
+def float32_analog_waveforms_to_protobuf_list(
+    values: npt.NDArray[np.float32],
+    /,
+    *,
+    timing: _AnyTiming | None = None,
+    extended_properties: Mapping[str, ExtendedPropertyValue] | None = None,
+    channel_properties: Sequence[Mapping[str, ExtendedPropertyValue]] | None = None,
+) -> list[FloatAnalogWaveform]:
+    """Convert the rows of a 2-D array to a list of protobuf FloatAnalogWaveform messages.
+
+    The timing and extended_properties arguments apply to every row, and
+    channel_properties specifies additional extended properties for each row. The timing
+    fields are converted once, and each row is encoded from a view of the array.
+    """
+    return [
+        FloatAnalogWaveform.FromString(data)
+        for data in _serialize_rows(
+            FloatAnalogWaveform,
+            values,
+            np.float32,
+            timing,
+            extended_properties,
+            channel_properties,
+            None,
+        )
+    ]
+
+
+def int16_analog_waveforms_to_protobuf_list(
+    values: npt.NDArray[np.int16],
+    /,
+    *,
+    timing: _AnyTiming | None = None,
+    extended_properties: Mapping[str, ExtendedPropertyValue] | None = None,
+    channel_properties: Sequence[Mapping[str, ExtendedPropertyValue]] | None = None,
+    scale_mode: ScaleMode | None = None,
+) -> list[I16AnalogWaveform]:
+    """Convert the rows of a 2-D array to a list of protobuf I16AnalogWaveform messages.
+
+    The timing, extended_properties, and scale_mode arguments apply to every row, and
+    channel_properties specifies additional extended properties for each row. The timing
+    fields are converted once, and each row is encoded from a view of the array.
+    """
+    return [
+        I16AnalogWaveform.FromString(data)
+        for data in _serialize_rows(
+            I16AnalogWaveform,
+            values,
+            np.int16,
+            timing,
+            extended_properties,
+            channel_properties,
+            scale_mode,
+        )
+    ]
+
+
+def float64_complex_waveforms_to_protobuf_list(
+    values: npt.NDArray[np.complex128],
+    /,
+    *,
+    timing: _AnyTiming | None = None,
+    extended_properties: Mapping[str, ExtendedPropertyValue] | None = None,
+    channel_properties: Sequence[Mapping[str, ExtendedPropertyValue]] | None = None,
+) -> list[DoubleComplexWaveform]:
+    """Convert the rows of a 2-D array to a list of protobuf DoubleComplexWaveform messages.
+
+    The timing and extended_properties arguments apply to every row, and
+    channel_properties specifies additional extended properties for each row. The timing
+    fields are converted once, and each row is encoded from a view of the array.
+    """
+    return [
+        DoubleComplexWaveform.FromString(data)
+        for data in _serialize_rows(
+            DoubleComplexWaveform,
+            values,
+            np.complex128,
+            timing,
+            extended_properties,
+            channel_properties,
+            None,
+        )
+    ]
+
+
+def float32_complex_waveforms_to_protobuf_list(
+    values: npt.NDArray[np.complex64],
+    /,
+    *,
+    timing: _AnyTiming | None = None,
+    extended_properties: Mapping[str, ExtendedPropertyValue] | None = None,
+    channel_properties: Sequence[Mapping[str, ExtendedPropertyValue]] | None = None,
+) -> list[FloatComplexWaveform]:
+    """Convert the rows of a 2-D array to a list of protobuf FloatComplexWaveform messages.
+
+    The timing and extended_properties arguments apply to every row, and
+    channel_properties specifies additional extended properties for each row. The timing
+    fields are converted once, and each row is encoded from a view of the array.
+    """
+    return [
+        FloatComplexWaveform.FromString(data)
+        for data in _serialize_rows(
+            FloatComplexWaveform,
+            values,
+            np.complex64,
+            timing,
+            extended_properties,
+            channel_properties,
+            None,
+        )
+    ]
+
+
+def int16_complex_waveforms_to_protobuf_list(
+    values: npt.NDArray[ComplexInt32Base],
+    /,
+    *,
+    timing: _AnyTiming | None = None,
+    extended_properties: Mapping[str, ExtendedPropertyValue] | None = None,
+    channel_properties: Sequence[Mapping[str, ExtendedPropertyValue]] | None = None,
+    scale_mode: ScaleMode | None = None,
+) -> list[I16ComplexWaveform]:
+    """Convert the rows of a 2-D array to a list of protobuf I16ComplexWaveform messages.
+
+    The timing, extended_properties, and scale_mode arguments apply to every row, and
+    channel_properties specifies additional extended properties for each row. The timing
+    fields are converted once, and each row is encoded from a view of the array.
+    """
+    return [
+        I16ComplexWaveform.FromString(data)
+        for data in _serialize_rows(
+            I16ComplexWaveform,
+            values,
+            ComplexInt32DType,
+            timing,
+            extended_properties,
+            channel_properties,
+            scale_mode,
+        )
+    ]
+
+
+def _check_sequence_arguments(
+    timing: _AnyTiming | None,
+    extended_properties: Mapping[str, ExtendedPropertyValue] | None,
+    channel_properties: Sequence[Mapping[str, ExtendedPropertyValue]] | None,
+    scale_mode: ScaleMode | None,
+) -> None:
+    if (
+        timing is not None
+        or extended_properties is not None
+        or channel_properties is not None
+        or scale_mode is not None
+    ):
+        raise ValueError(
+            "The timing, extended_properties, channel_properties, and scale_mode arguments are "
+            "only supported when the values are a 2-D array."
+        )
+
+
+def _add_rows(
+    container: RepeatedCompositeFieldContainer[Any],
+    message_type: type[AnyWaveformProto],
+    values: npt.NDArray[Any],
+    dtype: npt.DTypeLike,
+    timing: _AnyTiming | None,
+    extended_properties: Mapping[str, ExtendedPropertyValue] | None,
+    channel_properties: Sequence[Mapping[str, ExtendedPropertyValue]] | None,
+    scale_mode: ScaleMode | None,
+) -> None:
+    for data in _serialize_rows(
+        message_type, values, dtype, timing, extended_properties, channel_properties, scale_mode
+    ):
+        container.add().MergeFromString(data)
+
+
+def _serialize_rows(
+    message_type: type[AnyWaveformProto],
+    values: npt.NDArray[Any],
+    dtype: npt.DTypeLike,
+    timing: _AnyTiming | None,
+    extended_properties: Mapping[str, ExtendedPropertyValue] | None,
+    channel_properties: Sequence[Mapping[str, ExtendedPropertyValue]] | None,
+    scale_mode: ScaleMode | None,
+) -> Iterator[bytes]:
+    """Serialize each row of a 2-D array as a waveform message.
+
+    The rows share one serialized header with the timing and scale fields, and rows with the
+    same extended properties share one serialized attributes field.
+    """
+    if values.ndim != 2:
+        raise ValueError(
+            f"The array must be two-dimensional.\n\nNumber of dimensions: {values.ndim}"
+        )
+    if values.dtype != dtype:
+        raise TypeError(
+            f"The array data type must be {np.dtype(dtype)}.\n\nData type: {values.dtype}"
+        )
+    if channel_properties is not None and len(channel_properties) != len(values):
+        raise ValueError(
+            "The number of channel properties must match the number of rows.\n\n"
+            f"Number of channel properties: {len(channel_properties)}\n"
+            f"Number of rows: {len(values)}"
+        )
+
+    header = _make_timing_header(message_type, timing or Timing.empty, values.shape[1])
+    if scale_mode is not None and isinstance(header, (I16AnalogWaveform, I16ComplexWaveform)):
+        scale = _scale_from_scale_mode(scale_mode)
+        if scale is not None:
+            header.scale.CopyFrom(scale)
+    serialized_header = header.SerializeToString()
+
+    properties = dict(extended_properties or {})
+    if channel_properties is None:
+        attributes = [_get_serialized_attributes(message_type, properties)] * len(values)
+    else:
+        attributes = [
+            _get_serialized_attributes(message_type, {**properties, **row_properties})
+            for row_properties in channel_properties
+        ]
+
+    encode_data = _ROW_ENCODERS[message_type]
+    return (
+        b"".join([serialized_header, row_attributes, *encode_data(row)])
+        for row, row_attributes in zip(values, attributes)
+    )
+
+
+def _make_timing_header(
+    message_type: type[_TWaveformProto], timing: _AnyTiming, sample_count: int
+) -> _TWaveformProto:
+    if timing.sample_interval_mode == SampleIntervalMode.IRREGULAR:
+        message = message_type()
+        _add_timestamps_from_timing(message, timing, sample_count)
+        return message
+    return message_type(
+        t0=_t0_from_timing(timing),
+        dt=_time_interval_from_timing(timing),
+        timestamp=_timestamp_from_timing(timing),
+        time_offset=_time_offset_from_timing(timing),
+    )
+
+
+def _spectra_from_array_2d(
+    values: Sequence[Spectrum[Any]] | npt.NDArray[Any],
+    dtype: npt.DTypeLike,
+    start_frequency: float,
+    frequency_increment: float,
+    extended_properties: Mapping[str, ExtendedPropertyValue] | None,
+) -> Sequence[Spectrum[Any]]:
+    if not isinstance(values, np.ndarray):
+        return values
+    return Spectrum.from_array_2d(
+        values,
+        dtype,
+        copy=False,
+        start_frequency=start_frequency,
+        frequency_increment=frequency_increment,
+        extended_properties=extended_properties,
+    )
+
+
+def _add_waveforms(
+    container: RepeatedCompositeFieldContainer[Any],
+    values: Sequence[_TWaveform],
+    to_protobuf: Callable[[_TWaveform], AnyWaveformProto],
+    make_header: Callable[[_TWaveform], AnyWaveformProto],
+    encode_data: Callable[[_TWaveform], list[Buffer]],
+) -> None:
+    # Waveforms that share timing, extended properties, and scaling share one serialized header,
+    # so the header is only converted once per batch.
+    headers: dict[Hashable, bytes] = {}
+    for value in values:
+        if value.timing.sample_interval_mode == SampleIntervalMode.IRREGULAR:
+            container.append(to_protobuf(value))
+            continue
+        key = _header_key(value)
+        header = headers.get(key)
+        if header is None:
+            header = headers[key] = make_header(value).SerializeToString()
+        container.add().MergeFromString(b"".join([header, *encode_data(value)]))
+
+
+def _add_spectra(
+    container: RepeatedCompositeFieldContainer[Any],
+    values: Sequence[Spectrum[Any]],
+    message_type: type[_TSpectrumProto],
+) -> None:
+    for value in values:
+        header = _merge_attributes(
+            message_type(
+                start_frequency=value.start_frequency,
+                frequency_increment=value.frequency_increment,
+            ),
+            value.extended_properties,
+        ).SerializeToString()
+        data = encode_packed_fixed(message_type.DATA_FIELD_NUMBER, value.data)
+        container.add().MergeFromString(b"".join([header, *data]))
+
+
+def _header_key(value: AnyNiWaveform) -> Hashable:
+    scale_key: Hashable = None
+    if isinstance(value, DigitalWaveform):
+        scale_key = value.signal_count
+    elif isinstance(value.scale_mode, LinearScaleMode):
+        scale_key = (value.scale_mode.gain, value.scale_mode.offset)
+    return (id(value.timing), _extended_properties_key(value.extended_properties), scale_key)
+
+
+def _make_header(message_type: type[_TWaveformProto], value: AnyNiWaveform) -> _TWaveformProto:
+    message = message_type(
+        t0=_t0_from_waveform(value),
+        dt=_time_interval_from_waveform(value),
+        timestamp=_timestamp_from_waveform(value),
+        time_offset=_time_offset_from_waveform(value),
+    )
+    return _merge_attributes(message, value.extended_properties)
+
+
+def _make_scaled_header(
+    message_type: type[I16AnalogWaveform] | type[I16ComplexWaveform],
+    value: AnalogWaveform[Any] | ComplexWaveform[Any],
+) -> I16AnalogWaveform | I16ComplexWaveform:
+    message = _make_header(message_type, value)
+    scale = _scale_from_waveform(value)
+    if scale is not None:
+        message.scale.CopyFrom(scale)
+    return message
+
+
+def _make_digital_header(value: DigitalWaveform[Any]) -> DigitalWaveformProto:
+    message = _make_header(DigitalWaveformProto, value)
+    message.signal_count = value.signal_count
+    return message
+
+
+def _stack_repeated_field(
+    fields: Sequence[Sequence[Any]], dtype: npt.DTypeLike
+) -> npt.NDArray[Any] | None:
+    lengths = {len(field) for field in fields}
+    if len(lengths) != 1:
+        return None
+    data = np.empty((len(fields), lengths.pop()), dtype)
+    for row, field in zip(data, fields):
+        row[...] = field
+    return data
+
+
+def _numeric_waveforms_from_rows(
+    waveform_type: type[_TNumericWaveform],
+    messages: Sequence[AnyWaveformProto],
+    data: npt.NDArray[Any],
+) -> list[Any]:
+    # Waveforms with the same timing fields share one Timing object from the timing cache.
+    waveforms = []
+    for row, message in zip(data, messages):
+        timing = _timing_from_waveform_message(message)
+        scale_mode: ScaleMode = NoneScaleMode()
+        if isinstance(message, (I16AnalogWaveform, I16ComplexWaveform)):
+            scale_mode = _scale_mode_from_waveform_message(message)
+        waveforms.append(
+            waveform_type.from_array_1d(
+                row,
+                copy=False,
+                extended_properties=_attributes_to_extended_properties(message.attributes),
+                timing=timing,
+                scale_mode=scale_mode,
+            )
+        )
+    return waveforms
+
+
+def _spectra_from_protobuf(
+    messages: Sequence[DoubleSpectrum | FloatSpectrum], dtype: npt.DTypeLike
+) -> list[Spectrum[Any]]:
+    data = _stack_repeated_field([message.data for message in messages], dtype)
+    spectra = []
+    for i, message in enumerate(messages):
+        spectra.append(
+            Spectrum.from_array_1d(
+                data[i] if data is not None else message.data,
+                dtype,
+                copy=data is None,
+                start_frequency=message.start_frequency,
+                frequency_increment=message.frequency_increment,
+                extended_properties=_attributes_to_extended_properties(message.attributes),
+            )
+        )
+    return spectra
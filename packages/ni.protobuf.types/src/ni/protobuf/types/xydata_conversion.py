@@ -4,34 +4,85 @@ from __future__ import annotations
 
 import numpy as np
 from nitypes.xy_data import XYData
+from typing_extensions import Buffer
 
 from ni.protobuf.types import xydata_pb2
+from ni.protobuf.types._wire_format import encode_packed_fixed, frombuffer_le, parse_fields
 from ni.protobuf.types.extended_property_conversion import (
+    _get_extended_properties,
+    _get_serialized_attributes,
+    _merge_attributes,
     extended_properties_from_protobuf,
-    extended_properties_to_protobuf,
 )
 
 
 def float64_xydata_to_protobuf(value: XYData[np.float64], /) -> xydata_pb2.DoubleXYData:
     """Convert a XYData python object to a protobuf xydata_pb2.DoubleXYData."""
-    attributes = extended_properties_to_protobuf(value.extended_properties)
     xydata_message = xydata_pb2.DoubleXYData(
         x_data=value.x_data,
         y_data=value.y_data,
-        attributes=attributes,
     )
-    return xydata_message
+    return _merge_attributes(xydata_message, value.extended_properties)
 
 
 def float64_xydata_from_protobuf(message: xydata_pb2.DoubleXYData, /) -> XYData[np.float64]:
     """Convert the protobuf xydata_pb2.DoubleXYData to a Python XYData."""
+    # np.array() copies each repeated field in one step, so XYData does not need to copy again.
     xydata = XYData.from_arrays_1d(
-        x_array=message.x_data,
-        y_array=message.y_data,
+        x_array=np.array(message.x_data, np.float64),
+        y_array=np.array(message.y_data, np.float64),
         dtype=np.float64,
+        copy=False,
     )
 
     # Transfer attributes to extended_properties
     extended_properties_from_protobuf(message.attributes, xydata.extended_properties)
 
     return xydata
+
+
+def float64_xydata_to_protobuf_bytes(value: XYData[np.float64], /) -> bytes:
+    """Convert a XYData python object to a serialized protobuf xydata_pb2.DoubleXYData.
+
+    The result is the same as ``float64_xydata_to_protobuf(value).SerializeToString()``, but
+    the data is written directly from the XYData's arrays instead of being copied into a
+    protobuf message first.
+    """
+    return b"".join(_encode_float64_xydata(value))
+
+
+def float64_xydata_from_protobuf_bytes(data: Buffer, /) -> XYData[np.float64]:
+    """Convert a serialized protobuf xydata_pb2.DoubleXYData to a Python XYData.
+
+    The data is not copied. The returned XYData's x_data and y_data are read-only NumPy views
+    of ``data``, created with ``np.frombuffer``, and keep a reference to ``data``. Do not modify
+    ``data`` while the XYData is in use. The data is copied only if ``x_data`` or ``y_data`` is
+    split across multiple records in ``data``.
+    """
+    buffer = memoryview(data).cast("B")
+    x_payloads: list[memoryview] = []
+    y_payloads: list[memoryview] = []
+    attributes: list[memoryview] = []
+    for field in parse_fields(buffer):
+        if field.number == xydata_pb2.DoubleXYData.X_DATA_FIELD_NUMBER:
+            x_payloads.append(buffer[field.value_start : field.end])
+        elif field.number == xydata_pb2.DoubleXYData.Y_DATA_FIELD_NUMBER:
+            y_payloads.append(buffer[field.value_start : field.end])
+        elif field.number == xydata_pb2.DoubleXYData.ATTRIBUTES_FIELD_NUMBER:
+            attributes.append(buffer[field.start : field.end])
+    return XYData.from_arrays_1d(
+        frombuffer_le(x_payloads, np.float64),
+        frombuffer_le(y_payloads, np.float64),
+        np.float64,
+        copy=False,
+        extended_properties=_get_extended_properties(xydata_pb2.DoubleXYData, b"".join(attributes)),
+    )
+
+
+def _encode_float64_xydata(value: XYData[np.float64]) -> list[Buffer]:
+    # Protobuf serializes fields in field number order: x_data, y_data, then attributes.
+    return [
+        *encode_packed_fixed(xydata_pb2.DoubleXYData.X_DATA_FIELD_NUMBER, value.x_data),
+        *encode_packed_fixed(xydata_pb2.DoubleXYData.Y_DATA_FIELD_NUMBER, value.y_data),
+        _get_serialized_attributes(xydata_pb2.DoubleXYData, value.extended_properties),
+    ]
@@ -0,0 +1,162 @@
+"""Methods to convert to and from DoubleXYDataArrayValue protobuf messages."""
+
+from __future__ import annotations
+
+from collections.abc import Mapping, Sequence
+
+import numpy as np
+import numpy.typing as npt
+from nitypes.waveform.typing import ExtendedPropertyValue
+from nitypes.xy_data import XYData
+from typing_extensions import Buffer
+
+from ni.protobuf.types._wire_format import (
+    WIRETYPE_LENGTH_DELIMITED,
+    encode_packed_fixed,
+    encode_tag,
+    encode_varint,
+    parse_fields,
+)
+from ni.protobuf.types.extended_property_conversion import (
+    _get_serialized_attributes,
+    extended_properties_from_protobuf,
+)
+from ni.protobuf.types.waveform_wrappers_conversion import _stack_repeated_field
+from ni.protobuf.types.xydata_conversion import (
+    _encode_float64_xydata,
+    float64_xydata_from_protobuf,
+    float64_xydata_from_protobuf_bytes,
+)
+from ni.protobuf.types.xydata_pb2 import DoubleXYData
+from ni.protobuf.types.xydata_wrappers_pb2 import DoubleXYDataArrayValue
+
+
+def float64_xydata_array_to_protobuf(
+    values: Sequence[XYData[np.float64]] | npt.NDArray[np.float64],
+    /,
+    *,
+    x_data: npt.NDArray[np.float64] | None = None,
+    extended_properties: Mapping[str, ExtendedPropertyValue] | None = None,
+) -> DoubleXYDataArrayValue:
+    """Convert a batch of Python XYData objects to a protobuf DoubleXYDataArrayValue.
+
+    The values may be a sequence of XYData objects or a 2-D array of y data with one curve per
+    row. For a 2-D array, x_data is either a 1-D array shared by every row or a 2-D array with
+    the same shape as the values, and extended_properties applies to every row.
+
+    Every curve is serialized and the result is parsed in one step. Curves with the same
+    extended properties share one serialized attributes field.
+    """
+    message = DoubleXYDataArrayValue()
+    message.MergeFromString(
+        float64_xydata_array_to_protobuf_bytes(
+            values, x_data=x_data, extended_properties=extended_properties
+        )
+    )
+    return message
+
+
+def float64_xydata_array_to_protobuf_bytes(
+    values: Sequence[XYData[np.float64]] | npt.NDArray[np.float64],
+    /,
+    *,
+    x_data: npt.NDArray[np.float64] | None = None,
+    extended_properties: Mapping[str, ExtendedPropertyValue] | None = None,
+) -> bytes:
+    """Convert a batch of Python XYData objects to a serialized DoubleXYDataArrayValue.
+
+    The arguments are the same as :func:`float64_xydata_array_to_protobuf`. The data is written
+    directly from the arrays instead of being copied into protobuf messages first.
+    """
+    if not isinstance(values, np.ndarray):
+        if x_data is not None or extended_properties is not None:
+            raise ValueError(
+                "The x_data and extended_properties arguments are only supported when the "
+                "values are a 2-D array."
+            )
+        records = [_encode_float64_xydata(value) for value in values]
+    else:
+        records = _serialize_rows(values, x_data, extended_properties)
+    # Each record is an element of the repeated field, even if it is empty. The buffers of every
+    # record are joined once, so the data is only copied into the result.
+    tag = encode_tag(DoubleXYDataArrayValue.X_Y_DATA_FIELD_NUMBER, WIRETYPE_LENGTH_DELIMITED)
+    buffers: list[Buffer] = []
+    for record in records:
+        buffers += [tag, encode_varint(sum(memoryview(buffer).nbytes for buffer in record))]
+        buffers += record
+    return b"".join(buffers)
+
+
+def float64_xydata_array_from_protobuf(
+    message: DoubleXYDataArrayValue, /
+) -> list[XYData[np.float64]]:
+    """Convert the protobuf DoubleXYDataArrayValue to a list of Python XYData objects.
+
+    If the curves have the same length, their x and y data are decoded into two contiguous
+    2-D arrays and each XYData's data is a row of those arrays.
+    """
+    messages = message.x_y_data
+    x_data = _stack_repeated_field([xydata.x_data for xydata in messages], np.float64)
+    y_data = _stack_repeated_field([xydata.y_data for xydata in messages], np.float64)
+    if x_data is None or y_data is None or x_data.shape != y_data.shape:
+        return [float64_xydata_from_protobuf(xydata) for xydata in messages]
+    values = []
+    for x_row, y_row, xydata in zip(x_data, y_data, messages):
+        value = XYData.from_arrays_1d(x_row, y_row, np.float64, copy=False)
+        extended_properties_from_protobuf(xydata.attributes, value.extended_properties)
+        values.append(value)
+    return values
+
+
+def float64_xydata_array_from_protobuf_bytes(data: Buffer, /) -> list[XYData[np.float64]]:
+    """Convert a serialized protobuf DoubleXYDataArrayValue to a list of Python XYData objects.
+
+    The data is not copied. Each XYData's x_data and y_data are read-only NumPy views of
+    ``data``, as described in
+    :func:`ni.protobuf.types.xydata_conversion.float64_xydata_from_protobuf_bytes`.
+    """
+    buffer = memoryview(data).cast("B")
+    return [
+        float64_xydata_from_protobuf_bytes(buffer[field.value_start : field.end])
+        for field in parse_fields(buffer)
+        if field.number == DoubleXYDataArrayValue.X_Y_DATA_FIELD_NUMBER
+    ]
+
+
+def _serialize_rows(
+    values: npt.NDArray[np.float64],
+    x_data: npt.NDArray[np.float64] | None,
+    extended_properties: Mapping[str, ExtendedPropertyValue] | None,
+) -> list[list[Buffer]]:
+    if values.ndim != 2:
+        raise ValueError(
+            f"The array must be two-dimensional.\n\nNumber of dimensions: {values.ndim}"
+        )
+    if values.dtype != np.float64:
+        raise TypeError(f"The array data type must be float64.\n\nData type: {values.dtype}")
+    if x_data is None:
+        raise ValueError("The x_data argument is required when the values are a 2-D array.")
+    x_data = np.asarray(x_data, np.float64)
+    if x_data.shape != values.shape and x_data.shape != values.shape[1:]:
+        raise ValueError(
+            "The x_data shape must match the shape of the values or the length of a row.\n\n"
+            f"x_data shape: {x_data.shape}\n"
+            f"Values shape: {values.shape}"
+        )
+
+    # The x data and attributes are serialized once when every row shares them.
+    attributes = _get_serialized_attributes(DoubleXYData, dict(extended_properties or {}))
+    if x_data.ndim == 1:
+        shared_x = b"".join(encode_packed_fixed(DoubleXYData.X_DATA_FIELD_NUMBER, x_data))
+        return [
+            [shared_x, *encode_packed_fixed(DoubleXYData.Y_DATA_FIELD_NUMBER, y_row), attributes]
+            for y_row in values
+        ]
+    return [
+        [
+            *encode_packed_fixed(DoubleXYData.X_DATA_FIELD_NUMBER, x_row),
+            *encode_packed_fixed(DoubleXYData.Y_DATA_FIELD_NUMBER, y_row),
+            attributes,
+        ]
+        for x_row, y_row in zip(x_data, values)
+    ]
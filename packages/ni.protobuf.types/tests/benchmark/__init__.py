@@ -0,0 +1,10 @@
+"""Benchmarks for the ni.protobuf.types conversions.
+
+Run the benchmarks from the package directory::
+
+    poetry run python -m tests.benchmark --sample-counts 100,10000,1000000 --output results.json
+
+Compare against a stored baseline, failing if any benchmark regresses by more than 10%::
+
+    poetry run python -m tests.benchmark --compare baseline.json --threshold 0.1
+"""
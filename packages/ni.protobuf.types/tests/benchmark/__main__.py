@@ -0,0 +1,138 @@
+"""Command line interface for the ni.protobuf.types benchmarks."""
+
+from __future__ import annotations
+
+import argparse
+import json
+import sys
+from collections.abc import Sequence
+
+from tests.benchmark._cases import SAMPLE_COUNTS, get_cases
+from tests.benchmark._runner import (
+    BenchmarkResult,
+    Comparison,
+    compare,
+    results_from_json,
+    results_to_json,
+    run_cases,
+)
+
+_DEFAULT_SAMPLE_COUNTS = [100, 10_000, 1_000_000]
+_MIB = 1024 * 1024
+
+
+def _parse_sample_counts(value: str) -> list[int]:
+    sample_counts = [int(float(item)) for item in value.split(",")]
+    if any(count < 1 for count in sample_counts):
+        raise argparse.ArgumentTypeError("Sample counts must be positive.")
+    return sample_counts
+
+
+def _format_bytes(value: int | None) -> str:
+    return "n/a" if value is None else f"{value / _MIB:.1f}"
+
+
+def _format_row(result: BenchmarkResult, comparison: Comparison | None) -> str:
+    row = (
+        f"{result.name:<56} {result.sample_count:>11} {result.ns_per_sample:>12.3f}"
+        f" {_format_bytes(result.peak_traced_bytes):>12} {_format_bytes(result.peak_rss_bytes):>12}"
+    )
+    if comparison is not None:
+        row += " {:>10}".format("new" if comparison.ratio is None else f"{comparison.ratio:.2f}x")
+    return row
+
+
+def main(argv: Sequence[str] | None = None) -> int:
+    """Run the benchmarks and return the exit code."""
+    parser = argparse.ArgumentParser(
+        prog="python -m tests.benchmark", description="Benchmark the ni.protobuf.types conversions."
+    )
+    parser.add_argument(
+        "--sample-counts",
+        type=_parse_sample_counts,
+        default=_DEFAULT_SAMPLE_COUNTS,
+        help=(
+            "Comma-separated sample counts, such as 1e2,1e4,1e6. The benchmarks support "
+            f"{SAMPLE_COUNTS[0]:.0e} to {SAMPLE_COUNTS[-1]:.0e} samples. "
+            "Default: %(default)s"
+        ),
+    )
+    parser.add_argument(
+        "-k",
+        "--filter",
+        action="append",
+        default=[],
+        help="Only run benchmarks whose name contains this string. May be repeated.",
+    )
+    parser.add_argument(
+        "--repeat", type=int, default=5, help="Timing repetitions per benchmark. Default: 5"
+    )
+    parser.add_argument("--output", help="Write the results to this JSON file.")
+    parser.add_argument("--compare", help="Compare the results against this JSON baseline file.")
+    parser.add_argument(
+        "--threshold",
+        type=float,
+        default=0.1,
+        help=(
+            "With --compare, fail if any benchmark's ns/sample is slower than the baseline by "
+            "more than this fraction. Default: 0.1"
+        ),
+    )
+    parser.add_argument(
+        "--no-isolate",
+        action="store_true",
+        help="Run every benchmark in this process. Peak RSS then includes earlier benchmarks.",
+    )
+    parser.add_argument("--list", action="store_true", help="List the benchmarks and exit.")
+    args = parser.parse_args(argv)
+
+    cases = [
+        case
+        for case in get_cases()
+        if not args.filter or any(pattern in case.name for pattern in args.filter)
+    ]
+    if args.list:
+        for case in cases:
+            print(case.name)
+        return 0
+
+    baseline = None
+    if args.compare:
+        with open(args.compare, encoding="utf-8") as file:
+            baseline = results_from_json(json.load(file))
+
+    header = (
+        f"{'benchmark':<56} {'samples':>11} {'ns/sample':>12} {'traced MiB':>12}"
+        f" {'peak RSS MiB':>12}"
+    )
+    print(header + (f" {'vs base':>10}" if baseline is not None else ""))
+
+    results = []
+    regressions = []
+    for result in run_cases(
+        cases, args.sample_counts, repeat=args.repeat, isolate=not args.no_isolate
+    ):
+        results.append(result)
+        comparison = compare([result], baseline)[0] if baseline is not None else None
+        if comparison is not None and comparison.ratio is not None:
+            if comparison.ratio > 1.0 + args.threshold:
+                regressions.append(comparison)
+        print(_format_row(result, comparison), flush=True)
+
+    if args.output:
+        with open(args.output, "w", encoding="utf-8") as file:
+            json.dump(results_to_json(results), file, indent=2)
+
+    if regressions:
+        print(f"\n{len(regressions)} benchmark(s) regressed by more than {args.threshold:.0%}:")
+        for comparison in regressions:
+            print(
+                f"  {comparison.result.name} ({comparison.result.sample_count} samples): "
+                f"{comparison.ratio:.2f}x"
+            )
+        return 1
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,588 @@
+"""Benchmark cases for the ni.protobuf.types conversions."""
+
+from __future__ import annotations
+
+import datetime as dt
+from collections.abc import Callable
+from typing import Any, NamedTuple
+
+import nitypes.bintime as bt
+import numpy as np
+import numpy.typing as npt
+from nitypes.complex import ComplexInt32DType
+from nitypes.scalar import Scalar
+from nitypes.vector import Vector
+from nitypes.waveform import AnalogWaveform, ComplexWaveform, DigitalWaveform, Spectrum, Timing
+from nitypes.xy_data import XYData
+
+from ni.protobuf.types import (
+    array_conversion,
+    batch_conversion,
+    converter_registry,
+    scalar_conversion,
+    vector_conversion,
+    waveform_builder,
+    waveform_conversion as wfc,
+    waveform_decimation,
+    waveform_wrappers_conversion,
+    xydata_conversion,
+    xydata_wrappers_conversion,
+)
+
+SAMPLE_COUNTS = [10**exponent for exponent in range(2, 9)]
+"""The sample counts supported by the benchmarks, from 10^2 to 10^8."""
+
+TIMING_MODES = ["none", "regular", "irregular"]
+
+# Irregular timing stores one timestamp object per sample, so larger sample counts take too
+# much time and memory to set up.
+_MAX_IRREGULAR_SAMPLE_COUNT = 10**6
+# Vectors and strings store one Python object per sample.
+_MAX_OBJECT_SAMPLE_COUNT = 10**7
+
+_T0 = bt.DateTime(2025, 1, 1, tzinfo=dt.timezone.utc)
+_EXTENDED_PROPERTIES = {"NI_ChannelName": "Dev1/ai0", "NI_UnitDescription": "Volts"}
+_CHANNEL_COUNT = 8
+
+
+class BenchmarkCase(NamedTuple):
+    """A conversion to benchmark."""
+
+    name: str
+    """The benchmark name, including the converter, dtype, and timing mode."""
+
+    setup: Callable[[int], Callable[[], object]]
+    """Creates the input data for a sample count and returns the function to measure."""
+
+    max_sample_count: int = SAMPLE_COUNTS[-1]
+    """The largest sample count that the case supports."""
+
+
+def _create_timing(timing_mode: str, sample_count: int) -> Timing[Any, Any, Any]:
+    if timing_mode == "none":
+        return Timing.empty
+    elif timing_mode == "regular":
+        return Timing.create_with_regular_interval(bt.TimeDelta(1e-6), _T0)
+    elif timing_mode == "irregular":
+        interval = bt.TimeDelta(1e-6)
+        return Timing.create_with_irregular_interval(
+            [_T0 + interval * i for i in range(sample_count)]
+        )
+    raise ValueError(f"Invalid timing mode: {timing_mode}")
+
+
+def _random_data(dtype: npt.DTypeLike, sample_count: int) -> npt.NDArray[Any]:
+    rng = np.random.default_rng(0)
+    dtype = np.dtype(dtype)
+    if dtype == ComplexInt32DType:
+        data = np.zeros(sample_count, ComplexInt32DType)
+        data["real"] = rng.integers(-32768, 32768, sample_count)
+        data["imag"] = rng.integers(-32768, 32768, sample_count)
+        return data
+    elif np.issubdtype(dtype, np.integer):
+        info = np.iinfo(dtype)
+        return rng.integers(info.min, info.max, sample_count, endpoint=True).astype(dtype)
+    elif np.issubdtype(dtype, np.complexfloating):
+        return (rng.random(sample_count) + 1j * rng.random(sample_count)).astype(dtype)
+    return rng.random(sample_count).astype(dtype)
+
+
+def _waveform_cases(
+    label: str,
+    create: Callable[[int, Timing[Any, Any, Any]], Any],
+    to_protobuf: Callable[[Any], Any],
+    from_protobuf: Callable[[Any], Any],
+    to_protobuf_bytes: Callable[[Any], bytes],
+    from_protobuf_bytes: Callable[[bytes], Any] | None,
+) -> list[BenchmarkCase]:
+    cases = []
+    for timing_mode in TIMING_MODES:
+        max_sample_count = (
+            _MAX_IRREGULAR_SAMPLE_COUNT if timing_mode == "irregular" else SAMPLE_COUNTS[-1]
+        )
+
+        def _create(sample_count: int, timing_mode: str = timing_mode) -> Any:
+            return create(sample_count, _create_timing(timing_mode, sample_count))
+
+        def _setup_to(sample_count: int, _create: Callable[[int], Any] = _create) -> Any:
+            value = _create(sample_count)
+            return lambda: to_protobuf(value)
+
+        def _setup_from(sample_count: int, _create: Callable[[int], Any] = _create) -> Any:
+            message = to_protobuf(_create(sample_count))
+            return lambda: from_protobuf(message)
+
+        def _setup_to_bytes(sample_count: int, _create: Callable[[int], Any] = _create) -> Any:
+            value = _create(sample_count)
+            return lambda: to_protobuf_bytes(value)
+
+        cases += [
+            BenchmarkCase(f"{label}_to_protobuf[{timing_mode}]", _setup_to, max_sample_count),
+            BenchmarkCase(f"{label}_from_protobuf[{timing_mode}]", _setup_from, max_sample_count),
+            BenchmarkCase(
+                f"{label}_to_protobuf_bytes[{timing_mode}]", _setup_to_bytes, max_sample_count
+            ),
+        ]
+        if from_protobuf_bytes is not None:
+
+            def _setup_from_bytes(
+                sample_count: int,
+                _create: Callable[[int], Any] = _create,
+                from_protobuf_bytes: Callable[[bytes], Any] = from_protobuf_bytes,
+            ) -> Any:
+                data = to_protobuf_bytes(_create(sample_count))
+                return lambda: from_protobuf_bytes(data)
+
+            cases.append(
+                BenchmarkCase(
+                    f"{label}_from_protobuf_bytes[{timing_mode}]",
+                    _setup_from_bytes,
+                    max_sample_count,
+                )
+            )
+    return cases
+
+
+def _analog(dtype: npt.DTypeLike) -> Callable[[int, Timing[Any, Any, Any]], Any]:
+    return lambda sample_count, timing: AnalogWaveform.from_array_1d(
+        _random_data(dtype, sample_count),
+        timing=timing,
+        extended_properties=_EXTENDED_PROPERTIES,
+    )
+
+
+def _complex(dtype: npt.DTypeLike) -> Callable[[int, Timing[Any, Any, Any]], Any]:
+    return lambda sample_count, timing: ComplexWaveform.from_array_1d(
+        _random_data(dtype, sample_count),
+        timing=timing,
+        extended_properties=_EXTENDED_PROPERTIES,
+    )
+
+
+def _digital(sample_count: int, timing: Timing[Any, Any, Any]) -> Any:
+    return DigitalWaveform.from_lines(
+        _random_data(np.uint8, sample_count * 8).reshape(sample_count, 8) & 1,
+        timing=timing,
+        extended_properties=_EXTENDED_PROPERTIES,
+    )
+
+
+def _spectrum_cases(label: str, dtype: npt.DTypeLike) -> list[BenchmarkCase]:
+    to_protobuf = getattr(wfc, f"{label}_to_protobuf")
+    from_protobuf = getattr(wfc, f"{label}_from_protobuf")
+
+    def _create(sample_count: int) -> Any:
+        return Spectrum.from_array_1d(
+            _random_data(dtype, sample_count),
+            start_frequency=10.0,
+            frequency_increment=1.0,
+            extended_properties=_EXTENDED_PROPERTIES,
+        )
+
+    def _setup_to(sample_count: int) -> Any:
+        value = _create(sample_count)
+        return lambda: to_protobuf(value)
+
+    def _setup_from(sample_count: int) -> Any:
+        message = to_protobuf(_create(sample_count))
+        return lambda: from_protobuf(message)
+
+    return [
+        BenchmarkCase(f"{label}_to_protobuf", _setup_to),
+        BenchmarkCase(f"{label}_from_protobuf", _setup_from),
+    ]
+
+
+def _vector_cases() -> list[BenchmarkCase]:
+    cases = []
+    # Vectors exclude the Int32 limits, so the int32 values are generated as int16.
+    for label, dtype, source_dtype in [
+        ("bool", np.bool_, np.uint8),
+        ("int32", np.int32, np.int16),
+        ("float64", np.float64, np.float64),
+    ]:
+
+        def _create(
+            sample_count: int, dtype: Any = dtype, source_dtype: Any = source_dtype
+        ) -> npt.NDArray[Any]:
+            return _random_data(source_dtype, sample_count).astype(dtype)
+
+        def _setup_to(sample_count: int, _create: Callable[[int], Any] = _create) -> Any:
+            value = Vector(_create(sample_count).tolist())
+            return lambda: vector_conversion.vector_to_protobuf(value)
+
+        def _setup_from(sample_count: int, _create: Callable[[int], Any] = _create) -> Any:
+            message = vector_conversion.vector_to_protobuf(Vector(_create(sample_count).tolist()))
+            return lambda: vector_conversion.vector_from_protobuf(message)
+
+        def _setup_array_to(sample_count: int, _create: Callable[[int], Any] = _create) -> Any:
+            values = _create(sample_count)
+            return lambda: vector_conversion.array_to_vector_protobuf(values)
+
+        def _setup_array_from(sample_count: int, _create: Callable[[int], Any] = _create) -> Any:
+            message = vector_conversion.array_to_vector_protobuf(_create(sample_count))
+            return lambda: vector_conversion.array_from_vector_protobuf(message)
+
+        cases += [
+            BenchmarkCase(f"vector_to_protobuf[{label}]", _setup_to, _MAX_OBJECT_SAMPLE_COUNT),
+            BenchmarkCase(f"vector_from_protobuf[{label}]", _setup_from, _MAX_OBJECT_SAMPLE_COUNT),
+            BenchmarkCase(f"array_to_vector_protobuf[{label}]", _setup_array_to),
+            BenchmarkCase(f"array_from_vector_protobuf[{label}]", _setup_array_from),
+        ]
+    return cases
+
+
+def _scalar_cases() -> list[BenchmarkCase]:
+    # Each scalar is a separate message, so the sample count is the number of messages.
+    def _setup_to(sample_count: int) -> Any:
+        scalars = [
+            Scalar(value, "Volts") for value in _random_data(np.float64, sample_count).tolist()
+        ]
+        return lambda: [scalar_conversion.scalar_to_protobuf(scalar) for scalar in scalars]
+
+    def _setup_array_to(sample_count: int) -> Any:
+        values = _random_data(np.float64, sample_count)
+        return lambda: scalar_conversion.array_to_scalar_protobufs(values, units="Volts")
+
+    def _setup_array_from(sample_count: int) -> Any:
+        messages = scalar_conversion.array_to_scalar_protobufs(
+            _random_data(np.float64, sample_count), units="Volts"
+        )
+        return lambda: scalar_conversion.array_from_scalar_protobufs(messages)
+
+    return [
+        BenchmarkCase("scalar_to_protobuf[float64]", _setup_to, _MAX_IRREGULAR_SAMPLE_COUNT),
+        BenchmarkCase(
+            "array_to_scalar_protobufs[float64]", _setup_array_to, _MAX_IRREGULAR_SAMPLE_COUNT
+        ),
+        BenchmarkCase(
+            "array_from_scalar_protobufs[float64]", _setup_array_from, _MAX_IRREGULAR_SAMPLE_COUNT
+        ),
+    ]
+
+
+def _xydata_cases() -> list[BenchmarkCase]:
+    def _create(sample_count: int) -> XYData[np.float64]:
+        return XYData.from_arrays_1d(
+            _random_data(np.float64, sample_count),
+            _random_data(np.float64, sample_count),
+            np.float64,
+            extended_properties=_EXTENDED_PROPERTIES,
+        )
+
+    def _setup_to(sample_count: int) -> Any:
+        value = _create(sample_count)
+        return lambda: xydata_conversion.float64_xydata_to_protobuf(value)
+
+    def _setup_from(sample_count: int) -> Any:
+        message = xydata_conversion.float64_xydata_to_protobuf(_create(sample_count))
+        return lambda: xydata_conversion.float64_xydata_from_protobuf(message)
+
+    def _setup_to_bytes(sample_count: int) -> Any:
+        value = _create(sample_count)
+        return lambda: xydata_conversion.float64_xydata_to_protobuf_bytes(value)
+
+    def _setup_from_bytes(sample_count: int) -> Any:
+        data = xydata_conversion.float64_xydata_to_protobuf_bytes(_create(sample_count))
+        return lambda: xydata_conversion.float64_xydata_from_protobuf_bytes(data)
+
+    # Batches of 100-point curves, such as I-V sweeps.
+    def _create_curves(sample_count: int) -> list[XYData[np.float64]]:
+        x_data = np.linspace(0.0, 1.0, 100)
+        y_data = _random_data(np.float64, sample_count).reshape(-1, min(sample_count, 100))
+        return [
+            XYData.from_arrays_1d(
+                x_data[: len(row)], row, np.float64, extended_properties=_EXTENDED_PROPERTIES
+            )
+            for row in y_data
+        ]
+
+    def _setup_array_to(sample_count: int) -> Any:
+        values = _create_curves(sample_count)
+        return lambda: xydata_wrappers_conversion.float64_xydata_array_to_protobuf(values)
+
+    def _setup_array_from(sample_count: int) -> Any:
+        message = xydata_wrappers_conversion.float64_xydata_array_to_protobuf(
+            _create_curves(sample_count)
+        )
+        return lambda: xydata_wrappers_conversion.float64_xydata_array_from_protobuf(message)
+
+    def _setup_array_from_bytes(sample_count: int) -> Any:
+        data = xydata_wrappers_conversion.float64_xydata_array_to_protobuf_bytes(
+            _create_curves(sample_count)
+        )
+        return lambda: xydata_wrappers_conversion.float64_xydata_array_from_protobuf_bytes(data)
+
+    return [
+        BenchmarkCase("float64_xydata_to_protobuf", _setup_to),
+        BenchmarkCase("float64_xydata_from_protobuf", _setup_from),
+        BenchmarkCase("float64_xydata_to_protobuf_bytes", _setup_to_bytes),
+        BenchmarkCase("float64_xydata_from_protobuf_bytes", _setup_from_bytes),
+        BenchmarkCase(
+            "float64_xydata_array_to_protobuf", _setup_array_to, _MAX_OBJECT_SAMPLE_COUNT
+        ),
+        BenchmarkCase(
+            "float64_xydata_array_from_protobuf", _setup_array_from, _MAX_OBJECT_SAMPLE_COUNT
+        ),
+        BenchmarkCase(
+            "float64_xydata_array_from_protobuf_bytes",
+            _setup_array_from_bytes,
+            _MAX_OBJECT_SAMPLE_COUNT,
+        ),
+    ]
+
+
+def _array_2d_cases() -> list[BenchmarkCase]:
+    def _create(sample_count: int) -> npt.NDArray[np.float64]:
+        # Use 1000 columns, or one row for small sample counts.
+        columns = min(sample_count, 1000)
+        return _random_data(np.float64, sample_count).reshape(-1, columns)
+
+    def _setup_to(sample_count: int) -> Any:
+        value = _create(sample_count)
+        return lambda: array_conversion.double_2d_array_to_protobuf(value)
+
+    def _setup_to_transposed(sample_count: int) -> Any:
+        value = _create(sample_count).T
+        return lambda: array_conversion.double_2d_array_to_protobuf(value)
+
+    def _setup_from(sample_count: int) -> Any:
+        message = array_conversion.double_2d_array_to_protobuf(_create(sample_count))
+        return lambda: array_conversion.double_2d_array_from_protobuf(message)
+
+    def _setup_from_bytes(sample_count: int) -> Any:
+        data = array_conversion.double_2d_array_to_protobuf(_create(sample_count))
+        serialized = data.SerializeToString()
+        return lambda: array_conversion.double_2d_array_from_protobuf_bytes(serialized)
+
+    return [
+        BenchmarkCase("double_2d_array_to_protobuf[c_order]", _setup_to),
+        BenchmarkCase("double_2d_array_to_protobuf[transposed]", _setup_to_transposed),
+        BenchmarkCase("double_2d_array_from_protobuf", _setup_from),
+        BenchmarkCase("double_2d_array_from_protobuf_bytes", _setup_from_bytes),
+    ]
+
+
+def _reduced_precision_cases() -> list[BenchmarkCase]:
+    def _setup_to_int16(sample_count: int) -> Any:
+        value = _analog(np.float64)(sample_count, _create_timing("regular", sample_count))
+        return lambda: wfc.float64_analog_waveform_to_int16_protobuf(value)
+
+    def _setup_to_float32(sample_count: int) -> Any:
+        value = _analog(np.float64)(sample_count, _create_timing("regular", sample_count))
+        return lambda: wfc.float64_analog_waveform_to_float32_protobuf(value)
+
+    return [
+        BenchmarkCase("float64_analog_waveform_to_int16_protobuf", _setup_to_int16),
+        BenchmarkCase("float64_analog_waveform_to_float32_protobuf", _setup_to_float32),
+    ]
+
+
+def _builder_cases() -> list[BenchmarkCase]:
+    def _create(sample_count: int) -> Any:
+        builder = waveform_builder.Float64AnalogWaveformBuilder(
+            timing=_create_timing("regular", sample_count)
+        )
+        builder.append(_random_data(np.float64, sample_count))
+        return builder
+
+    def _setup_to(sample_count: int) -> Any:
+        return _create(sample_count).to_protobuf
+
+    def _setup_to_bytes(sample_count: int) -> Any:
+        return _create(sample_count).to_protobuf_bytes
+
+    return [
+        BenchmarkCase("float64_analog_waveform_builder_to_protobuf", _setup_to),
+        BenchmarkCase("float64_analog_waveform_builder_to_protobuf_bytes", _setup_to_bytes),
+    ]
+
+
+def _decimation_cases() -> list[BenchmarkCase]:
+    def _setup_to_decimated(sample_count: int) -> Any:
+        value = _analog(np.float64)(sample_count, _create_timing("regular", sample_count))
+        return lambda: waveform_decimation.float64_analog_waveform_to_decimated_protobuf(
+            value, point_count=2000
+        )
+
+    return [BenchmarkCase("float64_analog_waveform_to_decimated_protobuf", _setup_to_decimated)]
+
+
+def _multi_channel_cases() -> list[BenchmarkCase]:
+    def _create(sample_count: int) -> npt.NDArray[np.float64]:
+        # Split the samples across the channels, with at least one sample per channel.
+        columns = max(sample_count // _CHANNEL_COUNT, 1)
+        return _random_data(np.float64, columns * _CHANNEL_COUNT).reshape(_CHANNEL_COUNT, -1)
+
+    channel_properties = [
+        {"NI_ChannelName": f"Dev1/ai{i}", "NI_UnitDescription": "Volts"}
+        for i in range(_CHANNEL_COUNT)
+    ]
+
+    def _setup_per_channel(sample_count: int) -> Any:
+        value = _create(sample_count)
+        timing = _create_timing("regular", value.shape[1])
+        return lambda: [
+            wfc.float64_analog_waveform_to_protobuf(
+                AnalogWaveform.from_array_1d(row, timing=timing, extended_properties=properties)
+            )
+            for row, properties in zip(value, channel_properties)
+        ]
+
+    def _setup_to_list(sample_count: int) -> Any:
+        value = _create(sample_count)
+        timing = _create_timing("regular", value.shape[1])
+        return lambda: waveform_wrappers_conversion.float64_analog_waveforms_to_protobuf_list(
+            value, timing=timing, channel_properties=channel_properties
+        )
+
+    def _setup_to_array_value(sample_count: int) -> Any:
+        value = _create(sample_count)
+        timing = _create_timing("regular", value.shape[1])
+        return lambda: waveform_wrappers_conversion.float64_analog_waveforms_to_protobuf(
+            value, timing=timing, channel_properties=channel_properties
+        )
+
+    return [
+        BenchmarkCase("multi_channel_float64_analog[per_channel]", _setup_per_channel),
+        BenchmarkCase("multi_channel_float64_analog[to_protobuf_list]", _setup_to_list),
+        BenchmarkCase("multi_channel_float64_analog[to_array_value]", _setup_to_array_value),
+    ]
+
+
+def _batch_cases() -> list[BenchmarkCase]:
+    def _create(sample_count: int) -> list[AnalogWaveform[np.float64]]:
+        # Split the samples across the waveforms, with at least one sample per waveform.
+        columns = max(sample_count // _CHANNEL_COUNT, 1)
+        timing = _create_timing("regular", columns)
+        return [
+            AnalogWaveform.from_array_1d(_random_data(np.float64, columns), timing=timing)
+            for _ in range(_CHANNEL_COUNT)
+        ]
+
+    def _setup_serial(sample_count: int) -> Any:
+        values = _create(sample_count)
+        return lambda: [wfc.float64_analog_waveform_to_protobuf_bytes(value) for value in values]
+
+    def _setup_convert_many(sample_count: int) -> Any:
+        values = _create(sample_count)
+        return lambda: list(
+            batch_conversion.convert_many(wfc.float64_analog_waveform_to_protobuf_bytes, values)
+        )
+
+    # Blocks of 100 samples with the same sample interval and consecutive start times, such as
+    # the records of a continuous acquisition.
+    def _setup_from_blocks(sample_count: int) -> Any:
+        block_size = min(sample_count, 100)
+        messages = [
+            wfc.float64_analog_waveform_to_protobuf(
+                AnalogWaveform.from_array_1d(
+                    _random_data(np.float64, block_size),
+                    timing=Timing.create_with_regular_interval(
+                        dt.timedelta(milliseconds=1), _T0 + dt.timedelta(seconds=0.1 * i)
+                    ),
+                )
+            )
+            for i in range(sample_count // block_size)
+        ]
+        return lambda: [wfc.float64_analog_waveform_from_protobuf(message) for message in messages]
+
+    return [
+        BenchmarkCase("batch_float64_analog_to_protobuf_bytes[serial]", _setup_serial),
+        BenchmarkCase("batch_float64_analog_to_protobuf_bytes[convert_many]", _setup_convert_many),
+        BenchmarkCase(
+            "batch_float64_analog_from_protobuf[blocks]",
+            _setup_from_blocks,
+            _MAX_IRREGULAR_SAMPLE_COUNT,
+        ),
+    ]
+
+
+def _any_cases() -> list[BenchmarkCase]:
+    def _setup_to_any(sample_count: int) -> Any:
+        value = _analog(np.float64)(sample_count, _create_timing("regular", sample_count))
+        return lambda: converter_registry.to_any(value)
+
+    def _setup_from_any(sample_count: int) -> Any:
+        value = _analog(np.float64)(sample_count, _create_timing("regular", sample_count))
+        message = converter_registry.to_any(value)
+        return lambda: converter_registry.from_any(message)
+
+    return [
+        BenchmarkCase("to_any[float64_analog_waveform]", _setup_to_any),
+        BenchmarkCase("from_any[float64_analog_waveform]", _setup_from_any),
+    ]
+
+
+def get_cases() -> list[BenchmarkCase]:
+    """Get all of the benchmark cases."""
+    return [
+        *_waveform_cases(
+            "float64_analog_waveform",
+            _analog(np.float64),
+            wfc.float64_analog_waveform_to_protobuf,
+            wfc.float64_analog_waveform_from_protobuf,
+            wfc.float64_analog_waveform_to_protobuf_bytes,
+            wfc.float64_analog_waveform_from_protobuf_bytes,
+        ),
+        *_waveform_cases(
+            "float32_analog_waveform",
+            _analog(np.float32),
+            wfc.float32_analog_waveform_to_protobuf,
+            wfc.float32_analog_waveform_from_protobuf,
+            wfc.float32_analog_waveform_to_protobuf_bytes,
+            wfc.float32_analog_waveform_from_protobuf_bytes,
+        ),
+        *_waveform_cases(
+            "int16_analog_waveform",
+            _analog(np.int16),
+            wfc.int16_analog_waveform_to_protobuf,
+            wfc.int16_analog_waveform_from_protobuf,
+            wfc.int16_analog_waveform_to_protobuf_bytes,
+            wfc.int16_analog_waveform_from_protobuf_bytes,
+        ),
+        *_waveform_cases(
+            "float64_complex_waveform",
+            _complex(np.complex128),
+            wfc.float64_complex_waveform_to_protobuf,
+            wfc.float64_complex_waveform_from_protobuf,
+            wfc.float64_complex_waveform_to_protobuf_bytes,
+            wfc.float64_complex_waveform_from_protobuf_bytes,
+        ),
+        *_waveform_cases(
+            "float32_complex_waveform",
+            _complex(np.complex64),
+            wfc.float32_complex_waveform_to_protobuf,
+            wfc.float32_complex_waveform_from_protobuf,
+            wfc.float32_complex_waveform_to_protobuf_bytes,
+            wfc.float32_complex_waveform_from_protobuf_bytes,
+        ),
+        *_waveform_cases(
+            "int16_complex_waveform",
+            _complex(ComplexInt32DType),
+            wfc.int16_complex_waveform_to_protobuf,
+            wfc.int16_complex_waveform_from_protobuf,
+            wfc.int16_complex_waveform_to_protobuf_bytes,
+            wfc.int16_complex_waveform_from_protobuf_bytes,
+        ),
+        *_waveform_cases(
+            "digital_waveform",
+            _digital,
+            wfc.digital_waveform_to_protobuf,
+            wfc.digital_waveform_from_protobuf,
+            wfc.digital_waveform_to_protobuf_bytes,
+            wfc.digital_waveform_from_protobuf_bytes,
+        ),
+        *_reduced_precision_cases(),
+        *_decimation_cases(),
+        *_builder_cases(),
+        *_spectrum_cases("float64_spectrum", np.float64),
+        *_spectrum_cases("float32_spectrum", np.float32),
+        *_scalar_cases(),
+        *_vector_cases(),
+        *_xydata_cases(),
+        *_array_2d_cases(),
+        *_multi_channel_cases(),
+        *_batch_cases(),
+        *_any_cases(),
+    ]
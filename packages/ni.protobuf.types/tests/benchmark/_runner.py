@@ -0,0 +1,187 @@
+"""Measure the benchmark cases and compare the results against a baseline."""
+
+from __future__ import annotations
+
+import gc
+import multiprocessing
+import platform
+import sys
+import timeit
+import tracemalloc
+from collections.abc import Iterable, Mapping, Sequence
+from typing import Any, NamedTuple
+
+import google.protobuf
+import nitypes
+import numpy as np
+from google.protobuf.internal import api_implementation
+
+from tests.benchmark._cases import BenchmarkCase, get_cases
+
+
+class BenchmarkResult(NamedTuple):
+    """The measurements for one benchmark case and sample count."""
+
+    name: str
+    sample_count: int
+    seconds_per_call: float
+    """The fastest time per call, in seconds."""
+    ns_per_sample: float
+    """The fastest time per call, in nanoseconds per sample."""
+    peak_traced_bytes: int
+    """The peak size of the Python and NumPy allocations made by one call, traced with
+    tracemalloc. Allocations made by the protobuf C extension are not traced."""
+    retained_blocks: int
+    """The number of Python memory blocks that are still allocated while the result is alive."""
+    setup_peak_rss_bytes: int | None
+    """The peak resident set size of the benchmark process after creating the input data."""
+    peak_rss_bytes: int | None
+    """The peak resident set size of the benchmark process after running the case."""
+
+
+class Comparison(NamedTuple):
+    """A benchmark result compared against the baseline."""
+
+    result: BenchmarkResult
+    baseline: BenchmarkResult | None
+    ratio: float | None
+    """The result's ns/sample divided by the baseline's ns/sample."""
+
+
+def get_peak_rss() -> int | None:
+    """Get the peak resident set size of the current process, in bytes."""
+    if sys.platform == "win32":
+        import ctypes
+        from ctypes import wintypes
+
+        class _ProcessMemoryCounters(ctypes.Structure):
+            _fields_ = [
+                ("cb", wintypes.DWORD),
+                ("PageFaultCount", wintypes.DWORD),
+                ("PeakWorkingSetSize", ctypes.c_size_t),
+                ("WorkingSetSize", ctypes.c_size_t),
+                ("QuotaPeakPagedPoolUsage", ctypes.c_size_t),
+                ("QuotaPagedPoolUsage", ctypes.c_size_t),
+                ("QuotaPeakNonPagedPoolUsage", ctypes.c_size_t),
+                ("QuotaNonPagedPoolUsage", ctypes.c_size_t),
+                ("PagefileUsage", ctypes.c_size_t),
+                ("PeakPagefileUsage", ctypes.c_size_t),
+            ]
+
+        counters = _ProcessMemoryCounters()
+        counters.cb = ctypes.sizeof(counters)
+        process = ctypes.windll.kernel32.GetCurrentProcess()
+        if not ctypes.windll.psapi.GetProcessMemoryInfo(
+            process, ctypes.byref(counters), counters.cb
+        ):
+            return None
+        return int(counters.PeakWorkingSetSize)
+
+    import resource
+
+    max_rss = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss
+    # ru_maxrss is in bytes on macOS and in kilobytes on Linux.
+    return max_rss if sys.platform == "darwin" else max_rss * 1024
+
+
+def run_case(case: BenchmarkCase, sample_count: int, repeat: int) -> BenchmarkResult:
+    """Measure one benchmark case in the current process."""
+    func = case.setup(sample_count)
+    setup_peak_rss = get_peak_rss()
+
+    gc.collect()
+    blocks_before = sys.getallocatedblocks()
+    tracemalloc.start()
+    try:
+        result = func()
+        _, peak_traced = tracemalloc.get_traced_memory()
+    finally:
+        tracemalloc.stop()
+    retained_blocks = sys.getallocatedblocks() - blocks_before
+    del result
+
+    timer = timeit.Timer(func)
+    number, _ = timer.autorange()
+    seconds_per_call = min(timer.repeat(repeat=repeat, number=number)) / number
+    return BenchmarkResult(
+        case.name,
+        sample_count,
+        seconds_per_call,
+        seconds_per_call * 1e9 / sample_count,
+        peak_traced,
+        retained_blocks,
+        setup_peak_rss,
+        get_peak_rss(),
+    )
+
+
+def _run_case_by_name(name: str, sample_count: int, repeat: int) -> BenchmarkResult:
+    (case,) = [case for case in get_cases() if case.name == name]
+    return run_case(case, sample_count, repeat)
+
+
+def run_cases(
+    cases: Iterable[BenchmarkCase],
+    sample_counts: Sequence[int],
+    *,
+    repeat: int = 5,
+    isolate: bool = True,
+) -> Iterable[BenchmarkResult]:
+    """Measure the benchmark cases for each sample count that the case supports.
+
+    If isolate is True, each measurement runs in a new process, so the peak resident set size
+    only includes that measurement.
+    """
+    context = multiprocessing.get_context("spawn")
+    for case in cases:
+        for sample_count in sample_counts:
+            if sample_count > case.max_sample_count:
+                continue
+            if isolate:
+                with context.Pool(1) as pool:
+                    yield pool.apply(_run_case_by_name, (case.name, sample_count, repeat))
+            else:
+                yield run_case(case, sample_count, repeat)
+
+
+def get_environment() -> dict[str, str]:
+    """Get the versions and platform that the benchmarks ran on."""
+    return {
+        "python": platform.python_version(),
+        "platform": platform.platform(),
+        "machine": platform.machine(),
+        "numpy": np.__version__,
+        "nitypes": getattr(nitypes, "__version__", "unknown"),
+        "protobuf": google.protobuf.__version__,
+        "protobuf_implementation": api_implementation.Type(),
+    }
+
+
+def results_to_json(results: Iterable[BenchmarkResult]) -> dict[str, Any]:
+    """Convert the results to a JSON-serializable dictionary."""
+    return {
+        "environment": get_environment(),
+        "results": [result._asdict() for result in results],
+    }
+
+
+def results_from_json(data: Mapping[str, Any]) -> list[BenchmarkResult]:
+    """Convert a JSON dictionary created by results_to_json to a list of results."""
+    return [BenchmarkResult(**result) for result in data["results"]]
+
+
+def compare(
+    results: Iterable[BenchmarkResult], baseline: Iterable[BenchmarkResult]
+) -> list[Comparison]:
+    """Compare the results against the baseline results with the same name and sample count."""
+    baseline_by_key = {(result.name, result.sample_count): result for result in baseline}
+    comparisons = []
+    for result in results:
+        baseline_result = baseline_by_key.get((result.name, result.sample_count))
+        ratio = (
+            result.ns_per_sample / baseline_result.ns_per_sample
+            if baseline_result is not None and baseline_result.ns_per_sample > 0
+            else None
+        )
+        comparisons.append(Comparison(result, baseline_result, ratio))
+    return comparisons
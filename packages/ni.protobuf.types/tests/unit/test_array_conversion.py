@@ -0,0 +1,211 @@
+import os
+import subprocess
+import sys
+import textwrap
+from collections.abc import Callable
+from typing import Any
+
+import numpy as np
+import numpy.typing as npt
+import pytest
+
+from ni.protobuf.types.array_conversion import (
+    double_2d_array_from_protobuf,
+    double_2d_array_from_protobuf_bytes,
+    double_2d_array_to_protobuf,
+    string_2d_array_from_protobuf,
+    string_2d_array_to_protobuf,
+)
+from ni.protobuf.types.array_pb2 import Double2DArray, String2DArray
+
+# Encoded in several 1 MiB blocks, the last of which is partial.
+_MULTI_BLOCK_SHAPE = (1000, 512)
+
+_LARGE_SHAPE = (4096, 4096)
+_LARGE_NBYTES = _LARGE_SHAPE[0] * _LARGE_SHAPE[1] * 8
+
+# Converts a large array in a new process and prints the peak memory used during the conversion
+# that is no longer in use after it. The message itself is still in use, so this measures the
+# temporary copies. tracemalloc cannot be used, because it does not see upb arena allocations,
+# and the ru_maxrss of resource.getrusage() cannot be used, because a child process inherits the
+# peak RSS of the pytest process. The VmHWM peak in /proc starts over when the process starts.
+_TRANSIENT_RSS_SCRIPT = textwrap.dedent(
+    """
+    import sys
+
+    import numpy as np
+
+    from ni.protobuf.types.array_conversion import double_2d_array_to_protobuf
+
+    def get_rss_kib(name):
+        with open("/proc/self/status") as file:
+            for line in file:
+                if line.startswith(name + ":"):
+                    return int(line.split()[1])
+        raise ValueError(name)
+
+    value = np.random.rand({rows}, {columns})
+    if sys.argv[1] == "transposed":
+        value = value.T
+    message = double_2d_array_to_protobuf(value)
+    print((get_rss_kib("VmHWM") - get_rss_kib("VmRSS")) * 1024)
+    """
+).format(rows=_LARGE_SHAPE[0], columns=_LARGE_SHAPE[1])
+
+
+# ========================================================
+# Double2DArray
+# ========================================================
+def test___double_2d_array___convert___valid_protobuf() -> None:
+    value = np.array([[1.0, 2.0, 3.0], [4.0, 5.0, 6.0]])
+
+    message = double_2d_array_to_protobuf(value)
+
+    assert message == Double2DArray(rows=2, columns=3, data=[1.0, 2.0, 3.0, 4.0, 5.0, 6.0])
+
+
+@pytest.mark.parametrize(
+    "value",
+    [
+        np.arange(12.0).reshape(3, 4),
+        np.asfortranarray(np.arange(12.0).reshape(3, 4)),
+        np.arange(12.0).reshape(3, 4).T,
+        np.arange(24.0).reshape(4, 6)[::2, 1::2],
+        np.arange(12, dtype=np.int32).reshape(3, 4),
+        np.arange(12, dtype=np.float32).reshape(3, 4),
+        np.zeros((0, 4)),
+        np.zeros((4, 0)),
+    ],
+    ids=["c_order", "fortran_order", "transposed", "strided", "int32", "float32", "0x4", "4x0"],
+)
+def test___double_2d_array___round_trip___values_and_shape_preserved(
+    value: npt.NDArray[Any],
+) -> None:
+    message = double_2d_array_to_protobuf(value)
+    result = double_2d_array_from_protobuf(message)
+
+    assert result.dtype == np.float64
+    assert result.flags.c_contiguous
+    assert result.shape == value.shape
+    assert np.array_equal(result, value)
+
+
+def test___double_2d_array_bytes___convert_from_bytes___view_of_bytes() -> None:
+    value = np.arange(12.0).reshape(3, 4)
+    data = double_2d_array_to_protobuf(value).SerializeToString()
+
+    result = double_2d_array_from_protobuf_bytes(data)
+
+    assert result.flags.c_contiguous
+    assert np.array_equal(result, value)
+    assert np.shares_memory(result, np.frombuffer(data, np.uint8))
+
+
+@pytest.mark.parametrize(
+    "layout",
+    [lambda x: x, lambda x: x.T, lambda x: np.asfortranarray(x)],
+    ids=["c_order", "transposed", "fortran_order"],
+)
+def test___multi_block_double_2d_array___round_trip___values_preserved(
+    layout: Callable[[npt.NDArray[np.float64]], npt.NDArray[np.float64]],
+) -> None:
+    value = layout(np.random.rand(*_MULTI_BLOCK_SHAPE))
+
+    message = double_2d_array_to_protobuf(value)
+
+    assert (message.rows, message.columns) == value.shape
+    assert np.array_equal(double_2d_array_from_protobuf(message), value)
+    assert np.array_equal(double_2d_array_from_protobuf_bytes(message.SerializeToString()), value)
+
+
+def test___large_double_2d_array___round_trip___values_preserved() -> None:
+    value = np.random.rand(*_LARGE_SHAPE)
+
+    message = double_2d_array_to_protobuf(value)
+
+    assert (message.rows, message.columns) == _LARGE_SHAPE
+    assert np.array_equal(double_2d_array_from_protobuf(message), value)
+    assert np.array_equal(double_2d_array_from_protobuf_bytes(message.SerializeToString()), value)
+
+
+@pytest.mark.skipif(sys.platform != "linux", reason="Reads the peak and current RSS from /proc.")
+@pytest.mark.parametrize("layout", ["c_order", "transposed"])
+def test___large_double_2d_array___convert___no_full_size_temporary(layout: str) -> None:
+    result = subprocess.run(
+        [sys.executable, "-c", _TRANSIENT_RSS_SCRIPT, layout],
+        capture_output=True,
+        check=True,
+        env={**os.environ, "PYTHONPATH": os.pathsep.join(sys.path)},
+        text=True,
+    )
+
+    assert int(result.stdout) < _LARGE_NBYTES // 8
+
+
+# ========================================================
+# String2DArray
+# ========================================================
+def test___string_2d_array___convert___valid_protobuf() -> None:
+    value = np.array([["a", "b", "c"], ["d", "e", "f"]])
+
+    message = string_2d_array_to_protobuf(value)
+
+    assert message == String2DArray(rows=2, columns=3, data=["a", "b", "c", "d", "e", "f"])
+
+
+@pytest.mark.parametrize(
+    "value",
+    [
+        np.array([["a", "bb"], ["ccc", ""]]),
+        np.array([["a", "bb"], ["ccc", ""]], object),
+        np.array([["a", "bb"], ["ccc", ""]]).T,
+        np.empty((0, 3), object),
+    ],
+    ids=["str", "object", "transposed", "0x3"],
+)
+def test___string_2d_array___round_trip___values_and_shape_preserved(
+    value: npt.NDArray[Any],
+) -> None:
+    result = string_2d_array_from_protobuf(string_2d_array_to_protobuf(value))
+
+    assert result.dtype == np.object_
+    assert result.flags.c_contiguous
+    assert result.shape == value.shape
+    assert result.tolist() == value.tolist()
+
+
+def test___large_string_2d_array___round_trip___values_preserved() -> None:
+    value = np.arange(_LARGE_SHAPE[0] * 16).astype(str).reshape(_LARGE_SHAPE[0], 16)
+
+    result = string_2d_array_from_protobuf(string_2d_array_to_protobuf(value))
+
+    assert result.shape == value.shape
+    assert result.tolist() == value.tolist()
+
+
+# ========================================================
+# Errors
+# ========================================================
+@pytest.mark.parametrize("shape", [(4,), (2, 2, 2)])
+def test___not_2d_array___convert___raises_value_error(shape: tuple[int, ...]) -> None:
+    with pytest.raises(ValueError, match="must be two-dimensional"):
+        double_2d_array_to_protobuf(np.zeros(shape))
+
+
+@pytest.mark.parametrize(
+    "message",
+    [
+        Double2DArray(rows=2, columns=3, data=[1.0, 2.0]),
+        Double2DArray(rows=-1, columns=0),
+    ],
+)
+def test___mismatched_shape___convert_from_protobuf___raises_value_error(
+    message: Double2DArray,
+) -> None:
+    with pytest.raises(ValueError):
+        double_2d_array_from_protobuf(message)
+
+
+def test___mismatched_shape___convert_string_from_protobuf___raises_value_error() -> None:
+    with pytest.raises(ValueError, match="does not match the shape"):
+        string_2d_array_from_protobuf(String2DArray(rows=1, columns=2, data=["a"]))
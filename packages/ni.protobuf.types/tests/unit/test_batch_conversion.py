@@ -0,0 +1,164 @@
+import threading
+from collections.abc import Iterator
+from concurrent.futures import ProcessPoolExecutor, ThreadPoolExecutor
+
+import numpy as np
+import pytest
+from nitypes.waveform import AnalogWaveform, Spectrum
+from nitypes.xy_data import XYData
+
+from ni.protobuf.types.batch_conversion import convert_many
+from ni.protobuf.types.waveform_conversion import (
+    float64_analog_waveform_from_protobuf_bytes,
+    float64_analog_waveform_to_protobuf,
+    float64_analog_waveform_to_protobuf_bytes,
+    float64_spectrum_from_protobuf,
+    float64_spectrum_to_protobuf,
+)
+from ni.protobuf.types.xydata_conversion import (
+    float64_xydata_from_protobuf,
+    float64_xydata_to_protobuf,
+)
+
+
+def _make_waveforms(count: int) -> list[AnalogWaveform[np.float64]]:
+    return [
+        AnalogWaveform.from_array_1d(
+            np.arange(i, i + 100.0), extended_properties={"NI_ChannelName": f"Dev1/ai{i}"}
+        )
+        for i in range(count)
+    ]
+
+
+# ========================================================
+# Convert Many
+# ========================================================
+def test___waveforms___convert_many_to_protobuf___results_in_order() -> None:
+    waveforms = _make_waveforms(20)
+
+    messages = list(convert_many(float64_analog_waveform_to_protobuf, waveforms, max_workers=4))
+
+    assert messages == [float64_analog_waveform_to_protobuf(w) for w in waveforms]
+
+
+def test___serialized_waveforms___convert_many_from_protobuf_bytes___round_trips() -> None:
+    waveforms = _make_waveforms(20)
+    data = convert_many(float64_analog_waveform_to_protobuf_bytes, waveforms, max_workers=4)
+
+    results = list(convert_many(float64_analog_waveform_from_protobuf_bytes, data, max_workers=4))
+
+    assert [list(w.raw_data) for w in results] == [list(w.raw_data) for w in waveforms]
+    assert [w.channel_name for w in results] == [w.channel_name for w in waveforms]
+
+
+def test___spectra_and_xydata___convert_many___round_trips() -> None:
+    spectra = [Spectrum.from_array_1d(np.arange(i + 1.0), start_frequency=i) for i in range(5)]
+    xydata = [
+        XYData.from_arrays_1d(np.arange(i + 1.0), np.arange(i + 1.0), np.float64) for i in range(5)
+    ]
+
+    spectrum_messages = convert_many(float64_spectrum_to_protobuf, spectra)
+    xydata_messages = convert_many(float64_xydata_to_protobuf, xydata)
+
+    assert list(convert_many(float64_spectrum_from_protobuf, spectrum_messages)) == spectra
+    assert list(convert_many(float64_xydata_from_protobuf, xydata_messages)) == xydata
+
+
+def test___empty_values___convert_many___no_results() -> None:
+    assert list(convert_many(float64_analog_waveform_to_protobuf, [])) == []
+
+
+def test___max_pending___convert_many___values_read_lazily() -> None:
+    read_count = 0
+
+    def read_values() -> Iterator[AnalogWaveform[np.float64]]:
+        nonlocal read_count
+        for waveform in _make_waveforms(20):
+            read_count += 1
+            yield waveform
+
+    results = convert_many(
+        float64_analog_waveform_to_protobuf, read_values(), max_workers=2, max_pending=3
+    )
+    yielded_count = 0
+    for _ in results:
+        yielded_count += 1
+        assert read_count - yielded_count <= 3
+
+    assert yielded_count == 20
+
+
+def test___max_workers___convert_many___concurrency_bounded() -> None:
+    lock = threading.Lock()
+    active_count = max_active_count = 0
+    barrier = threading.Barrier(2, timeout=10.0)
+
+    def convert(value: int) -> int:
+        nonlocal active_count, max_active_count
+        with lock:
+            active_count += 1
+            max_active_count = max(max_active_count, active_count)
+        if value < 2:
+            barrier.wait()
+        with lock:
+            active_count -= 1
+        return value * 2
+
+    results = list(convert_many(convert, range(10), max_workers=2))
+
+    assert results == [value * 2 for value in range(10)]
+    assert max_active_count == 2
+
+
+def test___converter_raises___convert_many___exception_raised_in_order() -> None:
+    def convert(value: int) -> int:
+        if value == 3:
+            raise ValueError("Bad value.")
+        return value
+
+    results = convert_many(convert, range(10), max_workers=2)
+
+    assert [next(results) for _ in range(3)] == [0, 1, 2]
+    with pytest.raises(ValueError, match="Bad value."):
+        next(results)
+
+
+def test___custom_executor___convert_many___executor_not_shut_down() -> None:
+    waveforms = _make_waveforms(5)
+
+    with ThreadPoolExecutor(2) as executor:
+        first = list(
+            convert_many(float64_analog_waveform_to_protobuf, waveforms, executor=executor)
+        )
+        second = list(
+            convert_many(float64_analog_waveform_to_protobuf, waveforms, executor=executor)
+        )
+
+    assert first == second
+
+
+def test___process_pool_executor___convert_many___results_in_order() -> None:
+    waveforms = _make_waveforms(5)
+
+    with ProcessPoolExecutor(1) as executor:
+        data = list(
+            convert_many(float64_analog_waveform_to_protobuf_bytes, waveforms, executor=executor)
+        )
+
+    assert data == [float64_analog_waveform_to_protobuf_bytes(w) for w in waveforms]
+
+
+def test___zero_max_workers___convert_many___raises_value_error() -> None:
+    with pytest.raises(ValueError, match="The max workers must be a positive integer."):
+        convert_many(float64_analog_waveform_to_protobuf, [], max_workers=0)
+
+
+def test___zero_max_pending___convert_many___raises_value_error() -> None:
+    with pytest.raises(ValueError, match="The max pending must be a positive integer."):
+        convert_many(float64_analog_waveform_to_protobuf, [], max_pending=0)
+
+
+def test___executor_and_max_workers___convert_many___raises_value_error() -> None:
+    with ThreadPoolExecutor(1) as executor:
+        with pytest.raises(ValueError, match="The max_workers argument cannot be used"):
+            convert_many(float64_analog_waveform_to_protobuf, [], executor=executor, max_workers=2)
@@ -0,0 +1,115 @@
+import threading
+
+import numpy as np
+import pytest
+from nitypes.scalar import Scalar
+from nitypes.vector import Vector
+
+from ni.protobuf.types import conversion_context
+from ni.protobuf.types.batch_conversion import convert_many
+from ni.protobuf.types.conversion_context import is_trusted_input, trusted_input
+from ni.protobuf.types.precision_timestamp_pb2 import PrecisionTimestamp
+from ni.protobuf.types.scalar_conversion import scalar_to_protobuf
+from ni.protobuf.types.vector_conversion import array_to_vector_protobuf, vector_to_protobuf
+from ni.protobuf.types.waveform_conversion import float64_analog_waveform_from_protobuf
+from ni.protobuf.types.waveform_pb2 import DoubleAnalogWaveform
+
+# The Int32 range checks exclude the Int32 limits, which protobuf accepts.
+_INT32_MAX = 0x7FFFFFFF
+
+
+@pytest.fixture(autouse=True)
+def validation_in_release_mode(monkeypatch: pytest.MonkeyPatch) -> None:
+    monkeypatch.setattr(conversion_context, "_ALWAYS_VALIDATE", False)
+
+
+# ========================================================
+# Trusted Input
+# ========================================================
+def test___default___is_trusted_input___false() -> None:
+    assert not is_trusted_input()
+
+
+def test___trusted_input_context___is_trusted_input___true_until_exit() -> None:
+    with trusted_input():
+        assert is_trusted_input()
+        with trusted_input(False):
+            assert not is_trusted_input()
+        assert is_trusted_input()
+
+    assert not is_trusted_input()
+
+
+def test___trusted_input_decorator___call___trusted_during_call() -> None:
+    @trusted_input()
+    def convert() -> bool:
+        return is_trusted_input()
+
+    assert convert()
+    assert not is_trusted_input()
+
+
+def test___trusted_input_context___other_thread___not_trusted() -> None:
+    results = []
+
+    with trusted_input():
+        thread = threading.Thread(target=lambda: results.append(is_trusted_input()))
+        thread.start()
+        thread.join()
+
+    assert results == [False]
+
+
+def test___int32_max_scalar___to_protobuf_with_trusted_input___check_skipped() -> None:
+    with pytest.raises(ValueError, match="must be within the range of an Int32"):
+        scalar_to_protobuf(Scalar(_INT32_MAX))
+
+    with trusted_input():
+        message = scalar_to_protobuf(Scalar(_INT32_MAX))
+
+    assert message.sint32_value == _INT32_MAX
+
+
+def test___int32_max_scalars___convert_many_with_trusted_input___check_skipped() -> None:
+    scalars = [Scalar(_INT32_MAX)] * 8
+
+    with trusted_input():
+        messages = list(convert_many(scalar_to_protobuf, scalars, max_workers=2))
+
+    assert [message.sint32_value for message in messages] == [_INT32_MAX] * 8
+
+
+def test___int32_max_vector___to_protobuf_with_trusted_input___check_skipped() -> None:
+    with pytest.raises(ValueError, match="must be within the range of an Int32"):
+        vector_to_protobuf(Vector([0, _INT32_MAX]))
+
+    with trusted_input():
+        message = vector_to_protobuf(Vector([0, _INT32_MAX]))
+        array_message = array_to_vector_protobuf(np.array([0, _INT32_MAX]))
+
+    assert list(message.sint32_array.values) == [0, _INT32_MAX]
+    assert array_message == message
+
+
+def test___t0_with_time_offset___from_protobuf_with_trusted_input___check_skipped() -> None:
+    message = DoubleAnalogWaveform(
+        t0=PrecisionTimestamp(seconds=100), time_offset=1.0, y_data=[1.0]
+    )
+    with pytest.raises(ValueError, match="Timestamp must be set"):
+        float64_analog_waveform_from_protobuf(message)
+
+    with trusted_input():
+        waveform = float64_analog_waveform_from_protobuf(message)
+
+    assert list(waveform.raw_data) == [1.0]
+
+
+def test___always_validate___trusted_input___checks_kept(
+    monkeypatch: pytest.MonkeyPatch,
+) -> None:
+    monkeypatch.setattr(conversion_context, "_ALWAYS_VALIDATE", True)
+
+    with trusted_input():
+        assert not is_trusted_input()
+        with pytest.raises(ValueError, match="must be within the range of an Int32"):
+            scalar_to_protobuf(Scalar(_INT32_MAX))
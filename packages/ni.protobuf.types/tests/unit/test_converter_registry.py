@@ -0,0 +1,268 @@
+import datetime as dt
+from typing import Any
+
+import hightime as ht
+import nitypes.bintime as bt
+import numpy as np
+import pytest
+from google.protobuf import any_pb2
+from nitypes.complex import ComplexInt32DType
+from nitypes.scalar import Scalar
+from nitypes.vector import Vector
+from nitypes.waveform import AnalogWaveform, ComplexWaveform, DigitalWaveform, Spectrum, Timing
+from nitypes.xy_data import XYData
+
+from ni.protobuf.types import array_pb2, scalar_pb2, waveform_pb2
+from ni.protobuf.types.converter_registry import (
+    Converter,
+    ConverterRegistry,
+    from_any,
+    from_protobuf,
+    to_any,
+    to_protobuf,
+)
+from ni.protobuf.types.precision_timestamp_pb2 import PrecisionTimestamp
+from ni.protobuf.types.waveform_conversion import (
+    float64_analog_waveform_from_protobuf,
+    float64_analog_waveform_to_protobuf,
+    int16_analog_waveform_to_protobuf,
+)
+from ni.protobuf.types.waveform_wrappers_conversion import float64_analog_waveforms_to_protobuf
+
+_TIMING = Timing.create_with_regular_interval(
+    dt.timedelta(milliseconds=1), bt.DateTime(2025, 1, 1, tzinfo=dt.timezone.utc)
+)
+
+
+# ========================================================
+# To Protobuf
+# ========================================================
+@pytest.mark.parametrize(
+    "value, message_type",
+    [
+        (Scalar(1.5, "Volts"), scalar_pb2.Scalar),
+        (Vector([1, 2, 3]), "ni.protobuf.types.Vector"),
+        (XYData.from_arrays_1d([1.0], [2.0], np.float64), "ni.protobuf.types.DoubleXYData"),
+        (bt.DateTime(2025, 1, 1, tzinfo=dt.timezone.utc), PrecisionTimestamp),
+        (ht.datetime(2025, 1, 1, tzinfo=dt.timezone.utc), PrecisionTimestamp),
+        (bt.TimeDelta(1.5), "ni.protobuf.types.PrecisionDuration"),
+        (ht.timedelta(seconds=1.5), "ni.protobuf.types.PrecisionDuration"),
+        (np.zeros((2, 3)), array_pb2.Double2DArray),
+        (np.array([["a", "b"]]), array_pb2.String2DArray),
+        (np.array([["a", "b"]], object), array_pb2.String2DArray),
+        (AnalogWaveform(3, np.float64), waveform_pb2.DoubleAnalogWaveform),
+        (AnalogWaveform(3, np.float32), waveform_pb2.FloatAnalogWaveform),
+        (AnalogWaveform(3, np.int16), waveform_pb2.I16AnalogWaveform),
+        (ComplexWaveform(3, np.complex128), waveform_pb2.DoubleComplexWaveform),
+        (ComplexWaveform(3, np.complex64), waveform_pb2.FloatComplexWaveform),
+        (ComplexWaveform(3, ComplexInt32DType), waveform_pb2.I16ComplexWaveform),
+        (Spectrum(3, np.float64), waveform_pb2.DoubleSpectrum),
+        (Spectrum(3, np.float32), waveform_pb2.FloatSpectrum),
+        (DigitalWaveform(3, 2), waveform_pb2.DigitalWaveform),
+    ],
+)
+def test___supported_value___to_protobuf___message_type_matches(
+    value: object, message_type: Any
+) -> None:
+    message = to_protobuf(value)
+
+    if isinstance(message_type, str):
+        assert message.DESCRIPTOR.full_name == message_type
+    else:
+        assert type(message) is message_type
+
+
+def test___float64_analog_waveform___to_protobuf___matches_conversion_function() -> None:
+    analog_waveform = AnalogWaveform.from_array_1d(np.arange(5.0), timing=_TIMING)
+
+    message = to_protobuf(analog_waveform)
+
+    assert message == float64_analog_waveform_to_protobuf(analog_waveform)
+
+
+def test___unsupported_type___to_protobuf___raises_type_error() -> None:
+    with pytest.raises(TypeError, match="No converter is registered for type"):
+        to_protobuf(object())
+
+
+def test___unsupported_dtype___to_protobuf___raises_type_error() -> None:
+    with pytest.raises(TypeError, match="with dtype: int64"):
+        to_protobuf(AnalogWaveform(3, np.int64))
+
+
+# ========================================================
+# From Protobuf
+# ========================================================
+def test___int16_analog_message___from_protobuf___int16_waveform_returned() -> None:
+    analog_waveform = AnalogWaveform.from_array_1d(np.array([1, 2, 3], np.int16), timing=_TIMING)
+
+    result = from_protobuf(int16_analog_waveform_to_protobuf(analog_waveform))
+
+    assert isinstance(result, AnalogWaveform)
+    assert result.dtype == np.int16
+    assert list(result.raw_data) == [1, 2, 3]
+
+
+def test___precision_timestamp___from_protobuf___bintime_returned() -> None:
+    result = from_protobuf(PrecisionTimestamp(seconds=1, fractional_seconds=1 << 63))
+
+    assert isinstance(result, bt.DateTime)
+
+
+def test___waveform_array_value___from_protobuf___list_of_waveforms_returned() -> None:
+    message = float64_analog_waveforms_to_protobuf(np.arange(6.0).reshape(2, 3), timing=_TIMING)
+
+    result = from_protobuf(message)
+
+    assert [list(waveform.raw_data) for waveform in result] == [[0.0, 1.0, 2.0], [3.0, 4.0, 5.0]]
+
+
+def test___unregistered_message___from_protobuf___raises_type_error() -> None:
+    with pytest.raises(TypeError, match="No converter is registered for message type"):
+        from_protobuf(waveform_pb2.LinearScale())
+
+
+# ========================================================
+# Any
+# ========================================================
+def test___float64_analog_waveform___to_any___matches_pack() -> None:
+    analog_waveform = AnalogWaveform.from_array_1d(
+        np.arange(5.0), timing=_TIMING, extended_properties={"NI_ChannelName": "Dev1/ai0"}
+    )
+    expected = any_pb2.Any()
+    expected.Pack(float64_analog_waveform_to_protobuf(analog_waveform))
+
+    result = to_any(analog_waveform)
+
+    assert result == expected
+
+
+@pytest.mark.parametrize(
+    "value",
+    [
+        Scalar("abc"),
+        Vector([1.0, 2.0]),
+        bt.TimeDelta(0.25),
+        AnalogWaveform.from_array_1d(np.arange(5.0), timing=_TIMING),
+        AnalogWaveform.from_array_1d(np.arange(5, dtype=np.int16), timing=_TIMING),
+        DigitalWaveform.from_lines(np.array([[0, 1], [1, 0]], np.uint8), timing=_TIMING),
+    ],
+    ids=["scalar", "vector", "timedelta", "float64_analog", "int16_analog", "digital"],
+)
+def test___supported_value___round_trip_any___value_preserved(value: object) -> None:
+    result = from_any(to_any(value))
+
+    assert result == from_protobuf(to_protobuf(value))
+
+
+def test___double_2d_array___round_trip_any___value_preserved() -> None:
+    value = np.arange(6.0).reshape(2, 3)
+
+    result = from_any(to_any(value))
+
+    assert np.array_equal(result, value)
+
+
+@pytest.mark.parametrize(
+    "value",
+    [
+        AnalogWaveform.from_array_1d(np.arange(5.0), timing=_TIMING),
+        ComplexWaveform.from_array_1d(np.arange(5.0) + 1j, timing=_TIMING),
+        DigitalWaveform.from_lines(np.array([[0, 1], [1, 0]], np.uint8), timing=_TIMING),
+    ],
+    ids=["float64_analog", "float64_complex", "digital"],
+)
+def test___waveform___from_any___decoded_from_serialized_bytes(
+    value: AnalogWaveform[Any] | ComplexWaveform[Any] | DigitalWaveform[Any],
+) -> None:
+    any_message = to_any(value)
+
+    result = from_any(any_message)
+
+    assert result == from_protobuf(to_protobuf(value))
+    # The *_from_protobuf_bytes decoders return read-only views of the serialized data.
+    data = result.data if isinstance(result, DigitalWaveform) else result.raw_data
+    assert not data.flags.writeable
+
+
+def test___any_with_custom_type_url_prefix___from_any___value_converted() -> None:
+    message = float64_analog_waveform_to_protobuf(AnalogWaveform.from_array_1d(np.arange(3.0)))
+    any_message = any_pb2.Any()
+    any_message.Pack(message, type_url_prefix="example.com/types")
+
+    result = from_any(any_message)
+
+    assert result == float64_analog_waveform_from_protobuf(message)
+
+
+def test___unregistered_type_url___from_any___raises_type_error() -> None:
+    with pytest.raises(TypeError, match="No converter is registered for type URL"):
+        from_any(any_pb2.Any(type_url="type.googleapis.com/example.Unknown"))
+
+
+# ========================================================
+# Registry
+# ========================================================
+def test___registry___register_subclass_base___subclass_converted() -> None:
+    class _Counter(int):
+        pass
+
+    registry = ConverterRegistry()
+    registry.register(
+        Converter(
+            scalar_pb2.Scalar,
+            lambda message: message.sint32_value,
+            int,
+            to_protobuf=lambda value: scalar_pb2.Scalar(sint32_value=value),
+        )
+    )
+
+    assert registry.to_protobuf(_Counter(3)) == scalar_pb2.Scalar(sint32_value=3)
+    assert registry.get_converter(_Counter(3)) is registry.get_converter(3)
+
+
+def test___subclass_converted___replace_base_converter___new_converter_used() -> None:
+    class _Counter(int):
+        pass
+
+    registry = ConverterRegistry()
+    registry.register(
+        Converter(
+            scalar_pb2.Scalar,
+            lambda message: None,
+            int,
+            to_protobuf=lambda value: scalar_pb2.Scalar(),
+        )
+    )
+    assert registry.to_protobuf(_Counter(3)) == scalar_pb2.Scalar()
+
+    registry.register(
+        Converter(
+            scalar_pb2.Scalar,
+            lambda message: message.sint32_value,
+            int,
+            to_protobuf=lambda value: scalar_pb2.Scalar(sint32_value=value),
+        )
+    )
+
+    assert registry.to_protobuf(_Counter(3)) == scalar_pb2.Scalar(sint32_value=3)
+
+
+def test___registry___replace_converter___new_converter_used() -> None:
+    registry = ConverterRegistry()
+    registry.register(Converter(scalar_pb2.Scalar, lambda message: "old"))
+    any_message = any_pb2.Any()
+    any_message.Pack(scalar_pb2.Scalar(), type_url_prefix="example.com")
+    assert registry.from_any(any_message) == "old"
+
+    registry.register(Converter(scalar_pb2.Scalar, lambda message: "new"))
+
+    assert registry.from_any(any_message) == "new"
+    assert registry.from_protobuf(scalar_pb2.Scalar()) == "new"
+
+
+def test___converter_without_to_protobuf___register___raises_value_error() -> None:
+    registry = ConverterRegistry()
+
+    with pytest.raises(ValueError, match="must have a to_protobuf function"):
+        registry.register(Converter(scalar_pb2.Scalar, lambda message: None, int))
@@ -0,0 +1,191 @@
+import math
+import threading
+from collections.abc import Iterator
+
+import numpy as np
+import pytest
+from nitypes.scalar import Scalar
+from nitypes.waveform import AnalogWaveform
+
+from ni.protobuf.types.extended_property_conversion import (
+    DEFAULT_ATTRIBUTE_CACHE_SIZE,
+    CacheInfo,
+    clear_attribute_cache,
+    get_attribute_cache_info,
+    set_attribute_cache_size,
+)
+from ni.protobuf.types.scalar_conversion import scalar_from_protobuf, scalar_to_protobuf
+from ni.protobuf.types.waveform_conversion import (
+    float64_analog_waveform_from_protobuf_bytes,
+    float64_analog_waveform_to_protobuf,
+    float64_analog_waveform_to_protobuf_bytes,
+)
+
+
+@pytest.fixture(autouse=True)
+def empty_attribute_cache() -> Iterator[None]:
+    clear_attribute_cache()
+    yield
+    set_attribute_cache_size(DEFAULT_ATTRIBUTE_CACHE_SIZE)
+    clear_attribute_cache()
+
+
+def _make_waveform(**extended_properties: bool | int | float | str) -> AnalogWaveform[np.float64]:
+    return AnalogWaveform.from_array_1d(
+        np.arange(3.0), extended_properties=extended_properties or None
+    )
+
+
+# ========================================================
+# To Protobuf
+# ========================================================
+def test___same_extended_properties___to_protobuf___cache_hit() -> None:
+    first = float64_analog_waveform_to_protobuf(_make_waveform(NI_ChannelName="Dev1/ai0"))
+    second = float64_analog_waveform_to_protobuf(_make_waveform(NI_ChannelName="Dev1/ai0"))
+
+    assert first == second
+    assert second.attributes["NI_ChannelName"].string_value == "Dev1/ai0"
+    assert get_attribute_cache_info().to_protobuf == CacheInfo(
+        hits=1, misses=1, maxsize=DEFAULT_ATTRIBUTE_CACHE_SIZE, currsize=1
+    )
+
+
+def test___bool_int_and_float_properties___to_protobuf___attribute_types_preserved() -> None:
+    values = [True, 1, 1.0]
+
+    messages = [scalar_to_protobuf(Scalar(0, "", extended_properties={"a": v})) for v in values]
+
+    assert [message.attributes["a"].WhichOneof("attribute") for message in messages] == [
+        "bool_value",
+        "integer_value",
+        "double_value",
+    ]
+    assert get_attribute_cache_info().to_protobuf.misses == 3
+
+
+@pytest.mark.parametrize("first_value, second_value", [(0.0, -0.0), (-0.0, 0.0)])
+def test___signed_zero_properties___to_protobuf___sign_preserved(
+    first_value: float, second_value: float
+) -> None:
+    float64_analog_waveform_to_protobuf(_make_waveform(offset=first_value))
+
+    message = float64_analog_waveform_to_protobuf(_make_waveform(offset=second_value))
+
+    assert math.copysign(1.0, message.attributes["offset"].double_value) == math.copysign(
+        1.0, second_value
+    )
+    assert get_attribute_cache_info().to_protobuf.misses == 2
+
+
+def test___nan_property___to_protobuf___cache_hit() -> None:
+    float64_analog_waveform_to_protobuf(_make_waveform(offset=math.nan))
+
+    message = float64_analog_waveform_to_protobuf(_make_waveform(offset=math.nan))
+
+    assert math.isnan(message.attributes["offset"].double_value)
+    assert get_attribute_cache_info().to_protobuf.hits == 1
+
+
+def test___cached_attributes___to_protobuf_bytes___matches_message_encoder() -> None:
+    waveform = _make_waveform(NI_ChannelName="Dev1/ai0", NI_UnitDescription="Volts")
+    float64_analog_waveform_to_protobuf(waveform)
+
+    data = float64_analog_waveform_to_protobuf_bytes(waveform)
+
+    assert data == float64_analog_waveform_to_protobuf(waveform).SerializeToString()
+    assert get_attribute_cache_info().to_protobuf.hits == 2
+
+
+def test___unsupported_property_value___to_protobuf___raises_type_error() -> None:
+    scalar = Scalar(0, "")
+    scalar.extended_properties["a"] = [1, 2]  # type: ignore[assignment]
+
+    with pytest.raises(TypeError, match="Unexpected type for extended property value"):
+        scalar_to_protobuf(scalar)
+
+
+# ========================================================
+# From Protobuf
+# ========================================================
+def test___same_serialized_attributes___from_protobuf_bytes___new_dictionary_returned() -> None:
+    data = float64_analog_waveform_to_protobuf_bytes(_make_waveform(NI_ChannelName="Dev1/ai0"))
+
+    first = float64_analog_waveform_from_protobuf_bytes(data)
+    first.extended_properties["NI_ChannelName"] = "changed"
+    second = float64_analog_waveform_from_protobuf_bytes(data)
+
+    assert second.extended_properties["NI_ChannelName"] == "Dev1/ai0"
+    assert get_attribute_cache_info().from_protobuf.hits == 1
+    assert get_attribute_cache_info().from_protobuf.misses == 1
+
+
+def test___scalar_message___round_trip___extended_properties_preserved() -> None:
+    scalar = Scalar(1.5, "Volts", extended_properties={"NI_ChannelName": "Dev1/ai0"})
+
+    result = scalar_from_protobuf(scalar_to_protobuf(scalar))
+
+    assert result == scalar
+
+
+def test___concurrent_conversions___to_protobuf___every_lookup_counted() -> None:
+    waveform = _make_waveform(NI_ChannelName="Dev1/ai0")
+
+    def convert() -> None:
+        for _ in range(200):
+            float64_analog_waveform_to_protobuf(waveform)
+
+    threads = [threading.Thread(target=convert) for _ in range(8)]
+    for thread in threads:
+        thread.start()
+    for thread in threads:
+        thread.join()
+
+    info = get_attribute_cache_info().to_protobuf
+    assert info.hits + info.misses == 1600
+    assert info.currsize == 1
+
+
+# ========================================================
+# Cache Size
+# ========================================================
+def test___cache_size_exceeded___to_protobuf___least_recently_used_evicted() -> None:
+    set_attribute_cache_size(2)
+    waveforms = [_make_waveform(NI_ChannelName=f"Dev1/ai{i}") for i in range(3)]
+
+    float64_analog_waveform_to_protobuf(waveforms[0])
+    float64_analog_waveform_to_protobuf(waveforms[1])
+    float64_analog_waveform_to_protobuf(waveforms[0])
+    float64_analog_waveform_to_protobuf(waveforms[2])
+    float64_analog_waveform_to_protobuf(waveforms[0])
+    float64_analog_waveform_to_protobuf(waveforms[1])
+
+    assert get_attribute_cache_info().to_protobuf == CacheInfo(
+        hits=2, misses=4, maxsize=2, currsize=2
+    )
+
+
+def test___cache_size_zero___to_protobuf___nothing_cached() -> None:
+    set_attribute_cache_size(0)
+
+    float64_analog_waveform_to_protobuf(_make_waveform(NI_ChannelName="Dev1/ai0"))
+    message = float64_analog_waveform_to_protobuf(_make_waveform(NI_ChannelName="Dev1/ai0"))
+
+    assert message.attributes["NI_ChannelName"].string_value == "Dev1/ai0"
+    assert get_attribute_cache_info().to_protobuf == CacheInfo(
+        hits=0, misses=2, maxsize=0, currsize=0
+    )
+
+
+def test___negative_cache_size___set_attribute_cache_size___raises_value_error() -> None:
+    with pytest.raises(ValueError, match="must be a non-negative integer"):
+        set_attribute_cache_size(-1)
+
+
+def test___populated_cache___clear_attribute_cache___entries_and_counters_reset() -> None:
+    float64_analog_waveform_to_protobuf(_make_waveform(NI_ChannelName="Dev1/ai0"))
+
+    clear_attribute_cache()
+
+    assert get_attribute_cache_info().to_protobuf == CacheInfo(
+        hits=0, misses=0, maxsize=DEFAULT_ATTRIBUTE_CACHE_SIZE, currsize=0
+    )
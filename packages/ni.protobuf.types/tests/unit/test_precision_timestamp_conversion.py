@@ -2,6 +2,8 @@ import datetime as dt
 
 import hightime as ht
 import nitypes.bintime as bt
+import numpy as np
+import pytest
 from nitypes.time import convert_datetime
 
 from ni.protobuf.types.precision_timestamp_conversion import (
@@ -9,8 +11,11 @@ from ni.protobuf.types.precision_timestamp_conversion import (
     bintime_datetime_from_protobuf,
     hightime_datetime_to_protobuf,
     hightime_datetime_from_protobuf,
+    precision_timestamps_from_arrays,
+    precision_timestamps_to_arrays,
 )
 from ni.protobuf.types.precision_timestamp_pb2 import PrecisionTimestamp
+from ni.protobuf.types.waveform_pb2 import DoubleAnalogWaveform
 
 
 # ========================================================
@@ -64,3 +69,79 @@ def test___hightime_datetime___convert___valid_precision_timestamp() -> None:
     time_value = bt_datetime.to_tuple()
     assert pts.seconds == time_value.whole_seconds
     assert pts.fractional_seconds == time_value.fractional_seconds
+
+
+# ========================================================
+# NumPy arrays <--> PrecisionTimestamps
+# ========================================================
+def test___arrays___convert___valid_precision_timestamps() -> None:
+    seconds = np.array([0, 1, -1, 128, 2**63 - 1, -(2**63)], np.int64)
+    fractional_seconds = np.array([0, 5, 0, 2**64 - 1, 128, 1], np.uint64)
+
+    timestamps = precision_timestamps_from_arrays(seconds, fractional_seconds)
+
+    assert isinstance(timestamps, list)
+    assert timestamps == [
+        PrecisionTimestamp(seconds=int(s), fractional_seconds=int(f))
+        for s, f in zip(seconds, fractional_seconds)
+    ]
+
+
+def test___arrays___convert_and_add_to_waveform___same_as_per_timestamp_conversion() -> None:
+    seconds = np.arange(1000, dtype=np.int64) + 3_000_000_000
+    fractional_seconds = np.arange(1000, dtype=np.uint64) * 12_345_678_901
+
+    message = DoubleAnalogWaveform(
+        timestamps=precision_timestamps_from_arrays(seconds, fractional_seconds)
+    )
+
+    expected_message = DoubleAnalogWaveform(
+        timestamps=[
+            PrecisionTimestamp(seconds=int(s), fractional_seconds=int(f))
+            for s, f in zip(seconds, fractional_seconds)
+        ]
+    )
+    assert message.SerializeToString() == expected_message.SerializeToString()
+
+
+def test___empty_arrays___convert___no_precision_timestamps() -> None:
+    timestamps = precision_timestamps_from_arrays([], [])
+
+    assert timestamps == []
+
+
+def test___mismatched_arrays___convert___raises_value_error() -> None:
+    with pytest.raises(ValueError, match="does not match"):
+        precision_timestamps_from_arrays([1, 2], [3])
+
+
+def test___negative_fractional_seconds___convert___raises_value_error() -> None:
+    with pytest.raises(ValueError, match="negative"):
+        precision_timestamps_from_arrays([1], [-1])
+
+
+def test___precision_timestamps___convert___valid_arrays() -> None:
+    timestamps = [
+        PrecisionTimestamp(seconds=25, fractional_seconds=123),
+        PrecisionTimestamp(seconds=-1, fractional_seconds=2**64 - 1),
+        PrecisionTimestamp(),
+    ]
+
+    seconds, fractional_seconds = precision_timestamps_to_arrays(timestamps)
+
+    assert seconds.dtype == np.int64
+    assert fractional_seconds.dtype == np.uint64
+    assert seconds.tolist() == [25, -1, 0]
+    assert fractional_seconds.tolist() == [123, 2**64 - 1, 0]
+
+
+def test___arrays___round_trip___values_preserved() -> None:
+    seconds = np.array([25, -1, 0], np.int64)
+    fractional_seconds = np.array([123, 2**64 - 1, 0], np.uint64)
+
+    result = precision_timestamps_to_arrays(
+        precision_timestamps_from_arrays(seconds, fractional_seconds)
+    )
+
+    assert np.array_equal(result[0], seconds)
+    assert np.array_equal(result[1], fractional_seconds)
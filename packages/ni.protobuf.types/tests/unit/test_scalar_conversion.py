@@ -1,9 +1,18 @@
+from typing import Any
+
+import numpy as np
+import numpy.typing as npt
 import pytest
 from nitypes.scalar import Scalar
 
 from ni.protobuf.types import scalar_pb2
 from ni.protobuf.types.attribute_value_pb2 import AttributeValue
-from ni.protobuf.types.scalar_conversion import scalar_from_protobuf, scalar_to_protobuf
+from ni.protobuf.types.scalar_conversion import (
+    array_from_scalar_protobufs,
+    array_to_scalar_protobufs,
+    scalar_from_protobuf,
+    scalar_to_protobuf,
+)
 
 
 # ========================================================
@@ -170,3 +179,99 @@ def test___int_scalar_out_of_range___convert___raises_value_error() -> None:
     assert exc.value.args[0].startswith(
         "The integer value in a scalar must be within the range of an Int32."
     )
+
+
+# ========================================================
+# Scalar Arrays
+# ========================================================
+@pytest.mark.parametrize(
+    "values",
+    [
+        np.array([True, False]),
+        np.array([-5, 0, 7], np.int32),
+        np.array([1.5, -2.25]),
+        np.array(["a", "bc"], object),
+    ],
+)
+def test___array___to_scalar_protobufs___matches_scalar_to_protobuf(values: np.ndarray) -> None:
+    messages = array_to_scalar_protobufs(
+        values, units="Volts", extended_properties={"NI_ChannelName": "Dev1/ai0"}
+    )
+
+    expected = []
+    for value in values.tolist():
+        scalar = Scalar(value, "Volts")
+        scalar.extended_properties["NI_ChannelName"] = "Dev1/ai0"
+        expected.append(scalar_to_protobuf(scalar))
+    assert messages == expected
+
+
+@pytest.mark.parametrize(
+    "values, dtype",
+    [
+        ([True, False], np.bool_),
+        ([-5, 0, 7], np.int32),
+        ([1.5, -2.25], np.float64),
+        (["a", "bc"], np.object_),
+    ],
+)
+def test___list___round_trip_scalar_protobufs___typed_array_returned(
+    values: list[Any], dtype: type[np.generic]
+) -> None:
+    messages = array_to_scalar_protobufs(values)
+
+    result = array_from_scalar_protobufs(messages)
+
+    assert result.dtype == dtype
+    assert result.tolist() == values
+
+
+def test___empty_array___to_scalar_protobufs___empty_list() -> None:
+    assert array_to_scalar_protobufs(np.array([], np.float64)) == []
+
+
+def test___units_mismatch___to_scalar_protobufs___raises_value_error() -> None:
+    with pytest.raises(ValueError, match="does not match the units"):
+        array_to_scalar_protobufs(
+            [1.0], units="Volts", extended_properties={"NI_UnitDescription": "Amps"}
+        )
+
+
+def test___int_array_out_of_range___to_scalar_protobufs___raises_value_error() -> None:
+    with pytest.raises(ValueError, match="must be within the range of an Int32"):
+        array_to_scalar_protobufs(np.array([0, 0x8FFFFFFF], np.int64))
+
+
+def test___mixed_value_types___array_from_scalar_protobufs___raises_value_error() -> None:
+    messages = [scalar_pb2.Scalar(double_value=1.0), scalar_pb2.Scalar(sint32_value=1)]
+
+    with pytest.raises(ValueError, match="must all have the same value type"):
+        array_from_scalar_protobufs(messages)
+
+
+def test___empty_sequence___array_from_scalar_protobufs___empty_float64_array() -> None:
+    result = array_from_scalar_protobufs([])
+
+    assert result.dtype == np.float64
+    assert result.shape == (0,)
+
+
+@pytest.mark.parametrize("dtype", [np.bool_, np.int32, np.float64, object])
+def test___empty_array___round_trip_with_dtype___empty_array_preserved(
+    dtype: npt.DTypeLike,
+) -> None:
+    value = np.empty(0, dtype)
+
+    result = array_from_scalar_protobufs(array_to_scalar_protobufs(value), dtype=dtype)
+
+    assert result.dtype == value.dtype
+    assert result.shape == (0,)
+
+
+def test___int32_scalars___array_from_scalar_protobufs_with_dtype___converted() -> None:
+    messages = [scalar_pb2.Scalar(sint32_value=value) for value in [1, 2, 3]]
+
+    result = array_from_scalar_protobufs(messages, dtype=np.int64)
+
+    assert result.dtype == np.int64
+    assert result.tolist() == [1, 2, 3]
@@ -3,8 +3,10 @@ from nitypes.waveform import Spectrum
 
 from ni.protobuf.types.waveform_conversion import (
     float32_spectrum_from_protobuf,
+    float32_spectrum_protobuf_size,
     float32_spectrum_to_protobuf,
     float64_spectrum_from_protobuf,
+    float64_spectrum_protobuf_size,
     float64_spectrum_to_protobuf,
 )
 from ni.protobuf.types.waveform_pb2 import (
@@ -169,3 +171,27 @@ def test___float_spectrum_with_attributes___convert___valid_python_object() -> N
     assert spectrum.channel_name == "Dev1/ai0"
     assert spectrum.units == "Volts"
     assert spectrum.dtype == np.float32
+
+
+# ========================================================
+# Serialized Size
+# ========================================================
+def test___spectrum64___get_protobuf_size___matches_message_size() -> None:
+    spectrum = Spectrum.from_array_1d(
+        np.array([1.0, 2.0, 3.0]),
+        start_frequency=100.0,
+        frequency_increment=10.0,
+        extended_properties={"NI_ChannelName": "Dev1/ai0"},
+    )
+
+    size = float64_spectrum_protobuf_size(spectrum)
+
+    assert size == float64_spectrum_to_protobuf(spectrum).ByteSize()
+
+
+def test___default_spectrum32___get_protobuf_size___matches_message_size() -> None:
+    spectrum = Spectrum(dtype=np.float32)
+
+    size = float32_spectrum_protobuf_size(spectrum)
+
+    assert size == float32_spectrum_to_protobuf(spectrum).ByteSize() == 0
@@ -1,10 +1,17 @@
+import numpy as np
+import numpy.typing as npt
 import pytest
 from nitypes.vector import Vector
 
 from ni.protobuf.types import array_pb2
 from ni.protobuf.types import vector_pb2
 from ni.protobuf.types.attribute_value_pb2 import AttributeValue
-from ni.protobuf.types.vector_conversion import vector_from_protobuf, vector_to_protobuf
+from ni.protobuf.types.vector_conversion import (
+    array_from_vector_protobuf,
+    array_to_vector_protobuf,
+    vector_from_protobuf,
+    vector_to_protobuf,
+)
 
 
 # ========================================================
@@ -213,3 +220,109 @@ def test___int_vector_out_of_range___convert___raises_value_error() -> None:
     assert exc.value.args[0].startswith(
         "Integer values in a vector must be within the range of an Int32."
     )
+
+
+def test___int_vector_at_int32_limit___convert___raises_value_error() -> None:
+    python_value = Vector([10, -0x80000000], "Volts")
+
+    with pytest.raises(ValueError, match="within the range of an Int32"):
+        _ = vector_to_protobuf(python_value)
+
+
+# ========================================================
+# NumPy Array: Python to Protobuf
+# ========================================================
+@pytest.mark.parametrize(
+    "values, pb_type",
+    [
+        (np.array([True, False]), "bool_array"),
+        (np.array([-10, 0, 20], np.int64), "sint32_array"),
+        (np.array([10, 20], np.uint8), "sint32_array"),
+        (np.array([20.0, -30.5], np.float64), "double_array"),
+        (np.array([0.5, 1.5], np.float32), "double_array"),
+        (np.array(["one", "two"]), "string_array"),
+        (np.array(["one", "two"], object), "string_array"),
+    ],
+)
+def test___array___convert___matches_vector_conversion(
+    values: npt.NDArray[np.generic], pb_type: str
+) -> None:
+    protobuf_value = array_to_vector_protobuf(values, units="Volts")
+
+    assert protobuf_value.WhichOneof("value") == pb_type
+    assert protobuf_value == vector_to_protobuf(Vector(values.tolist(), "Volts"))
+
+
+def test___strided_double_array___convert___values_converted() -> None:
+    values = np.arange(10.0)[::3]
+
+    protobuf_value = array_to_vector_protobuf(values)
+
+    assert protobuf_value.double_array.values == [0.0, 3.0, 6.0, 9.0]
+    assert protobuf_value.attributes["NI_UnitDescription"].string_value == ""
+
+
+def test___array_with_extended_properties___convert___attributes_converted() -> None:
+    values = np.array([1.0])
+
+    protobuf_value = array_to_vector_protobuf(
+        values, extended_properties={"NI_UnitDescription": "Volts", "NI_ChannelName": "Dev1/ai0"}
+    )
+
+    assert protobuf_value.attributes["NI_UnitDescription"].string_value == "Volts"
+    assert protobuf_value.attributes["NI_ChannelName"].string_value == "Dev1/ai0"
+
+
+def test___int_array_out_of_range___convert___raises_value_error() -> None:
+    values = np.array([10, 20, 0x8FFFFFFF], np.int64)
+
+    with pytest.raises(ValueError, match="within the range of an Int32"):
+        _ = array_to_vector_protobuf(values)
+
+
+@pytest.mark.parametrize(
+    "values, message",
+    [
+        (np.array([], np.float64), "Cannot convert an empty vector"),
+        (np.zeros((2, 2)), "must be one-dimensional"),
+    ],
+)
+def test___invalid_array___convert___raises_value_error(
+    values: npt.NDArray[np.generic], message: str
+) -> None:
+    with pytest.raises(ValueError, match=message):
+        _ = array_to_vector_protobuf(values)
+
+
+def test___complex_array___convert___raises_type_error() -> None:
+    with pytest.raises(TypeError, match="Invalid array value type"):
+        _ = array_to_vector_protobuf(np.array([1 + 2j]))
+
+
+# ========================================================
+# NumPy Array: Protobuf to Python
+# ========================================================
+@pytest.mark.parametrize(
+    "values, dtype",
+    [
+        (np.array([True, False]), np.bool_),
+        (np.array([-10, 0, 20]), np.int32),
+        (np.array([20.0, -30.5]), np.float64),
+        (np.array(["one", "two"]), np.object_),
+    ],
+)
+def test___vector_protobuf___convert_to_array___values_and_units_converted(
+    values: npt.NDArray[np.generic], dtype: type[np.generic]
+) -> None:
+    protobuf_value = array_to_vector_protobuf(values, units="Volts")
+
+    array, extended_properties = array_from_vector_protobuf(protobuf_value)
+
+    assert array.dtype == dtype
+    assert array.tolist() == values.tolist()
+    assert extended_properties["NI_UnitDescription"] == "Volts"
+
+
+def test___vector_protobuf_value_unset___convert_to_array___raises_value_error() -> None:
+    with pytest.raises(ValueError, match="Could not determine the data type of 'value'"):
+        _ = array_from_vector_protobuf(vector_pb2.Vector())
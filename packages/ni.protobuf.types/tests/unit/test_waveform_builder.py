@@ -0,0 +1,136 @@
+import datetime as dt
+
+import nitypes.bintime as bt
+import numpy as np
+import pytest
+from nitypes.waveform import AnalogWaveform, Timing
+
+from ni.protobuf.types.waveform_builder import Float64AnalogWaveformBuilder
+from ni.protobuf.types.waveform_conversion import (
+    float64_analog_waveform_from_protobuf,
+    float64_analog_waveform_to_protobuf,
+)
+
+_TIMESTAMP = bt.DateTime(2025, 1, 1, tzinfo=dt.timezone.utc)
+_TIMING = Timing.create_with_regular_interval(dt.timedelta(milliseconds=500), _TIMESTAMP)
+_EXTENDED_PROPERTIES = {"NI_ChannelName": "Dev1/ai0", "NI_UnitDescription": "Volts"}
+
+
+# ========================================================
+# Append
+# ========================================================
+def test___blocks___append___matches_waveform_conversion() -> None:
+    builder = Float64AnalogWaveformBuilder(timing=_TIMING, extended_properties=_EXTENDED_PROPERTIES)
+
+    for block in np.split(np.arange(5000.0), [1000, 1001, 3000]):
+        builder.append(block)
+
+    expected = AnalogWaveform.from_array_1d(
+        np.arange(5000.0), timing=_TIMING, extended_properties=_EXTENDED_PROPERTIES
+    )
+    assert builder.sample_count == 5000
+    assert builder.to_protobuf() == float64_analog_waveform_to_protobuf(expected)
+    assert (
+        builder.to_protobuf_bytes()
+        == float64_analog_waveform_to_protobuf(expected).SerializeToString()
+    )
+
+
+def test___snapshot___append_more___snapshot_unchanged() -> None:
+    builder = Float64AnalogWaveformBuilder()
+    builder.append([1.0, 2.0])
+    message = builder.to_protobuf()
+    waveform = builder.to_waveform()
+
+    builder.append([3.0])
+
+    assert list(message.y_data) == [1.0, 2.0]
+    assert list(waveform.raw_data) == [1.0, 2.0]
+    assert list(builder.to_protobuf().y_data) == [1.0, 2.0, 3.0]
+
+
+def test___int_list___append___converted_to_float64() -> None:
+    builder = Float64AnalogWaveformBuilder()
+
+    builder.append([1, 2, 3])
+
+    assert builder.to_waveform().raw_data.dtype == np.float64
+    assert list(builder.to_waveform().raw_data) == [1.0, 2.0, 3.0]
+
+
+def test___empty_builder___to_protobuf___empty_message() -> None:
+    builder = Float64AnalogWaveformBuilder(timing=_TIMING)
+
+    message = builder.to_protobuf()
+
+    assert list(message.y_data) == []
+    assert message == float64_analog_waveform_to_protobuf(AnalogWaveform(0, timing=_TIMING))
+
+
+def test___two_dimensional_block___append___raises_value_error() -> None:
+    builder = Float64AnalogWaveformBuilder()
+
+    with pytest.raises(ValueError, match="must be a one-dimensional array"):
+        builder.append(np.zeros((2, 2)))
+
+
+def test___irregular_timing___create_builder___raises_value_error() -> None:
+    timing = Timing.create_with_irregular_interval([_TIMESTAMP])
+
+    with pytest.raises(ValueError, match="Irregular timing is not supported"):
+        Float64AnalogWaveformBuilder(timing=timing)
+
+
+# ========================================================
+# Ring Buffer
+# ========================================================
+def test___max_sample_count___append___most_recent_samples_kept() -> None:
+    builder = Float64AnalogWaveformBuilder(timing=_TIMING, max_sample_count=10)
+
+    for block in np.split(np.arange(1000.0), 100):
+        builder.append(block)
+
+    result = float64_analog_waveform_from_protobuf(builder.to_protobuf())
+    assert builder.sample_count == 10
+    assert builder.start_index == 990
+    assert list(result.raw_data) == list(np.arange(990.0, 1000.0))
+    assert result.timing.start_time == _TIMESTAMP + bt.TimeDelta(495)
+
+
+def test___block_larger_than_max_sample_count___append___tail_of_block_kept() -> None:
+    builder = Float64AnalogWaveformBuilder(max_sample_count=4)
+    builder.append([1.0, 2.0])
+
+    builder.append(np.arange(10.0))
+
+    assert builder.start_index == 8
+    assert list(builder.to_waveform().raw_data) == [6.0, 7.0, 8.0, 9.0]
+
+
+def test___random_blocks___append_with_max_sample_count___matches_slice() -> None:
+    rng = np.random.default_rng(0)
+    builder = Float64AnalogWaveformBuilder(max_sample_count=100)
+    appended: list[float] = []
+
+    for _ in range(200):
+        block = rng.random(rng.integers(0, 150))
+        builder.append(block)
+        appended.extend(block)
+        assert list(builder.to_waveform().raw_data) == appended[-100:]
+
+
+def test___samples___clear___start_index_advanced() -> None:
+    builder = Float64AnalogWaveformBuilder(timing=_TIMING)
+    builder.append(np.arange(4.0))
+
+    builder.clear()
+    builder.append([5.0])
+
+    result = float64_analog_waveform_from_protobuf(builder.to_protobuf())
+    assert list(result.raw_data) == [5.0]
+    assert result.timing.start_time == _TIMESTAMP + bt.TimeDelta(2)
+
+
+def test___zero_max_sample_count___create_builder___raises_value_error() -> None:
+    with pytest.raises(ValueError, match="must be a positive integer"):
+        Float64AnalogWaveformBuilder(max_sample_count=0)
@@ -0,0 +1,222 @@
+import datetime as dt
+
+import nitypes.bintime as bt
+import numpy as np
+import pytest
+from nitypes.complex import ComplexInt32DType
+from nitypes.waveform import (
+    AnalogWaveform,
+    ComplexWaveform,
+    DigitalWaveform,
+    LinearScaleMode,
+    Timing,
+)
+
+from ni.protobuf.types.precision_timestamp_conversion import bintime_datetime_from_protobuf
+from ni.protobuf.types.waveform_chunking import (
+    digital_waveform_from_protobuf_chunks,
+    digital_waveform_to_protobuf_chunks,
+    float32_complex_waveform_from_protobuf_chunks,
+    float32_complex_waveform_to_protobuf_chunks,
+    float64_analog_waveform_from_protobuf_chunks,
+    float64_analog_waveform_to_protobuf_chunks,
+    int16_analog_waveform_from_protobuf_chunks,
+    int16_analog_waveform_to_protobuf_chunks,
+    int16_complex_waveform_from_protobuf_chunks,
+    int16_complex_waveform_to_protobuf_chunks,
+)
+from ni.protobuf.types.waveform_conversion import (
+    digital_waveform_from_protobuf,
+    digital_waveform_to_protobuf,
+    float64_analog_waveform_from_protobuf,
+    float64_analog_waveform_to_protobuf,
+    int16_analog_waveform_from_protobuf,
+    int16_analog_waveform_to_protobuf,
+)
+from ni.protobuf.types.waveform_pb2 import DoubleAnalogWaveform
+
+_TIMESTAMP = bt.DateTime(2025, 1, 1, tzinfo=dt.timezone.utc)
+_TIMING = Timing.create_with_regular_interval(
+    dt.timedelta(microseconds=1), _TIMESTAMP, dt.timedelta(seconds=2)
+)
+_EXTENDED_PROPERTIES = {"NI_ChannelName": "Dev1/ai0", "NI_UnitDescription": "Volts"}
+
+
+# ========================================================
+# Analog Waveforms
+# ========================================================
+def test___large_float64_analog_wfm___convert_to_chunks___chunks_within_size_limit() -> None:
+    analog_waveform = AnalogWaveform.from_array_1d(
+        np.random.rand(100_000), timing=_TIMING, extended_properties=_EXTENDED_PROPERTIES
+    )
+
+    chunks = list(
+        float64_analog_waveform_to_protobuf_chunks(analog_waveform, max_message_size=100_000)
+    )
+
+    assert len(chunks) > 1
+    assert all(chunk.ByteSize() <= 100_000 for chunk in chunks)
+    assert sum(len(chunk.y_data) for chunk in chunks) == 100_000
+
+
+def test___float64_analog_wfm___convert_to_chunks___t0_advanced_per_chunk() -> None:
+    analog_waveform = AnalogWaveform.from_array_1d(np.arange(1000.0), timing=_TIMING)
+
+    chunks = list(
+        float64_analog_waveform_to_protobuf_chunks(analog_waveform, max_message_size=1000)
+    )
+
+    sample_interval = _TIMING.to_bintime().sample_interval
+    start_index = 0
+    for chunk in chunks:
+        expected_timestamp = _TIMESTAMP + sample_interval * start_index
+        assert bintime_datetime_from_protobuf(chunk.timestamp) == expected_timestamp
+        assert bintime_datetime_from_protobuf(chunk.t0) == expected_timestamp + bt.TimeDelta(2)
+        assert chunk.time_offset == 2.0
+        assert chunk.dt == pytest.approx(1e-6)
+        start_index += len(chunk.y_data)
+
+
+@pytest.mark.parametrize("sample_count", [None, 100_000])
+def test___float64_analog_chunks___convert_from_chunks___matches_single_message(
+    sample_count: int | None,
+) -> None:
+    analog_waveform = AnalogWaveform.from_array_1d(
+        np.random.rand(100_000), timing=_TIMING, extended_properties=_EXTENDED_PROPERTIES
+    )
+    chunks = float64_analog_waveform_to_protobuf_chunks(analog_waveform, max_message_size=65536)
+
+    result = float64_analog_waveform_from_protobuf_chunks(chunks, sample_count=sample_count)
+
+    assert result == float64_analog_waveform_from_protobuf(
+        float64_analog_waveform_to_protobuf(analog_waveform)
+    )
+
+
+def test___empty_float64_analog_wfm___round_trip_chunks___one_empty_chunk() -> None:
+    analog_waveform = AnalogWaveform(0, timing=_TIMING)
+
+    chunks = list(float64_analog_waveform_to_protobuf_chunks(analog_waveform))
+    result = float64_analog_waveform_from_protobuf_chunks(chunks)
+
+    assert len(chunks) == 1
+    assert result.sample_count == 0
+
+
+def test___irregular_float64_analog_wfm___round_trip_chunks___timestamps_preserved() -> None:
+    timestamps = [_TIMESTAMP + bt.TimeDelta(i * 1e-3) for i in range(100)]
+    analog_waveform = AnalogWaveform.from_array_1d(
+        np.arange(100.0), timing=Timing.create_with_irregular_interval(timestamps)
+    )
+
+    chunks = list(
+        float64_analog_waveform_to_protobuf_chunks(analog_waveform, max_message_size=1000)
+    )
+    result = float64_analog_waveform_from_protobuf_chunks(chunks)
+
+    assert len(chunks) > 1
+    assert all(chunk.ByteSize() <= 1000 for chunk in chunks)
+    assert list(result.raw_data) == list(analog_waveform.raw_data)
+    assert list(result.timing.get_timestamps(0, 100)) == timestamps
+
+
+def test___int16_analog_wfm_with_scale___round_trip_chunks___scale_preserved() -> None:
+    analog_waveform = AnalogWaveform.from_array_1d(
+        (np.arange(10_000) % 65536 - 32768).astype(np.int16),
+        timing=_TIMING,
+        scale_mode=LinearScaleMode(2.0, 0.5),
+    )
+
+    chunks = list(int16_analog_waveform_to_protobuf_chunks(analog_waveform, max_message_size=4096))
+    result = int16_analog_waveform_from_protobuf_chunks(chunks, sample_count=10_000)
+
+    assert all(chunk.ByteSize() <= 4096 for chunk in chunks)
+    assert result == int16_analog_waveform_from_protobuf(
+        int16_analog_waveform_to_protobuf(analog_waveform)
+    )
+
+
+# ========================================================
+# Complex Waveforms
+# ========================================================
+def test___float32_complex_wfm___round_trip_chunks___values_preserved() -> None:
+    complex_waveform = ComplexWaveform.from_array_1d(
+        (np.arange(1000) + 1j * np.arange(1000)).astype(np.complex64), timing=_TIMING
+    )
+
+    chunks = list(
+        float32_complex_waveform_to_protobuf_chunks(complex_waveform, max_message_size=1024)
+    )
+    result = float32_complex_waveform_from_protobuf_chunks(chunks)
+
+    assert len(chunks) > 1
+    assert np.array_equal(result.raw_data, complex_waveform.raw_data)
+
+
+def test___int16_complex_wfm___round_trip_chunks___values_preserved() -> None:
+    data = np.zeros(1000, ComplexInt32DType)
+    data["real"] = np.arange(1000)
+    data["imag"] = -np.arange(1000)
+    complex_waveform = ComplexWaveform.from_array_1d(data, scale_mode=LinearScaleMode(3.0, 1.0))
+
+    chunks = list(int16_complex_waveform_to_protobuf_chunks(complex_waveform, max_message_size=512))
+    result = int16_complex_waveform_from_protobuf_chunks(chunks)
+
+    assert np.array_equal(result.raw_data, complex_waveform.raw_data)
+    assert result.scale_mode == LinearScaleMode(3.0, 1.0)
+
+
+# ========================================================
+# Digital Waveforms
+# ========================================================
+def test___digital_wfm___round_trip_chunks___matches_single_message() -> None:
+    digital_waveform = DigitalWaveform.from_lines(
+        np.random.randint(0, 2, (1000, 8), np.uint8),
+        timing=_TIMING,
+        extended_properties=_EXTENDED_PROPERTIES,
+    )
+
+    chunks = list(digital_waveform_to_protobuf_chunks(digital_waveform, max_message_size=1024))
+    result = digital_waveform_from_protobuf_chunks(chunks, sample_count=1000)
+
+    assert len(chunks) > 1
+    assert all(chunk.ByteSize() <= 1024 for chunk in chunks)
+    assert result == digital_waveform_from_protobuf(digital_waveform_to_protobuf(digital_waveform))
+
+
+# ========================================================
+# Errors
+# ========================================================
+def test___max_message_size_smaller_than_header___convert_to_chunks___raises_value_error() -> None:
+    analog_waveform = AnalogWaveform.from_array_1d(
+        np.arange(10.0), extended_properties=_EXTENDED_PROPERTIES
+    )
+
+    with pytest.raises(ValueError, match="maximum message size is too small"):
+        float64_analog_waveform_to_protobuf_chunks(analog_waveform, max_message_size=64)
+
+
+def test___no_chunks___convert_from_chunks___raises_value_error() -> None:
+    with pytest.raises(ValueError, match="At least one waveform chunk is required"):
+        float64_analog_waveform_from_protobuf_chunks([])
+
+
+@pytest.mark.parametrize(
+    "sample_count, message", [(2, "more samples"), (4, "fewer samples")], ids=["more", "fewer"]
+)
+def test___wrong_sample_count___convert_from_chunks___raises_value_error(
+    sample_count: int, message: str
+) -> None:
+    chunks = [DoubleAnalogWaveform(y_data=[1.0, 2.0]), DoubleAnalogWaveform(y_data=[3.0])]
+
+    with pytest.raises(ValueError, match=message):
+        float64_analog_waveform_from_protobuf_chunks(chunks, sample_count=sample_count)
+
+
+def test___chunks_with_different_sample_intervals___convert_from_chunks___raises_value_error() -> (
+    None
+):
+    chunks = [DoubleAnalogWaveform(dt=1e-3, y_data=[1.0]), DoubleAnalogWaveform(dt=2e-3)]
+
+    with pytest.raises(ValueError, match="different sample intervals"):
+        float64_analog_waveform_from_protobuf_chunks(chunks)
@@ -1,32 +1,70 @@
-from collections.abc import Mapping
+import datetime as dt
+import tracemalloc
+from collections.abc import Iterator, Mapping
 from typing import Any
 
 import hightime as ht
+import nitypes.bintime as bt
 import numpy as np
+import pytest
 from nitypes.complex import ComplexInt32Base, ComplexInt32DType
 from nitypes.waveform import (
     AnalogWaveform,
     ComplexWaveform,
     DigitalWaveform,
+    LinearScaleMode,
     NoneScaleMode,
     SampleIntervalMode,
+    Timing,
 )
+from nitypes.waveform.typing import ExtendedPropertyValue
 
+from ni.protobuf.types.extended_property_conversion import CacheInfo
+from ni.protobuf.types.precision_timestamp_pb2 import PrecisionTimestamp
 from ni.protobuf.types.waveform_conversion import (
+    DEFAULT_TIMING_CACHE_SIZE,
+    clear_timing_cache,
     digital_waveform_from_protobuf,
+    digital_waveform_from_protobuf_bytes,
+    digital_waveform_protobuf_size,
+    digital_waveform_signals_from_protobuf,
     digital_waveform_to_protobuf,
+    digital_waveform_to_protobuf_bytes,
     float32_analog_waveform_from_protobuf,
+    float32_analog_waveform_from_protobuf_bytes,
+    float32_analog_waveform_protobuf_size,
     float32_analog_waveform_to_protobuf,
+    float32_analog_waveform_to_protobuf_bytes,
     float32_complex_waveform_from_protobuf,
+    float32_complex_waveform_from_protobuf_bytes,
+    float32_complex_waveform_protobuf_size,
     float32_complex_waveform_to_protobuf,
+    float32_complex_waveform_to_protobuf_bytes,
     float64_analog_waveform_from_protobuf,
+    float64_analog_waveform_from_protobuf_bytes,
+    float64_analog_waveform_protobuf_size,
     float64_analog_waveform_to_protobuf,
+    float64_analog_waveform_to_float32_protobuf,
+    float64_analog_waveform_to_int16_protobuf,
+    float64_analog_waveform_to_protobuf_bytes,
+    float64_analog_waveform_to_reduced_protobuf,
     float64_complex_waveform_from_protobuf,
+    float64_complex_waveform_from_protobuf_bytes,
+    float64_complex_waveform_protobuf_size,
     float64_complex_waveform_to_protobuf,
+    float64_complex_waveform_to_protobuf_bytes,
+    get_timing_cache_info,
     int16_analog_waveform_from_protobuf,
+    int16_analog_waveform_from_protobuf_bytes,
+    int16_analog_waveform_protobuf_size,
     int16_analog_waveform_to_protobuf,
+    int16_analog_waveform_to_protobuf_bytes,
     int16_complex_waveform_from_protobuf,
+    int16_complex_waveform_from_protobuf_bytes,
+    int16_complex_waveform_protobuf_size,
     int16_complex_waveform_to_protobuf,
+    int16_complex_waveform_to_protobuf_bytes,
+    set_timing_cache_size,
 )
 from ni.protobuf.types.waveform_pb2 import (
     DigitalWaveform as DigitalWaveformProto,
@@ -36,6 +74,7 @@ from ni.protobuf.types.waveform_pb2 import (
     FloatComplexWaveform,
     I16AnalogWaveform,
     I16ComplexWaveform,
+    LinearScale,
     Scale,
     WaveformAttributeValue,
 )
@@ -583,3 +622,647 @@ class TestDigitalWaveformConversion(
         digital_waveform = digital_waveform_from_protobuf(digital_waveform_proto)
 
         assert digital_waveform.channel_name == "Dev1/port0"
+
+
+# ========================================================
+# Irregular Timing
+# ========================================================
+def test___irregular_timestamps_before_and_after_epoch___round_trip___timestamps_preserved() -> (
+    None
+):
+    timestamps = [
+        bt.DateTime(1850, 1, 1, tzinfo=dt.timezone.utc),
+        bt.DateTime(1904, 1, 1, tzinfo=dt.timezone.utc),
+        bt.DateTime(2000, 1, 1, microsecond=1, tzinfo=dt.timezone.utc),
+    ]
+    analog_waveform = AnalogWaveform.from_array_1d(
+        np.array([1.0, 2.0, 3.0]), timing=Timing.create_with_irregular_interval(timestamps)
+    )
+
+    message = float64_analog_waveform_to_protobuf(analog_waveform)
+    converted_waveform = float64_analog_waveform_from_protobuf(message)
+
+    assert [ts.seconds for ts in message.timestamps] == [
+        ts.to_tuple().whole_seconds for ts in timestamps
+    ]
+    assert converted_waveform.timing.get_timestamps(0, 3) == timestamps
+
+
+# ========================================================
+# From Serialized Protobuf Bytes
+# ========================================================
+def test___float64_analog_wfm_bytes___convert_from_bytes___data_not_copied() -> None:
+    data = DoubleAnalogWaveform(y_data=[1.0, 2.0, 3.0]).SerializeToString()
+
+    analog_waveform = float64_analog_waveform_from_protobuf_bytes(data)
+
+    assert analog_waveform.dtype == np.float64
+    assert list(analog_waveform.scaled_data) == [1.0, 2.0, 3.0]
+    assert np.shares_memory(analog_waveform.raw_data, np.frombuffer(data, np.uint8))
+
+
+def test___float32_analog_wfm_bytes___convert_from_bytes___data_not_copied() -> None:
+    data = FloatAnalogWaveform(y_data=[1.0, 2.0, 3.0]).SerializeToString()
+
+    analog_waveform = float32_analog_waveform_from_protobuf_bytes(data)
+
+    assert analog_waveform.dtype == np.float32
+    assert list(analog_waveform.scaled_data) == [1.0, 2.0, 3.0]
+    assert np.shares_memory(analog_waveform.raw_data, np.frombuffer(data, np.uint8))
+
+
+def test___float64_complex_wfm_bytes___convert_from_bytes___data_not_copied() -> None:
+    data = DoubleComplexWaveform(y_data=[1.0, 2.0, 3.0, 4.0]).SerializeToString()
+
+    complex_waveform = float64_complex_waveform_from_protobuf_bytes(data)
+
+    assert complex_waveform.dtype == np.complex128
+    assert list(complex_waveform.scaled_data) == [1.0 + 2.0j, 3.0 + 4.0j]
+    assert np.shares_memory(complex_waveform.raw_data, np.frombuffer(data, np.uint8))
+
+
+def test___float32_complex_wfm_bytes___convert_from_bytes___data_not_copied() -> None:
+    data = FloatComplexWaveform(y_data=[1.0, 2.0, 3.0, 4.0]).SerializeToString()
+
+    complex_waveform = float32_complex_waveform_from_protobuf_bytes(data)
+
+    assert complex_waveform.dtype == np.complex64
+    assert list(complex_waveform.scaled_data) == [1.0 + 2.0j, 3.0 + 4.0j]
+    assert np.shares_memory(complex_waveform.raw_data, np.frombuffer(data, np.uint8))
+
+
+def test___float64_analog_wfm_memoryview___convert_from_bytes___data_not_copied() -> None:
+    data = bytearray(DoubleAnalogWaveform(y_data=[1.0, 2.0, 3.0]).SerializeToString())
+
+    analog_waveform = float64_analog_waveform_from_protobuf_bytes(memoryview(data))
+
+    assert list(analog_waveform.scaled_data) == [1.0, 2.0, 3.0]
+    assert np.shares_memory(analog_waveform.raw_data, np.frombuffer(data, np.uint8))
+
+
+def test___dbl_analog_wfm_with_split_y_data___convert_from_bytes___data_concatenated() -> None:
+    data = (
+        DoubleAnalogWaveform(y_data=[1.0, 2.0], dt=0.5).SerializeToString()
+        + DoubleAnalogWaveform(y_data=[3.0]).SerializeToString()
+    )
+
+    analog_waveform = float64_analog_waveform_from_protobuf_bytes(data)
+
+    assert list(analog_waveform.scaled_data) == [1.0, 2.0, 3.0]
+    assert analog_waveform.timing.sample_interval == ht.timedelta(seconds=0.5)
+
+
+def test___dbl_analog_wfm_with_attributes___convert_from_bytes___matches_from_protobuf() -> None:
+    message = DoubleAnalogWaveform(
+        t0=PrecisionTimestamp(seconds=123, fractional_seconds=456),
+        dt=1e-3,
+        y_data=[1.0, 2.0, 3.0],
+        attributes={
+            "NI_ChannelName": WaveformAttributeValue(string_value="Dev1/ai0"),
+            "NI_UnitDescription": WaveformAttributeValue(string_value="Volts"),
+        },
+    )
+
+    analog_waveform = float64_analog_waveform_from_protobuf_bytes(message.SerializeToString())
+
+    assert analog_waveform == float64_analog_waveform_from_protobuf(message)
+
+
+def test___dbl_analog_wfm_irregular_timing___convert_from_bytes___timestamps_converted() -> None:
+    timestamps = [dt.datetime(2000, 1, 1, second=i, tzinfo=dt.timezone.utc) for i in range(2)]
+    analog_waveform = AnalogWaveform.from_array_1d(
+        np.array([1.0, 2.0]), timing=Timing.create_with_irregular_interval(timestamps)
+    )
+    message = float64_analog_waveform_to_protobuf(analog_waveform)
+
+    converted_waveform = float64_analog_waveform_from_protobuf_bytes(message.SerializeToString())
+
+    assert converted_waveform.timing.sample_interval_mode == SampleIntervalMode.IRREGULAR
+    assert converted_waveform.timing == float64_analog_waveform_from_protobuf(message).timing
+
+
+def test___odd_length_double_complex_wfm_bytes___convert_from_bytes___raises_value_error() -> None:
+    data = DoubleComplexWaveform(y_data=[1.0, 2.0, 3.0]).SerializeToString()
+
+    with pytest.raises(ValueError):
+        float64_complex_waveform_from_protobuf_bytes(data)
+
+
+def test___i16_analog_wfm_bytes___convert_from_bytes___data_and_scale_converted() -> None:
+    y_data = [0, 1, -1, 63, -64, 64, 8191, -8192, 8192, 32767, -32768]
+    message = I16AnalogWaveform(
+        y_data=y_data,
+        scale=Scale(linear_scale=LinearScale(gain=2.0, offset=0.5)),
+    )
+
+    analog_waveform = int16_analog_waveform_from_protobuf_bytes(message.SerializeToString())
+
+    assert analog_waveform.dtype == np.int16
+    assert list(analog_waveform.raw_data) == y_data
+    assert analog_waveform.scale_mode == LinearScaleMode(2.0, 0.5)
+
+
+def test___i16_complex_wfm_bytes___convert_from_bytes___data_converted() -> None:
+    message = I16ComplexWaveform(y_data=[1, -2, 32767, -32768])
+
+    complex_waveform = int16_complex_waveform_from_protobuf_bytes(message.SerializeToString())
+
+    expected_raw_data = np.array([(1, -2), (32767, -32768)], ComplexInt32DType)
+    assert np.array_equal(complex_waveform.raw_data, expected_raw_data)
+
+
+def test___i16_analog_wfm_bytes_out_of_range___convert_from_bytes___raises_value_error() -> None:
+    data = I16AnalogWaveform(y_data=[1, 40000]).SerializeToString()
+
+    with pytest.raises(ValueError, match="out of range"):
+        int16_analog_waveform_from_protobuf_bytes(data)
+
+
+def test___large_i16_analog_wfm_bytes___convert_from_bytes___no_intermediate_copies() -> None:
+    y_data = np.arange(1_000_000, dtype=np.int64) % 65536 - 32768
+    data = I16AnalogWaveform(y_data=y_data).SerializeToString()
+
+    tracemalloc.start()
+    try:
+        analog_waveform = int16_analog_waveform_from_protobuf_bytes(data)
+        _, peak = tracemalloc.get_traced_memory()
+    finally:
+        tracemalloc.stop()
+
+    assert np.array_equal(analog_waveform.raw_data, y_data)
+    # The decode allocates the output array and bounded per-block temporaries, but no
+    # full-size intermediate array (an int32 or int64 copy would be 2-4x the output size).
+    assert peak < 2 * analog_waveform.raw_data.nbytes
+
+
+# ========================================================
+# To Serialized Protobuf Bytes
+# ========================================================
+_REGULAR_TIMING = Timing.create_with_regular_interval(
+    dt.timedelta(milliseconds=1),
+    bt.DateTime(2025, 1, 1, tzinfo=dt.timezone.utc),
+    dt.timedelta(seconds=0.5),
+)
+_IRREGULAR_TIMING = Timing.create_with_irregular_interval(
+    [bt.DateTime(2025, 1, 1, second=i, tzinfo=dt.timezone.utc) for i in range(3)]
+)
+_EXTENDED_PROPERTIES: dict[str, ExtendedPropertyValue] = {
+    "NI_ChannelName": "Dev1/ai0",
+    "NI_UnitDescription": "Volts",
+    "Count": 3,
+}
+
+
+@pytest.mark.parametrize(
+    "timing",
+    [Timing.empty, _REGULAR_TIMING, _IRREGULAR_TIMING],
+    ids=["none", "regular", "irregular"],
+)
+def test___float64_analog_wfm___convert_to_bytes___matches_serialized_message(
+    timing: Timing[Any, Any, Any],
+) -> None:
+    analog_waveform = AnalogWaveform.from_array_1d(
+        np.array([1.0, -2.5, 3.25]), timing=timing, extended_properties=_EXTENDED_PROPERTIES
+    )
+
+    data = float64_analog_waveform_to_protobuf_bytes(analog_waveform)
+
+    assert data == float64_analog_waveform_to_protobuf(analog_waveform).SerializeToString()
+
+
+def test___float32_analog_wfm___convert_to_bytes___matches_serialized_message() -> None:
+    analog_waveform = AnalogWaveform.from_array_1d(
+        np.array([1.0, -2.5, 3.25], np.float32),
+        timing=_REGULAR_TIMING,
+        extended_properties=_EXTENDED_PROPERTIES,
+    )
+
+    data = float32_analog_waveform_to_protobuf_bytes(analog_waveform)
+
+    assert data == float32_analog_waveform_to_protobuf(analog_waveform).SerializeToString()
+
+
+@pytest.mark.parametrize(
+    "scale_mode", [NoneScaleMode(), LinearScaleMode(2.0, 0.5)], ids=["none", "linear"]
+)
+@pytest.mark.parametrize(
+    "timing", [_REGULAR_TIMING, _IRREGULAR_TIMING], ids=["regular", "irregular"]
+)
+def test___i16_analog_wfm___convert_to_bytes___matches_serialized_message(
+    timing: Timing[Any, Any, Any], scale_mode: LinearScaleMode | NoneScaleMode
+) -> None:
+    analog_waveform = AnalogWaveform.from_array_1d(
+        np.array([-32768, 0, 32767], np.int16),
+        timing=timing,
+        extended_properties=_EXTENDED_PROPERTIES,
+        scale_mode=scale_mode,
+    )
+
+    data = int16_analog_waveform_to_protobuf_bytes(analog_waveform)
+
+    assert data == int16_analog_waveform_to_protobuf(analog_waveform).SerializeToString()
+
+
+def test___float64_complex_wfm___convert_to_bytes___matches_serialized_message() -> None:
+    complex_waveform = ComplexWaveform.from_array_1d(
+        np.array([1.5 + 2.0j, -3.0 - 4.5j]),
+        timing=_REGULAR_TIMING,
+        extended_properties=_EXTENDED_PROPERTIES,
+    )
+
+    data = float64_complex_waveform_to_protobuf_bytes(complex_waveform)
+
+    assert data == float64_complex_waveform_to_protobuf(complex_waveform).SerializeToString()
+
+
+def test___float32_complex_wfm___convert_to_bytes___matches_serialized_message() -> None:
+    complex_waveform = ComplexWaveform.from_array_1d(
+        np.array([1.5 + 2.0j, -3.0 - 4.5j], np.complex64), timing=_REGULAR_TIMING
+    )
+
+    data = float32_complex_waveform_to_protobuf_bytes(complex_waveform)
+
+    assert data == float32_complex_waveform_to_protobuf(complex_waveform).SerializeToString()
+
+
+def test___i16_complex_wfm___convert_to_bytes___matches_serialized_message() -> None:
+    complex_waveform = ComplexWaveform.from_array_1d(
+        np.array([(1, -2), (-32768, 32767)], ComplexInt32DType),
+        timing=_REGULAR_TIMING,
+        scale_mode=LinearScaleMode(2.0, 0.5),
+    )
+
+    data = int16_complex_waveform_to_protobuf_bytes(complex_waveform)
+
+    assert data == int16_complex_waveform_to_protobuf(complex_waveform).SerializeToString()
+
+
+@pytest.mark.parametrize(
+    "timing", [_REGULAR_TIMING, _IRREGULAR_TIMING], ids=["regular", "irregular"]
+)
+def test___digital_wfm___convert_to_bytes___matches_serialized_message(
+    timing: Timing[Any, Any, Any],
+) -> None:
+    digital_waveform = DigitalWaveform.from_lines(
+        np.array([[0, 1], [1, 0], [1, 1]], np.uint8),
+        timing=timing,
+        extended_properties=_EXTENDED_PROPERTIES,
+    )
+
+    data = digital_waveform_to_protobuf_bytes(digital_waveform)
+
+    assert data == digital_waveform_to_protobuf(digital_waveform).SerializeToString()
+
+
+def test___empty_float64_analog_wfm___convert_to_bytes___matches_serialized_message() -> None:
+    analog_waveform = AnalogWaveform(0)
+
+    data = float64_analog_waveform_to_protobuf_bytes(analog_waveform)
+
+    assert data == float64_analog_waveform_to_protobuf(analog_waveform).SerializeToString()
+
+
+def test___strided_float64_analog_wfm___convert_to_bytes___matches_serialized_message() -> None:
+    analog_waveform = AnalogWaveform.from_array_1d(np.arange(10.0)[::3], copy=False)
+
+    data = float64_analog_waveform_to_protobuf_bytes(analog_waveform)
+
+    assert data == float64_analog_waveform_to_protobuf(analog_waveform).SerializeToString()
+    assert list(float64_analog_waveform_from_protobuf_bytes(data).raw_data) == [0.0, 3.0, 6.0, 9.0]
+
+
+# ========================================================
+# Reduced Precision
+# ========================================================
+def test___float64_analog_wfm___convert_to_int16___round_trip_within_reported_error() -> None:
+    data = np.sin(np.linspace(0.0, 10.0, 1000)) * 3.0 + 1.0
+    analog_waveform = AnalogWaveform.from_array_1d(
+        data, timing=_REGULAR_TIMING, extended_properties=_EXTENDED_PROPERTIES
+    )
+
+    message, error = float64_analog_waveform_to_int16_protobuf(analog_waveform)
+    result = int16_analog_waveform_from_protobuf(message)
+
+    differences = result.scaled_data - data
+    assert error.max_error == pytest.approx(np.abs(differences).max())
+    assert error.rms_error == pytest.approx(np.sqrt(np.mean(differences**2)))
+    assert error.max_error <= message.scale.linear_scale.gain / 2 * (1 + 1e-9)
+    assert min(message.y_data) == -0x8000 and max(message.y_data) == 0x7FFF
+    assert result.timing == analog_waveform.timing
+    assert result.extended_properties == analog_waveform.extended_properties
+
+
+def test___constant_float64_analog_wfm___convert_to_int16___exact() -> None:
+    analog_waveform = AnalogWaveform.from_array_1d(np.full(5, 2.5))
+
+    message, error = float64_analog_waveform_to_int16_protobuf(analog_waveform)
+
+    assert list(int16_analog_waveform_from_protobuf(message).scaled_data) == [2.5] * 5
+    assert error == (0.0, 0.0)
+
+
+def test___irregular_float64_analog_wfm___convert_to_int16___timing_preserved() -> None:
+    analog_waveform = AnalogWaveform.from_array_1d(
+        np.array([1.0, -2.5, 3.25]), timing=_IRREGULAR_TIMING
+    )
+
+    message, _ = float64_analog_waveform_to_int16_protobuf(analog_waveform)
+
+    assert int16_analog_waveform_from_protobuf(message).timing == _IRREGULAR_TIMING
+
+
+def test___float64_analog_wfm_with_nan___convert_to_int16___raises_value_error() -> None:
+    analog_waveform = AnalogWaveform.from_array_1d(np.array([1.0, np.nan]))
+
+    with pytest.raises(ValueError, match="NaN or infinite values cannot be quantized"):
+        float64_analog_waveform_to_int16_protobuf(analog_waveform)
+
+
+def test___float64_analog_wfm___convert_to_float32___matches_float32_conversion() -> None:
+    data = np.array([0.1, -2.5, 1e30, np.inf, np.nan])
+    analog_waveform = AnalogWaveform.from_array_1d(data, timing=_REGULAR_TIMING)
+
+    message, error = float64_analog_waveform_to_float32_protobuf(analog_waveform)
+
+    expected = AnalogWaveform.from_array_1d(data.astype(np.float32), timing=_REGULAR_TIMING)
+    assert message == float32_analog_waveform_to_protobuf(expected)
+    finite_differences = data[:3].astype(np.float32).astype(np.float64) - data[:3]
+    assert error.max_error == np.abs(finite_differences).max()
+
+
+def test___float64_analog_wfm_out_of_float32_range___convert_to_float32___raises_value_error() -> (
+    None
+):
+    analog_waveform = AnalogWaveform.from_array_1d(np.array([1.0, 1e300]))
+
+    with pytest.raises(ValueError, match="outside the range of a float32"):
+        float64_analog_waveform_to_float32_protobuf(analog_waveform)
+
+
+@pytest.mark.parametrize(
+    "max_error, expected_type",
+    [
+        (1e-3, I16AnalogWaveform),
+        (1e-6, FloatAnalogWaveform),
+        (0.0, DoubleAnalogWaveform),
+    ],
+)
+def test___max_error___convert_to_reduced___smallest_type_within_error_returned(
+    max_error: float, expected_type: type[Any]
+) -> None:
+    analog_waveform = AnalogWaveform.from_array_1d(np.sin(np.linspace(0.0, 10.0, 1000)))
+
+    message = float64_analog_waveform_to_reduced_protobuf(analog_waveform, max_error=max_error)
+
+    assert type(message) is expected_type
+
+
+def test___float64_analog_wfm_with_nan___convert_to_reduced___float32_returned() -> None:
+    analog_waveform = AnalogWaveform.from_array_1d(np.array([0.5, np.nan, 0.25]))
+
+    message = float64_analog_waveform_to_reduced_protobuf(analog_waveform, max_error=1.0)
+
+    assert isinstance(message, FloatAnalogWaveform)
+
+
+# ========================================================
+# Serialized Size
+# ========================================================
+@pytest.mark.parametrize(
+    "timing",
+    [Timing.empty, _REGULAR_TIMING, _IRREGULAR_TIMING],
+    ids=["none", "regular", "irregular"],
+)
+@pytest.mark.parametrize(
+    "extended_properties", [{}, _EXTENDED_PROPERTIES], ids=["no_properties", "properties"]
+)
+def test___float64_analog_wfm___get_protobuf_size___matches_message_size(
+    timing: Timing[Any, Any, Any], extended_properties: Mapping[str, ExtendedPropertyValue]
+) -> None:
+    analog_waveform = AnalogWaveform.from_array_1d(
+        np.array([1.0, -2.5, 3.25]), timing=timing, extended_properties=extended_properties
+    )
+
+    size = float64_analog_waveform_protobuf_size(analog_waveform)
+
+    assert size == float64_analog_waveform_to_protobuf(analog_waveform).ByteSize()
+
+
+def test___empty_float64_analog_wfm___get_protobuf_size___matches_message_size() -> None:
+    analog_waveform = AnalogWaveform(0)
+
+    size = float64_analog_waveform_protobuf_size(analog_waveform)
+
+    assert size == float64_analog_waveform_to_protobuf(analog_waveform).ByteSize()
+
+
+def test___large_float32_analog_wfm___get_protobuf_size___matches_message_size() -> None:
+    analog_waveform = AnalogWaveform.from_array_1d(
+        np.arange(100_000, dtype=np.float32), timing=_REGULAR_TIMING
+    )
+
+    size = float32_analog_waveform_protobuf_size(analog_waveform)
+
+    assert size == float32_analog_waveform_to_protobuf(analog_waveform).ByteSize()
+
+
+@pytest.mark.parametrize(
+    "scale_mode", [NoneScaleMode(), LinearScaleMode(2.0, 0.5)], ids=["none", "linear"]
+)
+@pytest.mark.parametrize(
+    "timing", [_REGULAR_TIMING, _IRREGULAR_TIMING], ids=["regular", "irregular"]
+)
+def test___i16_analog_wfm___get_protobuf_size___matches_message_size(
+    timing: Timing[Any, Any, Any], scale_mode: LinearScaleMode | NoneScaleMode
+) -> None:
+    analog_waveform = AnalogWaveform.from_array_1d(
+        np.array([-32768, 64, 32767], np.int16),
+        timing=timing,
+        extended_properties=_EXTENDED_PROPERTIES,
+        scale_mode=scale_mode,
+    )
+
+    size = int16_analog_waveform_protobuf_size(analog_waveform)
+
+    assert size == int16_analog_waveform_to_protobuf(analog_waveform).ByteSize()
+
+
+def test___complex_wfms___get_protobuf_size___matches_message_size() -> None:
+    data = np.array([1.5 + 2.0j, -3.0 - 4.5j])
+    float64_waveform = ComplexWaveform.from_array_1d(
+        data, timing=_REGULAR_TIMING, extended_properties=_EXTENDED_PROPERTIES
+    )
+    float32_waveform = ComplexWaveform.from_array_1d(
+        data.astype(np.complex64),
+        timing=Timing.create_with_irregular_interval(
+            [bt.DateTime(2025, 1, 1, tzinfo=dt.timezone.utc), bt.DateTime.now(dt.timezone.utc)]
+        ),
+    )
+    int16_waveform = ComplexWaveform.from_array_1d(
+        np.array([(1, -2), (-300, 400)], ComplexInt32DType),
+        timing=_REGULAR_TIMING,
+        scale_mode=LinearScaleMode(2.0, 0.5),
+    )
+
+    assert (
+        float64_complex_waveform_protobuf_size(float64_waveform)
+        == float64_complex_waveform_to_protobuf(float64_waveform).ByteSize()
+    )
+    assert (
+        float32_complex_waveform_protobuf_size(float32_waveform)
+        == float32_complex_waveform_to_protobuf(float32_waveform).ByteSize()
+    )
+    assert (
+        int16_complex_waveform_protobuf_size(int16_waveform)
+        == int16_complex_waveform_to_protobuf(int16_waveform).ByteSize()
+    )
+
+
+@pytest.mark.parametrize(
+    "timing", [_REGULAR_TIMING, _IRREGULAR_TIMING], ids=["regular", "irregular"]
+)
+def test___digital_wfm___get_protobuf_size___matches_message_size(
+    timing: Timing[Any, Any, Any],
+) -> None:
+    digital_waveform = DigitalWaveform.from_lines(
+        np.array([[0, 1], [1, 0], [1, 1]], np.uint8),
+        timing=timing,
+        extended_properties=_EXTENDED_PROPERTIES,
+    )
+
+    size = digital_waveform_protobuf_size(digital_waveform)
+
+    assert size == digital_waveform_to_protobuf(digital_waveform).ByteSize()
+
+
+# ========================================================
+# Digital Waveform Bytes and Signals
+# ========================================================
+_DIGITAL_DATA = np.array([[0, 1, 0], [1, 1, 0], [0, 0, 1], [1, 0, 1]], np.uint8)
+
+
+@pytest.mark.parametrize("timing", [Timing.empty, _REGULAR_TIMING], ids=["none", "regular"])
+def test___serialized_digital_wfm___convert_from_bytes___data_is_view(
+    timing: Timing[Any, Any, Any],
+) -> None:
+    digital_waveform = DigitalWaveform.from_lines(
+        _DIGITAL_DATA, timing=timing, extended_properties=_EXTENDED_PROPERTIES
+    )
+    data = digital_waveform_to_protobuf_bytes(digital_waveform)
+
+    result = digital_waveform_from_protobuf_bytes(data)
+
+    assert result == digital_waveform_from_protobuf(DigitalWaveformProto.FromString(data))
+    assert np.shares_memory(result.data, np.frombuffer(data, np.uint8))
+    assert not result.data.flags.writeable
+
+
+def test___serialized_digital_wfm_without_signal_count___convert_from_bytes___raises_value_error() -> (
+    None
+):
+    data = DigitalWaveformProto(y_data=b"\x00\x01").SerializeToString()
+
+    with pytest.raises(ValueError, match="signal_count must be greater than zero."):
+        digital_waveform_from_protobuf_bytes(data)
+
+
+@pytest.mark.parametrize("serialize", [False, True], ids=["message", "bytes"])
+def test___digital_wfm___convert_signals___requested_signals_returned(serialize: bool) -> None:
+    digital_waveform = DigitalWaveform.from_lines(_DIGITAL_DATA, timing=_REGULAR_TIMING)
+    message = digital_waveform_to_protobuf(digital_waveform)
+    value = message.SerializeToString() if serialize else message
+
+    result = digital_waveform_signals_from_protobuf(value, [2, 0])
+
+    assert result.signal_count == 2
+    assert list(result.signals[0].data) == list(digital_waveform.signals[2].data)
+    assert list(result.signals[1].data) == list(digital_waveform.signals[0].data)
+    assert result.timing == digital_waveform_from_protobuf(message).timing
+
+
+def test___digital_wfm_with_line_names___convert_signals___line_names_selected() -> None:
+    digital_waveform = DigitalWaveform.from_lines(
+        _DIGITAL_DATA,
+        extended_properties={"NI_LineNames": "port0/line2, port0/line1, port0/line0"},
+    )
+    data = digital_waveform_to_protobuf_bytes(digital_waveform)
+
+    result = digital_waveform_signals_from_protobuf(data, [0, 1])
+
+    assert [signal.name for signal in result.signals] == ["port0/line0", "port0/line1"]
+
+
+@pytest.mark.parametrize("signal_index", [-1, 3])
+def test___invalid_signal_index___convert_signals___raises_value_error(signal_index: int) -> None:
+    message = digital_waveform_to_protobuf(DigitalWaveform.from_lines(_DIGITAL_DATA))
+
+    with pytest.raises(ValueError, match="The signal index must be a non-negative integer"):
+        digital_waveform_signals_from_protobuf(message, [signal_index])
+
+
+# ========================================================
+# Timing Cache
+# ========================================================
+@pytest.fixture
+def empty_timing_cache() -> Iterator[None]:
+    clear_timing_cache()
+    yield
+    set_timing_cache_size(DEFAULT_TIMING_CACHE_SIZE)
+    clear_timing_cache()
+
+
+def _make_timing_message(seconds: int, dt: float = 0.5) -> DoubleAnalogWaveform:
+    return DoubleAnalogWaveform(t0=PrecisionTimestamp(seconds=seconds), dt=dt, y_data=[1.0, 2.0])
+
+
+def test___same_timing_fields___from_protobuf___timing_shared(empty_timing_cache: None) -> None:
+    first = float64_analog_waveform_from_protobuf(_make_timing_message(100))
+    second = float64_analog_waveform_from_protobuf_bytes(
+        _make_timing_message(100).SerializeToString()
+    )
+
+    assert second.timing is first.timing
+    assert get_timing_cache_info() == CacheInfo(
+        hits=1, misses=1, maxsize=DEFAULT_TIMING_CACHE_SIZE, currsize=1
+    )
+
+
+def test___different_t0___from_protobuf___sample_interval_shared(
+    empty_timing_cache: None,
+) -> None:
+    first = float64_analog_waveform_from_protobuf(_make_timing_message(100))
+    second = float64_analog_waveform_from_protobuf(_make_timing_message(101))
+
+    assert second.timing is not first.timing
+    assert second.timing.start_time == first.timing.start_time + ht.timedelta(seconds=1)
+    assert second.timing.sample_interval is first.timing.sample_interval
+
+
+def test___t0_and_timestamp___from_protobuf___timestamp_takes_precedence(
+    empty_timing_cache: None,
+) -> None:
+    t0_message = _make_timing_message(100)
+    timestamp_message = _make_timing_message(100)
+    timestamp_message.timestamp.seconds = 200
+
+    first = float64_analog_waveform_from_protobuf(t0_message)
+    second = float64_analog_waveform_from_protobuf(timestamp_message)
+
+    assert second.timing is not first.timing
+    assert second.timing.timestamp == first.timing.timestamp + ht.timedelta(seconds=100)
+
+
+def test___cache_size_zero___from_protobuf___timing_not_shared(empty_timing_cache: None) -> None:
+    set_timing_cache_size(0)
+
+    first = float64_analog_waveform_from_protobuf(_make_timing_message(100))
+    second = float64_analog_waveform_from_protobuf(_make_timing_message(100))
+
+    assert second.timing is not first.timing
+    assert second.timing == first.timing
+    assert get_timing_cache_info().currsize == 0
+
+
+def test___negative_size___set_timing_cache_size___raises_value_error() -> None:
+    with pytest.raises(ValueError, match="must be a non-negative integer"):
+        set_timing_cache_size(-1)
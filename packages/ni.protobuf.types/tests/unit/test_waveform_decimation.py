@@ -0,0 +1,143 @@
+import datetime as dt
+
+import nitypes.bintime as bt
+import numpy as np
+import pytest
+from nitypes.waveform import AnalogWaveform, LinearScaleMode, Timing
+
+from ni.protobuf.types.waveform_conversion import (
+    float64_analog_waveform_from_protobuf,
+    float64_analog_waveform_to_protobuf,
+)
+from ni.protobuf.types.waveform_decimation import (
+    DECIMATION_BUCKET_SIZE_PROPERTY,
+    DECIMATION_METHOD_PROPERTY,
+    MIN_MAX_DECIMATION_METHOD,
+    float64_analog_waveform_to_decimated_protobuf,
+)
+from ni.protobuf.types.waveform_pb2 import DoubleAnalogWaveform
+
+_TIMESTAMP = bt.DateTime(2025, 1, 1, tzinfo=dt.timezone.utc)
+_TIMING = Timing.create_with_regular_interval(dt.timedelta(milliseconds=1), _TIMESTAMP)
+
+
+# ========================================================
+# Min/Max Decimation
+# ========================================================
+def test___bucket_size___decimate___min_and_max_in_sample_order() -> None:
+    data = np.array([0.0, 5.0, -1.0, 2.0, 9.0, -3.0, 1.0, 1.5, 0.5, 4.0])
+    analog_waveform = AnalogWaveform.from_array_1d(data, timing=_TIMING)
+
+    message = float64_analog_waveform_to_decimated_protobuf(analog_waveform, bucket_size=3)
+
+    # Buckets: [0, 5, -1], [2, 9, -3], [1, 1.5, 0.5], [4]
+    assert list(message.y_data) == [5.0, -1.0, 9.0, -3.0, 1.5, 0.5, 4.0, 4.0]
+
+
+def test___scaled_waveform___decimate___scaled_data_decimated() -> None:
+    analog_waveform = AnalogWaveform.from_array_1d(
+        np.arange(10.0), timing=_TIMING, scale_mode=LinearScaleMode(2.0, 100.0)
+    )
+
+    message = float64_analog_waveform_to_decimated_protobuf(analog_waveform, bucket_size=5)
+
+    assert list(message.y_data) == [100.0, 108.0, 110.0, 118.0]
+
+
+def test___point_count___decimate___point_count_not_exceeded() -> None:
+    analog_waveform = AnalogWaveform.from_array_1d(np.random.rand(100_003), timing=_TIMING)
+
+    message = float64_analog_waveform_to_decimated_protobuf(analog_waveform, point_count=2000)
+
+    assert len(message.y_data) <= 2000
+    assert max(message.y_data) == analog_waveform.raw_data.max()
+    assert min(message.y_data) == analog_waveform.raw_data.min()
+
+
+def test___fewer_samples_than_point_count___decimate___not_decimated() -> None:
+    analog_waveform = AnalogWaveform.from_array_1d(np.arange(10.0), timing=_TIMING)
+
+    message = float64_analog_waveform_to_decimated_protobuf(analog_waveform, point_count=10)
+
+    assert message == float64_analog_waveform_to_protobuf(analog_waveform)
+
+
+def test___regular_timing___decimate___timing_preserved_and_dt_scaled() -> None:
+    analog_waveform = AnalogWaveform.from_array_1d(np.arange(100.0), timing=_TIMING)
+
+    message = float64_analog_waveform_to_decimated_protobuf(analog_waveform, bucket_size=10)
+
+    expected = float64_analog_waveform_to_protobuf(analog_waveform)
+    assert message.t0 == expected.t0
+    assert message.timestamp == expected.timestamp
+    assert message.dt == pytest.approx(0.005)
+    assert float64_analog_waveform_from_protobuf(message).sample_count == 20
+
+
+def test___irregular_timing___decimate___timestamps_of_selected_samples() -> None:
+    timestamps = [_TIMESTAMP + bt.TimeDelta(i) for i in range(6)]
+    analog_waveform = AnalogWaveform.from_array_1d(
+        np.array([3.0, 1.0, 2.0, 0.0, 7.0, 5.0]),
+        timing=Timing.create_with_irregular_interval(timestamps),
+    )
+
+    message = float64_analog_waveform_to_decimated_protobuf(analog_waveform, bucket_size=3)
+
+    result = float64_analog_waveform_from_protobuf(message)
+    assert list(result.raw_data) == [3.0, 1.0, 0.0, 7.0]
+    assert list(result.timing.get_timestamps(0, 4)) == [timestamps[i] for i in [0, 1, 3, 4]]
+
+
+def test___extended_properties___decimate___decimation_attributes_added() -> None:
+    analog_waveform = AnalogWaveform.from_array_1d(
+        np.arange(100.0), timing=_TIMING, extended_properties={"NI_ChannelName": "Dev1/ai0"}
+    )
+
+    message = float64_analog_waveform_to_decimated_protobuf(analog_waveform, bucket_size=10)
+
+    assert message.attributes["NI_ChannelName"].string_value == "Dev1/ai0"
+    assert message.attributes[DECIMATION_METHOD_PROPERTY].string_value == MIN_MAX_DECIMATION_METHOD
+    assert message.attributes[DECIMATION_BUCKET_SIZE_PROPERTY].integer_value == 10
+
+
+def test___chunks___decimate_each_chunk___matches_whole_waveform() -> None:
+    data = np.random.rand(1000)
+    whole = AnalogWaveform.from_array_1d(data, timing=_TIMING)
+    chunks = [AnalogWaveform.from_array_1d(chunk) for chunk in np.split(data, [300, 600, 900])]
+
+    expected = float64_analog_waveform_to_decimated_protobuf(whole, bucket_size=50)
+    messages = [
+        float64_analog_waveform_to_decimated_protobuf(chunk, bucket_size=50) for chunk in chunks
+    ]
+
+    assert [y for message in messages for y in message.y_data] == list(expected.y_data)
+
+
+def test___empty_waveform___decimate___empty_message() -> None:
+    analog_waveform = AnalogWaveform.from_array_1d(np.array([], np.float64))
+
+    message = float64_analog_waveform_to_decimated_protobuf(analog_waveform, bucket_size=4)
+
+    assert isinstance(message, DoubleAnalogWaveform)
+    assert list(message.y_data) == []
+
+
+@pytest.mark.parametrize(
+    "kwargs, message",
+    [
+        ({}, "Specify exactly one of the point_count and bucket_size arguments."),
+        (
+            {"point_count": 10, "bucket_size": 2},
+            "Specify exactly one of the point_count and bucket_size arguments.",
+        ),
+        ({"point_count": 1}, "The point count must be at least 2."),
+        ({"bucket_size": 0}, "The bucket size must be a positive integer."),
+    ],
+)
+def test___invalid_arguments___decimate___raises_value_error(
+    kwargs: dict[str, int], message: str
+) -> None:
+    analog_waveform = AnalogWaveform.from_array_1d(np.arange(100.0))
+
+    with pytest.raises(ValueError, match=message):
+        float64_analog_waveform_to_decimated_protobuf(analog_waveform, **kwargs)
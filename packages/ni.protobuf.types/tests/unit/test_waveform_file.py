@@ -0,0 +1,260 @@
+import datetime as dt
+import pathlib
+import struct
+
+import nitypes.bintime as bt
+import numpy as np
+import pytest
+from nitypes.waveform import AnalogWaveform, DigitalWaveform, LinearScaleMode, Timing
+
+from ni.protobuf.types.waveform_conversion import (
+    digital_waveform_from_protobuf,
+    digital_waveform_to_protobuf,
+    float64_analog_waveform_from_protobuf_bytes,
+    float64_analog_waveform_to_protobuf_bytes,
+    int16_analog_waveform_from_protobuf_bytes,
+    int16_analog_waveform_to_protobuf_bytes,
+)
+from ni.protobuf.types.waveform_file import (
+    AnyFileWaveformProto,
+    WaveformFileReader,
+    WaveformFileWriter,
+)
+from ni.protobuf.types.waveform_pb2 import (
+    DigitalWaveform as DigitalWaveformProto,
+    DoubleAnalogWaveform,
+    I16AnalogWaveform,
+)
+from ni.protobuf.types.waveform_view import Float64AnalogWaveformView
+
+_TIMING = Timing.create_with_regular_interval(
+    dt.timedelta(milliseconds=500), bt.DateTime(2025, 1, 1, tzinfo=dt.timezone.utc)
+)
+
+
+def _make_waveforms() -> (
+    tuple[AnalogWaveform[np.float64], AnalogWaveform[np.int16], DigitalWaveform[np.uint8]]
+):
+    return (
+        AnalogWaveform.from_array_1d(
+            np.arange(10.0), timing=_TIMING, extended_properties={"NI_ChannelName": "Dev1/ai0"}
+        ),
+        AnalogWaveform.from_array_1d(
+            np.arange(-5, 5, dtype=np.int16),
+            timing=_TIMING,
+            scale_mode=LinearScaleMode(2.0, 0.5),
+        ),
+        DigitalWaveform.from_lines(np.array([[0, 1], [1, 0], [1, 1]], np.uint8), timing=_TIMING),
+    )
+
+
+def _round_trip(
+    waveforms: tuple[
+        AnalogWaveform[np.float64], AnalogWaveform[np.int16], DigitalWaveform[np.uint8]
+    ],
+) -> list[AnalogWaveform[np.float64] | AnalogWaveform[np.int16] | DigitalWaveform[np.uint8]]:
+    return [
+        float64_analog_waveform_from_protobuf_bytes(
+            float64_analog_waveform_to_protobuf_bytes(waveforms[0])
+        ),
+        int16_analog_waveform_from_protobuf_bytes(
+            int16_analog_waveform_to_protobuf_bytes(waveforms[1])
+        ),
+        digital_waveform_from_protobuf(digital_waveform_to_protobuf(waveforms[2])),
+    ]
+
+
+# ========================================================
+# Write and Read
+# ========================================================
+def test___waveforms___write_and_read___round_trips(tmp_path: pathlib.Path) -> None:
+    path = tmp_path / "capture.niwfm"
+    waveforms = _make_waveforms()
+
+    with WaveformFileWriter(path) as writer:
+        indices = [writer.write(waveform) for waveform in waveforms]
+    with WaveformFileReader(path) as reader:
+        results = [reader.read(index) for index in range(len(reader))]
+
+    assert indices == [0, 1, 2]
+    assert results == _round_trip(waveforms)
+
+
+def test___waveforms___write_and_get_message_type___message_types_returned(
+    tmp_path: pathlib.Path,
+) -> None:
+    path = tmp_path / "capture.niwfm"
+
+    with WaveformFileWriter(path) as writer:
+        for waveform in _make_waveforms():
+            writer.write(waveform)
+    with WaveformFileReader(path) as reader:
+        message_types = [reader.get_message_type(index) for index in range(len(reader))]
+
+    assert message_types == [DoubleAnalogWaveform, I16AnalogWaveform, DigitalWaveformProto]
+
+
+def test___messages___write_and_get_serialized___serialized_messages_returned(
+    tmp_path: pathlib.Path,
+) -> None:
+    path = tmp_path / "capture.niwfm"
+    messages: list[AnyFileWaveformProto] = [
+        DoubleAnalogWaveform(y_data=[1.0, 2.0]),
+        I16AnalogWaveform(y_data=[-1, 1]),
+        DigitalWaveformProto(signal_count=1, y_data=b"\x00\x01"),
+    ]
+
+    with WaveformFileWriter(path) as writer:
+        for message in messages:
+            writer.write(message)
+    with WaveformFileReader(path) as reader:
+        data = [bytes(reader.get_serialized(index)) for index in range(len(reader))]
+
+    assert data == [message.SerializeToString() for message in messages]
+
+
+def test___serialized_message___write_serialized_and_get_view___samples_decoded(
+    tmp_path: pathlib.Path,
+) -> None:
+    path = tmp_path / "capture.niwfm"
+    waveform = _make_waveforms()[0]
+
+    with WaveformFileWriter(path) as writer:
+        writer.write_serialized(
+            DoubleAnalogWaveform, float64_analog_waveform_to_protobuf_bytes(waveform)
+        )
+    with WaveformFileReader(path) as reader:
+        view = reader.get_view(-1)
+        assert isinstance(view, Float64AnalogWaveformView)
+        assert list(view.get_raw_data(2, 3)) == [2.0, 3.0, 4.0]
+        assert view.extended_properties == waveform.extended_properties
+
+
+@pytest.mark.parametrize("index", [0, 1, 2])
+def test___waveforms___read_sample_slice___samples_and_timing_sliced(
+    tmp_path: pathlib.Path, index: int
+) -> None:
+    path = tmp_path / "capture.niwfm"
+    waveforms = _make_waveforms()
+
+    with WaveformFileWriter(path) as writer:
+        for waveform in waveforms:
+            writer.write(waveform)
+    with WaveformFileReader(path) as reader:
+        result = reader.read(index, 1, 2)
+
+    assert result.sample_count == 2
+    bin_timing = _TIMING.to_bintime()
+    assert result.timing.start_time == bin_timing.start_time + bin_timing.sample_interval
+    expected = waveforms[index]
+    if isinstance(result, DigitalWaveform):
+        assert result.data.tolist() == [[1, 0], [1, 1]]
+    else:
+        assert isinstance(expected, AnalogWaveform)
+        assert list(result.raw_data) == list(expected.raw_data[1:3])
+
+
+def test___irregular_timing___read_sample_slice___timestamps_sliced(tmp_path: pathlib.Path) -> None:
+    path = tmp_path / "capture.niwfm"
+    timestamps = [bt.DateTime(2025, 1, 1, second=i, tzinfo=dt.timezone.utc) for i in range(4)]
+    waveform = AnalogWaveform.from_array_1d(
+        np.arange(4.0), timing=Timing.create_with_irregular_interval(timestamps)
+    )
+
+    with WaveformFileWriter(path) as writer:
+        writer.write(waveform)
+    with WaveformFileReader(path) as reader:
+        result = reader.read(0, 2)
+
+    assert list(result.timing.get_timestamps(0, 2)) == timestamps[2:]
+
+
+def test___empty_file___read___no_records(tmp_path: pathlib.Path) -> None:
+    path = tmp_path / "capture.niwfm"
+
+    with WaveformFileWriter(path):
+        pass
+    with WaveformFileReader(path) as reader:
+        views = list(reader)
+
+    assert views == []
+
+
+def test___iterate_reader___views_returned_in_order(tmp_path: pathlib.Path) -> None:
+    path = tmp_path / "capture.niwfm"
+    waveforms = _make_waveforms()
+
+    with WaveformFileWriter(path) as writer:
+        for waveform in waveforms:
+            writer.write(waveform)
+    with WaveformFileReader(path) as reader:
+        results = [view.to_waveform() for view in reader]
+
+    assert results == _round_trip(waveforms)
+
+
+def test___views_alive___close_reader___views_still_readable(tmp_path: pathlib.Path) -> None:
+    path = tmp_path / "capture.niwfm"
+
+    with WaveformFileWriter(path) as writer:
+        writer.write(_make_waveforms()[0])
+    reader = WaveformFileReader(path)
+    view = reader.get_view(0)
+    assert isinstance(view, Float64AnalogWaveformView)
+    data = view.raw_data
+    reader.close()
+
+    assert list(data) == list(np.arange(10.0))
+
+
+# ========================================================
+# Errors
+# ========================================================
+def test___unsupported_dtype___write___raises_type_error(tmp_path: pathlib.Path) -> None:
+    with WaveformFileWriter(tmp_path / "capture.niwfm") as writer:
+        with pytest.raises(TypeError, match="must be float64 or int16"):
+            writer.write(AnalogWaveform(2, np.float32))  # type: ignore[arg-type]
+
+
+def test___unclosed_file___open_reader___raises_value_error(tmp_path: pathlib.Path) -> None:
+    path = tmp_path / "capture.niwfm"
+    writer = WaveformFileWriter(path)
+    writer.write(_make_waveforms()[0])
+    writer._file.flush()
+
+    with pytest.raises(ValueError, match="not a waveform file or was not closed"):
+        WaveformFileReader(path)
+    writer.close()
+
+
+@pytest.mark.parametrize(
+    "field_offset, field_format, value",
+    [
+        (0, "<Q", 0),  # The record overlaps the header.
+        (8, "<Q", 1 << 40),  # The record extends past the index.
+        (16, "B", 9),  # The message type is unknown.
+    ],
+)
+def test___corrupt_index_entry___open_reader___raises_value_error(
+    tmp_path: pathlib.Path, field_offset: int, field_format: str, value: int
+) -> None:
+    path = tmp_path / "capture.niwfm"
+    with WaveformFileWriter(path) as writer:
+        writer.write(_make_waveforms()[0])
+    data = bytearray(path.read_bytes())
+    (index_offset,) = struct.unpack_from("<Q", data, len(data) - 24)
+    struct.pack_into(field_format, data, index_offset + field_offset, value)
+    path.write_bytes(data)
+
+    with pytest.raises(ValueError, match="index is corrupt"):
+        WaveformFileReader(path)
+
+
+def test___index_out_of_range___read___raises_index_error(tmp_path: pathlib.Path) -> None:
+    path = tmp_path / "capture.niwfm"
+
+    with WaveformFileWriter(path) as writer:
+        writer.write(_make_waveforms()[0])
+    with WaveformFileReader(path) as reader:
+        with pytest.raises(IndexError):
+            reader.read(1)
@@ -0,0 +1,218 @@
+import datetime as dt
+
+import nitypes.bintime as bt
+import numpy as np
+import pytest
+from nitypes.waveform import (
+    AnalogWaveform,
+    DigitalWaveform,
+    LinearScaleMode,
+    NoneScaleMode,
+    Timing,
+)
+
+from ni.protobuf.types.waveform_conversion import (
+    digital_waveform_from_protobuf,
+    digital_waveform_to_protobuf,
+    float64_analog_waveform_from_protobuf,
+    float64_analog_waveform_to_protobuf,
+    float64_analog_waveform_to_protobuf_bytes,
+    int16_analog_waveform_from_protobuf,
+    int16_analog_waveform_to_protobuf,
+    int16_analog_waveform_to_protobuf_bytes,
+)
+from ni.protobuf.types.waveform_pb2 import (
+    DigitalWaveform as DigitalWaveformProto,
+    DoubleAnalogWaveform,
+    I16AnalogWaveform,
+)
+from ni.protobuf.types.waveform_view import (
+    DigitalWaveformView,
+    Float64AnalogWaveformView,
+    Int16AnalogWaveformView,
+    _WaveformView,
+)
+
+_TIMING = Timing.create_with_regular_interval(
+    dt.timedelta(milliseconds=1), bt.DateTime(2025, 1, 1, tzinfo=dt.timezone.utc)
+)
+
+
+# ========================================================
+# Float64 Analog
+# ========================================================
+def test___float64_message___create_view___header_converted_and_data_not_decoded() -> None:
+    analog_waveform = AnalogWaveform.from_array_1d(
+        np.arange(10.0), timing=_TIMING, extended_properties={"NI_ChannelName": "Dev1/ai0"}
+    )
+    message = float64_analog_waveform_to_protobuf(analog_waveform)
+
+    view = Float64AnalogWaveformView(message)
+
+    expected = float64_analog_waveform_from_protobuf(message)
+    assert view.timing == expected.timing
+    assert view.extended_properties == {"NI_ChannelName": "Dev1/ai0"}
+    assert view.sample_count == 10
+    assert view.scale_mode == NoneScaleMode()
+    assert not view.is_materialized
+
+
+def test___float64_message_view___get_raw_data_slice___slice_returned() -> None:
+    view = Float64AnalogWaveformView(DoubleAnalogWaveform(y_data=np.arange(10.0)))
+
+    data = view.get_raw_data(3, 4)
+
+    assert list(data) == [3.0, 4.0, 5.0, 6.0]
+    assert not view.is_materialized
+
+
+def test___float64_bytes___create_view___data_is_view_of_bytes() -> None:
+    analog_waveform = AnalogWaveform.from_array_1d(np.arange(10.0), timing=_TIMING)
+    data = float64_analog_waveform_to_protobuf_bytes(analog_waveform)
+
+    view = Float64AnalogWaveformView(data)
+
+    assert view.sample_count == 10
+    assert (
+        view.timing
+        == float64_analog_waveform_from_protobuf(
+            float64_analog_waveform_to_protobuf(analog_waveform)
+        ).timing
+    )
+    assert list(view.get_raw_data(8)) == [8.0, 9.0]
+    assert np.shares_memory(view.raw_data, np.frombuffer(data, np.uint8))
+    assert view.is_materialized
+
+
+def test___float64_view___to_waveform___matches_from_protobuf() -> None:
+    message = float64_analog_waveform_to_protobuf(
+        AnalogWaveform.from_array_1d(
+            np.arange(5.0), timing=_TIMING, extended_properties={"NI_UnitDescription": "Volts"}
+        )
+    )
+
+    waveform = Float64AnalogWaveformView(message.SerializeToString()).to_waveform()
+
+    assert waveform == float64_analog_waveform_from_protobuf(message)
+
+
+@pytest.mark.parametrize(
+    "start_index, sample_count, message",
+    [
+        (-1, None, "non-negative"),
+        (11, None, "start index must be less than or equal"),
+        (4, 7, "sum of the start index and sample count"),
+        (0, -1, "non-negative"),
+    ],
+)
+def test___float64_view___get_raw_data_out_of_range___raises_value_error(
+    start_index: int, sample_count: int | None, message: str
+) -> None:
+    view = Float64AnalogWaveformView(DoubleAnalogWaveform(y_data=np.arange(10.0)))
+
+    with pytest.raises(ValueError, match=message):
+        view.get_raw_data(start_index, sample_count)
+
+
+def test___float64_bytes_with_truncated_sample___get_sample_count___raises_value_error() -> None:
+    # A y_data field with one and a half samples.
+    data = bytes([DoubleAnalogWaveform.Y_DATA_FIELD_NUMBER << 3 | 2, 12]) + bytes(12)
+    view = Float64AnalogWaveformView(data)
+
+    with pytest.raises(ValueError, match="must be a multiple of 8 bytes"):
+        _ = view.sample_count
+
+
+# ========================================================
+# Int16 Analog
+# ========================================================
+def test___int16_bytes___create_view___header_and_scale_converted() -> None:
+    analog_waveform = AnalogWaveform.from_array_1d(
+        np.array([-32768, -1, 0, 1, 32767], np.int16),
+        timing=_TIMING,
+        scale_mode=LinearScaleMode(2.0, 0.5),
+    )
+
+    view = Int16AnalogWaveformView(int16_analog_waveform_to_protobuf_bytes(analog_waveform))
+
+    assert view.sample_count == 5
+    assert view.scale_mode == LinearScaleMode(2.0, 0.5)
+    assert not view.is_materialized
+
+
+@pytest.mark.parametrize("start_index, sample_count", [(0, 0), (0, 5), (1, 3), (4, 1), (5, 0)])
+def test___int16_bytes_view___get_raw_data_slice___only_slice_decoded(
+    start_index: int, sample_count: int
+) -> None:
+    y_data = np.array([-32768, -1, 0, 200, 32767], np.int16)
+    view = Int16AnalogWaveformView(I16AnalogWaveform(y_data=y_data).SerializeToString())
+
+    data = view.get_raw_data(start_index, sample_count)
+
+    assert data.dtype == np.int16
+    assert list(data) == list(y_data[start_index : start_index + sample_count])
+    assert not view.is_materialized
+
+
+def test___large_int16_bytes_view___get_raw_data_slice___slice_decoded() -> None:
+    y_data = (np.arange(200_000) % 65536 - 32768).astype(np.int16)
+    view = Int16AnalogWaveformView(I16AnalogWaveform(y_data=y_data).SerializeToString())
+
+    data = view.get_raw_data(150_000, 1000)
+
+    assert view.sample_count == 200_000
+    assert np.array_equal(data, y_data[150_000:151_000])
+
+
+def test___int16_message_view___to_waveform___matches_from_protobuf() -> None:
+    message = int16_analog_waveform_to_protobuf(
+        AnalogWaveform.from_array_1d(
+            np.array([1, 2, 3], np.int16), timing=_TIMING, scale_mode=LinearScaleMode(3.0, 4.0)
+        )
+    )
+
+    view = Int16AnalogWaveformView(message)
+
+    assert list(view.get_raw_data(1)) == [2, 3]
+    assert view.to_waveform() == int16_analog_waveform_from_protobuf(message)
+
+
+# ========================================================
+# Digital
+# ========================================================
+def test___digital_bytes___create_view___signal_count_and_data_converted() -> None:
+    digital_waveform = DigitalWaveform.from_lines(
+        np.array([[0, 1], [1, 0], [1, 1]], np.uint8), timing=_TIMING
+    )
+    message = digital_waveform_to_protobuf(digital_waveform)
+
+    view = DigitalWaveformView(message.SerializeToString())
+
+    assert view.signal_count == 2
+    assert view.sample_count == 3
+    assert view.get_data(1, 2).tolist() == [[1, 0], [1, 1]]
+    assert view.to_waveform() == digital_waveform_from_protobuf(message)
+
+
+def test___digital_message_with_zero_signal_count___create_view___raises_value_error() -> None:
+    with pytest.raises(ValueError, match="signal_count must be greater than zero"):
+        DigitalWaveformView(DigitalWaveformProto(signal_count=0, y_data=b"\x00"))
+
+
+def test___digital_message_with_bad_length___get_sample_count___raises_value_error() -> None:
+    view = DigitalWaveformView(DigitalWaveformProto(signal_count=2, y_data=b"\x00\x01\x00"))
+
+    with pytest.raises(ValueError, match="does not match expected shape"):
+        _ = view.sample_count
+
+
+# ========================================================
+# Base Class
+# ========================================================
+def test___incomplete_subclass___create_view___raises_type_error() -> None:
+    class IncompleteView(_WaveformView[DoubleAnalogWaveform, np.float64]):
+        def _count_samples(self) -> int:
+            return 0
+
+    with pytest.raises(TypeError, match="abstract"):
+        IncompleteView(DoubleAnalogWaveform, DoubleAnalogWaveform())  # type: ignore[abstract]
@@ -0,0 +1,371 @@
+import datetime as dt
+
+import hightime as ht
+import numpy as np
+import pytest
+from nitypes.complex import ComplexInt32DType
+from nitypes.waveform import (
+    AnalogWaveform,
+    ComplexWaveform,
+    DigitalWaveform,
+    LinearScaleMode,
+    Spectrum,
+    Timing,
+)
+
+from ni.protobuf.types.waveform_conversion import (
+    digital_waveform_from_protobuf,
+    digital_waveform_to_protobuf,
+    float32_spectrum_to_protobuf,
+    float64_analog_waveform_from_protobuf,
+    float64_analog_waveform_to_protobuf,
+    float64_complex_waveform_from_protobuf,
+    float64_complex_waveform_to_protobuf,
+    int16_analog_waveform_from_protobuf,
+    int16_analog_waveform_to_protobuf,
+    int16_complex_waveform_from_protobuf,
+    int16_complex_waveform_to_protobuf,
+)
+from ni.protobuf.types.waveform_wrappers_conversion import (
+    digital_waveforms_from_protobuf,
+    digital_waveforms_to_protobuf,
+    float32_analog_waveforms_from_protobuf,
+    float32_analog_waveforms_to_protobuf,
+    float32_complex_waveforms_from_protobuf,
+    float32_complex_waveforms_to_protobuf,
+    float32_spectra_from_protobuf,
+    float32_spectra_to_protobuf,
+    float64_analog_waveforms_from_protobuf,
+    float64_analog_waveforms_to_protobuf,
+    float64_analog_waveforms_to_protobuf_list,
+    float64_complex_waveforms_from_protobuf,
+    float64_complex_waveforms_to_protobuf,
+    float64_spectra_from_protobuf,
+    float64_spectra_to_protobuf,
+    int16_analog_waveforms_from_protobuf,
+    int16_analog_waveforms_to_protobuf,
+    int16_analog_waveforms_to_protobuf_list,
+    int16_complex_waveforms_from_protobuf,
+    int16_complex_waveforms_to_protobuf,
+    int16_complex_waveforms_to_protobuf_list,
+)
+from ni.protobuf.types.waveform_wrappers_pb2 import (
+    DoubleAnalogWaveformArrayValue,
+)
+
+_TIMING = Timing.create_with_regular_interval(
+    ht.timedelta(seconds=1e-3), ht.datetime(2025, 1, 1, tzinfo=dt.timezone.utc)
+)
+
+
+# ========================================================
+# Analog Waveforms
+# ========================================================
+def test___waveform_sequence___convert___matches_single_conversion() -> None:
+    waveforms = [
+        AnalogWaveform.from_array_1d(
+            np.arange(i, i + 5, dtype=np.float64),
+            timing=_TIMING,
+            extended_properties={"NI_ChannelName": f"Dev1/ai{i}"},
+        )
+        for i in range(3)
+    ]
+
+    message = float64_analog_waveforms_to_protobuf(waveforms)
+
+    assert list(message.waveforms) == [
+        float64_analog_waveform_to_protobuf(waveform) for waveform in waveforms
+    ]
+
+
+def test___2d_array___convert___each_row_becomes_a_waveform() -> None:
+    array = np.arange(12, dtype=np.float64).reshape(3, 4)
+
+    message = float64_analog_waveforms_to_protobuf(
+        array, timing=_TIMING, extended_properties={"NI_UnitDescription": "Volts"}
+    )
+
+    assert len(message.waveforms) == 3
+    assert list(message.waveforms[2].y_data) == [8.0, 9.0, 10.0, 11.0]
+    assert message.waveforms[0].dt == pytest.approx(1e-3)
+    assert message.waveforms[1].attributes["NI_UnitDescription"].string_value == "Volts"
+
+
+def test___waveform_sequence_with_timing_argument___convert___raises_value_error() -> None:
+    with pytest.raises(ValueError, match="only supported when the values are a 2-D array"):
+        float64_analog_waveforms_to_protobuf([AnalogWaveform(2)], timing=_TIMING)
+
+
+def test___irregular_timing___convert___matches_single_conversion() -> None:
+    timestamps = [ht.datetime(2025, 1, 1, 0, 0, i, tzinfo=dt.timezone.utc) for i in range(3)]
+    waveform = AnalogWaveform.from_array_1d(
+        np.array([1.0, 2.0, 3.0]), timing=Timing.create_with_irregular_interval(timestamps)
+    )
+
+    message = float64_analog_waveforms_to_protobuf([waveform, AnalogWaveform(1)])
+
+    assert message.waveforms[0] == float64_analog_waveform_to_protobuf(waveform)
+    assert float64_analog_waveforms_from_protobuf(message)[0] == waveform
+
+
+def test___same_length_waveforms___convert_from_protobuf___rows_of_one_array() -> None:
+    message = float64_analog_waveforms_to_protobuf(
+        np.arange(12, dtype=np.float64).reshape(3, 4), timing=_TIMING
+    )
+
+    waveforms = float64_analog_waveforms_from_protobuf(message)
+
+    assert [list(waveform.raw_data) for waveform in waveforms] == [
+        [0.0, 1.0, 2.0, 3.0],
+        [4.0, 5.0, 6.0, 7.0],
+        [8.0, 9.0, 10.0, 11.0],
+    ]
+    assert waveforms[0].raw_data.base is waveforms[2].raw_data.base
+    assert waveforms[0].timing is waveforms[1].timing
+    assert waveforms[0].timing == float64_analog_waveform_from_protobuf(message.waveforms[0]).timing
+
+
+def test___ragged_waveforms___convert_from_protobuf___matches_single_conversion() -> None:
+    waveforms = [
+        AnalogWaveform.from_array_1d(np.arange(n, dtype=np.float64), timing=_TIMING)
+        for n in (1, 3, 0)
+    ]
+
+    message = float64_analog_waveforms_to_protobuf(waveforms)
+
+    assert float64_analog_waveforms_from_protobuf(message) == [
+        float64_analog_waveform_from_protobuf(waveform) for waveform in message.waveforms
+    ]
+
+
+def test___empty_array_value___convert_from_protobuf___returns_empty_list() -> None:
+    assert float64_analog_waveforms_from_protobuf(DoubleAnalogWaveformArrayValue()) == []
+
+
+def test___float32_2d_array___round_trip___values_match() -> None:
+    array = np.linspace(-1.0, 1.0, 16, dtype=np.float32).reshape(4, 4)
+
+    result = float32_analog_waveforms_from_protobuf(float32_analog_waveforms_to_protobuf(array))
+
+    assert np.array_equal(np.stack([waveform.raw_data for waveform in result]), array)
+    assert result[0].dtype == np.float32
+
+
+def test___int16_waveforms_with_scale___convert___matches_single_conversion() -> None:
+    waveforms = [
+        AnalogWaveform.from_array_1d(
+            np.array([-32768, 0, 32767], np.int16), scale_mode=LinearScaleMode(2.0, 0.5)
+        ),
+        AnalogWaveform.from_array_1d(np.array([1, -1, 2], np.int16)),
+    ]
+
+    message = int16_analog_waveforms_to_protobuf(waveforms)
+
+    assert list(message.waveforms) == [
+        int16_analog_waveform_to_protobuf(waveform) for waveform in waveforms
+    ]
+    assert int16_analog_waveforms_from_protobuf(message) == [
+        int16_analog_waveform_from_protobuf(waveform) for waveform in message.waveforms
+    ]
+
+
+def test___int16_2d_array_with_scale_mode___round_trip___values_match() -> None:
+    array = np.arange(-4, 4, dtype=np.int16).reshape(2, 4)
+
+    result = int16_analog_waveforms_from_protobuf(
+        int16_analog_waveforms_to_protobuf(array, scale_mode=LinearScaleMode(3.0, 4.0))
+    )
+
+    assert list(result[1].raw_data) == [0, 1, 2, 3]
+    assert result[1].scale_mode == LinearScaleMode(3.0, 4.0)
+
+
+# ========================================================
+# Multi-Channel Arrays
+# ========================================================
+def test___2d_array_with_channel_properties___convert_to_list___matches_single_conversion() -> None:
+    array = np.arange(12, dtype=np.float64).reshape(3, 4)
+    channel_properties = [{"NI_ChannelName": f"Dev1/ai{i}"} for i in range(3)]
+
+    messages = float64_analog_waveforms_to_protobuf_list(
+        array,
+        timing=_TIMING,
+        extended_properties={"NI_UnitDescription": "Volts"},
+        channel_properties=channel_properties,
+    )
+
+    assert messages == [
+        float64_analog_waveform_to_protobuf(
+            AnalogWaveform.from_array_1d(
+                row,
+                timing=_TIMING,
+                extended_properties={"NI_UnitDescription": "Volts", **properties},
+            )
+        )
+        for row, properties in zip(array, channel_properties)
+    ]
+
+
+def test___2d_array_with_channel_properties___convert___matches_list_conversion() -> None:
+    array = np.arange(12, dtype=np.float64).reshape(3, 4)
+    channel_properties = [{"NI_ChannelName": f"Dev1/ai{i}"} for i in range(3)]
+
+    message = float64_analog_waveforms_to_protobuf(
+        array, timing=_TIMING, channel_properties=channel_properties
+    )
+
+    assert list(message.waveforms) == float64_analog_waveforms_to_protobuf_list(
+        array, timing=_TIMING, channel_properties=channel_properties
+    )
+
+
+def test___2d_array_with_irregular_timing___convert_to_list___matches_single_conversion() -> None:
+    timestamps = [ht.datetime(2025, 1, 1, 0, 0, i, tzinfo=dt.timezone.utc) for i in range(4)]
+    timing = Timing.create_with_irregular_interval(timestamps)
+    array = np.arange(8, dtype=np.float64).reshape(2, 4)
+
+    messages = float64_analog_waveforms_to_protobuf_list(array, timing=timing)
+
+    assert messages == [
+        float64_analog_waveform_to_protobuf(AnalogWaveform.from_array_1d(row, timing=timing))
+        for row in array
+    ]
+
+
+def test___non_contiguous_2d_array___convert_to_list___values_match() -> None:
+    array = np.arange(24, dtype=np.float64).reshape(4, 6)[::2, ::3]
+
+    messages = float64_analog_waveforms_to_protobuf_list(array)
+
+    assert [list(message.y_data) for message in messages] == array.tolist()
+
+
+def test___int16_2d_array_with_scale_mode___convert_to_list___matches_single_conversion() -> None:
+    array = np.array([[1, -2], [3, -4]], np.int16)
+    scale_mode = LinearScaleMode(2.0, 0.5)
+
+    messages = int16_analog_waveforms_to_protobuf_list(array, timing=_TIMING, scale_mode=scale_mode)
+
+    assert messages == [
+        int16_analog_waveform_to_protobuf(
+            AnalogWaveform.from_array_1d(row, timing=_TIMING, scale_mode=scale_mode)
+        )
+        for row in array
+    ]
+
+
+def test___int16_complex_2d_array___convert_to_list___matches_single_conversion() -> None:
+    array = np.array([[(1, -2), (3, 4)], [(5, 6), (-7, 8)]], ComplexInt32DType)
+
+    messages = int16_complex_waveforms_to_protobuf_list(array, timing=_TIMING)
+
+    assert messages == [
+        int16_complex_waveform_to_protobuf(ComplexWaveform.from_array_1d(row, timing=_TIMING))
+        for row in array
+    ]
+
+
+def test___wrong_number_of_channel_properties___convert_to_list___raises_value_error() -> None:
+    array = np.zeros((3, 4))
+
+    with pytest.raises(ValueError, match="number of channel properties must match"):
+        float64_analog_waveforms_to_protobuf_list(array, channel_properties=[{}, {}])
+
+
+def test___1d_array___convert_to_list___raises_value_error() -> None:
+    with pytest.raises(ValueError, match="must be two-dimensional"):
+        float64_analog_waveforms_to_protobuf_list(np.zeros(4))
+
+
+def test___wrong_dtype___convert_to_list___raises_type_error() -> None:
+    with pytest.raises(TypeError, match="data type must be float64"):
+        float64_analog_waveforms_to_protobuf_list(np.zeros((2, 4), np.float32))
+
+
+# ========================================================
+# Complex Waveforms
+# ========================================================
+def test___float64_complex_waveforms___convert___matches_single_conversion() -> None:
+    waveforms = [
+        ComplexWaveform.from_array_1d(np.array([1 + 2j, 3 - 4j], np.complex128), timing=_TIMING)
+        for _ in range(2)
+    ]
+
+    message = float64_complex_waveforms_to_protobuf(waveforms)
+
+    assert message.waveforms[0] == float64_complex_waveform_to_protobuf(waveforms[0])
+    assert float64_complex_waveforms_from_protobuf(message) == [
+        float64_complex_waveform_from_protobuf(waveform) for waveform in message.waveforms
+    ]
+
+
+def test___float32_complex_2d_array___round_trip___values_match() -> None:
+    array = (np.arange(6) + 1j * np.arange(6)).astype(np.complex64).reshape(2, 3)
+
+    result = float32_complex_waveforms_from_protobuf(float32_complex_waveforms_to_protobuf(array))
+
+    assert list(result[1].raw_data) == [3 + 3j, 4 + 4j, 5 + 5j]
+    assert result[1].dtype == np.complex64
+
+
+def test___int16_complex_waveforms___convert___matches_single_conversion() -> None:
+    data = np.array([(1, -2), (-32768, 32767)], ComplexInt32DType)
+    waveforms = [ComplexWaveform.from_array_1d(data, scale_mode=LinearScaleMode(2.0, 1.0))]
+
+    message = int16_complex_waveforms_to_protobuf(waveforms)
+
+    assert message.waveforms[0] == int16_complex_waveform_to_protobuf(waveforms[0])
+    assert int16_complex_waveforms_from_protobuf(message) == [
+        int16_complex_waveform_from_protobuf(waveform) for waveform in message.waveforms
+    ]
+
+
+# ========================================================
+# Spectrums
+# ========================================================
+def test___float64_2d_array___convert_spectra___round_trips() -> None:
+    array = np.arange(8, dtype=np.float64).reshape(2, 4)
+
+    result = float64_spectra_from_protobuf(
+        float64_spectra_to_protobuf(array, start_frequency=10.0, frequency_increment=0.5)
+    )
+
+    assert list(result[1].data) == [4.0, 5.0, 6.0, 7.0]
+    assert result[0].start_frequency == 10.0
+    assert result[0].frequency_increment == 0.5
+
+
+def test___float32_spectra_sequence___convert___matches_single_conversion() -> None:
+    spectra = [
+        Spectrum.from_array_1d(
+            np.arange(n, dtype=np.float32),
+            start_frequency=1.0,
+            frequency_increment=2.0,
+            extended_properties={"NI_ChannelName": "Dev1/ai0"},
+        )
+        for n in (2, 3)
+    ]
+
+    message = float32_spectra_to_protobuf(spectra)
+
+    assert list(message.waveforms) == [float32_spectrum_to_protobuf(value) for value in spectra]
+    assert float32_spectra_from_protobuf(message) == spectra
+
+
+# ========================================================
+# Digital Waveforms
+# ========================================================
+def test___digital_waveforms___convert___matches_single_conversion() -> None:
+    waveforms = [
+        DigitalWaveform.from_lines(np.array([[0, 1], [1, 0], [1, 1]], np.uint8), timing=_TIMING),
+        DigitalWaveform.from_lines(np.array([[1], [0]], np.uint8)),
+    ]
+
+    message = digital_waveforms_to_protobuf(waveforms)
+
+    assert list(message.waveforms) == [
+        digital_waveform_to_protobuf(waveform) for waveform in waveforms
+    ]
+    assert digital_waveforms_from_protobuf(message) == [
+        digital_waveform_from_protobuf(waveform) for waveform in message.waveforms
+    ]
@@ -5,7 +5,9 @@ from ni.protobuf.types import xydata_pb2
 from ni.protobuf.types.attribute_value_pb2 import AttributeValue
 from ni.protobuf.types.xydata_conversion import (
     float64_xydata_from_protobuf,
+    float64_xydata_from_protobuf_bytes,
     float64_xydata_to_protobuf,
+    float64_xydata_to_protobuf_bytes,
 )
 
 
@@ -129,3 +131,50 @@ def test___xydata_with_extended_properties___convert___valid_doublexydata_protob
     assert protobuf_value.attributes["1"].integer_value == 1
     assert protobuf_value.attributes["1.0"].double_value == 1.0
     assert protobuf_value.attributes["str"].string_value == "str"
+
+
+# ========================================================
+# XYData: Serialized Bytes
+# ========================================================
+def test___xydata___to_protobuf_bytes___matches_serialized_message() -> None:
+    python_value = XYData.from_arrays_1d(
+        np.arange(5.0), np.arange(5.0) * 2, np.float64, x_units="Volts", y_units="Amps"
+    )
+
+    data = float64_xydata_to_protobuf_bytes(python_value)
+
+    assert data == float64_xydata_to_protobuf(python_value).SerializeToString()
+
+
+def test___serialized_xydata___from_protobuf_bytes___matches_message_conversion() -> None:
+    protobuf_value = xydata_pb2.DoubleXYData(
+        x_data=[1.0, 2.0],
+        y_data=[3.0, 4.0],
+        attributes={"NI_UnitDescription_X": AttributeValue(string_value="Volts")},
+    )
+
+    python_value = float64_xydata_from_protobuf_bytes(protobuf_value.SerializeToString())
+
+    assert python_value == float64_xydata_from_protobuf(protobuf_value)
+    assert python_value.x_units == "Volts"
+
+
+def test___serialized_xydata___from_protobuf_bytes___data_not_copied() -> None:
+    data = bytearray(
+        float64_xydata_to_protobuf_bytes(XYData.from_arrays_1d([1.0], [2.0], np.float64))
+    )
+
+    python_value = float64_xydata_from_protobuf_bytes(data)
+
+    assert np.shares_memory(python_value.x_data, np.frombuffer(data, np.uint8))
+    assert np.shares_memory(python_value.y_data, np.frombuffer(data, np.uint8))
+
+
+def test___empty_xydata___round_trip_protobuf_bytes___empty_arrays() -> None:
+    python_value = XYData.from_arrays_1d([], [], np.float64)
+
+    result = float64_xydata_from_protobuf_bytes(float64_xydata_to_protobuf_bytes(python_value))
+
+    assert result.x_data.dtype == np.float64
+    assert len(result.x_data) == 0
+    assert len(result.y_data) == 0
@@ -0,0 +1,123 @@
+import numpy as np
+import pytest
+from nitypes.xy_data import XYData
+
+from ni.protobuf.types.xydata_conversion import (
+    float64_xydata_from_protobuf,
+    float64_xydata_to_protobuf,
+)
+from ni.protobuf.types.xydata_wrappers_conversion import (
+    float64_xydata_array_from_protobuf,
+    float64_xydata_array_from_protobuf_bytes,
+    float64_xydata_array_to_protobuf,
+    float64_xydata_array_to_protobuf_bytes,
+)
+from ni.protobuf.types.xydata_wrappers_pb2 import DoubleXYDataArrayValue
+
+
+def _make_xydata(length: int, offset: float = 0.0) -> XYData[np.float64]:
+    return XYData.from_arrays_1d(
+        np.arange(length, dtype=np.float64),
+        np.arange(length, dtype=np.float64) + offset,
+        np.float64,
+        x_units="Volts",
+        y_units="Amps",
+    )
+
+
+# ========================================================
+# XYData Array: Python to Protobuf
+# ========================================================
+def test___xydata_sequence___to_protobuf___matches_single_conversion() -> None:
+    values = [_make_xydata(3), _make_xydata(0), _make_xydata(5, 1.0)]
+
+    message = float64_xydata_array_to_protobuf(values)
+
+    assert list(message.x_y_data) == [float64_xydata_to_protobuf(value) for value in values]
+
+
+def test___xydata_sequence___to_protobuf_bytes___parses_as_array_value() -> None:
+    values = [_make_xydata(3), _make_xydata(4, 1.0)]
+
+    data = float64_xydata_array_to_protobuf_bytes(values)
+
+    expected = DoubleXYDataArrayValue(
+        x_y_data=[float64_xydata_to_protobuf(value) for value in values]
+    )
+    assert DoubleXYDataArrayValue.FromString(data) == expected
+
+
+def test___2d_array_with_shared_x_data___to_protobuf___rows_converted() -> None:
+    y_data = np.arange(12.0).reshape(4, 3)
+    x_data = np.array([0.1, 0.2, 0.3])
+
+    message = float64_xydata_array_to_protobuf(
+        y_data, x_data=x_data, extended_properties={"NI_UnitDescription_Y": "Amps"}
+    )
+
+    assert len(message.x_y_data) == 4
+    for row, xydata in zip(y_data, message.x_y_data):
+        assert list(xydata.x_data) == list(x_data)
+        assert list(xydata.y_data) == list(row)
+        assert xydata.attributes["NI_UnitDescription_Y"].string_value == "Amps"
+
+
+def test___2d_array_with_2d_x_data___to_protobuf___rows_converted() -> None:
+    y_data = np.arange(6.0).reshape(2, 3)
+    x_data = -y_data
+
+    message = float64_xydata_array_to_protobuf(y_data, x_data=x_data)
+
+    assert [list(xydata.x_data) for xydata in message.x_y_data] == x_data.tolist()
+    assert [list(xydata.y_data) for xydata in message.x_y_data] == y_data.tolist()
+
+
+def test___2d_array_without_x_data___to_protobuf___raises_value_error() -> None:
+    with pytest.raises(ValueError, match="x_data argument is required"):
+        float64_xydata_array_to_protobuf(np.zeros((2, 3)))
+
+
+def test___x_data_shape_mismatch___to_protobuf___raises_value_error() -> None:
+    with pytest.raises(ValueError, match="x_data shape must match"):
+        float64_xydata_array_to_protobuf(np.zeros((2, 3)), x_data=np.zeros(4))
+
+
+def test___int_array___to_protobuf___raises_type_error() -> None:
+    with pytest.raises(TypeError, match="must be float64"):
+        float64_xydata_array_to_protobuf(np.zeros((2, 3), np.int32), x_data=np.zeros(3))
+
+
+def test___sequence_with_x_data___to_protobuf___raises_value_error() -> None:
+    with pytest.raises(ValueError, match="only supported when the values are a 2-D array"):
+        float64_xydata_array_to_protobuf([_make_xydata(3)], x_data=np.zeros(3))
+
+
+# ========================================================
+# XYData Array: Protobuf to Python
+# ========================================================
+def test___same_length_xydata___from_protobuf___rows_of_contiguous_arrays() -> None:
+    message = float64_xydata_array_to_protobuf([_make_xydata(3), _make_xydata(3, 1.0)])
+
+    values = float64_xydata_array_from_protobuf(message)
+
+    assert values == [float64_xydata_from_protobuf(xydata) for xydata in message.x_y_data]
+    assert values[0].y_data.base is values[1].y_data.base
+
+
+def test___different_length_xydata___from_protobuf___converted_individually() -> None:
+    message = float64_xydata_array_to_protobuf([_make_xydata(3), _make_xydata(5)])
+
+    values = float64_xydata_array_from_protobuf(message)
+
+    assert values == [float64_xydata_from_protobuf(xydata) for xydata in message.x_y_data]
+
+
+def test___serialized_xydata_array___from_protobuf_bytes___matches_message_conversion() -> None:
+    message = float64_xydata_array_to_protobuf(
+        [_make_xydata(3), _make_xydata(0), _make_xydata(4, 2.0)]
+    )
+
+    values = float64_xydata_array_from_protobuf_bytes(message.SerializeToString())
+
+    assert values == [float64_xydata_from_protobuf(xydata) for xydata in message.x_y_data]
+    assert not values[2].y_data.flags.writeable